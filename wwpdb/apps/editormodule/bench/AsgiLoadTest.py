@@ -0,0 +1,146 @@
+##
+# File:    AsgiLoadTest.py
+# Date:    19-Oct-2026
+#
+# Updates:
+##
+"""
+Local load test for the ASGI front end (EditorAsgiApp).
+
+Concurrent requests are driven straight through the ASGI callable (no network).  By default
+each request runs a synthetic blocking operation of fixed duration, standing in for data store
+work, so that throughput of the bounded pool can be compared with a single synchronous worker
+(which would need requests x delay).  With --path the requests are dispatched through
+EditorWebApp instead, e.g. against an existing session:
+
+    python -m wwpdb.apps.editormodule.bench.AsgiLoadTest --path /service/editor/check_skip_calc \
+        --param sessionid=... --param identifier=D_000000 --requests 200 --concurrency 32
+
+"""
+__docformat__ = "restructuredtext en"
+__author__ = "Raul Sala"
+__email__ = "rsala@rcsb.rutgers.edu"
+__license__ = "Creative Commons Attribution 3.0 Unported"
+__version__ = "V0.01"
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+import logging
+
+from wwpdb.apps.editormodule.webapp.EditorAsgiApp import EditorAsgiApp
+
+logger = logging.getLogger(__name__)
+
+
+def syntheticRequest(parameterDict, siteId=None, verbose=False, materialize=False):  # pylint: disable=unused-argument
+    """Blocking stand-in for a data store operation, of duration delay_ms"""
+    time.sleep(float(parameterDict.get("delay_ms", ["50"])[0]) / 1000.0)
+    return {"CONTENT_TYPE": "application/json", "RETURN_STRING": json.dumps({"path": parameterDict["request_path"][0]})}
+
+
+def percentile(valueL, pct):
+    if not valueL:
+        return 0.0
+    valueL = sorted(valueL)
+    idx = min(len(valueL) - 1, int(round(pct / 100.0 * (len(valueL) - 1))))
+    return valueL[idx]
+
+
+class AsgiLoadTest(object):
+    """Drive concurrent requests through an EditorAsgiApp and report latency/throughput"""
+
+    def __init__(self, app, path="/service/editor/synthetic", queryString="", requests=100, concurrency=16):
+        self.__app = app
+        self.__path = path
+        self.__queryString = queryString
+        self.__requests = requests
+        self.__concurrency = concurrency
+
+    async def __request(self):
+        scope = {"type": "http", "method": "GET", "path": self.__path, "query_string": self.__queryString.encode("utf-8"), "headers": []}
+        messageL = []
+
+        async def receive():
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        async def send(message):
+            messageL.append(message)
+
+        t0 = time.time()
+        await self.__app(scope, receive, send)
+        return (time.time() - t0) * 1000.0, messageL[0]["status"]
+
+    async def __runAll(self):
+        queue = asyncio.Queue()
+        for _ in range(self.__requests):
+            queue.put_nowait(None)
+        resultL = []
+
+        async def client():
+            while not queue.empty():
+                queue.get_nowait()
+                resultL.append(await self.__request())
+
+        await asyncio.gather(*[client() for _ in range(self.__concurrency)])
+        return resultL
+
+    def run(self):
+        """Return dictionary of load test results"""
+        t0 = time.time()
+        loop = asyncio.new_event_loop()
+        try:
+            resultL = loop.run_until_complete(self.__runAll())
+        finally:
+            loop.close()
+        wallS = time.time() - t0
+        latencyL = [ms for ms, _status in resultL]
+        statusD = {}
+        for _ms, status in resultL:
+            statusD[str(status)] = statusD.get(str(status), 0) + 1
+        return {
+            "benchmark": "asgi_load",
+            "path": self.__path,
+            "requests": self.__requests,
+            "concurrency": self.__concurrency,
+            "wall_s": round(wallS, 3),
+            "throughput_rps": round(len(resultL) / wallS, 1) if wallS > 0 else 0.0,
+            "latency_ms": {"p50": round(percentile(latencyL, 50), 1), "p95": round(percentile(latencyL, 95), 1), "p99": round(percentile(latencyL, 99), 1)},
+            "status": statusD,
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local load test for the editor ASGI front end")
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--workers", type=int, default=16, help="ASGI pool size")
+    parser.add_argument("--processes", action="store_true", help="Use a process pool")
+    parser.add_argument("--delay-ms", type=float, default=50.0, help="Duration of synthetic blocking operation")
+    parser.add_argument("--path", help="Dispatch this /service/editor/ path through EditorWebApp instead of the synthetic operation")
+    parser.add_argument("--param", action="append", default=[], help="name=value request parameter (repeatable)")
+    parser.add_argument("--output", help="Write JSON results to this file")
+    args = parser.parse_args()
+
+    if args.path:
+        app = EditorAsgiApp(maxWorkers=args.workers, maxPending=args.requests, useProcesses=args.processes)
+        path, queryString = args.path, "&".join(args.param)
+    else:
+        app = EditorAsgiApp(maxWorkers=args.workers, maxPending=args.requests, useProcesses=args.processes, requestFunc=syntheticRequest)
+        path, queryString = "/service/editor/synthetic", "&".join(["delay_ms=%s" % args.delay_ms] + args.param)
+    rD = AsgiLoadTest(app, path=path, queryString=queryString, requests=args.requests, concurrency=args.concurrency).run()
+    if not args.path:
+        # a single synchronous worker serves the same load in requests x delay
+        rD["serial_equivalent_s"] = round(args.requests * args.delay_ms / 1000.0, 3)
+    app.shutdown()
+    if args.output:
+        with open(args.output, "w") as ofh:
+            json.dump(rD, ofh, indent=2, sort_keys=True)
+    print(json.dumps(rD, indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
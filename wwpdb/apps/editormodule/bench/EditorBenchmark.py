@@ -0,0 +1,408 @@
+##
+# File:    EditorBenchmark.py
+# Date:    19-Oct-2026
+#
+# Updates:
+#    2026-10-19    RPS    Added comparison with a stored baseline (--baseline) and saving of baselines (--save-baseline).
+#    2026-10-19    RPS    mandatory_check and dict_violations scenarios check all categories of the view (cifctgry=all).
+#    2026-10-19    RPS    Added --log-level/--log-levels/--log-queue, for measuring the cost of logging on the operations.
+#    2026-10-19    RPS    Scenario marked failed when any repeat reports ok false, no rows or no output bytes.
+##
+"""
+Benchmark of editor operations on a synthetic entry of given size (see SyntheticEntry).
+
+The real PdbxDataIo/EditorDepict operations behind the editor endpoints are run in a local
+session area, with the site configuration replaced by a locally installed application context
+(EditorAppContext.installLocal) and, unless a PDBx dictionary file is given, a dictionary
+generated for the synthetic entry.  As for web requests, each timed call builds its own
+PdbxDataIo instance.
+
+Scenarios:
+    launch            data store and dictionary store initialization of a new session (EditorLaunchPipeline)
+    relaunch          launch of the same session again, with the model file unchanged
+    launch_template   rendering of the launch page (EditorDepict.doRender)
+    jmol_template     rendering of the Jmol viewer markup (EditorDepict.getJmolMarkup)
+    table_config      DataTable configuration of the paged category (EditorDepict.getDataTableTemplate)
+    page_fetch        first page of the paged category
+    page_fetch_last   last page of the paged category
+    page_search       page of the paged category with a global search filter
+    validate_edit     validation of a proposed value against the dictionary
+    edit              update of a single value
+    row_insert        insertion of a row after the last row of audit_author
+    row_delete        deletion of the last row of audit_author (removing the rows inserted before)
+    mandatory_check   check for missing mandatory items
+    dict_violations   check of all values against dictionary constraints
+    export            export of the data store to an mmCIF file
+
+For each scenario the minimum, median and maximum time over the repeats (ms) are reported, with
+the persisted store access of the last repeat.  A scenario is marked failed if a repeat raised or
+reported ok false, no rows or no output bytes.  Results are written as JSON for trend tracking.
+
+With --baseline FILE the key scenarios are run on the entry size and with the repeats of a stored
+baseline and compared with it, the exit status being 1 on a regression (see EditorBenchmarkBaseline).
+With --save-baseline FILE a baseline is written from the results of the run.
+
+Logging is off (WARNING) unless --log-level LEVEL is given, records then being written to
+editor_bench.log in the work directory, with any per-subsystem levels of --log-levels (see
+EditorLogging.setLevels) and, with --log-queue, through a QueueHandler as in a server with site
+setting EDITOR_LOG_QUEUE.
+
+Usage:
+    python -m wwpdb.apps.editormodule.bench.EditorBenchmark [--atoms N] [--authors N] [--entities N] \\
+        [--struct-conn N] [--categories N] [--dict FILE] [--repeat N] [--scenario NAME ...] [--output FILE] \\
+        [--baseline FILE [--tolerance FRACTION] | --save-baseline FILE] [--log-level LEVEL [--log-levels SPEC] [--log-queue]]
+
+"""
+__docformat__ = "restructuredtext en"
+__author__ = "Raul Sala"
+__email__ = "rsala@rcsb.rutgers.edu"
+__license__ = "Creative Commons Attribution 3.0 Unported"
+__version__ = "V0.01"
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+import logging
+
+from wwpdb.apps.editormodule.bench.EditorBenchmarkBaseline import EditorBenchmarkBaseline, KEY_SCENARIOS, calibrate, isScenarioFailed
+from wwpdb.apps.editormodule.bench.SyntheticEntry import SyntheticEntryGenerator
+from wwpdb.apps.editormodule.config.EditorAppContext import EditorAppContext
+from wwpdb.apps.editormodule.config import EditorLogging
+from wwpdb.apps.editormodule.io.EditorMemoryProfile import EditorMemoryProfile
+from wwpdb.apps.editormodule.io.EditorStoreTrace import EditorStoreTrace
+from wwpdb.apps.editormodule.io.PdbxDataIo import PdbxDataIo
+from wwpdb.apps.editormodule.webapp.EditorLaunchPipeline import EditorLaunchPipeline
+from wwpdb.apps.editormodule.webapp.WebRequest import EditorInputRequest
+
+logger = logging.getLogger(__name__)
+
+
+def summarizeTimes(msL):
+    """Return minimum, median and maximum of a list of times (ms)"""
+    msL = sorted(msL)
+    return {"ms_min": round(msL[0], 2), "ms_median": round(msL[len(msL) // 2], 2), "ms_max": round(msL[-1], 2), "runs": len(msL)}
+
+
+class EditorBenchmark(object):
+    """Time editor operations on a synthetic entry in a local session area"""
+
+    SITE_ID = "EDITOR_BENCH"
+    SCENARIOS = [
+        "launch",
+        "relaunch",
+        "launch_template",
+        "jmol_template",
+        "table_config",
+        "page_fetch",
+        "page_fetch_last",
+        "page_search",
+        "validate_edit",
+        "edit",
+        "row_insert",
+        "row_delete",
+        "mandatory_check",
+        "dict_violations",
+        "export",
+    ]
+
+    def __init__(self, workPath, generator=None, repeat=3, dictFilePath=None, scenarios=None, pageCategory="atom_site", pageLength=25, verbose=False, log=sys.stderr):
+        """
+        :param `workPath`:      directory for the session area, model file and dictionary (created if necessary)
+        :param `generator`:     SyntheticEntryGenerator for the entry (default size if None)
+        :param `repeat`:        number of timed calls per scenario
+        :param `dictFilePath`:  PDBx dictionary to use instead of one generated for the synthetic entry
+        :param `scenarios`:     names of scenarios to run (all if None)
+        :param `pageCategory`:  category for table configuration and page fetch scenarios
+
+        """
+        self.__verbose = verbose
+        self.__lfh = log
+        self.__workPath = os.path.abspath(workPath)
+        self.__generator = generator if generator is not None else SyntheticEntryGenerator()
+        self.__repeat = max(1, repeat)
+        self.__dictFilePath = dictFilePath
+        self.__scenarioL = [name for name in self.SCENARIOS if scenarios is None or name in scenarios]
+        self.__pageCategory = pageCategory
+        self.__pageLength = pageLength
+        self.__topSessionPath = os.path.join(self.__workPath, "sessions_top")
+        self.__modelFileName = "bench-model.cif"
+        self.__modelFilePath = os.path.join(self.__workPath, self.__modelFileName)
+        self.__launchCount = 0
+        self.__insertCount = 0
+
+    def setUp(self):
+        """Write model file and dictionary, and install the local application context"""
+        # sessions of an earlier run in the same work directory would be relaunched rather than launched
+        if os.path.isdir(self.__topSessionPath):
+            shutil.rmtree(self.__topSessionPath)
+        os.makedirs(os.path.join(self.__topSessionPath, "sessions"))
+        self.__generator.writeEntry(self.__modelFilePath)
+        if self.__dictFilePath is None:
+            self.__dictFilePath = self.__generator.writeDictionary(os.path.join(self.__workPath, "mmcif_pdbx_bench.dic"))
+        EditorAppContext.installLocal(self.SITE_ID, self.__topSessionPath, self.__dictFilePath)
+
+    def __getReqObj(self, sessionId, paramD=None):
+        """Request object as built by EditorWebApp for a non-workflow session on the local model file"""
+        parameterDict = {
+            "TopSessionPath": [self.__topSessionPath],
+            "TemplatePath": [EditorAppContext.get(self.SITE_ID).getTemplatePath()],
+            "WWPDB_SITE_ID": [self.SITE_ID],
+            "sessionid": [sessionId],
+            "datafile": [self.__modelFileName],
+            "filesource": ["upload"],
+            "identifier": ["D_800001"],
+            "store_cache": ["n"],
+        }
+        for name, value in (paramD or {}).items():
+            parameterDict[name] = [value]
+        return EditorInputRequest(parameterDict, verbose=self.__verbose, log=self.__lfh)
+
+    def __newSession(self):
+        """Return request object for a new session holding a copy of the model file"""
+        self.__launchCount += 1
+        reqObj = self.__getReqObj("bench_launch_%d" % self.__launchCount)
+        shutil.copyfile(self.__modelFilePath, os.path.join(reqObj.newSessionObj().getPath(), self.__modelFileName))
+        return reqObj
+
+    def __launch(self, reqObj):
+        pdbxDataIo = PdbxDataIo(reqObj, self.__verbose, self.__lfh)
+        launchPipeline = EditorLaunchPipeline(pdbxDataIo, parallel=True, verbose=self.__verbose, log=self.__lfh)
+        dataBlockName, entryTitle, _entryAccessionIdsLst = launchPipeline.run()
+        reqObj.setValue("datablockname", dataBlockName)
+        reqObj.setValue("entrytitle", entryTitle)
+        defView = pdbxDataIo.getDefView()
+        if defView:
+            reqObj.setValue("defview", defView)
+        return launchPipeline.getTimings()
+
+    def __timeScenario(self, name, reqObj):
+        """Time repeated calls of scenario name, returning summary of times and store access"""
+        mth = getattr(self, "_scenario_" + name)
+        msL = []
+        traceD = {}
+        extraD = {}
+        bFailed = False
+        for _ in range(self.__repeat):
+            callReqObj = self.__newSession() if name == "launch" else reqObj
+            EditorStoreTrace.begin()
+            t0 = time.time()
+            try:
+                extraD = mth(callReqObj) or {}
+            finally:
+                msL.append((time.time() - t0) * 1000.0)
+                traceD = EditorStoreTrace.end()
+            if isScenarioFailed(extraD):
+                logger.warning("benchmark scenario %s did not complete: %r", name, extraD)
+                bFailed = True
+        rD = summarizeTimes(msL)
+        rD["stores"] = dict((storeNm, dict((key, sD[key]) for key in ["opens", "fetches", "updates"])) for storeNm, sD in traceD.get("stores", {}).items())
+        rD.update(extraD)
+        if bFailed:
+            rD["failed"] = True
+        return rD
+
+    def run(self):
+        """Run scenarios and return dictionary of results"""
+        self.setUp()
+        #
+        reqObj = self.__newSession()
+        t0 = time.time()
+        self.__launch(reqObj)
+        setupMs = (time.time() - t0) * 1000.0
+        #
+        scenarioD = {}
+        for name in self.__scenarioL:
+            try:
+                scenarioD[name] = self.__timeScenario(name, reqObj)
+            except:  # noqa: E722 pylint: disable=bare-except
+                logger.exception("benchmark scenario %s failed", name)
+                scenarioD[name] = {"failed": True}
+            if self.__verbose:
+                logger.info("scenario %s: %r", name, scenarioD[name])
+        return {
+            "benchmark": "editor_ops",
+            "python": platform.python_version(),
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime()),
+            "entry": self.__generator.getSize(),
+            "model_file_bytes": os.path.getsize(self.__modelFilePath),
+            "dictionary": "synthetic" if self.__dictFilePath.startswith(self.__workPath) else self.__dictFilePath,
+            "page_category": self.__pageCategory,
+            "repeat": self.__repeat,
+            "setup_launch_ms": round(setupMs, 2),
+            "peak_rss_bytes": EditorMemoryProfile.getPeakRss(),
+            "scenarios": scenarioD,
+        }
+
+    # ------------------------------------------------------------------------------------------------------------
+    #      Scenarios - each is passed the request object of the launched session (a new session for "launch")
+    # ------------------------------------------------------------------------------------------------------------
+    #
+    def _scenario_launch(self, reqObj):
+        return {"stage_ms": self.__launch(reqObj)}
+
+    def _scenario_relaunch(self, reqObj):
+        return {"stage_ms": self.__launch(reqObj)}
+
+    def _scenario_launch_template(self, reqObj):
+        from wwpdb.apps.editormodule.depict.EditorDepict import EditorDepict  # pylint: disable=import-outside-toplevel
+
+        edtrDpct = EditorDepict(self.__verbose, self.__lfh)
+        edtrDpct.setSessionPaths(reqObj)
+        return {"bytes": len("\n".join(edtrDpct.doRender(reqObj, False)))}
+
+    def _scenario_jmol_template(self, reqObj):
+        from wwpdb.apps.editormodule.depict.EditorDepict import EditorDepict  # pylint: disable=import-outside-toplevel
+
+        # viewer markup for the first struct_conn row, as requested from the struct_conn table
+        pdbxDataIo = PdbxDataIo(reqObj, self.__verbose, self.__lfh)
+        _bOk, colList = pdbxDataIo.getCategoryColList("struct_conn")
+        rowList, _iTotal, _iDisplay = pdbxDataIo.getCategoryRowList("struct_conn", 0, 1, "", {})
+        jmolReqObj = self.__getReqObj(reqObj.getSessionId(), {"cifctgry": "struct_conn", "row_idx": "row_0", "row_key_value_json": json.dumps(dict(zip(colList, rowList[0])))})
+        jmolReqObj.setValue("RelativeSessionPath", jmolReqObj.newSessionObj().getRelativePath())
+        edtrDpct = EditorDepict(verbose=self.__verbose, log=self.__lfh)
+        return {"bytes": len("".join(edtrDpct.getJmolMarkup(jmolReqObj, False)))}
+
+    def _scenario_table_config(self, reqObj):
+        from wwpdb.apps.editormodule.depict.EditorDepict import EditorDepict  # pylint: disable=import-outside-toplevel
+
+        edtrDpct = EditorDepict(verbose=self.__verbose, log=self.__lfh)
+        _dataTblTmplt, catObjDict = edtrDpct.getDataTableTemplate(reqObj, self.__pageCategory, labelName=self.__pageCategory)
+        return {"columns": len(catObjDict.get("COLUMN_DISPLAY_ORDER", []))}
+
+    def __fetchPage(self, reqObj, iDisplayStart, sSearch):
+        pdbxDataIo = PdbxDataIo(reqObj, self.__verbose, self.__lfh)
+        _bOk, _ctgryColList = pdbxDataIo.getCategoryColList(self.__pageCategory)
+        rowList, iTotal, iDisplay = pdbxDataIo.getCategoryRowList(self.__pageCategory, iDisplayStart, self.__pageLength, sSearch, {})
+        return {"rows": len(rowList), "total_rows": iTotal, "display_rows": iDisplay}
+
+    def _scenario_page_fetch(self, reqObj):
+        return self.__fetchPage(reqObj, 0, "")
+
+    def _scenario_page_fetch_last(self, reqObj):
+        _bOk, rowCount = self.__getRowCount(reqObj, self.__pageCategory)
+        return self.__fetchPage(reqObj, max(0, rowCount - self.__pageLength), "")
+
+    def _scenario_page_search(self, reqObj):
+        return self.__fetchPage(reqObj, 0, "ALA")
+
+    def __getRowCount(self, reqObj, ctgryNm):
+        pdbxDataIo = PdbxDataIo(reqObj, self.__verbose, self.__lfh)
+        _rowList, iTotal, _iDisplay = pdbxDataIo.getCategoryRowList(ctgryNm, 0, 1, "", {})
+        return True, iTotal
+
+    def _scenario_validate_edit(self, reqObj):
+        pdbxDataIo = PdbxDataIo(reqObj, self.__verbose, self.__lfh)
+        _bOk, colList = pdbxDataIo.getCategoryColList("entity")
+        return {"result": pdbxDataIo.validateItemValue("entity", "123.456", 0, colList.index("formula_weight"))}
+
+    def _scenario_edit(self, reqObj):
+        pdbxDataIo = PdbxDataIo(reqObj, self.__verbose, self.__lfh)
+        _bOk, colList = pdbxDataIo.getCategoryColList("struct")
+        return {"ok": pdbxDataIo.setItemValue("struct", "Benchmark title %s" % time.time(), 0, colList.index("title"))}
+
+    def _scenario_row_insert(self, reqObj):
+        _bOk, rowCount = self.__getRowCount(reqObj, "audit_author")
+        pdbxDataIo = PdbxDataIo(reqObj, self.__verbose, self.__lfh)
+        bOk = pdbxDataIo.insertRows(p_ctgryNm="audit_author", p_rowIdx=rowCount - 1, p_relativePos="after", p_iNumRows=1)
+        self.__insertCount += 1 if bOk else 0
+        return {"ok": bOk}
+
+    def _scenario_row_delete(self, reqObj):
+        _bOk, rowCount = self.__getRowCount(reqObj, "audit_author")
+        if self.__insertCount < 1:
+            return {"skipped": True}
+        pdbxDataIo = PdbxDataIo(reqObj, self.__verbose, self.__lfh)
+        bOk, _sErrMsg = pdbxDataIo.deleteRows("audit_author", rowCount - 1, 1)
+        self.__insertCount -= 1 if bOk else 0
+        return {"ok": bOk}
+
+    def _scenario_mandatory_check(self, reqObj):
+        # check of all categories of the current view (cifctgry=all) - without cifctgry no category is checked
+        pdbxDataIo = PdbxDataIo(self.__getReqObj(reqObj.getSessionId(), {"cifctgry": "all"}), self.__verbose, self.__lfh)
+        return {"result_len": len(pdbxDataIo.checkForMandatoryItems()["violation_map"])}
+
+    def _scenario_dict_violations(self, reqObj):
+        pdbxDataIo = PdbxDataIo(self.__getReqObj(reqObj.getSessionId(), {"cifctgry": "all"}), self.__verbose, self.__lfh)
+        return {"result_len": len(pdbxDataIo.checkForDictViolations()["violation_map"])}
+
+    def _scenario_export(self, reqObj):
+        pdbxDataIo = PdbxDataIo(reqObj, self.__verbose, self.__lfh)
+        exprtDirPath = os.path.join(self.__workPath, "export")
+        if not os.path.isdir(exprtDirPath):
+            os.makedirs(exprtDirPath)
+        exprtFilePath = os.path.join(exprtDirPath, "bench-model-export.cif")
+        bOk = pdbxDataIo.doExport(exprtDirPath, exprtFilePath)
+        return {"ok": bool(bOk), "bytes": os.path.getsize(exprtFilePath) if bOk else 0}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark of editor operations on a synthetic entry")
+    parser.add_argument("--atoms", type=int, default=20000)
+    parser.add_argument("--authors", type=int, default=20)
+    parser.add_argument("--entities", type=int, default=4)
+    parser.add_argument("--struct-conn", type=int, default=200)
+    parser.add_argument("--categories", type=int, default=50, help="Number of additional small categories")
+    parser.add_argument("--dict", help="PDBx dictionary file to use instead of one generated for the synthetic entry")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--scenario", action="append", choices=EditorBenchmark.SCENARIOS, help="Scenario to run (repeatable, default all)")
+    parser.add_argument("--work-dir", help="Directory for session area and generated files (default: temporary, removed afterwards)")
+    parser.add_argument("--output", help="Write JSON results to this file")
+    parser.add_argument("--baseline", help="Compare key scenarios with this baseline, run on its entry size and repeats")
+    parser.add_argument("--tolerance", type=float, help="Allowed slowdown relative to the baseline as a fraction (default from baseline)")
+    parser.add_argument("--save-baseline", help="Write a baseline of the scenarios run (default key scenarios) to this file")
+    parser.add_argument("--log-level", help="Log at this level to editor_bench.log in the work directory (default: no logging)")
+    parser.add_argument("--log-levels", help="Per-subsystem levels NAME=LEVEL[,NAME=LEVEL ...], e.g. io=WARNING")
+    parser.add_argument("--log-queue", action="store_true", default=False, help="Log through a queue handler and listener thread")
+    args = parser.parse_args()
+
+    baseline = EditorBenchmarkBaseline.fromFile(args.baseline) if args.baseline else None
+    if baseline is not None:
+        sizeD = baseline.getEntrySize()
+        generator = SyntheticEntryGenerator(
+            entities=sizeD["entities"], authors=sizeD["authors"], structConnRows=sizeD["struct_conn"], categories=sizeD["categories"], atoms=sizeD["atoms"]
+        )
+        repeat, scenarioL = baseline.getRepeat(), baseline.getScenarios()
+    else:
+        generator = SyntheticEntryGenerator(entities=args.entities, authors=args.authors, structConnRows=args.struct_conn, categories=args.categories, atoms=args.atoms)
+        repeat, scenarioL = args.repeat, args.scenario
+        if args.save_baseline and not scenarioL:
+            # scenarios of a baseline are run alone, as they will be on comparison (earlier scenarios may add to the store)
+            scenarioL = KEY_SCENARIOS
+    # reference workload timed before and after the run, the faster of the two standing for the speed of the host
+    calibrationMs = calibrate() if baseline is not None or args.save_baseline else None
+    workPath = args.work_dir if args.work_dir else tempfile.mkdtemp(prefix="editor_bench_")
+    if args.log_level:
+        if not os.path.isdir(workPath):
+            os.makedirs(workPath)
+        logging.basicConfig(filename=os.path.join(workPath, "editor_bench.log"), level=args.log_level.upper(), format="%(asctime)s %(levelname)s %(name)s %(message)s")
+        EditorLogging.setLevels(args.log_levels)
+        if args.log_queue:
+            EditorLogging.installQueue()
+    try:
+        rD = EditorBenchmark(workPath, generator=generator, repeat=repeat, dictFilePath=args.dict, scenarios=scenarioL).run()
+    finally:
+        EditorLogging.stopQueue()
+        if not args.work_dir:
+            shutil.rmtree(workPath, ignore_errors=True)
+    bOk = not [name for name, sD in rD["scenarios"].items() if sD.get("failed")]
+    if calibrationMs is not None:
+        calibrationMs = min(calibrationMs, calibrate())
+        if baseline is not None:
+            rD["comparison"] = baseline.compare(rD, calibrationMs, tolerance=args.tolerance)
+            bOk = bOk and rD["comparison"]["ok"]
+        if args.save_baseline:
+            EditorBenchmarkBaseline.fromResult(rD, calibrationMs, tolerance=args.tolerance if args.tolerance is not None else 0.5, scenarios=scenarioL).write(args.save_baseline)
+    if args.output:
+        with open(args.output, "w") as ofh:
+            json.dump(rD, ofh, indent=2, sort_keys=True)
+    print(json.dumps(rD, indent=2, sort_keys=True))
+    return 0 if bOk else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
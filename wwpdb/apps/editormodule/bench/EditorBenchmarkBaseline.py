@@ -0,0 +1,162 @@
+##
+# File:    EditorBenchmarkBaseline.py
+# Date:    19-Oct-2026
+#
+# Updates:
+#    2026-10-19    RPS    Scenarios reporting ok false, no rows or no output counted as failed (isScenarioFailed()).
+##
+"""
+Baselines for the editor operations benchmark (see EditorBenchmark), for catching performance
+regressions in PdbxDataIo/EditorDepict before release.
+
+A baseline records, for the key scenarios, the minimum time of the scenario and the persisted
+store access of the scenario, with the size of the synthetic entry and the number of repeats it
+was taken with.  A benchmark run on the same entry is compared with it:
+
+  - times are compared relative to the time of a fixed pure Python reference workload run on
+    the same host (calibrate()), so that a baseline taken on one machine can be used on another
+    of different speed.  A scenario has regressed when its relative time exceeds that of the
+    baseline by more than the tolerance (a fraction, e.g. 0.5 for 50% slower).  Scenarios given
+    to more variation between runs (launch, which overlaps parsing in two threads) may carry
+    their own tolerance in the baseline.
+  - store opens, fetches and updates do not depend on the host, and any increase over the
+    baseline is a regression.
+  - a scenario that raised, or whose result reports ok false, no rows or no output bytes, has
+    failed (isScenarioFailed()), as its time is not that of the operation.
+
+The baseline in this directory (editor_ops_baseline.json) is checked with
+
+    python -m wwpdb.apps.editormodule.bench.EditorBenchmark --baseline wwpdb/apps/editormodule/bench/editor_ops_baseline.json
+
+(tox environment bench_regression), and is renewed with --save-baseline FILE after intended changes.
+
+"""
+__docformat__ = "restructuredtext en"
+__author__ = "Raul Sala"
+__email__ = "rsala@rcsb.rutgers.edu"
+__license__ = "Creative Commons Attribution 3.0 Unported"
+__version__ = "V0.01"
+
+import json
+import time
+import platform
+import logging
+
+logger = logging.getLogger(__name__)
+
+# launch of a large entry, page fetch on the 20k row atom_site category, a single edit, full validation and export
+KEY_SCENARIOS = ["launch", "page_fetch", "edit", "mandatory_check", "dict_violations", "export"]
+STORE_COUNTS = ["opens", "fetches", "updates"]
+
+
+def isScenarioFailed(sD):
+    """Return True if scenario result sD is missing, failed, or reports ok false, no rows or no output bytes"""
+    if sD is None or sD.get("failed"):
+        return True
+    return sD.get("ok") is False or sD.get("rows") == 0 or sD.get("bytes") == 0
+
+
+def calibrate(rounds=15):
+    """Return minimum time (ms) of a fixed pure Python reference workload (string, dict and sort operations)"""
+    msL = []
+    for _ in range(rounds):
+        t0 = time.time()
+        rowD = {}
+        for ii in range(20000):
+            rowD["ATOM_%d" % ii] = [str(ii % 97), "%.3f" % (ii * 0.5), "CA"]
+        text = "\n".join(" ".join(rowD[key]) for key in sorted(rowD))
+        msL.append((time.time() - t0) * 1000.0)
+        logger.debug("calibration round of %d characters in %.2f ms", len(text), msL[-1])
+    return min(msL)
+
+
+class EditorBenchmarkBaseline(object):
+    """Baseline of benchmark scenario times and store access"""
+
+    def __init__(self, baselineD):
+        self.__baselineD = baselineD
+
+    @classmethod
+    def fromFile(cls, filePath):
+        with open(filePath, "r") as ifh:
+            return cls(json.load(ifh))
+
+    @classmethod
+    def fromResult(cls, resultD, calibrationMs, tolerance=0.5, scenarios=None):
+        """Baseline from benchmark results resultD (EditorBenchmark.run()) for the given (default key) scenarios"""
+        scenarioD = {}
+        for name in scenarios or KEY_SCENARIOS:
+            sD = resultD["scenarios"].get(name)
+            if isScenarioFailed(sD):
+                continue
+            scenarioD[name] = {"ms_min": sD["ms_min"], "relative": round(sD["ms_min"] / calibrationMs, 4), "stores": sD.get("stores", {})}
+        return cls(
+            {
+                "benchmark": resultD["benchmark"],
+                "python": platform.python_version(),
+                "time": resultD["time"],
+                "entry": resultD["entry"],
+                "repeat": resultD["repeat"],
+                "calibration_ms": round(calibrationMs, 2),
+                "tolerance": tolerance,
+                "scenarios": scenarioD,
+            }
+        )
+
+    def get(self):
+        return self.__baselineD
+
+    def getEntrySize(self):
+        return self.__baselineD["entry"]
+
+    def getRepeat(self):
+        return self.__baselineD.get("repeat", 3)
+
+    def getScenarios(self):
+        return sorted(self.__baselineD["scenarios"])
+
+    def write(self, filePath):
+        with open(filePath, "w") as ofh:
+            json.dump(self.__baselineD, ofh, indent=2, sort_keys=True)
+            ofh.write("\n")
+
+    def compare(self, resultD, calibrationMs, tolerance=None):
+        """Compare benchmark results resultD with the baseline.
+
+        :Returns:
+            dictionary with 'ok' (False on any regression or failed scenario) and per scenario details
+
+        """
+        tolerance = tolerance if tolerance is not None else self.__baselineD.get("tolerance", 0.5)
+        compD = {}
+        bOk = True
+        for name, bD in self.__baselineD["scenarios"].items():
+            sD = resultD["scenarios"].get(name)
+            if isScenarioFailed(sD):
+                compD[name] = {"failed": True}
+                bOk = False
+                logger.warning("scenario %s failed: %r", name, sD)
+                continue
+            relative = sD["ms_min"] / calibrationMs
+            change = relative / bD["relative"] - 1.0 if bD["relative"] > 0 else 0.0
+            storeRegressionL = []
+            for storeNm, countD in sD.get("stores", {}).items():
+                baseCountD = bD.get("stores", {}).get(storeNm, {})
+                for key in STORE_COUNTS:
+                    if countD.get(key, 0) > baseCountD.get(key, 0):
+                        storeRegressionL.append("%s %s %d > %d" % (storeNm, key, countD.get(key, 0), baseCountD.get(key, 0)))
+            cD = {
+                "baseline_ms": bD["ms_min"],
+                "ms": sD["ms_min"],
+                "baseline_relative": bD["relative"],
+                "relative": round(relative, 4),
+                "change": round(change, 4),
+                "tolerance": bD.get("tolerance", tolerance),
+                "time_regressed": change > bD.get("tolerance", tolerance),
+                "store_regressions": storeRegressionL,
+            }
+            compD[name] = cD
+            if cD["time_regressed"] or storeRegressionL:
+                bOk = False
+                logger.warning("scenario %s regressed: time change %+.1f%% (tolerance %.0f%%) %s", name, change * 100.0, cD["tolerance"] * 100.0, "; ".join(storeRegressionL))
+        return {"ok": bOk, "calibration_ms": round(calibrationMs, 2), "baseline_calibration_ms": self.__baselineD.get("calibration_ms"), "scenarios": compD}
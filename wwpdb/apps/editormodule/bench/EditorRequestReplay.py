@@ -0,0 +1,245 @@
+##
+# File:    EditorRequestReplay.py
+# Date:    19-Oct-2026
+#
+# Updates:
+#    2026-10-19    RPS    Replayed requests matched to their log records by sequence number (parameter replay_seq).
+##
+"""
+Offline replay of recorded editor sessions (see webapp.EditorRequestRecorder) against a fresh
+EditorWebApp in this process, without the web server or workflow system.
+
+Requests from all given logs are replayed one at a time in the order they were originally received,
+each recorded session being mapped to a new session.  By default requests are sent as fast as
+possible - with --pace the recorded gaps between requests are kept.  Replayed requests are
+themselves recorded, so that their handling times and error flags are measured as for the
+original requests.  Each replayed request carries its position in the replay as parameter
+replay_seq, by which its log record is found; requests without a log record are counted as unlogged.
+
+Files uploaded in the original session are taken from --upload-dir, by file name.  With
+--model-file, each session is instead launched on the given model file as an upload, so that
+sessions recorded under the workflow system can be replayed without its archive.
+
+The site configuration is that of --site-id, or with --sessions-dir and --dict a local
+application context (EditorAppContext.installLocal) with any --setting NAME=VALUE site settings
+(e.g. to compare store backends on the same workload).
+
+For each route, the minimum, median and maximum of recorded and replayed handling times (ms)
+are reported, with requests whose error flag differs from the recording.
+
+Usage:
+    python -m wwpdb.apps.editormodule.bench.EditorRequestReplay LOG [LOG ...] \\
+        [--site-id ID | --sessions-dir DIR --dict FILE [--setting NAME=VALUE ...]] \\
+        [--upload-dir DIR] [--model-file FILE] [--pace] [--output FILE]
+
+where LOG is a session directory or its editor_request_log.jsonl.
+
+"""
+__docformat__ = "restructuredtext en"
+__author__ = "Raul Sala"
+__email__ = "rsala@rcsb.rutgers.edu"
+__license__ = "Creative Commons Attribution 3.0 Unported"
+__version__ = "V0.01"
+
+import io
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import logging
+
+from wwpdb.apps.editormodule.bench.EditorBenchmark import summarizeTimes
+from wwpdb.apps.editormodule.config.EditorAppContext import EditorAppContext
+from wwpdb.apps.editormodule.webapp.EditorRequestRecorder import EditorRequestRecorder
+
+logger = logging.getLogger(__name__)
+
+
+class ReplayUpload(object):
+    """File upload from a local file, in place of the cgi.FieldStorage of the recorded request"""
+
+    def __init__(self, filePath):
+        self.filename = os.path.basename(filePath)
+        with open(filePath, "rb") as ifh:
+            self.file = io.BytesIO(ifh.read())
+
+
+class EditorRequestReplay(object):
+    """Replay recorded editor requests against EditorWebApp"""
+
+    LAUNCH_ROUTES = ["/service/editor/launch", "/service/editor/new_session/wf", "/service/editor/wf/new_session"]
+    LOCAL_SITE_ID = "EDITOR_REPLAY"
+
+    def __init__(self, logPathList, siteId, uploadPath=None, modelFilePath=None, pace=False, verbose=False, log=sys.stderr):
+        """
+        :param `logPathList`:   request logs (or session directories holding them) to replay
+        :param `siteId`:        site id for EditorWebApp
+        :param `uploadPath`:    directory holding the files uploaded in the recorded sessions
+        :param `modelFilePath`: model file uploaded on launch of each session, in place of the recorded source
+        :param `pace`:          keep the recorded gaps between requests
+
+        """
+        self.__verbose = verbose
+        self.__lfh = log
+        self.__siteId = siteId
+        self.__uploadPath = uploadPath
+        self.__modelFilePath = modelFilePath
+        self.__pace = pace
+        self.__recL = []
+        for logPath in logPathList:
+            self.__recL.extend(EditorRequestRecorder.readLog(logPath))
+        self.__recL.sort(key=lambda recD: recD.get("t", 0.0))
+        self.__runTag = "%d" % int(time.time() * 1000)
+        self.__sessionIdD = {}
+
+    def getRequestCount(self):
+        return len(self.__recL)
+
+    def __getSessionId(self, recSessionId):
+        """Return id of the new session for a recorded session, creating the session directory on first use"""
+        if recSessionId not in self.__sessionIdD:
+            sessionId = "%s_replay_%s" % (recSessionId, self.__runTag)
+            appCtx = EditorAppContext.get(self.__siteId)
+            appCtx.getSessionObj(appCtx.getTopSessionPath(), sessionId)
+            self.__sessionIdD[recSessionId] = sessionId
+        return self.__sessionIdD[recSessionId]
+
+    def __getUpload(self, fileName):
+        filePath = os.path.join(self.__uploadPath, fileName) if self.__uploadPath else None
+        if filePath is None or not os.access(filePath, os.R_OK):
+            logger.warning("uploaded file %s not available, request replayed without it", fileName)
+            return ""
+        return ReplayUpload(filePath)
+
+    def __getParameterDict(self, recD, seq):
+        """Recorded parameters with session id mapped to the new session, uploads supplied again and replay sequence number seq"""
+        bModelLaunch = self.__modelFilePath is not None and recD.get("sessionid") and recD.get("params", {}).get("request_path", [""])[0] in self.LAUNCH_ROUTES
+        parameterDict = {}
+        for name, vL in recD.get("params", {}).items():
+            if bModelLaunch and name == "cifinput":
+                continue
+            parameterDict[name] = [self.__getUpload(v[EditorRequestRecorder.UPLOAD_KEY]) if EditorRequestRecorder.isUpload(v) else v for v in vL]
+        if recD.get("sessionid"):
+            parameterDict["sessionid"] = [self.__getSessionId(recD["sessionid"])]
+        if self.__modelFilePath is not None and recD.get("sessionid"):
+            parameterDict["filesource"] = ["upload"]
+        if bModelLaunch:
+            parameterDict["cifinput"] = [ReplayUpload(self.__modelFilePath)]
+        parameterDict["record_requests"] = ["y"]
+        parameterDict["replay_seq"] = [str(seq)]
+        return parameterDict
+
+    def __doRequest(self, parameterDict):
+        from wwpdb.apps.editormodule.webapp.EditorWebApp import EditorWebApp  # pylint: disable=import-outside-toplevel
+
+        rD = EditorWebApp(parameterDict=parameterDict, verbose=self.__verbose, log=self.__lfh, siteId=self.__siteId).doOp()
+        if rD.get("RETURN_ITERABLE") is not None:
+            # streamed content is produced as it is delivered
+            for _chunk in rD["RETURN_ITERABLE"]:
+                pass
+
+    def run(self):
+        """Replay requests and return dictionary of results"""
+        replayL = []
+        t0 = time.time()
+        tRec0 = self.__recL[0].get("t", 0.0) if self.__recL else 0.0
+        for seq, recD in enumerate(self.__recL):
+            if self.__pace:
+                waitSecs = (recD.get("t", 0.0) - tRec0) - (time.time() - t0)
+                if waitSecs > 0:
+                    time.sleep(waitSecs)
+            parameterDict = self.__getParameterDict(recD, seq)
+            try:
+                self.__doRequest(parameterDict)
+            except:  # noqa: E722 pylint: disable=bare-except
+                logger.exception("replay of %s failed", recD.get("route"))
+            replayL.append((recD, parameterDict.get("sessionid", [None])[0]))
+        totalSecs = time.time() - t0
+        #
+        # handling time and error flag of each replayed request, from the request logs of the new sessions
+        # replay sequence number -> log record
+        rplD = {}
+        sessionsPath = os.path.join(EditorAppContext.get(self.__siteId).getTopSessionPath(), "sessions")
+        for sessionId in self.__sessionIdD.values():
+            try:
+                rplRecL = EditorRequestRecorder.readLog(os.path.join(sessionsPath, sessionId))
+            except IOError:
+                rplRecL = []
+            for rplRecD in rplRecL:
+                seqL = rplRecD.get("params", {}).get("replay_seq")
+                if seqL:
+                    rplD[seqL[0]] = rplRecD
+        #
+        routeD = {}
+        mismatchL = []
+        errorCount = 0
+        unloggedCount = 0
+        for ii, (recD, sessionId) in enumerate(replayL):
+            route = recD.get("route", "unknown")
+            rD = routeD.setdefault(route, {"recorded": [], "replay": []})
+            rD["recorded"].append(recD.get("ms", 0.0))
+            rplRecD = rplD.get(str(ii))
+            if rplRecD is None:
+                # request without session, or replay failed before its handling completed
+                unloggedCount += 1 if sessionId is not None else 0
+                continue
+            rD["replay"].append(rplRecD["ms"])
+            errorCount += 1 if rplRecD["error"] else 0
+            if rplRecD["error"] != recD.get("error", False):
+                mismatchL.append({"index": ii, "route": route, "recorded_error": recD.get("error", False), "replay_error": rplRecD["error"]})
+        return {
+            "replay": "editor_requests",
+            "python": platform.python_version(),
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime()),
+            "site_id": self.__siteId,
+            "sessions": len(self.__sessionIdD),
+            "requests": len(replayL),
+            "errors": errorCount,
+            "unlogged": unloggedCount,
+            "total_ms": round(totalSecs * 1000.0, 2),
+            "mismatches": mismatchL,
+            "routes": dict((route, dict((key, summarizeTimes(msL)) for key, msL in rD.items() if msL)) for route, rD in routeD.items()),
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay recorded editor sessions")
+    parser.add_argument("logs", nargs="+", help="request logs, or session directories holding them")
+    parser.add_argument("--site-id", default=None, help="site id of the site configuration to use")
+    parser.add_argument("--sessions-dir", default=None, help="parent of the 'sessions' directory, for a local application context")
+    parser.add_argument("--dict", default=None, help="PDBx dictionary file, for a local application context")
+    parser.add_argument("--setting", action="append", default=[], help="site setting NAME=VALUE, for a local application context")
+    parser.add_argument("--upload-dir", default=None, help="directory holding files uploaded in the recorded sessions")
+    parser.add_argument("--model-file", default=None, help="model file to launch each session on")
+    parser.add_argument("--pace", action="store_true", default=False, help="keep the recorded gaps between requests")
+    parser.add_argument("--output", default=None, help="write JSON results to this file")
+    parser.add_argument("-v", "--verbose", action="store_true", default=False)
+    args = parser.parse_args()
+    #
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING, format="%(asctime)s %(levelname)s %(name)s %(message)s")
+    if args.sessions_dir is not None:
+        if args.dict is None:
+            parser.error("--dict is required with --sessions-dir")
+        siteId = EditorRequestReplay.LOCAL_SITE_ID
+        sessionsPath = os.path.join(os.path.abspath(args.sessions_dir), "sessions")
+        if not os.path.isdir(sessionsPath):
+            os.makedirs(sessionsPath)
+        settingD = dict(setting.split("=", 1) for setting in args.setting)
+        EditorAppContext.installLocal(siteId, os.path.abspath(args.sessions_dir), os.path.abspath(args.dict), settingD=settingD)
+    else:
+        siteId = args.site_id or os.getenv("WWPDB_SITE_ID", "WWPDB_DEV")
+    #
+    replay = EditorRequestReplay(args.logs, siteId, uploadPath=args.upload_dir, modelFilePath=args.model_file, pace=args.pace, verbose=args.verbose)
+    rD = replay.run()
+    text = json.dumps(rD, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, "w") as ofh:
+            ofh.write(text + "\n")
+    print(text)
+    return 1 if rD["mismatches"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,295 @@
+##
+# File:    EditorSessionLoadTest.py
+# Date:    19-Oct-2026
+#
+# Updates:
+##
+"""
+Multi-session load test - how many simultaneous annotator sessions one host can serve.
+
+N simulated annotator sessions on a synthetic entry (see SyntheticEntry) are run in a pool of
+worker processes, each request being dispatched through EditorWebApp in the worker (no web
+server), with a local application context (EditorAppContext.installLocal).  Each session follows
+the request sequence of the editor front end:
+
+    launch                            upload of the model file
+    for each navigation (tab selection, cycling through NAVIGATION_TABS):
+        get_multi_dtbl_config_dtls    DataTable configuration of the categories of the tab
+        init_rollback_point           initial snapshot for undo
+        get_dtbl_data                 first page of each category of the tab
+        submit_edit, get_dtbl_data    edits of a value of the tab, each followed by a reload of its category
+        undo                          rollback of the last edit
+    exit_not_finished                 save of the session state
+
+Throughput, latency percentiles (p50/p95/p99) and errors per route are reported, with the
+disk space taken by each session and the growth in resident memory of the worker process
+while it ran each session.  Errors are taken from the request log of each session
+(see webapp.EditorRequestRecorder).
+
+Usage:
+    python -m wwpdb.apps.editormodule.bench.EditorSessionLoadTest [--sessions N] [--processes N] \\
+        [--navigations N] [--edits N] [--think-ms MS] [--atoms N] [--categories N] [--dict FILE] \\
+        [--work-dir DIR] [--output FILE]
+
+"""
+__docformat__ = "restructuredtext en"
+__author__ = "Raul Sala"
+__email__ = "rsala@rcsb.rutgers.edu"
+__license__ = "Creative Commons Attribution 3.0 Unported"
+__version__ = "V0.01"
+
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import platform
+import tempfile
+import multiprocessing
+import logging
+
+from wwpdb.apps.editormodule.bench.AsgiLoadTest import percentile
+from wwpdb.apps.editormodule.bench.EditorRequestReplay import ReplayUpload
+from wwpdb.apps.editormodule.bench.SyntheticEntry import SyntheticEntryGenerator, CATEGORY_SCHEMA
+from wwpdb.apps.editormodule.config.EditorAppContext import EditorAppContext
+from wwpdb.apps.editormodule.io.EditorMemoryProfile import EditorMemoryProfile
+from wwpdb.apps.editormodule.webapp.EditorRequestRecorder import EditorRequestRecorder
+
+logger = logging.getLogger(__name__)
+
+# (categories of the tab, (category, item, value) edited on the tab)
+NAVIGATION_TABS = [
+    (["entry", "struct", "struct_keywords"], ("struct", "title", "Load test title %d")),
+    (["audit_author", "citation", "citation_author"], ("citation", "title", "Load test citation title %d")),
+    (["entity", "entity_poly", "struct_conn"], ("entity", "pdbx_description", "Load test protein %d")),
+    (["atom_site"], ("atom_site", "occupancy", "0.%d")),
+]
+
+# per-process settings of the session workers (set by _initWorker)
+_workerD = {}
+
+
+def _getRss():
+    """Current resident set size of this process in bytes (peak where not available)"""
+    try:
+        with open("/proc/self/statm", "r") as ifh:
+            return int(ifh.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (IOError, OSError, ValueError):
+        return EditorMemoryProfile.getPeakRss()
+
+
+def _getDiskBytes(dirPath):
+    totalBytes = 0
+    for rootPath, _dirL, fileL in os.walk(dirPath):
+        for fileName in fileL:
+            try:
+                totalBytes += os.path.getsize(os.path.join(rootPath, fileName))
+            except OSError:
+                pass
+    return totalBytes
+
+
+def _initWorker(siteId, topSessionPath, dictFilePath, settingD):
+    EditorAppContext.installLocal(siteId, topSessionPath, dictFilePath, settingD=settingD)
+    _workerD.update({"siteId": siteId, "topSessionPath": topSessionPath})
+
+
+def _runSession(args):
+    """Run one simulated session in a worker process - returns per-request timings and session resource use"""
+    sessionId, modelFilePath, navigations, edits, thinkMs = args
+    from wwpdb.apps.editormodule.webapp.EditorWebApp import EditorWebApp  # pylint: disable=import-outside-toplevel
+
+    siteId = _workerD["siteId"]
+    sessionPath = EditorAppContext.get(siteId).getSessionObj(_workerD["topSessionPath"], sessionId).getPath()
+    dataFile = os.path.basename(modelFilePath)
+    requestL = []
+
+    def doOp(requestPath, **paramD):
+        parameterDict = {"request_path": [requestPath], "sessionid": [sessionId], "filesource": ["upload"], "datafile": [dataFile], "record_requests": ["y"]}
+        for name, value in paramD.items():
+            parameterDict[name] = [value]
+        t0 = time.time()
+        rD = EditorWebApp(parameterDict=parameterDict, siteId=siteId).doOp()
+        for _chunk in rD.get("RETURN_ITERABLE") or []:
+            pass
+        requestL.append([requestPath, (time.time() - t0) * 1000.0])
+        if thinkMs > 0:
+            time.sleep(thinkMs / 1000.0)
+
+    rss0 = _getRss()
+    t0 = time.time()
+    doOp("/service/editor/launch", cifinput=ReplayUpload(modelFilePath))
+    for ii in range(navigations):
+        ctgryL, (editCtgry, editItem, editValue) = NAVIGATION_TABS[ii % len(NAVIGATION_TABS)]
+        doOp("/service/editor/get_multi_dtbl_config_dtls", cifctgry="+".join(ctgryL), displabels=",".join(ctgryL), format="json")
+        doOp("/service/editor/init_rollback_point", format="json")
+        for sEcho, ctgry in enumerate(ctgryL):
+            doOp("/service/editor/get_dtbl_data", cifctgry=ctgry, iDisplayStart="0", iDisplayLength="25", sEcho=str(sEcho + 1), sSearch="")
+        colIdx = [attrT[0] for attrT in CATEGORY_SCHEMA[editCtgry][0]].index(editItem)
+        for editActnIndx in range(edits):
+            doOp("/service/editor/submit_edit", cifctgry=editCtgry, row_idx="row_0", col_idx=str(colIdx), new_value=editValue % (editActnIndx + 1), edit_actn_indx=str(editActnIndx))
+            doOp("/service/editor/get_dtbl_data", cifctgry=editCtgry, iDisplayStart="0", iDisplayLength="25", sEcho="1", sSearch="")
+        if edits > 0:
+            doOp("/service/editor/undo", cifctgry=editCtgry, mode="incremental", rewind_idx=str(edits - 1))
+    doOp("/service/editor/exit_not_finished")
+    #
+    # error flags as recorded in the session request log
+    try:
+        recL = EditorRequestRecorder.readLog(sessionPath)
+    except IOError:
+        recL = []
+    for requestT, recD in zip(requestL, recL):
+        requestT.append(recD["error"])
+    return {
+        "session": sessionId,
+        "pid": os.getpid(),
+        "wall_ms": round((time.time() - t0) * 1000.0, 2),
+        "requests": requestL,
+        "disk_bytes": _getDiskBytes(sessionPath),
+        "rss_growth_bytes": _getRss() - rss0,
+    }
+
+
+class EditorSessionLoadTest(object):
+    """Run simulated annotator sessions concurrently in worker processes and report latency, throughput and resource use"""
+
+    SITE_ID = "EDITOR_SESSION_LOAD"
+
+    def __init__(self, workPath, generator=None, sessions=8, processes=4, navigations=4, edits=2, thinkMs=0.0, dictFilePath=None, settingD=None, verbose=False, log=sys.stderr):
+        """
+        :param `workPath`:      directory for the session area, model file and dictionary (created if necessary)
+        :param `generator`:     SyntheticEntryGenerator for the entry (default size if None)
+        :param `sessions`:      number of sessions
+        :param `processes`:     number of worker processes, i.e. of simultaneous sessions
+        :param `navigations`:   tab selections per session
+        :param `edits`:         edits per tab selection
+        :param `thinkMs`:       pause after each request
+        :param `dictFilePath`:  PDBx dictionary to use instead of one generated for the synthetic entry
+        :param `settingD`:      site settings of the local application context
+
+        """
+        self.__verbose = verbose
+        self.__lfh = log
+        self.__workPath = os.path.abspath(workPath)
+        self.__generator = generator if generator is not None else SyntheticEntryGenerator(atoms=5000, categories=10)
+        self.__sessions = sessions
+        self.__processes = max(1, processes)
+        self.__navigations = navigations
+        self.__edits = edits
+        self.__thinkMs = thinkMs
+        self.__dictFilePath = dictFilePath
+        self.__settingD = settingD or {}
+        self.__topSessionPath = os.path.join(self.__workPath, "sessions_top")
+        self.__modelFilePath = os.path.join(self.__workPath, "D_800001_model.cif")
+
+    def setUp(self):
+        """Write model file and dictionary"""
+        if not os.path.isdir(os.path.join(self.__topSessionPath, "sessions")):
+            os.makedirs(os.path.join(self.__topSessionPath, "sessions"))
+        self.__generator.writeEntry(self.__modelFilePath)
+        if self.__dictFilePath is None:
+            self.__dictFilePath = self.__generator.writeDictionary(os.path.join(self.__workPath, "mmcif_pdbx_load.dic"))
+
+    def run(self):
+        """Run sessions and return dictionary of results"""
+        self.setUp()
+        runTag = "%d" % int(time.time() * 1000)
+        argL = [("load_%s_%d" % (runTag, ii + 1), self.__modelFilePath, self.__navigations, self.__edits, self.__thinkMs) for ii in range(self.__sessions)]
+        t0 = time.time()
+        pool = multiprocessing.Pool(processes=self.__processes, initializer=_initWorker, initargs=(self.SITE_ID, self.__topSessionPath, self.__dictFilePath, self.__settingD))
+        try:
+            sessionL = list(pool.imap_unordered(_runSession, argL))
+        finally:
+            pool.close()
+            pool.join()
+        wallS = time.time() - t0
+        #
+        routeD = {}
+        for sD in sessionL:
+            for requestT in sD["requests"]:
+                rD = routeD.setdefault(requestT[0], {"ms": [], "errors": 0})
+                rD["ms"].append(requestT[1])
+                rD["errors"] += 1 if len(requestT) > 2 and requestT[2] else 0
+        requestCount = sum([len(rD["ms"]) for rD in routeD.values()])
+        diskL = [sD["disk_bytes"] for sD in sessionL]
+        rssL = [sD["rss_growth_bytes"] for sD in sessionL if sD["rss_growth_bytes"] is not None]
+        return {
+            "benchmark": "editor_session_load",
+            "python": platform.python_version(),
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime()),
+            "entry": self.__generator.getSize(),
+            "sessions": self.__sessions,
+            "processes": self.__processes,
+            "navigations": self.__navigations,
+            "edits": self.__edits,
+            "think_ms": self.__thinkMs,
+            "wall_s": round(wallS, 3),
+            "requests": requestCount,
+            "errors": sum([rD["errors"] for rD in routeD.values()]),
+            "throughput_rps": round(requestCount / wallS, 2) if wallS > 0 else 0.0,
+            "sessions_per_min": round(len(sessionL) * 60.0 / wallS, 2) if wallS > 0 else 0.0,
+            "session_ms": {"p50": round(percentile([sD["wall_ms"] for sD in sessionL], 50), 1), "max": round(max([sD["wall_ms"] for sD in sessionL] or [0.0]), 1)},
+            "session_disk_bytes": {"mean": int(sum(diskL) / len(diskL)) if diskL else 0, "max": max(diskL or [0])},
+            "session_rss_growth_bytes": {"mean": int(sum(rssL) / len(rssL)) if rssL else None, "max": max(rssL) if rssL else None},
+            "routes": dict(
+                (
+                    route,
+                    {
+                        "count": len(rD["ms"]),
+                        "errors": rD["errors"],
+                        "p50_ms": round(percentile(rD["ms"], 50), 1),
+                        "p95_ms": round(percentile(rD["ms"], 95), 1),
+                        "p99_ms": round(percentile(rD["ms"], 99), 1),
+                    },
+                )
+                for route, rD in routeD.items()
+            ),
+            "per_session": [dict((key, sD[key]) for key in ["session", "pid", "wall_ms", "disk_bytes", "rss_growth_bytes"]) for sD in sorted(sessionL, key=lambda sD: sD["session"])],
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Multi-session load test of the editor")
+    parser.add_argument("--sessions", type=int, default=8)
+    parser.add_argument("--processes", type=int, default=4, help="Worker processes (simultaneous sessions)")
+    parser.add_argument("--navigations", type=int, default=4, help="Tab selections per session")
+    parser.add_argument("--edits", type=int, default=2, help="Edits per tab selection")
+    parser.add_argument("--think-ms", type=float, default=0.0, help="Pause after each request")
+    parser.add_argument("--atoms", type=int, default=5000)
+    parser.add_argument("--categories", type=int, default=10, help="Number of additional small categories")
+    parser.add_argument("--dict", help="PDBx dictionary file to use instead of one generated for the synthetic entry")
+    parser.add_argument("--setting", action="append", default=[], help="site setting NAME=VALUE")
+    parser.add_argument("--work-dir", help="Directory for session area and generated files (default: temporary, removed afterwards)")
+    parser.add_argument("--output", help="Write JSON results to this file")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING, format="%(asctime)s %(levelname)s %(name)s %(message)s")
+    workPath = args.work_dir or tempfile.mkdtemp(prefix="editor_load_")
+    try:
+        generator = SyntheticEntryGenerator(atoms=args.atoms, categories=args.categories)
+        settingD = dict(setting.split("=", 1) for setting in args.setting)
+        loadTest = EditorSessionLoadTest(
+            workPath,
+            generator=generator,
+            sessions=args.sessions,
+            processes=args.processes,
+            navigations=args.navigations,
+            edits=args.edits,
+            thinkMs=args.think_ms,
+            dictFilePath=args.dict,
+            settingD=settingD,
+        )
+        rD = loadTest.run()
+    finally:
+        if not args.work_dir:
+            shutil.rmtree(workPath, ignore_errors=True)
+    if args.output:
+        with open(args.output, "w") as ofh:
+            json.dump(rD, ofh, indent=2, sort_keys=True)
+    print(json.dumps(rD, indent=2, sort_keys=True))
+    return 1 if rD["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
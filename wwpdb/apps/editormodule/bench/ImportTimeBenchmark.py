@@ -0,0 +1,133 @@
+##
+# File:    ImportTimeBenchmark.py
+# Date:    19-Oct-2026
+#
+# Updates:
+#    2026-10-19    RPS    mmcif_utils.persist.PdbxDictionaryInfo added to the deferred modules.
+##
+"""
+Import-time benchmark for the editor web entry point, based on "python -X importtime".
+
+Each measurement imports the module in a fresh interpreter.  Reported are the cumulative
+import time of the module (minimum over repeats), the most expensive imports, and which of
+the modules that are meant to be deferred to the operations needing them got loaded anyway.
+
+Usage:
+    python -m wwpdb.apps.editormodule.bench.ImportTimeBenchmark [--module M] [--repeat N] [--output FILE]
+
+The exit status is 1 if a deferred module was loaded.  tox environment bench_import runs the
+benchmark on the default module.
+
+"""
+__docformat__ = "restructuredtext en"
+__author__ = "Raul Sala"
+__email__ = "rsala@rcsb.rutgers.edu"
+__license__ = "Creative Commons Attribution 3.0 Unported"
+__version__ = "V0.01"
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class ImportTimeBenchmark(object):
+    """Measure import cost of a module in a fresh interpreter"""
+
+    DEFAULT_MODULE = "wwpdb.apps.editormodule.webapp.EditorWebApp"
+    # modules only needed by particular operations, which importing the entry point should not load
+    DEFERRED_MODULES = [
+        "wwpdb.apps.editormodule.depict.EditorDepict",
+        "wwpdb.io.graphics.GraphicsContext3D",
+        "wwpdb.io.locator.DataReference",
+        "wwpdb.utils.db.DBLoadUtil",
+        "wwpdb.utils.dp.DepositorSyncUtil",
+        "mmcif.io.IoAdapterCore",
+        "mmcif_utils.persist.PdbxDictionaryInfo",
+        "smtplib",
+    ]
+
+    def __init__(self, module=DEFAULT_MODULE, repeat=3, topN=15, verbose=False, log=sys.stderr):
+        self.__verbose = verbose
+        self.__lfh = log
+        self.__module = module
+        self.__repeat = repeat
+        self.__topN = topN
+
+    @staticmethod
+    def parseImportTime(text):
+        """Parse "-X importtime" output.
+
+        :Returns:
+            dictionary of imported module name -> (self us, cumulative us)
+        """
+        rD = {}
+        for line in text.splitlines():
+            if not line.startswith("import time:"):
+                continue
+            fields = line[len("import time:") :].split("|")
+            if len(fields) != 3:
+                continue
+            try:
+                rD[fields[2].strip()] = (int(fields[0]), int(fields[1]))
+            except ValueError:
+                # header line
+                continue
+        return rD
+
+    def __runOnce(self):
+        code = "import sys, json, %s; json.dump(sorted(sys.modules), sys.stdout)" % self.__module
+        t0 = time.time()
+        proc = subprocess.Popen([sys.executable, "-X", "importtime", "-c", code], stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True)
+        out, err = proc.communicate()
+        wallMs = (time.time() - t0) * 1000.0
+        if proc.returncode != 0:
+            raise RuntimeError("importing %s failed: %s" % (self.__module, err.strip().splitlines()[-1:]))
+        return wallMs, self.parseImportTime(err), json.loads(out)
+
+    def run(self):
+        """Return dictionary of benchmark results"""
+        best = None
+        for _ in range(self.__repeat):
+            wallMs, timeD, moduleL = self.__runOnce()
+            cumulativeUs = timeD.get(self.__module, (0, 0))[1]
+            if best is None or cumulativeUs < best[1]:
+                best = (wallMs, cumulativeUs, timeD, moduleL)
+        wallMs, cumulativeUs, timeD, moduleL = best
+        topL = sorted(timeD.items(), key=lambda item: item[1][1], reverse=True)[: self.__topN]
+        return {
+            "benchmark": "import_time",
+            "module": self.__module,
+            "python": platform.python_version(),
+            "repeat": self.__repeat,
+            "cumulative_ms": round(cumulativeUs / 1000.0, 2),
+            "process_wall_ms": round(wallMs, 1),
+            "modules_loaded": len(moduleL),
+            "top_imports": [{"module": name, "self_ms": round(selfUs / 1000.0, 2), "cumulative_ms": round(cumUs / 1000.0, 2)} for name, (selfUs, cumUs) in topL],
+            "deferred_loaded": [name for name in self.DEFERRED_MODULES if name in moduleL],
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import-time benchmark for the editor web entry point")
+    parser.add_argument("--module", default=ImportTimeBenchmark.DEFAULT_MODULE, help="Module to import")
+    parser.add_argument("--repeat", type=int, default=3, help="Number of fresh interpreter runs (minimum reported)")
+    parser.add_argument("--output", help="Write JSON results to this file")
+    args = parser.parse_args()
+
+    rD = ImportTimeBenchmark(module=args.module, repeat=args.repeat).run()
+    if args.output:
+        with open(args.output, "w") as ofh:
+            json.dump(rD, ofh, indent=2, sort_keys=True)
+    print(json.dumps(rD, indent=2, sort_keys=True))
+    # non-zero exit when deferred modules are loaded, so this can gate CI
+    return 1 if rD["deferred_loaded"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,365 @@
+##
+# File:    SyntheticEntry.py
+# Date:    19-Oct-2026
+#
+# Updates:
+#    2026-10-19    RPS    Added launchSession() (local application context and a launched session on the entry, for tests).
+#    2026-10-19    RPS    Experimental methods of the entry may be given (methods); launchSession() sets the launch details
+#                         (datablock name, title, default view) in the request object returned.
+##
+"""
+Synthetic mmCIF entries of given size, with a matching PDBx-style (DDL2) dictionary, for benchmarks.
+
+An entry is scaled along the axes that drive cost in the editor: number of entities (entity,
+entity_poly), entry authors (audit_author, citation_author), struct_conn rows, additional
+categories (pdbx_bench_ctgry_<n>, standing in for the many small categories of a deposition)
+and atoms (atom_site).  Values are generated from a seeded random stream so that an entry of
+given size is the same from run to run.
+
+The dictionary defines every category and item written to the entry, with item types, regular
+expressions, enumerations, boundaries and mandatory codes, so that the dictionary store and
+validation operations have realistic work to do without the site PDBx dictionary.
+
+"""
+__docformat__ = "restructuredtext en"
+__author__ = "Raul Sala"
+__email__ = "rsala@rcsb.rutgers.edu"
+__license__ = "Creative Commons Attribution 3.0 Unported"
+__version__ = "V0.01"
+
+import os
+import random
+import sys
+import logging
+
+from mmcif.api.DataCategory import DataCategory
+from mmcif.api.PdbxContainers import DataContainer, DefinitionContainer
+from mmcif.io.PdbxWriter import PdbxWriter
+
+logger = logging.getLogger(__name__)
+
+# (type code, primitive code, construct)
+ITEM_TYPE_LIST = [
+    ("code", "char", r"[_,.;:()/\\{}*|+A-Za-z0-9-]*"),
+    ("line", "char", r"[ \t_(),.;:/\\{}*|+=?A-Za-z0-9-]*"),
+    ("text", "char", r"[ \n\t()_,.;:/\\{}*|+=?A-Za-z0-9-]*"),
+    ("int", "numb", r"[+-]?[0-9]+"),
+    ("float", "numb", r"-?(([0-9]+)[.]?|([0-9]*[.][0-9]+))([(][0-9]+[)])?([eE][+-]?[0-9]+)?"),
+    ("yyyy-mm-dd", "char", r"[0-9]?[0-9]?[0-9][0-9]-[0-9]?[0-9]-[0-9][0-9]"),
+]
+
+# category -> list of (attribute, type code, mandatory, enumerations, (minimum, maximum)), key attributes
+CATEGORY_SCHEMA = {
+    "entry": ([("id", "code", "yes", None, None)], ["id"]),
+    "database_2": ([("database_id", "code", "yes", ["PDB", "WWPDB", "EMDB", "BMRB"], None), ("database_code", "line", "yes", None, None)], ["database_id"]),
+    "pdbx_database_status": (
+        [
+            ("entry_id", "code", "yes", None, None),
+            ("status_code", "code", "no", ["PROC", "WAIT", "AUTH", "HPUB", "HOLD", "REL"], None),
+            ("deposit_site", "code", "no", ["RCSB", "PDBE", "PDBJ", "BMRB"], None),
+            ("process_site", "code", "no", ["RCSB", "PDBE", "PDBJ", "BMRB"], None),
+            ("recvd_initial_deposition_date", "yyyy-mm-dd", "no", None, None),
+        ],
+        ["entry_id"],
+    ),
+    "struct": ([("entry_id", "code", "yes", None, None), ("title", "text", "no", None, None), ("pdbx_descriptor", "text", "no", None, None)], ["entry_id"]),
+    "struct_keywords": ([("entry_id", "code", "yes", None, None), ("pdbx_keywords", "line", "no", None, None), ("text", "text", "no", None, None)], ["entry_id"]),
+    "exptl": (
+        [
+            ("entry_id", "code", "yes", None, None),
+            ("method", "line", "yes", ["X-RAY DIFFRACTION", "NEUTRON DIFFRACTION", "ELECTRON MICROSCOPY", "ELECTRON CRYSTALLOGRAPHY", "SOLUTION NMR"], None),
+            ("crystals_number", "int", "no", None, ("0", ".")),
+        ],
+        ["entry_id", "method"],
+    ),
+    "audit_author": ([("name", "line", "yes", None, None), ("pdbx_ordinal", "int", "yes", None, ("1", ".")), ("identifier_ORCID", "code", "no", None, None)], ["pdbx_ordinal"]),
+    "citation": (
+        [
+            ("id", "code", "yes", None, None),
+            ("title", "text", "no", None, None),
+            ("journal_abbrev", "line", "no", None, None),
+            ("year", "int", "no", None, ("1900", "2100")),
+        ],
+        ["id"],
+    ),
+    "citation_author": (
+        [("citation_id", "code", "yes", None, None), ("name", "line", "yes", None, None), ("ordinal", "int", "yes", None, ("1", "."))],
+        ["citation_id", "name", "ordinal"],
+    ),
+    "entity": (
+        [
+            ("id", "code", "yes", None, None),
+            ("type", "code", "no", ["polymer", "non-polymer", "macrolide", "water", "branched"], None),
+            ("src_method", "code", "no", ["man", "nat", "syn"], None),
+            ("pdbx_description", "line", "no", None, None),
+            ("formula_weight", "float", "no", None, ("1.0", ".")),
+            ("pdbx_number_of_molecules", "int", "no", None, ("0", ".")),
+        ],
+        ["id"],
+    ),
+    "entity_poly": (
+        [
+            ("entity_id", "code", "yes", None, None),
+            ("type", "line", "no", ["polypeptide(L)", "polypeptide(D)", "polyribonucleotide", "polydeoxyribonucleotide", "other"], None),
+            ("pdbx_strand_id", "line", "no", None, None),
+            ("pdbx_seq_one_letter_code", "text", "no", None, None),
+        ],
+        ["entity_id"],
+    ),
+    "struct_conn": (
+        [
+            ("id", "line", "yes", None, None),
+            ("conn_type_id", "code", "yes", ["covale", "disulf", "hydrog", "metalc", "mismat"], None),
+            ("ptnr1_label_asym_id", "code", "yes", None, None),
+            ("ptnr1_label_comp_id", "code", "yes", None, None),
+            ("ptnr1_label_seq_id", "int", "yes", None, None),
+            ("ptnr1_label_atom_id", "code", "yes", None, None),
+            ("ptnr2_label_asym_id", "code", "yes", None, None),
+            ("ptnr2_label_comp_id", "code", "yes", None, None),
+            ("ptnr2_label_seq_id", "int", "yes", None, None),
+            ("ptnr2_label_atom_id", "code", "yes", None, None),
+            ("pdbx_dist_value", "float", "no", None, ("0.0", "10.0")),
+        ],
+        ["id"],
+    ),
+    "atom_site": (
+        [
+            ("group_PDB", "code", "no", ["ATOM", "HETATM"], None),
+            ("id", "code", "yes", None, None),
+            ("type_symbol", "code", "yes", None, None),
+            ("label_atom_id", "code", "yes", None, None),
+            ("label_comp_id", "code", "yes", None, None),
+            ("label_asym_id", "code", "yes", None, None),
+            ("label_entity_id", "code", "yes", None, None),
+            ("label_seq_id", "int", "yes", None, ("1", ".")),
+            ("Cartn_x", "float", "no", None, None),
+            ("Cartn_y", "float", "no", None, None),
+            ("Cartn_z", "float", "no", None, None),
+            ("occupancy", "float", "no", None, ("0.0", "1.0")),
+            ("B_iso_or_equiv", "float", "no", None, None),
+            ("pdbx_PDB_model_num", "int", "yes", None, None),
+        ],
+        ["id"],
+    ),
+}
+
+# schema of each additional category pdbx_bench_ctgry_<n>
+EXTRA_CATEGORY_ATTRIBUTES = [
+    ("ordinal", "int", "yes", None, ("1", ".")),
+    ("name", "line", "yes", None, None),
+    ("value", "float", "no", None, ("0.0", "100.0")),
+    ("flag", "code", "no", ["Y", "N"], None),
+    ("details", "text", "no", None, None),
+]
+
+_AMINO_ACIDS = [("ALA", "A"), ("ARG", "R"), ("ASN", "N"), ("ASP", "D"), ("CYS", "C"), ("GLU", "E"), ("GLN", "Q"), ("GLY", "G"), ("HIS", "H"), ("LEU", "L"), ("LYS", "K"), ("SER", "S")]
+_BACKBONE = [("N", "N"), ("CA", "C"), ("C", "C"), ("O", "O"), ("CB", "C"), ("CG", "C"), ("CD", "C"), ("NE", "N")]
+_WORDS = ["crystal", "structure", "of", "the", "kinase", "domain", "in", "complex", "with", "inhibitor", "human", "mutant", "bound", "form", "apo", "transporter"]
+
+
+class SyntheticEntryGenerator(object):
+    """Generate a synthetic entry of given size and a dictionary covering its categories"""
+
+    def __init__(self, entities=4, authors=10, structConnRows=50, categories=0, atoms=1000, entryId="D_800001", seed=1, methods=None, verbose=False, log=sys.stderr):
+        """
+        :param `entities`:        number of polymer entities (one chain each)
+        :param `authors`:         number of entry authors (also used for the primary citation)
+        :param `structConnRows`:  number of struct_conn rows
+        :param `categories`:      number of additional small categories
+        :param `atoms`:           number of atom_site rows, spread over the polymer chains
+        :param `methods`:         list of experimental methods (exptl), X-RAY DIFFRACTION if not given
+
+        """
+        self.__verbose = verbose
+        self.__lfh = log
+        self.__entities = max(1, entities)
+        self.__authors = authors
+        self.__structConnRows = structConnRows
+        self.__categories = categories
+        self.__atoms = atoms
+        self.__entryId = entryId
+        self.__seed = seed
+        self.__methods = methods or ["X-RAY DIFFRACTION"]
+
+    def getSize(self):
+        """Return the size parameters of the entry, as recorded with benchmark results"""
+        return {"entities": self.__entities, "authors": self.__authors, "struct_conn": self.__structConnRows, "categories": self.__categories, "atoms": self.__atoms}
+
+    def getExtraCategoryNames(self):
+        return ["pdbx_bench_ctgry_%d" % (n + 1) for n in range(self.__categories)]
+
+    def __getSchema(self):
+        schemaD = dict(CATEGORY_SCHEMA)
+        for ctgryNm in self.getExtraCategoryNames():
+            schemaD[ctgryNm] = (EXTRA_CATEGORY_ATTRIBUTES, ["ordinal"])
+        return schemaD
+
+    def __phrase(self, rng, nWords):
+        return " ".join([rng.choice(_WORDS) for _ in range(nWords)]).capitalize()
+
+    def __addCategory(self, container, ctgryNm, rowList):
+        attributeList = [attrib[0] for attrib in self.__getSchema()[ctgryNm][0]]
+        container.append(DataCategory(ctgryNm, attributeList, rowList))
+
+    def makeContainer(self):
+        """Return data container of the synthetic entry"""
+        rng = random.Random(self.__seed)
+        eId = self.__entryId
+        container = DataContainer(eId)
+        self.__addCategory(container, "entry", [[eId]])
+        self.__addCategory(container, "database_2", [["PDB", "9ZZZ"], ["WWPDB", eId]])
+        self.__addCategory(container, "pdbx_database_status", [[eId, "PROC", "RCSB", "RCSB", "2026-01-15"]])
+        self.__addCategory(container, "struct", [[eId, self.__phrase(rng, 12), self.__phrase(rng, 4)]])
+        self.__addCategory(container, "struct_keywords", [[eId, "TRANSFERASE", "kinase, inhibitor, transferase"]])
+        self.__addCategory(container, "exptl", [[eId, method, "1"] for method in self.__methods])
+        #
+        surnames = ["Smith", "Jones", "Garcia", "Chen", "Kumar", "Muller", "Rossi", "Tanaka", "Novak", "Silva"]
+        authorL = ["%s%s, %s." % (surnames[n % len(surnames)], "" if n < len(surnames) else str(n // len(surnames)), chr(ord("A") + n % 26)) for n in range(self.__authors)]
+        self.__addCategory(container, "audit_author", [[name, str(n + 1), "?"] for n, name in enumerate(authorL)])
+        self.__addCategory(container, "citation", [["primary", self.__phrase(rng, 10), "To be published", "?"]])
+        self.__addCategory(container, "citation_author", [["primary", name, str(n + 1)] for n, name in enumerate(authorL)])
+        #
+        chainIdL = [self.__chainId(n) for n in range(self.__entities)]
+        residuesPerChain = max(1, (self.__atoms // len(_BACKBONE)) // self.__entities + 1)
+        entityRowL = []
+        polyRowL = []
+        for n in range(self.__entities):
+            seq = "".join([_AMINO_ACIDS[(n + k) % len(_AMINO_ACIDS)][1] for k in range(residuesPerChain)])
+            entityRowL.append([str(n + 1), "polymer", "man", "Protein chain %d" % (n + 1), "%.3f" % (110.0 * residuesPerChain), "1"])
+            polyRowL.append([str(n + 1), "polypeptide(L)", chainIdL[n], seq])
+        self.__addCategory(container, "entity", entityRowL)
+        self.__addCategory(container, "entity_poly", polyRowL)
+        #
+        connRowL = []
+        for n in range(self.__structConnRows):
+            c1, c2 = rng.randrange(self.__entities), rng.randrange(self.__entities)
+            s1, s2 = rng.randrange(residuesPerChain), rng.randrange(residuesPerChain)
+            connRowL.append(
+                [
+                    "covale%d" % (n + 1),
+                    "covale",
+                    chainIdL[c1],
+                    _AMINO_ACIDS[(c1 + s1) % len(_AMINO_ACIDS)][0],
+                    str(s1 + 1),
+                    "C",
+                    chainIdL[c2],
+                    _AMINO_ACIDS[(c2 + s2) % len(_AMINO_ACIDS)][0],
+                    str(s2 + 1),
+                    "N",
+                    "%.3f" % rng.uniform(1.2, 3.5),
+                ]
+            )
+        self.__addCategory(container, "struct_conn", connRowL)
+        #
+        atomRowL = []
+        for n in range(self.__atoms):
+            residueIdx = n // len(_BACKBONE)
+            chainIdx = min(self.__entities - 1, residueIdx // residuesPerChain)
+            seqIdx = residueIdx - chainIdx * residuesPerChain
+            atomNm, element = _BACKBONE[n % len(_BACKBONE)]
+            atomRowL.append(
+                [
+                    "ATOM",
+                    str(n + 1),
+                    element,
+                    atomNm,
+                    _AMINO_ACIDS[(chainIdx + seqIdx) % len(_AMINO_ACIDS)][0],
+                    chainIdL[chainIdx],
+                    str(chainIdx + 1),
+                    str(seqIdx + 1),
+                    "%.3f" % rng.uniform(-50.0, 50.0),
+                    "%.3f" % rng.uniform(-50.0, 50.0),
+                    "%.3f" % rng.uniform(-50.0, 50.0),
+                    "1.00",
+                    "%.2f" % rng.uniform(10.0, 80.0),
+                    "1",
+                ]
+            )
+        self.__addCategory(container, "atom_site", atomRowL)
+        #
+        for ctgryNm in self.getExtraCategoryNames():
+            self.__addCategory(container, ctgryNm, [[str(k + 1), "%s item %d" % (ctgryNm, k + 1), "%.2f" % rng.uniform(0.0, 100.0), "N", self.__phrase(rng, 6)] for k in range(3)])
+        return container
+
+    def __chainId(self, n):
+        letters = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+        chainId = ""
+        n += 1
+        while n > 0:
+            n, r = divmod(n - 1, len(letters))
+            chainId = letters[r] + chainId
+        return chainId
+
+    def writeEntry(self, filePath):
+        """Write synthetic entry to filePath in mmCIF format"""
+        with open(filePath, "w") as ofh:
+            PdbxWriter(ofh).write([self.makeContainer()])
+        if self.__verbose:
+            logger.info("synthetic entry %r written to %s", self.getSize(), filePath)
+        return filePath
+
+    def makeDictionaryContainerList(self):
+        """Return container list of a DDL2 dictionary defining the categories and items of the synthetic entry"""
+        dictContainer = DataContainer("mmcif_pdbx_bench.dic")
+        dictContainer.append(DataCategory("datablock", ["id", "description"], [["mmcif_pdbx_bench.dic", "Synthetic dictionary for editor benchmarks"]]))
+        dictContainer.append(DataCategory("dictionary", ["title", "datablock_id", "version"], [["mmcif_pdbx_bench.dic", "mmcif_pdbx_bench.dic", "1.0"]]))
+        dictContainer.append(DataCategory("item_type_list", ["code", "primitive_code", "construct"], [list(row) for row in ITEM_TYPE_LIST]))
+        containerList = [dictContainer]
+        for ctgryNm, (attributeList, keyList) in sorted(self.__getSchema().items()):
+            cDef = DefinitionContainer(ctgryNm)
+            cDef.append(DataCategory("category", ["id", "description", "mandatory_code"], [[ctgryNm, "Synthetic definition of category %s" % ctgryNm, "no"]]))
+            cDef.append(DataCategory("category_key", ["name"], [["_%s.%s" % (ctgryNm, attrNm)] for attrNm in keyList]))
+            containerList.append(cDef)
+            for attrNm, typeCode, mandatory, enumList, boundary in attributeList:
+                itemNm = "_%s.%s" % (ctgryNm, attrNm)
+                iDef = DefinitionContainer(itemNm)
+                iDef.append(DataCategory("item_description", ["description"], [["Synthetic definition of item %s" % itemNm]]))
+                iDef.append(DataCategory("item", ["name", "category_id", "mandatory_code"], [[itemNm, ctgryNm, mandatory]]))
+                iDef.append(DataCategory("item_type", ["code"], [[typeCode]]))
+                if enumList:
+                    iDef.append(DataCategory("item_enumeration", ["value"], [[value] for value in enumList]))
+                if boundary:
+                    iDef.append(DataCategory("item_range", ["minimum", "maximum"], [[boundary[0], boundary[1]]]))
+                containerList.append(iDef)
+        return containerList
+
+    def writeDictionary(self, filePath):
+        """Write dictionary covering the synthetic entry to filePath"""
+        with open(filePath, "w") as ofh:
+            PdbxWriter(ofh).write(self.makeDictionaryContainerList())
+        return filePath
+
+    def launchSession(self, topSessionPath, siteId, sessionId, dataFileName):
+        """Write the dictionary into topSessionPath and install a local application context for siteId with it,
+        then write the entry as dataFileName into new session sessionId and launch the session (serially).
+        Returns the request object of the session, holding the launch details used in rendering (as set by the launch operation).
+        """
+        from wwpdb.apps.editormodule.config.EditorAppContext import EditorAppContext  # pylint: disable=import-outside-toplevel
+        from wwpdb.apps.editormodule.io.PdbxDataIo import PdbxDataIo  # pylint: disable=import-outside-toplevel
+        from wwpdb.apps.editormodule.webapp.EditorLaunchPipeline import EditorLaunchPipeline  # pylint: disable=import-outside-toplevel
+        from wwpdb.apps.editormodule.webapp.WebRequest import EditorInputRequest  # pylint: disable=import-outside-toplevel
+
+        dictFilePath = self.writeDictionary(os.path.join(topSessionPath, "mmcif_pdbx_bench.dic"))
+        EditorAppContext.installLocal(siteId, topSessionPath, dictFilePath)
+        reqObj = EditorInputRequest(
+            {
+                "TopSessionPath": [topSessionPath],
+                "TemplatePath": [EditorAppContext.get(siteId).getTemplatePath()],
+                "WWPDB_SITE_ID": [siteId],
+                "sessionid": [sessionId],
+                "datafile": [dataFileName],
+                "filesource": ["upload"],
+                "identifier": [self.__entryId],
+                "store_cache": ["n"],
+            },
+            verbose=self.__verbose,
+            log=self.__lfh,
+        )
+        self.writeEntry(os.path.join(reqObj.newSessionObj().getPath(), dataFileName))
+        pdbxDataIo = PdbxDataIo(reqObj, self.__verbose, self.__lfh)
+        dataBlockName, entryTitle, _entryAccessionIdsLst = EditorLaunchPipeline(pdbxDataIo, parallel=False, verbose=self.__verbose, log=self.__lfh).run()
+        reqObj.setValue("datablockname", dataBlockName)
+        reqObj.setValue("entrytitle", entryTitle)
+        if pdbxDataIo.getDefView():
+            reqObj.setValue("defview", pdbxDataIo.getDefView())
+        return reqObj
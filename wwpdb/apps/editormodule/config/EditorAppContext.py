@@ -0,0 +1,159 @@
+##
+# File:    EditorAppContext.py
+# Date:    19-Oct-2026
+#
+# Updates:
+#    2026-10-19    RPS    Added getSetting() for site configuration settings looked up once per process.
+#    2026-10-19    RPS    Added installLocal() for running without a site configuration (benchmarks, tests).
+#    2026-10-19    RPS    Added getSessionPaths() listing the sessions served by this process.
+##
+"""
+Process-wide application context for the general annotation editor.
+
+Site configuration objects, resolved resource paths and session handles are created once
+per site and process and then shared by all requests served by a persistent worker, rather
+than being rebuilt by every EditorWebApp/PdbxDataIo instance.
+
+"""
+__docformat__ = "restructuredtext en"
+__author__ = "Raul Sala"
+__email__ = "rsala@rcsb.rutgers.edu"
+__license__ = "Creative Commons Attribution 3.0 Unported"
+__version__ = "V0.01"
+
+import os
+import threading
+import logging
+from collections import OrderedDict
+
+from wwpdb.utils.config.ConfigInfo import ConfigInfo
+from wwpdb.utils.config.ConfigInfoApp import ConfigInfoAppCommon
+from wwpdb.utils.session.SessionManager import SessionManager
+from wwpdb.apps.editormodule.config.AccessConfigCifFiles import get_display_view_info_master_cif, get_display_view_info_cif
+from wwpdb.apps.editormodule.config.AccessTemplateFiles import get_template_file_path
+
+logger = logging.getLogger(__name__)
+
+
+class EditorAppContext(object):
+    """Per-site, per-process holder of configuration, resource paths and session handles"""
+
+    __contexts = {}
+    __contextLock = threading.Lock()
+
+    def __init__(self, siteId=None, maxSessions=256, pathD=None):
+        self.__siteId = siteId
+        self.__maxSessions = maxSessions
+        self.__lock = threading.Lock()
+        self.__cI = None
+        self.__cICommon = None
+        self.__pathD = dict(pathD) if pathD else {}
+        self.__sessionD = OrderedDict()
+
+    @classmethod
+    def get(cls, siteId=None):
+        """Return the context for siteId (default site taken from WWPDB_SITE_ID), creating it on first use"""
+        key = siteId if siteId else os.environ.get("WWPDB_SITE_ID")
+        ctx = cls.__contexts.get(key)
+        if ctx is None:
+            with cls.__contextLock:
+                ctx = cls.__contexts.get(key)
+                if ctx is None:
+                    ctx = cls(siteId=key)
+                    cls.__contexts[key] = ctx
+                    logger.info("created application context for site %s", key)
+        return ctx
+
+    @classmethod
+    def installLocal(cls, siteId, topSessionPath, pdbxDictFilePath, settingD=None):
+        """Register a context for siteId with the given session area, PDBx dictionary and settings, in place of
+        those from site configuration (packaged view config files and templates are used).  For benchmarks and
+        tests run without a site configuration.
+        """
+        pathD = {"top_sessions": topSessionPath, "pdbx_dict": pdbxDictFilePath}
+        for name, value in (settingD or {}).items():
+            pathD["setting:" + name] = value
+        ctx = cls(siteId=siteId, pathD=pathD)
+        with cls.__contextLock:
+            cls.__contexts[siteId] = ctx
+        return ctx
+
+    @classmethod
+    def reset(cls):
+        """Discard all contexts, e.g. after a change in site configuration"""
+        with cls.__contextLock:
+            cls.__contexts.clear()
+
+    def getSiteId(self):
+        return self.__siteId
+
+    def getConfigInfo(self):
+        if self.__cI is None:
+            self.__cI = ConfigInfo(self.__siteId)
+        return self.__cI
+
+    def getConfigInfoAppCommon(self):
+        if self.__cICommon is None:
+            self.__cICommon = ConfigInfoAppCommon(self.__siteId)
+        return self.__cICommon
+
+    def __getPath(self, name, resolveFunc):
+        if name not in self.__pathD:
+            self.__pathD[name] = resolveFunc()
+        return self.__pathD[name]
+
+    def getTopSessionPath(self):
+        return self.__getPath("top_sessions", lambda: self.getConfigInfoAppCommon().get_site_web_apps_top_sessions_path())
+
+    def getTemplatePath(self):
+        return self.__getPath("templates", get_template_file_path)
+
+    def getPdbxDictFilePath(self):
+        return self.__getPath("pdbx_dict", lambda: self.getConfigInfoAppCommon().get_mmcif_next_dictionary_file_path())
+
+    def getMasterViewFilePath(self):
+        return self.__getPath("master_view", get_display_view_info_master_cif)
+
+    def getDisplayViewFilePath(self):
+        return self.__getPath("display_view", get_display_view_info_cif)
+
+    def getSetting(self, name, default=None):
+        """Return site configuration setting name (looked up once per process), or default if not set"""
+        value = self.__getPath("setting:" + name, lambda: self.getConfigInfo().get(name))
+        return value if value is not None else default
+
+    def getSessionObj(self, topPath, sessionId):
+        """Return session handle for an existing session id.
+        The session directory is only created when the session is first seen by this process (or has since been removed).
+        """
+        key = (topPath, sessionId)
+        with self.__lock:
+            sObj = self.__sessionD.pop(key, None)
+            if sObj is not None:
+                self.__sessionD[key] = sObj
+        # SessionManager.getPath() is None once the session directory no longer exists
+        if sObj is not None and sObj.getPath() is not None:
+            return sObj
+        #
+        sObj = SessionManager(topPath=topPath) if topPath else SessionManager()
+        sObj.setId(sessionId)
+        sObj.makeSessionPath()
+        with self.__lock:
+            self.__sessionD[key] = sObj
+            while len(self.__sessionD) > self.__maxSessions:
+                self.__sessionD.popitem(last=False)
+        return sObj
+
+    def getSessionPaths(self):
+        """Return list of (session id, session path) for the session handles held, most recently used first"""
+        with self.__lock:
+            sessionL = [(key[1], sObj) for key, sObj in self.__sessionD.items()]
+        sessionPathL = []
+        for sessionId, sObj in reversed(sessionL):
+            sessionPath = sObj.getPath()
+            if sessionPath is not None:
+                sessionPathL.append((sessionId, sessionPath))
+        return sessionPathL
+
+    def getStats(self):
+        return {"site_id": self.__siteId, "session_handles": len(self.__sessionD), "resolved_paths": sorted([name for name in self.__pathD if not name.startswith("setting:")])}
@@ -0,0 +1,226 @@
+##
+# File:    EditorLogging.py
+# Date:    19-Oct-2026
+#
+# Updates:
+#    2026-10-19    RPS    Docstring corrected - with EDITOR_LOG_QUEUE records are formatted on the logging thread.
+##
+"""
+Low-overhead logging for the general annotation editor.
+
+  - LOG_NOW: current time as a log argument, formatted only when a record is emitted - in place of
+    time.strftime(...) arguments, which are evaluated on every call whatever the logging level.
+  - EditorLogSampler: logging of events raised per row or per cell (validation loops, scans of
+    ordinal ids).  The level is checked before anything else, and of the events under a key only
+    the first and every Nth after are emitted, each with the count of events seen.
+  - configure(): per-subsystem levels from site setting EDITOR_LOG_LEVELS, e.g.
+
+        EDITOR_LOG_LEVELS = io=WARNING,depict=INFO,webapp=INFO,mmcif_utils=WARNING
+
+    where a subsystem (bench, config, depict, io, utils, webapp) stands for its package logger
+    wwpdb.apps.editormodule.<subsystem> and any other name is taken as a logger name.  With site
+    setting EDITOR_LOG_QUEUE the handlers of the root logger are moved behind a QueueHandler and the
+    I/O of records is done by a listener thread off the request path (Python 3).  Records are still
+    formatted (with any LOG_NOW time) by QueueHandler.prepare() on the logging thread.
+
+configure() is applied once per site and process, on the first request (EditorWebApp).
+
+"""
+__docformat__ = "restructuredtext en"
+__author__ = "Raul Sala"
+__email__ = "rsala@rcsb.rutgers.edu"
+__license__ = "Creative Commons Attribution 3.0 Unported"
+__version__ = "V0.01"
+
+import os
+import sys
+import time
+import atexit
+import threading
+import logging
+
+logger = logging.getLogger(__name__)
+
+SUBSYSTEM_ROOT = "wwpdb.apps.editormodule"
+SUBSYSTEMS = ["bench", "config", "depict", "io", "utils", "webapp"]
+DEFAULT_SAMPLE_EVERY = 1000
+
+_lock = threading.Lock()
+_stateD = {"configured": set(), "listener": None, "sample_every": DEFAULT_SAMPLE_EVERY}
+
+
+class LazyLogArg(object):
+    """Log argument computed by func(*args) when the record is formatted"""
+
+    def __init__(self, func, *args):
+        self.__func = func
+        self.__args = args
+
+    def __str__(self):
+        return str(self.__func(*self.__args))
+
+    def __repr__(self):
+        return repr(self.__func(*self.__args))
+
+
+def _localTime(fmt="%Y %m %d %H:%M:%S"):
+    return time.strftime(fmt, time.localtime())
+
+
+LOG_NOW = LazyLogArg(_localTime)
+
+
+class EditorLogSampler(object):
+    """Sampled logging of repeated events on a logger - the first and every Nth event per key are emitted.
+
+    Counts are held per sampler, so a sampler is made per request (e.g. per PdbxDataIo instance).
+    """
+
+    def __init__(self, log, every=None):
+        self.__log = log
+        self.__every = max(1, int(every if every else _stateD["sample_every"]))
+        self.__countD = {}
+
+    def isEnabledFor(self, level):
+        return self.__log.isEnabledFor(level)
+
+    def log(self, level, key, msg, *args, **kwargs):
+        """Count event under key and log it if it is sampled.  Returns True if the event was logged."""
+        if not self.__log.isEnabledFor(level):
+            return False
+        count = self.__countD.get(key, 0) + 1
+        self.__countD[key] = count
+        if count > 1 and count % self.__every != 0:
+            return False
+        if sys.version_info >= (3, 8):
+            # attribute the record to the caller
+            kwargs.setdefault("stacklevel", 2)
+        else:
+            kwargs.pop("stacklevel", None)
+        self.__log.log(level, "[%s #%d, 1 in %d logged] " + msg, key, count, self.__every, *args, **kwargs)
+        return True
+
+    def debug(self, key, msg, *args, **kwargs):
+        kwargs.setdefault("stacklevel", 3)
+        return self.log(logging.DEBUG, key, msg, *args, **kwargs)
+
+    def info(self, key, msg, *args, **kwargs):
+        kwargs.setdefault("stacklevel", 3)
+        return self.log(logging.INFO, key, msg, *args, **kwargs)
+
+    def exception(self, key, msg, *args, **kwargs):
+        kwargs["exc_info"] = True
+        kwargs.setdefault("stacklevel", 3)
+        return self.log(logging.ERROR, key, msg, *args, **kwargs)
+
+    def getCounts(self):
+        """Return dictionary of the number of events seen per key (counted only while the level was enabled)"""
+        return dict(self.__countD)
+
+
+def getLoggerName(name):
+    """Return logger name for a subsystem name (e.g. io, io.PdbxDataIo) or logger name"""
+    if name.split(".")[0] in SUBSYSTEMS:
+        return SUBSYSTEM_ROOT + "." + name
+    return name
+
+
+def setLevels(levelSpec):
+    """Set logger levels from a specification NAME=LEVEL[,NAME=LEVEL ...].  Returns dictionary of levels set by logger name."""
+    levelD = {}
+    for item in (levelSpec or "").split(","):
+        if not item.strip():
+            continue
+        try:
+            name, levelName = [tok.strip() for tok in item.split("=", 1)]
+            level = logging.getLevelName(levelName.upper())
+            if not isinstance(level, int):
+                raise ValueError(levelName)
+        except ValueError:
+            logger.warning("ignoring invalid log level setting %r", item)
+            continue
+        loggerName = getLoggerName(name)
+        logging.getLogger(loggerName).setLevel(level)
+        levelD[loggerName] = level
+    return levelD
+
+
+def installQueue():
+    """Move the handlers of the root logger behind a QueueHandler, with a QueueListener thread passing records to them.
+
+    The queue is unbounded so that logging never blocks the caller.  Returns False where QueueHandler is not
+    available (Python 2), the root logger has no handlers or a queue is already installed in this process.
+    """
+    try:
+        import queue  # pylint: disable=import-outside-toplevel
+        from logging.handlers import QueueHandler, QueueListener  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        return False
+    listenerD = _stateD["listener"]
+    if listenerD is not None:
+        if listenerD["pid"] == os.getpid():
+            return False
+        # installed before this process was forked - the listener thread is not running here
+        _restoreHandlers(listenerD["handlers"])
+    rootLogger = logging.getLogger()
+    handlerL = [hndlr for hndlr in rootLogger.handlers if not isinstance(hndlr, QueueHandler)]
+    if not handlerL:
+        return False
+    logQueue = queue.Queue(-1)
+    listener = QueueListener(logQueue, *handlerL, respect_handler_level=True)
+    for hndlr in handlerL:
+        rootLogger.removeHandler(hndlr)
+    rootLogger.addHandler(QueueHandler(logQueue))
+    listener.start()
+    _stateD["listener"] = {"pid": os.getpid(), "listener": listener, "handlers": handlerL}
+    atexit.register(stopQueue)
+    return True
+
+
+def stopQueue():
+    """Stop the listener, after it has passed on the queued records, and restore the root logger handlers.  Returns False if no queue is installed."""
+    listenerD = _stateD["listener"]
+    if listenerD is None or listenerD["pid"] != os.getpid():
+        return False
+    _stateD["listener"] = None
+    listenerD["listener"].stop()
+    _restoreHandlers(listenerD["handlers"])
+    return True
+
+
+def _restoreHandlers(handlerL):
+    """Replace the QueueHandler on the root logger by handlers handlerL"""
+    from logging.handlers import QueueHandler  # pylint: disable=import-outside-toplevel
+
+    rootLogger = logging.getLogger()
+    for hndlr in list(rootLogger.handlers):
+        if isinstance(hndlr, QueueHandler):
+            rootLogger.removeHandler(hndlr)
+    for hndlr in handlerL:
+        rootLogger.addHandler(hndlr)
+
+
+def isQueueInstalled():
+    listenerD = _stateD["listener"]
+    return listenerD is not None and listenerD["pid"] == os.getpid()
+
+
+def configure(appCtx):
+    """Apply logging settings of the site of application context appCtx, once per site and process"""
+    key = (os.getpid(), appCtx.getSiteId())
+    if key in _stateD["configured"]:
+        return False
+    with _lock:
+        if key in _stateD["configured"]:
+            return False
+        _stateD["configured"].add(key)
+        try:
+            setLevels(appCtx.getSetting("EDITOR_LOG_LEVELS", ""))
+            sampleEvery = appCtx.getSetting("EDITOR_LOG_SAMPLE_EVERY")
+            if sampleEvery:
+                _stateD["sample_every"] = max(1, int(sampleEvery))
+            if str(appCtx.getSetting("EDITOR_LOG_QUEUE", "n")).lower() in ["y", "yes", "true"]:
+                installQueue()
+        except:  # noqa: E722 pylint: disable=bare-except
+            logger.exception("Failed applying logging settings for site %s", appCtx.getSiteId())
+    return True
@@ -76,6 +76,15 @@
 #    2017-06-19    EP     add pdbx_audit_support.funding_organization to list of enumerations with other
 #    2017-09-26    EP     add pdbx_nmr_ensemble.conformer_selection_criteria to list of enumerations with other
 #    2018-06-28    EP     start to use logging. Cut down on output. Provide function timing.
+#    2026-10-19    RPS    Enumerations now arrive pre-sorted from dictionary store. When requested via "enum_refs" parameter, enumerations
+#                            registered in the session PdbxEnumRegistry are vended as enum id references instead of full lists.
+#    2026-10-19    RPS    When requested via "enum_search" parameter, enumerations for autocomplete columns are not vended and are
+#                            instead searched server-side via the get_enum_matches service.
+#    2026-10-19    RPS    Rendered navigation bar markup and cardinality JS cached per (view id, category-set hash).
+#    2026-10-19    RPS    processTemplate() now served from process-wide EditorTemplateCache (keyed by path and mtime).
+#    2026-10-19    RPS    Data store index access recorded in the request trace (EditorStoreTrace).
+#    2026-10-19    RPS    Timestamps in log messages formatted only when logged (EditorLogging.LOG_NOW).
+#    2026-10-19    RPS    Navigation bar cache key includes the experimental methods of the session dictionary store view.
 ##
 """
 Base class for HTML depictions containing common HTML constructs.
@@ -97,9 +106,11 @@ except ImportError:
     from urllib import unquote as u_unquote
 
 from json import loads
-from mmcif_utils.persist.PdbxPersist import PdbxPersist  # temporary for testing
-from wwpdb.apps.editormodule.io.PdbxDataIo import PdbxDataIo
+from wwpdb.apps.editormodule.io.PdbxDataIo import PdbxDataIo, TracedPdbxPersist
+from wwpdb.apps.editormodule.io.EditorSessionMeta import EditorSessionMeta
+from wwpdb.apps.editormodule.depict.EditorTemplateCache import EditorTemplateCache
 from wwpdb.apps.editormodule.config.EditorConfig import EditorConfig
+from wwpdb.apps.editormodule.config.EditorLogging import LOG_NOW
 from wwpdb.io.graphics.GraphicsContext3D import GraphicsContext3D
 import logging
 
@@ -109,6 +120,10 @@ logger = logging.getLogger(__name__)
 class EditorDepict(object):
     """Base class for HTML depictions contain definitions of common constructs."""
 
+    # process-wide cache of rendered navigation bar: (view id, view config, context, category-set hash) -> (markup, cardinality JS string)
+    __navBarCache = {}
+    __navBarCacheMaxEntries = 64
+
     def __init__(self, verbose=False, log=sys.stderr):
         """
 
@@ -160,7 +175,7 @@ class EditorDepict(object):
         #
         if self.__verbose:
             logger.info("--------------------------------------------")
-            logger.info("Starting at %s", time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+            logger.info("Starting at %s", LOG_NOW)
             logger.info("identifier   %s", depId)
             logger.info("instance     %s", wfInstId)
             logger.info("file source  %s", fileSource)
@@ -240,7 +255,7 @@ class EditorDepict(object):
         #
         if self.__verbose:
             logger.info("--------------------------------------------")
-            logger.info("Starting at %s", time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+            logger.info("Starting at %s", LOG_NOW)
             logger.info("identifier   %s", depId)
             logger.info("instance     %s", wfInstId)
             logger.info("file source  %s", fileSource)
@@ -283,7 +298,6 @@ class EditorDepict(object):
                 myD["identifier"] = depDataSetId
         #
         pdbxDataIo = PdbxDataIo(p_reqObj, self.__verbose, self.__lfh)
-        self.__navTabGroups = pdbxDataIo.getCtgryNavConfig()
         #
         myD["session_url_prefix"] = self.rltvSessionPath
         myD["absolute_session_path"] = self.absltSessionPath
@@ -291,10 +305,39 @@ class EditorDepict(object):
         myD["data_block_name"] = dataBlockName
         myD["entry_title"] = entryTitle
         myD["defview"] = defView
-
-        if p_bIsWorkflow:
-            dataFile = pdbxDataIo.getPdbxDataFilePath()
-        myD["ctgry_nav_bar"], myD["crdnlty_dict"] = self.__genCtgryNavBar(dataBlockName, fileSource, dataFile, p_bIsWorkflow, context)
+        enumRegistry = pdbxDataIo.getEnumRegistry()
+        myD["enum_registry_version"] = enumRegistry.getVersion() if enumRegistry is not None else ""
+
+        # nav bar depends only on view config (including the methods for which the dictionary store view was generated,
+        # as several methods share a view id) and set of categories present, so reuse markup when rendered before --
+        # either by this process (any session) or, for short-lived processes, as recorded in the session metadata
+        ctgrySetHash = pdbxDataIo.getCategorySetHash()
+        viewMethods = pdbxDataIo.getDictStoreMethods()
+        navBarKey = "|".join([pdbxDataIo.getConfigViewId(), str(p_reqObj.getValue("configFilePath")), str(context), str(viewMethods), str(ctgrySetHash)])
+        navBar = None
+        if ctgrySetHash:
+            navBar = EditorDepict.__navBarCache.get(navBarKey)
+            if navBar is None:
+                sessMeta = EditorSessionMeta(self.absltSessionPath, verbose=self.__verbose, log=self.__lfh)
+                sessNavBar = sessMeta.get("nav_bar")
+                if sessNavBar and sessNavBar.get("key") == navBarKey:
+                    navBar = (sessNavBar["markup"], sessNavBar["crdnlty_dict"])
+        if navBar is None:
+            self.__navTabGroups = pdbxDataIo.getCtgryNavConfig()
+            if p_bIsWorkflow:
+                dataFile = pdbxDataIo.getPdbxDataFilePath()
+            navBar = self.__genCtgryNavBar(dataBlockName, fileSource, dataFile, p_bIsWorkflow, context)
+            if ctgrySetHash:
+                sessMeta = EditorSessionMeta(self.absltSessionPath, verbose=self.__verbose, log=self.__lfh)
+                sessMeta.set("nav_bar", {"key": navBarKey, "markup": navBar[0], "crdnlty_dict": navBar[1]})
+                sessMeta.store()
+        elif self.__verbose:
+            logger.info("-- reusing navigation bar for %s", navBarKey)
+        if ctgrySetHash and navBarKey not in EditorDepict.__navBarCache:
+            if len(EditorDepict.__navBarCache) >= EditorDepict.__navBarCacheMaxEntries:
+                EditorDepict.__navBarCache.clear()
+            EditorDepict.__navBarCache[navBarKey] = navBar
+        myD["ctgry_nav_bar"], myD["crdnlty_dict"] = navBar
         #
         if context:
             if context in ["emtesting", "em"]:
@@ -486,6 +529,10 @@ class EditorDepict(object):
                     if (catObjDict["MANDATORY_COLUMNS"] and len(catObjDict["MANDATORY_COLUMNS"]) > 0)
                     else []
                 )
+                if str(p_reqObj.getValue("enum_search")).lower() in ["y", "yes", "true"]:
+                    self.__deferAutocompleteEnums(catObjDict)
+                if str(p_reqObj.getValue("enum_refs")).lower() in ["y", "yes", "true"]:
+                    self.__applyEnumRefs(pdbxDataIo, p_cifCtgryNm, catObjDict, ctgryColList)
 
                 # provide DataTables "aoColumns" property to be used in initializing the DataTable
                 # with set of known column names that it can use for keeping track of column ordering
@@ -647,7 +694,7 @@ class EditorDepict(object):
 
                 if ctype == "select" or (len(enumOpts) > 0 and idx in enumOpts):
                     # assuming here that if there are enum options, that type should be of selection list type
-                    enumOpts[idx].sort(key=str.lower)
+                    # NOTE: enum options are sorted once when the dictionary store is built (see PdbxEnumRegistry)
 
                     # 2013-06-11,RPS: accommodating annotator requests for special case behavior via coding one-offs below, BUT should
                     # establish way to accommodate these configurations via config file
@@ -689,6 +736,48 @@ class EditorDepict(object):
 
         p_catObjDict["INPUT_TYPES"] = inputTypes
 
+    def __deferAutocompleteEnums(self, p_catObjDict):
+        """Drop enumeration lists for autocomplete columns from the config, as these are searched server-side
+        via the get_enum_matches service.
+
+        :Returns:
+            ``p_catObjDict``: via side-effect, 'COLUMN_ENUMS' entries for autocomplete columns moved to 'COLUMN_ENUM_SEARCH' list of colIdx
+        """
+        enumOpts = p_catObjDict["COLUMN_ENUMS"]
+        srchCols = []
+        for idx, inputType in p_catObjDict["INPUT_TYPES"].items():
+            if inputType in ["autocomplete", "autocomplete_w_other"] and idx in enumOpts:
+                srchCols.append(idx)
+                del enumOpts[idx]
+        p_catObjDict["COLUMN_ENUM_SEARCH"] = srchCols
+
+    def __applyEnumRefs(self, p_pdbxDataIo, p_cifCtgryNm, p_catObjDict, p_ctgryColList):
+        """Replace enumeration lists that are identical to those held in the session enum registry with enum id references,
+        so that large lists are shipped to the front end once per registry version instead of with every DataTable config.
+
+        :Returns:
+            ``p_catObjDict``: via side-effect, 'COLUMN_ENUMS' entries replaced by 'COLUMN_ENUM_REFS' colIdx -> enumId and 'ENUM_REGISTRY_VERSION' set
+        """
+        enumRegistry = p_pdbxDataIo.getEnumRegistry()
+        if enumRegistry is None:
+            return
+        #
+        bAlt = len(p_catObjDict["COLUMN_ENUMS_ALT"]) > 0
+        enumOpts = p_catObjDict["COLUMN_ENUMS"]
+        enumRefs = {}
+        for idx in list(enumOpts.keys()):
+            if idx >= len(p_ctgryColList):
+                continue
+            enumId = enumRegistry.getEnumId(p_cifCtgryNm, p_ctgryColList[idx], alt=bAlt)
+            registeredList = enumRegistry.getEnum(enumId) if enumId else None
+            # lists that differ from the registered list (e.g. extended with a "?" null option for the UI) stay inline
+            if registeredList is not None and list(registeredList) == list(enumOpts[idx]):
+                enumRefs[idx] = enumId
+                del enumOpts[idx]
+        #
+        p_catObjDict["COLUMN_ENUM_REFS"] = enumRefs
+        p_catObjDict["ENUM_REGISTRY_VERSION"] = enumRegistry.getVersion()
+
     # ####### BEGIN -- Specific to DataTable Implementation ##################
 
     def __createDataTableAaDataList(self, p_colList, p_recordList, p_iDisplayStart):  # pylint: disable=unused-argument
@@ -708,7 +797,7 @@ class EditorDepict(object):
         """
         if self.__verbose:
             logger.info("--------------------------------------------")
-            logger.info("Starting at %s", time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+            logger.info("Starting at %s", LOG_NOW)
         rtrnLst = []
 
         for indx, record in enumerate(p_recordList):
@@ -738,12 +827,12 @@ class EditorDepict(object):
         """Returns list of categories in the first data block"""
         if self.__verbose:
             logger.info("--------------------------------------------")
-            logger.info("-- starting at %s", time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+            logger.info("-- starting at %s", LOG_NOW)
         #
         ctgryList = []
 
         dbFilePath = os.path.join(self.absltSessionPath, "dataFile.db")
-        myPersist = PdbxPersist(self.__verbose, self.__lfh)
+        myPersist = TracedPdbxPersist(self.__verbose, self.__lfh)
         myInd = myPersist.getIndex(dbFileName=dbFilePath)
         containerNameList = myInd["__containers__"]
         dataBlockName = containerNameList[0][0]
@@ -751,7 +840,7 @@ class EditorDepict(object):
             ctgryList.append(objName)
 
         if self.__verbose:
-            logger.info("+++ completed at %s", time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+            logger.info("+++ completed at %s", LOG_NOW)
         return ctgryList
 
     def __genCtgryNavBar(self, p_dataBlockName, p_fileSource, p_dataFile, p_bIsWorkflow, p_context):  # pylint: disable=unused-argument
@@ -978,15 +1067,13 @@ class EditorDepict(object):
 
     def processTemplate(self, tmpltPth, fn, parameterDict=None):
         """Read the input HTML template data file and perform the key/value substitutions in the
-        input parameter dictionary.
+        input parameter dictionary.  Template content is cached process-wide (see EditorTemplateCache).
         """
         if parameterDict is None:
             parameterDict = {}
 
         fPath = os.path.join(tmpltPth, fn)
-        with open(fPath, "r") as ifh:
-            sIn = ifh.read()
-        return sIn % parameterDict
+        return EditorTemplateCache.render(fPath, parameterDict)
 
     def truncateForDisplay(self, content, maxlength=20, suffix="..."):
         """Obtain truncated version of long identifiers for display purposes (e.g. in comparison panel)"""
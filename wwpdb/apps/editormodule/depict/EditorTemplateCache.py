@@ -0,0 +1,99 @@
+##
+# File:    EditorTemplateCache.py
+# Date:    19-Oct-2026
+#
+# Updates:
+##
+"""
+Process-wide cache of HTML templates used by EditorDepict.
+
+Templates are re-read only when their modification time or size changes.  Templates using
+only "%(name)s" and "%%" substitutions are precompiled into a substitution plan (alternating
+literal text and parameter names) which is rendered by a single join instead of re-parsing
+the template text on every "%" substitution.
+
+"""
+__docformat__ = "restructuredtext en"
+__author__ = "Raul Sala"
+__email__ = "rsala@rcsb.rutgers.edu"
+__license__ = "Creative Commons Attribution 3.0 Unported"
+__version__ = "V0.01"
+
+import os
+import re
+import threading
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class EditorTemplateCache(object):
+    """Cache of template text and substitution plans keyed by template path"""
+
+    __cache = {}
+    __lock = threading.Lock()
+    __tokenRe = re.compile(r"%\((\w+)\)s|%%")
+    __hits = 0
+    __misses = 0
+
+    @classmethod
+    def render(cls, fPath, parameterDict, compiled=True):
+        """Return template at fPath with key/value substitutions from parameterDict applied
+        (same result as reading the file and applying "%" with parameterDict)
+        """
+        entry = cls.__getEntry(fPath)
+        plan = entry["plan"]
+        if not compiled or plan is None:
+            return entry["text"] % parameterDict
+        #
+        literals, keys = plan
+        out = [literals[0]]
+        for key, literal in zip(keys, literals[1:]):
+            out.append("%" if key is None else "%s" % (parameterDict[key],))
+            out.append(literal)
+        return "".join(out)
+
+    @classmethod
+    def getStats(cls):
+        """Return dictionary of cache entry count and hit/miss counts"""
+        return {"entries": len(cls.__cache), "hits": cls.__hits, "misses": cls.__misses}
+
+    @classmethod
+    def clear(cls):
+        with cls.__lock:
+            cls.__cache.clear()
+
+    @classmethod
+    def __getEntry(cls, fPath):
+        st = os.stat(fPath)
+        stamp = (st.st_mtime, st.st_size)
+        entry = cls.__cache.get(fPath)
+        if entry is not None and entry["stamp"] == stamp:
+            cls.__hits += 1
+            return entry
+        #
+        cls.__misses += 1
+        with open(fPath, "r") as ifh:
+            text = ifh.read()
+        entry = {"stamp": stamp, "text": text, "plan": cls.__compile(text)}
+        with cls.__lock:
+            cls.__cache[fPath] = entry
+        logger.debug("loaded template %s (compiled %s)", fPath, entry["plan"] is not None)
+        return entry
+
+    @classmethod
+    def __compile(cls, text):
+        """Split template into literal text and parameter names (None for "%%").
+        Returns None if the template uses any other "%" conversions, in which case "%" substitution is used.
+        """
+        if "%" in cls.__tokenRe.sub("", text):
+            return None
+        literals = []
+        keys = []
+        last = 0
+        for m in cls.__tokenRe.finditer(text):
+            literals.append(text[last : m.start()])
+            keys.append(m.group(1))
+            last = m.end()
+        literals.append(text[last:])
+        return literals, keys
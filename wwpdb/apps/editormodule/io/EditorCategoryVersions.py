@@ -0,0 +1,72 @@
+##
+# File:    EditorCategoryVersions.py
+# Date:    19-Oct-2026
+#
+# Updates:
+##
+"""
+Per-category version numbers for the session data store, kept in session metadata.
+
+The version of a category is advanced whenever the category object is updated in the data
+store.  Mutating requests may carry the version of the category the client last saw, so that
+edits made against stale content are rejected, and clients may cache category content against
+its version.  When the data store is rebuilt all versions are advanced past any earlier value,
+so a version number is never reused for different content within a session.
+
+"""
+__docformat__ = "restructuredtext en"
+__author__ = "Raul Sala"
+__email__ = "rsala@rcsb.rutgers.edu"
+__license__ = "Creative Commons Attribution 3.0 Unported"
+__version__ = "V0.01"
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class EditorCategoryVersions(object):
+    """Accessors for category version numbers held in an EditorSessionMeta instance.
+    Changes are written when the session metadata is stored by the caller.
+    """
+
+    def __init__(self, sessMeta):
+        self.__sessMeta = sessMeta
+
+    def __getBase(self):
+        return self.__sessMeta.get("ctgry_version_base", 0)
+
+    def get(self, ctgryNm):
+        """Return current version of category ctgryNm"""
+        return max(self.__sessMeta.get("ctgry_versions", {}).get(ctgryNm, 0), self.__getBase())
+
+    def getAll(self):
+        base = self.__getBase()
+        return dict((ctgryNm, max(version, base)) for ctgryNm, version in self.__sessMeta.get("ctgry_versions", {}).items())
+
+    def bump(self, ctgryNmList):
+        """Advance the version of each category in ctgryNmList.  Returns dictionary of the new versions."""
+        versionD = dict(self.__sessMeta.get("ctgry_versions", {}))
+        base = self.__getBase()
+        for ctgryNm in ctgryNmList:
+            versionD[ctgryNm] = max(versionD.get(ctgryNm, 0), base) + 1
+        self.__sessMeta.set("ctgry_versions", versionD)
+        return dict((ctgryNm, versionD[ctgryNm]) for ctgryNm in ctgryNmList)
+
+    def rebase(self):
+        """Advance all versions past any earlier value, as when the data store is rebuilt"""
+        versionL = list(self.__sessMeta.get("ctgry_versions", {}).values())
+        self.__sessMeta.set("ctgry_version_base", max(versionL + [self.__getBase()]) + 1)
+        self.__sessMeta.set("ctgry_versions", {})
+
+    def isCurrent(self, ctgryNm, expectedVersion):
+        """Return True if expectedVersion (as sent by the client) is the current version of ctgryNm.
+        Requests not carrying a version (None or empty) are not checked.
+        """
+        if expectedVersion is None or str(expectedVersion).strip() == "":
+            return True
+        try:
+            return int(expectedVersion) == self.get(ctgryNm)
+        except ValueError:
+            logger.warning("invalid category version %r for %s", expectedVersion, ctgryNm)
+            return False
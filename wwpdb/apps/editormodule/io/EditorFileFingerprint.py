@@ -0,0 +1,103 @@
+##
+# File:    EditorFileFingerprint.py
+# Date:    19-Oct-2026
+#
+# Updates:
+#    2026-10-19    RPS    make()/matches() accept a digest computed while staging the file.
+#    2026-10-19    RPS    Added getStorePath()/getStoreFiles() for the files of a shelve store under any dbm implementation.
+##
+"""
+File fingerprints (path, size, modification time and content digest) recorded in session
+metadata so that persisted stores built from a file can be reused while the file is unchanged.
+
+"""
+__docformat__ = "restructuredtext en"
+__author__ = "Raul Sala"
+__email__ = "rsala@rcsb.rutgers.edu"
+__license__ = "Creative Commons Attribution 3.0 Unported"
+__version__ = "V0.01"
+
+import os
+import hashlib
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class EditorFileFingerprint(object):
+    """Static helpers for making and comparing file fingerprints"""
+
+    BLOCK_SIZE = 1024 * 1024
+    # file name suffixes of a shelve store by dbm implementation - gdbm: none, ndbm: .db, dumb: .dat/.dir/.bak
+    STORE_DATA_SUFFIXES = ["", ".db", ".dat"]
+    STORE_SUFFIXES = ["", ".db", ".dat", ".dir", ".bak"]
+
+    @staticmethod
+    def getStorePath(dbFilePath):
+        """Return path of the file holding the records of shelve store dbFilePath - dbFilePath itself as written by gdbm,
+        or the data file of the ndbm/dumb implementations used by shelve where Python is built without gdbm.
+        dbFilePath is returned if there is no such file.
+        """
+        for suffix in EditorFileFingerprint.STORE_DATA_SUFFIXES:
+            if os.path.isfile(dbFilePath + suffix):
+                return dbFilePath + suffix
+        return dbFilePath
+
+    @staticmethod
+    def getStoreFiles(dbFilePath):
+        """Return list of (suffix, path) of the existing files making up shelve store dbFilePath"""
+        return [(suffix, dbFilePath + suffix) for suffix in EditorFileFingerprint.STORE_SUFFIXES if os.path.isfile(dbFilePath + suffix)]
+
+    @staticmethod
+    def hashFile(filePath):
+        """Return sha1 hex digest of file contents"""
+        h = hashlib.sha1()
+        with open(filePath, "rb") as ifh:
+            for block in iter(lambda: ifh.read(EditorFileFingerprint.BLOCK_SIZE), b""):
+                h.update(block)
+        return h.hexdigest()
+
+    @staticmethod
+    def stamp(filePath):
+        """Return [path, size, mtime] for filePath, or None if the file is not accessible"""
+        if filePath is None or not os.access(filePath, os.R_OK):
+            return None
+        st = os.stat(filePath)
+        return [filePath, st.st_size, st.st_mtime]
+
+    @staticmethod
+    def make(filePath, withHash=True, sha1=None):
+        """Return fingerprint dictionary for filePath, or None if the file is not accessible.
+        sha1 may be given if the digest was already computed while reading the file.
+        """
+        stamp = EditorFileFingerprint.stamp(filePath)
+        if stamp is None:
+            return None
+        fpD = {"path": stamp[0], "size": stamp[1], "mtime": stamp[2]}
+        if sha1 is not None:
+            fpD["sha1"] = sha1
+        elif withHash:
+            fpD["sha1"] = EditorFileFingerprint.hashFile(filePath)
+        return fpD
+
+    @staticmethod
+    def matches(fpD, filePath, sha1=None):
+        """Return True if filePath is unchanged with respect to fingerprint fpD.
+
+        Path and size must agree.  If the modification time also agrees the file is taken as
+        unchanged without reading it, otherwise the content digest (sha1 if already known) decides.
+        """
+        if not fpD or filePath is None or fpD.get("path") != filePath:
+            return False
+        stamp = EditorFileFingerprint.stamp(filePath)
+        if stamp is None or stamp[1] != fpD.get("size"):
+            return False
+        if stamp[2] == fpD.get("mtime"):
+            return True
+        if "sha1" not in fpD:
+            return False
+        try:
+            return (sha1 if sha1 is not None else EditorFileFingerprint.hashFile(filePath)) == fpD["sha1"]
+        except:  # noqa: E722 pylint: disable=bare-except
+            logger.exception("Failed hashing %s", filePath)
+            return False
@@ -0,0 +1,207 @@
+##
+# File:    EditorMemoryProfile.py
+# Date:    19-Oct-2026
+#
+# Updates:
+#    2026-10-19    RPS    Report file name documented with the process id.
+#    2026-10-19    RPS    Profiled operations serialized (process-wide tracemalloc state); nested profiles not reported separately.
+##
+"""
+Optional memory profiling of memory-intensive editor operations (data store and dictionary
+store initialization, export, dictionary checks).
+
+When enabled, an operation is run with tracemalloc tracing.  On completion the peak traced
+memory, the growth in memory still held, the peak resident set size of the process and the
+top allocation sites (compared with a snapshot taken on entry) are written to the session
+directory as memprofile_<op>_<timestamp>_<pid>.json, and per-operation figures are kept for metrics.
+
+Tracing slows allocation-heavy code considerably, so profiling is only done on request.  The
+process-wide tracemalloc figures include allocations made concurrently by other threads, so the
+launch pipeline runs its stages serially while profiling.  As tracing and its peak are process-wide,
+profiled operations of concurrent requests are run one at a time, and an operation profiled within
+another in the same thread is accounted to the enclosing one.
+
+"""
+__docformat__ = "restructuredtext en"
+__author__ = "Raul Sala"
+__email__ = "rsala@rcsb.rutgers.edu"
+__license__ = "Creative Commons Attribution 3.0 Unported"
+__version__ = "V0.01"
+
+import os
+import sys
+import json
+import time
+import threading
+import logging
+
+try:
+    import tracemalloc
+except ImportError:  # pragma: no cover
+    tracemalloc = None
+
+try:
+    import resource
+except ImportError:  # pragma: no cover
+    resource = None
+
+logger = logging.getLogger(__name__)
+
+
+class EditorMemoryProfile(object):
+    """Context manager profiling memory use of one operation"""
+
+    __statsLock = threading.Lock()
+    __statsD = {}
+    # held for the duration of a profiled operation - reentrant, for operations profiled within another
+    __profileLock = threading.RLock()
+    __depth = 0
+
+    def __init__(self, opName, sessionPath=None, enabled=True, topN=25, frames=1):
+        """
+        :param `opName`:       operation name, used in the file name and metrics
+        :param `sessionPath`:  directory receiving the profile report (none written if None)
+        :param `enabled`:      if False the context manager does nothing
+        :param `topN`:         number of allocation sites reported
+        :param `frames`:       traceback depth recorded per allocation
+
+        """
+        self.__opName = opName
+        self.__sessionPath = sessionPath
+        self.__enabled = enabled and tracemalloc is not None
+        self.__topN = topN
+        self.__frames = frames
+        self.__startedTracing = False
+        self.__startSnapshot = None
+        self.__startTraced = 0
+        self.__tStart = None
+        self.__reportD = None
+        self.__nested = False
+
+    @staticmethod
+    def getPeakRss():
+        """Return peak resident set size of this process in bytes (None where not available)"""
+        if resource is None:
+            return None
+        maxRss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # kilobytes on Linux, bytes on macOS
+        return maxRss if sys.platform == "darwin" else maxRss * 1024
+
+    def __enter__(self):
+        if not self.__enabled:
+            return self
+        EditorMemoryProfile.__profileLock.acquire()
+        EditorMemoryProfile.__depth += 1
+        if EditorMemoryProfile.__depth > 1:
+            # within a profiled operation of this thread - resetting the peak would corrupt the enclosing profile
+            self.__nested = True
+            return self
+        try:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start(self.__frames)
+                self.__startedTracing = True
+            elif hasattr(tracemalloc, "reset_peak"):
+                tracemalloc.reset_peak()
+            self.__startSnapshot = tracemalloc.take_snapshot()
+            self.__startTraced = tracemalloc.get_traced_memory()[0]
+            self.__tStart = time.time()
+        except:  # noqa: E722 pylint: disable=bare-except
+            self.__release()
+            raise
+        return self
+
+    def __release(self):
+        EditorMemoryProfile.__depth -= 1
+        EditorMemoryProfile.__profileLock.release()
+
+    def __exit__(self, excType, excValue, tb):
+        if not self.__enabled:
+            return False
+        if self.__nested:
+            self.__release()
+            return False
+        try:
+            self.__profile(excType)
+        finally:
+            self.__release()
+        if self.__reportD is not None:
+            self.__recordStats(self.__reportD)
+            self.__writeReport(self.__reportD)
+        return False
+
+    def __profile(self, excType):
+        try:
+            traced, peak = tracemalloc.get_traced_memory()
+            snapshot = tracemalloc.take_snapshot()
+            siteL = []
+            for stat in snapshot.compare_to(self.__startSnapshot, "lineno")[: self.__topN]:
+                frame = stat.traceback[0]
+                siteL.append({"site": "%s:%d" % (frame.filename, frame.lineno), "size_diff": stat.size_diff, "size": stat.size, "count_diff": stat.count_diff})
+            self.__reportD = {
+                "op": self.__opName,
+                "pid": os.getpid(),
+                "time": time.time(),
+                "elapsed_secs": time.time() - self.__tStart,
+                "failed": excType is not None,
+                "traced_peak_bytes": peak - self.__startTraced,
+                "traced_growth_bytes": traced - self.__startTraced,
+                "peak_rss_bytes": self.getPeakRss(),
+                "top_sites": siteL,
+            }
+        except:  # noqa: E722 pylint: disable=bare-except
+            logger.exception("Failed profiling memory use of %s", self.__opName)
+        finally:
+            self.__startSnapshot = None
+            if self.__startedTracing:
+                tracemalloc.stop()
+
+    def getReport(self):
+        """Return report dictionary of the profiled operation (None if not profiled)"""
+        return self.__reportD
+
+    def __writeReport(self, reportD):
+        if self.__sessionPath is None or not os.path.isdir(self.__sessionPath):
+            return
+        filePath = os.path.join(self.__sessionPath, "memprofile_%s_%s_%d.json" % (self.__opName, time.strftime("%Y%m%d%H%M%S", time.localtime()), os.getpid()))
+        try:
+            with open(filePath, "w") as ofh:
+                json.dump(reportD, ofh, indent=1)
+            logger.info("%s traced peak %d bytes, peak rss %s bytes, report in %s", self.__opName, reportD["traced_peak_bytes"], reportD["peak_rss_bytes"], filePath)
+        except:  # noqa: E722 pylint: disable=bare-except
+            logger.exception("Failed writing memory profile %s", filePath)
+
+    @classmethod
+    def __recordStats(cls, reportD):
+        with cls.__statsLock:
+            sD = cls.__statsD.setdefault(reportD["op"], {"count": 0, "traced_peak_bytes_max": 0, "traced_peak_bytes_last": 0, "traced_growth_bytes_last": 0})
+            sD["count"] += 1
+            sD["traced_peak_bytes_max"] = max(sD["traced_peak_bytes_max"], reportD["traced_peak_bytes"])
+            sD["traced_peak_bytes_last"] = reportD["traced_peak_bytes"]
+            sD["traced_growth_bytes_last"] = reportD["traced_growth_bytes"]
+
+    @classmethod
+    def getStats(cls):
+        """Return per-operation figures of profiled operations in this process"""
+        with cls.__statsLock:
+            return dict((opName, dict(sD)) for opName, sD in cls.__statsD.items())
+
+    @classmethod
+    def toPrometheus(cls):
+        """Render per-operation figures and process peak RSS as Prometheus text lines"""
+        lineL = []
+        statsD = cls.getStats()
+        if statsD:
+            lineL.append("# HELP editor_memory_traced_peak_bytes Largest traced memory peak of profiled operations in this process.")
+            lineL.append("# TYPE editor_memory_traced_peak_bytes gauge")
+            for opName, sD in sorted(statsD.items()):
+                lineL.append('editor_memory_traced_peak_bytes{op="%s"} %d' % (opName, sD["traced_peak_bytes_max"]))
+            lineL.append("# HELP editor_memory_profiled_total Memory profiled operations in this process.")
+            lineL.append("# TYPE editor_memory_profiled_total counter")
+            for opName, sD in sorted(statsD.items()):
+                lineL.append('editor_memory_profiled_total{op="%s"} %d' % (opName, sD["count"]))
+        peakRss = cls.getPeakRss()
+        if peakRss is not None:
+            lineL.append("# HELP editor_process_peak_rss_bytes Peak resident set size of this process.")
+            lineL.append("# TYPE editor_process_peak_rss_bytes gauge")
+            lineL.append("editor_process_peak_rss_bytes %d" % peakRss)
+        return lineL
@@ -0,0 +1,154 @@
+##
+# File:    EditorModelStaging.py
+# Date:    19-Oct-2026
+#
+# Updates:
+#    2026-10-19    RPS    Stream copy is the default.  Link strategies take the digest from the fingerprint recorded for the
+#                         source file when it is unchanged, rather than reading the linked file again.
+#    2026-10-19    RPS    Nothing copied or read when the source file is unchanged and its session copy is still as staged
+#                         (makeFingerprint()/isStaged()); digest of a file already in the session taken from its fingerprint.
+##
+"""
+Staging of the model data file from its source location (e.g. the workflow archive) into the
+session directory, computing the content digest in the same pass so that the model bytes are
+read from the source storage only once per launch.
+
+Strategies:
+
+    + ``reflink``:   copy-on-write clone of the source file (same filesystem, btrfs/xfs)
+    + ``hardlink``:  hard link to the source file (same filesystem)
+    + ``stream``:    chunked copy, digest updated from the same buffers (default)
+    + ``inplace``:   parse straight from the source path; the session path is a symbolic link
+    + ``auto``:      reflink, then hardlink, then stream
+
+Linking strategies and inplace read nothing while staging.  The digest is then taken from the
+fingerprint recorded for the source file at an earlier launch if the file is unchanged (same path,
+size and modification time), and is otherwise computed from the source file, in a single read.
+A fingerprint made by makeFingerprint() also records the size and modification time of the session
+copy; while both files are unchanged, staging again is skipped altogether.
+
+With hardlink (or inplace) the session file is the archive file.  The session path is only ever
+replaced by rename, here and on restaging; exports and other outputs are written to files of their
+own.  Because an in-place write to the session copy would modify the archive, these strategies
+must be requested explicitly (request parameter model_staging).
+
+"""
+__docformat__ = "restructuredtext en"
+__author__ = "Raul Sala"
+__email__ = "rsala@rcsb.rutgers.edu"
+__license__ = "Creative Commons Attribution 3.0 Unported"
+__version__ = "V0.01"
+
+import sys
+import os
+import hashlib
+import threading
+import logging
+
+from wwpdb.apps.editormodule.io.EditorFileFingerprint import EditorFileFingerprint
+from wwpdb.apps.editormodule.io.EditorStoreCache import EditorStoreCache
+
+logger = logging.getLogger(__name__)
+
+
+class EditorModelStaging(object):
+    """Stage a model data file into the session directory"""
+
+    STRATEGIES = ["auto", "reflink", "hardlink", "stream", "inplace"]
+
+    def __init__(self, strategy="stream", verbose=False, log=sys.stderr):
+        self.__verbose = verbose
+        self.__lfh = log
+        if strategy not in self.STRATEGIES:
+            logger.warning("unknown model staging strategy %r, using stream", strategy)
+            strategy = "stream"
+        self.__strategy = strategy
+
+    def stage(self, srcPath, lclPath, srcFingerprint=None):
+        """Stage srcPath as lclPath.
+
+        :param `srcFingerprint`:  fingerprint recorded for srcPath at an earlier launch (EditorFileFingerprint.make()), if any
+
+        :Returns:
+            ``parsePath``: path from which the model file should be parsed
+            ``method``:    staging method used ("reflink", "hardlink", "stream", "inplace", or "none" if srcPath is lclPath
+                           or the session copy of the unchanged source file is already in place)
+            ``sha1``:      hex digest of the file content
+        """
+        if srcPath == lclPath:
+            return lclPath, "none", self.__getDigest(lclPath, srcFingerprint)
+        if self.isStaged(srcPath, lclPath, srcFingerprint):
+            return (srcPath if os.path.islink(lclPath) else lclPath), "none", srcFingerprint["sha1"]
+        #
+        if self.__strategy == "inplace":
+            if self.__link(os.symlink, srcPath, lclPath):
+                return srcPath, "inplace", self.__getDigest(srcPath, srcFingerprint)
+            # session copy still needed for access from the front-end
+            return lclPath, "stream", self.__streamCopy(srcPath, lclPath)
+        #
+        tryL = ["reflink", "hardlink"] if self.__strategy == "auto" else [self.__strategy]
+        for method in tryL:
+            if method == "reflink" and self.__link(EditorStoreCache.reflinkFile, srcPath, lclPath):
+                return lclPath, method, self.__getDigest(srcPath, srcFingerprint)
+            if method == "hardlink" and hasattr(os, "link") and self.__link(os.link, srcPath, lclPath):
+                return lclPath, method, self.__getDigest(srcPath, srcFingerprint)
+        return lclPath, "stream", self.__streamCopy(srcPath, lclPath)
+
+    @staticmethod
+    def makeFingerprint(srcPath, lclPath, sha1=None):
+        """Return fingerprint of source file srcPath (EditorFileFingerprint.make()) recording also the size and
+        modification time of its session copy lclPath, or None if srcPath is not accessible
+        """
+        fpD = EditorFileFingerprint.make(srcPath, sha1=sha1)
+        stamp = EditorFileFingerprint.stamp(lclPath)
+        if fpD is not None and stamp is not None:
+            fpD["staged_stamp"] = stamp[1:]
+        return fpD
+
+    @staticmethod
+    def isStaged(srcPath, lclPath, srcFingerprint):
+        """Return True if srcPath has the path, size and modification time of fingerprint srcFingerprint (makeFingerprint())
+        and its session copy lclPath is unchanged since, so that neither needs to be read or copied again
+        """
+        if not srcFingerprint or not srcFingerprint.get("sha1") or not srcFingerprint.get("staged_stamp"):
+            return False
+        if EditorFileFingerprint.stamp(srcPath) != [srcFingerprint.get("path"), srcFingerprint.get("size"), srcFingerprint.get("mtime")]:
+            return False
+        stamp = EditorFileFingerprint.stamp(lclPath)
+        return stamp is not None and stamp[1:] == srcFingerprint["staged_stamp"]
+
+    def __getDigest(self, srcPath, srcFingerprint):
+        """Digest of recorded fingerprint srcFingerprint if srcPath is unchanged since, otherwise of the content of srcPath"""
+        stamp = EditorFileFingerprint.stamp(srcPath)
+        if srcFingerprint and srcFingerprint.get("sha1") and stamp is not None and [srcFingerprint.get("path"), srcFingerprint.get("size"), srcFingerprint.get("mtime")] == stamp:
+            return srcFingerprint["sha1"]
+        return EditorFileFingerprint.hashFile(srcPath)
+
+    def __getTmpPath(self, filePath):
+        return "%s.%d.%d.tmp" % (filePath, os.getpid(), threading.current_thread().ident)
+
+    def __link(self, linkFunc, srcPath, lclPath):
+        tmpPath = self.__getTmpPath(lclPath)
+        try:
+            if os.path.lexists(tmpPath):
+                os.remove(tmpPath)
+            linkFunc(srcPath, tmpPath)
+            os.rename(tmpPath, lclPath)
+            return True
+        except (IOError, OSError) as e:
+            if self.__verbose:
+                logger.info("%s of %s not possible: %s", getattr(linkFunc, "__name__", linkFunc), srcPath, e)
+            if os.path.lexists(tmpPath):
+                os.remove(tmpPath)
+        return False
+
+    def __streamCopy(self, srcPath, lclPath):
+        h = hashlib.sha1()
+        tmpPath = self.__getTmpPath(lclPath)
+        with open(srcPath, "rb") as ifh:
+            with open(tmpPath, "wb") as ofh:
+                for block in iter(lambda: ifh.read(EditorFileFingerprint.BLOCK_SIZE), b""):
+                    h.update(block)
+                    ofh.write(block)
+        os.rename(tmpPath, lclPath)
+        return h.hexdigest()
@@ -0,0 +1,223 @@
+##
+# File:    EditorSessionLock.py
+# Date:    19-Oct-2026
+#
+# Updates:
+#    2026-10-19    RPS    Added iterHolding() for holding the lock until streamed content has been consumed.
+##
+"""
+Per-session reader-writer lock serializing mutations of the session data stores.
+
+Requests that only read the session stores may proceed concurrently, while requests that
+modify them (edits, row actions, undo, launch/reload, export) are run one at a time, so that
+fetchOneObject()/updateOneObject() read-modify-write cycles of concurrent requests (e.g. a
+quick double edit, or an edit racing a snapshot) can no longer interleave.
+
+The lock is taken on files in the session directory with flock(), so that it holds between
+threads and between worker processes.  Entry is ordered through a "turnstile" lock: a waiting
+writer holds the turnstile, so readers arriving after it queue behind it rather than starving
+it.  Within one process waiters pass the turnstile strictly in arrival order.
+
+"""
+__docformat__ = "restructuredtext en"
+__author__ = "Raul Sala"
+__email__ = "rsala@rcsb.rutgers.edu"
+__license__ = "Creative Commons Attribution 3.0 Unported"
+__version__ = "V0.01"
+
+import sys
+import os
+import time
+import threading
+import logging
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+
+class _TicketQueue(object):
+    """In-process first-come first-served ordering of waiters for one session"""
+
+    def __init__(self):
+        self.cond = threading.Condition(threading.Lock())
+        self.nextTicket = 0
+        self.serving = 0
+
+
+class _HeldIterator(object):
+    """Iterator over iterable releasing lock sLock once exhausted, closed, failed or discarded"""
+
+    def __init__(self, iterable, sLock):
+        self.__iter = iter(iterable)
+        self.__sLock = sLock
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self.__sLock is None:
+            raise StopIteration
+        try:
+            return next(self.__iter)
+        except BaseException:
+            # StopIteration at the end of the content, or failure producing it
+            self.close()
+            raise
+
+    next = __next__  # Python 2
+
+    def close(self):
+        if self.__sLock is not None:
+            closeFunc = getattr(self.__iter, "close", None)
+            try:
+                if closeFunc is not None:
+                    closeFunc()
+            finally:
+                self.__sLock.release()
+                self.__sLock = None
+
+    def __del__(self):
+        self.close()
+
+
+class EditorSessionLock(object):
+    """Fair reader-writer lock on a session directory"""
+
+    LOCK_FILE_NAME = "sessionLock"
+    # waits longer than this are logged
+    WARN_WAIT_SECS = 2.0
+
+    __queueD = {}
+    __queueLock = threading.Lock()
+    __statsLock = threading.Lock()
+    __statsD = {}
+
+    def __init__(self, sessionPath, verbose=False, log=sys.stderr):
+        """
+        :param `sessionPath`:  session directory.  If None, acquiring the lock is a no-op (e.g. requests starting a new session).
+
+        """
+        self.__verbose = verbose
+        self.__lfh = log
+        self.__sessionPath = sessionPath
+        self.__fhL = []
+        self.__write = False
+        self.__opName = None
+        self.__tAcquired = None
+
+    def read(self, opName=None):
+        """Return this lock set for shared (read) access, for use in a with statement"""
+        self.__write = False
+        self.__opName = opName
+        return self
+
+    def write(self, opName=None):
+        """Return this lock set for exclusive (write) access, for use in a with statement"""
+        self.__write = True
+        self.__opName = opName
+        return self
+
+    def __enter__(self):
+        self.acquire(write=self.__write, opName=self.__opName)
+        return self
+
+    def __exit__(self, excType, excValue, tb):
+        self.release()
+        return False
+
+    def __getQueue(self):
+        with EditorSessionLock.__queueLock:
+            tq = EditorSessionLock.__queueD.get(self.__sessionPath)
+            if tq is None:
+                tq = _TicketQueue()
+                EditorSessionLock.__queueD[self.__sessionPath] = tq
+            return tq
+
+    def acquire(self, write=True, opName=None):
+        """Block until the lock is held for exclusive (write=True) or shared access"""
+        if self.__sessionPath is None or fcntl is None or self.__fhL:
+            return
+        self.__write = write
+        self.__opName = opName
+        lockPath = os.path.join(self.__sessionPath, self.LOCK_FILE_NAME)
+        tq = self.__getQueue()
+        tStart = time.time()
+        #
+        with tq.cond:
+            ticket = tq.nextTicket
+            tq.nextTicket += 1
+            queued = ticket - tq.serving
+            while ticket != tq.serving:
+                tq.cond.wait()
+        try:
+            turnFh = open(lockPath + ".turn", "a")
+            try:
+                fcntl.flock(turnFh.fileno(), fcntl.LOCK_EX)
+                lockFh = open(lockPath, "a")
+                fcntl.flock(lockFh.fileno(), fcntl.LOCK_EX if write else fcntl.LOCK_SH)
+            finally:
+                # closing releases the turnstile
+                turnFh.close()
+        finally:
+            with tq.cond:
+                tq.serving += 1
+                tq.cond.notify_all()
+        self.__fhL = [lockFh]
+        self.__tAcquired = time.time()
+        #
+        waitSecs = self.__tAcquired - tStart
+        self.__recordAcquire(waitSecs, queued)
+        if waitSecs > self.WARN_WAIT_SECS:
+            logger.warning("%s waited %.3f s for %s session lock on %s", opName, waitSecs, "write" if write else "read", self.__sessionPath)
+        elif self.__verbose:
+            logger.info("%s acquired %s session lock after %.3f s", opName, "write" if write else "read", waitSecs)
+
+    def release(self):
+        if not self.__fhL:
+            return
+        for fh in self.__fhL:
+            fh.close()
+        self.__fhL = []
+        self.__recordRelease(time.time() - self.__tAcquired)
+
+    def iterHolding(self, iterable):
+        """Return iterator over iterable that keeps this (acquired) lock until the iterator is exhausted or closed -
+        for content streamed from the session stores after the operation has returned.
+        """
+        return _HeldIterator(iterable, self)
+
+    def __recordAcquire(self, waitSecs, queued):
+        mode = "write" if self.__write else "read"
+        with EditorSessionLock.__statsLock:
+            sD = EditorSessionLock.__statsD.setdefault(
+                mode, {"acquired": 0, "contended": 0, "wait_secs_total": 0.0, "wait_secs_max": 0.0, "hold_secs_total": 0.0, "hold_secs_max": 0.0, "queued_max": 0}
+            )
+            sD["acquired"] += 1
+            # waits of less than a millisecond are the cost of taking the lock itself
+            if waitSecs > 0.001:
+                sD["contended"] += 1
+            sD["wait_secs_total"] += waitSecs
+            sD["wait_secs_max"] = max(sD["wait_secs_max"], waitSecs)
+            sD["queued_max"] = max(sD["queued_max"], queued)
+
+    def __recordRelease(self, holdSecs):
+        mode = "write" if self.__write else "read"
+        with EditorSessionLock.__statsLock:
+            sD = EditorSessionLock.__statsD[mode]
+            sD["hold_secs_total"] += holdSecs
+            sD["hold_secs_max"] = max(sD["hold_secs_max"], holdSecs)
+
+    @classmethod
+    def getStats(cls):
+        """Return contention counters for this process, by lock mode ("read", "write")"""
+        with cls.__statsLock:
+            return dict((mode, dict(sD)) for mode, sD in cls.__statsD.items())
+
+    @classmethod
+    def resetStats(cls):
+        with cls.__statsLock:
+            cls.__statsD.clear()
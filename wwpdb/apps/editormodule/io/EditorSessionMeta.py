@@ -0,0 +1,83 @@
+##
+# File:    EditorSessionMeta.py
+# Date:    19-Oct-2026
+#
+# Updates:
+##
+"""
+Small JSON document of per-session metadata (e.g. data store details recorded at launch)
+kept alongside the session data stores so that later requests need not reopen the stores.
+
+"""
+__docformat__ = "restructuredtext en"
+__author__ = "Raul Sala"
+__email__ = "rsala@rcsb.rutgers.edu"
+__license__ = "Creative Commons Attribution 3.0 Unported"
+__version__ = "V0.01"
+
+import sys
+import os
+import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class EditorSessionMeta(object):
+    """Accessors for the session metadata file (sessionMeta.json in the session directory)"""
+
+    def __init__(self, sessionPath, verbose=False, log=sys.stderr):
+        self.__verbose = verbose
+        self.__lfh = log
+        self.__filePath = os.path.join(sessionPath, "sessionMeta.json")
+        self.__metaD = {}
+        self.__loaded = False
+
+    def getFilePath(self):
+        return self.__filePath
+
+    def load(self):
+        """Read metadata file if present.  Returns True if metadata was read."""
+        self.__loaded = True
+        if not os.access(self.__filePath, os.R_OK):
+            return False
+        try:
+            with open(self.__filePath, "r") as ifh:
+                self.__metaD = json.load(ifh)
+            return True
+        except:  # noqa: E722 pylint: disable=bare-except
+            logger.exception("Failed reading session metadata from %s", self.__filePath)
+            self.__metaD = {}
+            return False
+
+    def store(self):
+        """Write metadata file (atomically replacing any prior version)"""
+        try:
+            tmpPath = self.__filePath + ".tmp"
+            with open(tmpPath, "w") as ofh:
+                json.dump(self.__metaD, ofh)
+            os.rename(tmpPath, self.__filePath)
+            return True
+        except:  # noqa: E722 pylint: disable=bare-except
+            logger.exception("Failed storing session metadata to %s", self.__filePath)
+            return False
+
+    def get(self, key, default=None):
+        if not self.__loaded:
+            self.load()
+        return self.__metaD.get(key, default)
+
+    def set(self, key, value):
+        if not self.__loaded:
+            self.load()
+        self.__metaD[key] = value
+
+    def update(self, metaD):
+        if not self.__loaded:
+            self.load()
+        self.__metaD.update(metaD)
+
+    def remove(self, key):
+        if not self.__loaded:
+            self.load()
+        self.__metaD.pop(key, None)
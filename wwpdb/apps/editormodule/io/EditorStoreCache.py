@@ -0,0 +1,194 @@
+##
+# File:    EditorStoreCache.py
+# Date:    19-Oct-2026
+#
+# Updates:
+#    2026-10-19    RPS    reflinkFile() split out of cloneFile() for use in model file staging.
+#    2026-10-19    RPS    Added process-wide hit/miss/store counts (getStats()) and getUsage() of the cache directory.
+#    2026-10-19    RPS    store() skips data stores not held in a single file (dbm fallbacks of shelve).
+##
+"""
+Host-level cache of persisted model data stores, keyed by the content digest of the model
+file they were built from, so that sessions opening identical model files share one parse.
+
+Each entry is a pristine copy of the shelved data store plus a small JSON document of entry
+header details recorded at build time.  Sessions never open cache entries directly; an entry
+is cloned into the session directory, using a copy-on-write reflink where the filesystem
+supports it and a plain copy otherwise, so edits made in one session cannot leak into the
+cache or into other sessions.  Least recently used entries are pruned beyond a fixed count.
+
+"""
+__docformat__ = "restructuredtext en"
+__author__ = "Raul Sala"
+__email__ = "rsala@rcsb.rutgers.edu"
+__license__ = "Creative Commons Attribution 3.0 Unported"
+__version__ = "V0.01"
+
+import sys
+import os
+import json
+import shutil
+import threading
+import logging
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+
+class EditorStoreCache(object):
+    """Content-addressed cache of persisted data stores"""
+
+    # bumped whenever the layout of persisted data stores or recorded header details changes
+    FORMAT_VERSION = "1"
+    # Linux FICLONE ioctl - whole file copy-on-write clone (btrfs, xfs, ...)
+    FICLONE = 0x40049409
+    # process-wide counts of fetches finding an entry (hits) or not (misses) and of entries stored
+    __statsD = {"hits": 0, "misses": 0, "stores": 0}
+    __statsLock = threading.Lock()
+
+    def __init__(self, cachePath, maxEntries=64, verbose=False, log=sys.stderr):
+        """
+        :param `cachePath`:   directory holding cache entries (created if necessary)
+        :param `maxEntries`:  number of entries retained, least recently used entries being pruned first
+
+        """
+        self.__verbose = verbose
+        self.__lfh = log
+        self.__cachePath = cachePath
+        self.__maxEntries = maxEntries
+
+    def __getEntryPaths(self, key):
+        base = os.path.join(self.__cachePath, "store_%s_%s" % (self.FORMAT_VERSION, key))
+        return base + ".db", base + ".json"
+
+    def __getTmpPath(self, filePath):
+        return "%s.%d.%d.tmp" % (filePath, os.getpid(), threading.current_thread().ident)
+
+    def fetch(self, key, dbFilePath):
+        """Clone cached data store for content digest key to dbFilePath.
+
+        :Returns:
+            dictionary of metadata recorded with the entry, or None if there is no usable entry
+        """
+        dbPath, metaPath = self.__getEntryPaths(key)
+        if not (os.access(dbPath, os.R_OK) and os.access(metaPath, os.R_OK)):
+            self.__count("misses")
+            return None
+        try:
+            with open(metaPath, "r") as ifh:
+                metaD = json.load(ifh)
+            tmpPath = self.__getTmpPath(dbFilePath)
+            method = self.cloneFile(dbPath, tmpPath)
+            os.rename(tmpPath, dbFilePath)
+            # recency for pruning
+            os.utime(metaPath, None)
+            logger.info("cloned cached data store %s to %s by %s", dbPath, dbFilePath, method)
+            self.__count("hits")
+            return metaD
+        except:  # noqa: E722 pylint: disable=bare-except
+            logger.exception("Failed fetching cached data store %s", dbPath)
+        self.__count("misses")
+        return None
+
+    def store(self, key, dbFilePath, metaD):
+        """Add pristine data store at dbFilePath to the cache under content digest key, along with metaD"""
+        dbPath, metaPath = self.__getEntryPaths(key)
+        if not os.path.isfile(dbFilePath):
+            # only stores held in a single file (gdbm) are cached - not those of the dbm fallbacks of shelve
+            logger.info("data store %s is not a single file, not cached", dbFilePath)
+            return False
+        try:
+            if not os.path.isdir(self.__cachePath):
+                os.makedirs(self.__cachePath)
+            #
+            tmpPath = self.__getTmpPath(dbPath)
+            self.cloneFile(dbFilePath, tmpPath)
+            os.rename(tmpPath, dbPath)
+            # metadata written last - an entry is only visible to fetch() once both are in place
+            tmpPath = self.__getTmpPath(metaPath)
+            with open(tmpPath, "w") as ofh:
+                json.dump(metaD, ofh)
+            os.rename(tmpPath, metaPath)
+            if self.__verbose:
+                logger.info("cached data store %s as %s", dbFilePath, dbPath)
+            self.__count("stores")
+            self.prune()
+            return True
+        except:  # noqa: E722 pylint: disable=bare-except
+            logger.exception("Failed caching data store %s", dbFilePath)
+        return False
+
+    @classmethod
+    def __count(cls, name):
+        with cls.__statsLock:
+            cls.__statsD[name] += 1
+
+    @classmethod
+    def getStats(cls):
+        """Return process-wide hit, miss and store counts"""
+        with cls.__statsLock:
+            return dict(cls.__statsD)
+
+    def getUsage(self):
+        """Return dictionary of the number of entries and bytes held in the cache directory"""
+        entries = 0
+        totalBytes = 0
+        fileL = os.listdir(self.__cachePath) if os.path.isdir(self.__cachePath) else []
+        for fn in fileL:
+            if fn.startswith("store_") and not fn.endswith(".tmp"):
+                try:
+                    totalBytes += os.stat(os.path.join(self.__cachePath, fn)).st_size
+                    entries += 1 if fn.endswith(".json") else 0
+                except OSError:
+                    # pruned meanwhile
+                    pass
+        return {"entries": entries, "bytes": totalBytes, "max_entries": self.__maxEntries}
+
+    def prune(self):
+        """Remove least recently used entries beyond the configured maximum"""
+        try:
+            entryL = []
+            for fn in os.listdir(self.__cachePath):
+                if fn.startswith("store_") and fn.endswith(".json"):
+                    fPath = os.path.join(self.__cachePath, fn)
+                    entryL.append((os.stat(fPath).st_mtime, fPath))
+            entryL.sort(reverse=True)
+            for _mtime, metaPath in entryL[self.__maxEntries :]:
+                for fPath in [metaPath, metaPath[: -len(".json")] + ".db"]:
+                    if os.path.exists(fPath):
+                        os.remove(fPath)
+        except:  # noqa: E722 pylint: disable=bare-except
+            logger.exception("Failed pruning data store cache %s", self.__cachePath)
+
+    @staticmethod
+    def cloneFile(srcPath, dstPath):
+        """Copy srcPath to dstPath as a copy-on-write reflink where supported, otherwise as a plain copy.
+
+        :Returns:
+            "reflink" or "copy"
+        """
+        try:
+            EditorStoreCache.reflinkFile(srcPath, dstPath)
+            return "reflink"
+        except (IOError, OSError):
+            pass
+        shutil.copyfile(srcPath, dstPath)
+        return "copy"
+
+    @staticmethod
+    def reflinkFile(srcPath, dstPath):
+        """Create dstPath as a copy-on-write clone of srcPath.  Raises OSError where not supported."""
+        if fcntl is None or not sys.platform.startswith("linux"):
+            raise OSError("reflink not supported on this platform")
+        try:
+            with open(srcPath, "rb") as ifh:
+                with open(dstPath, "wb") as ofh:
+                    fcntl.ioctl(ofh.fileno(), EditorStoreCache.FICLONE, ifh.fileno())
+        except (IOError, OSError):
+            if os.path.exists(dstPath):
+                os.remove(dstPath)
+            raise
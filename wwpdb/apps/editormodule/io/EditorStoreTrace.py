@@ -0,0 +1,124 @@
+##
+# File:    EditorStoreTrace.py
+# Date:    19-Oct-2026
+#
+# Updates:
+##
+"""
+Per-request tracing of persisted store access (model data store and dictionary store).
+
+Store classes are wrapped by tracedClass(), which returns a subclass recording each call of
+the store access methods in the trace of the current request: shelve opens, fetches, updates,
+time spent and, when detail is requested, an estimate of the bytes unpickled.  Fetches of the
+same object repeated within one request are reported, as an indication of handlers that
+reopen the store for the same category (N+1 access).
+
+A trace is begun and ended around each request by EditorWebApp; threads started while
+handling a request may adopt the trace with attach().
+
+"""
+__docformat__ = "restructuredtext en"
+__author__ = "Raul Sala"
+__email__ = "rsala@rcsb.rutgers.edu"
+__license__ = "Creative Commons Attribution 3.0 Unported"
+__version__ = "V0.01"
+
+import time
+import pickle
+import threading
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class EditorStoreTrace(object):
+    """Store access counters for one request"""
+
+    # methods of PdbxPersist / PdbxDictionaryInfoStore recorded, by kind of access - each opens the store file
+    FETCH_METHODS = ["fetchOneObject", "fetchViewObject", "getIndex", "recover"]
+    UPDATE_METHODS = ["updateOneObject", "store"]
+
+    __local = threading.local()
+
+    def __init__(self, detail=False):
+        self.__detail = detail
+        self.__lock = threading.Lock()
+        self.__storeD = {}
+        self.__fetchKeyD = {}
+
+    @classmethod
+    def begin(cls, detail=False):
+        """Begin a new trace for the request handled by the current thread"""
+        trace = cls(detail=detail)
+        cls.__local.trace = trace
+        return trace
+
+    @classmethod
+    def end(cls):
+        """End the trace of the current thread, returning its summary dictionary (or None if none was begun)"""
+        trace = getattr(cls.__local, "trace", None)
+        cls.__local.trace = None
+        return trace.getDict() if trace is not None else None
+
+    @classmethod
+    def current(cls):
+        return getattr(cls.__local, "trace", None)
+
+    @classmethod
+    def attach(cls, trace):
+        """Record store access of the current thread in trace (e.g. for a worker thread started by a request)"""
+        cls.__local.trace = trace
+
+    def record(self, storeName, method, elapsedSecs, args, result):
+        nBytes = 0
+        if self.__detail and method in ["fetchOneObject", "fetchViewObject"] and result is not None:
+            try:
+                nBytes = len(pickle.dumps(result, pickle.HIGHEST_PROTOCOL))
+            except:  # noqa: E722 pylint: disable=bare-except
+                nBytes = 0
+        with self.__lock:
+            sD = self.__storeD.setdefault(storeName, {"opens": 0, "fetches": 0, "updates": 0, "bytes": 0, "secs": 0.0, "calls": {}})
+            sD["opens"] += 1
+            if method in self.UPDATE_METHODS:
+                sD["updates"] += 1
+            else:
+                sD["fetches"] += 1
+            sD["bytes"] += nBytes
+            sD["secs"] += elapsedSecs
+            sD["calls"][method] = sD["calls"].get(method, 0) + 1
+            if method in ["fetchOneObject", "fetchViewObject"]:
+                key = "%s:%s:%s" % (storeName, method, ":".join([str(arg) for arg in args]))
+                self.__fetchKeyD[key] = self.__fetchKeyD.get(key, 0) + 1
+
+    def getDict(self):
+        with self.__lock:
+            rD = {"stores": dict((storeName, dict(sD, calls=dict(sD["calls"]))) for storeName, sD in self.__storeD.items())}
+            rD["repeated_fetches"] = dict((key, count) for key, count in self.__fetchKeyD.items() if count > 1)
+        rD["opens"] = sum([sD["opens"] for sD in rD["stores"].values()])
+        return rD
+
+
+def tracedClass(baseCls, storeName):
+    """Return subclass of store class baseCls recording calls of the store access methods in the current request trace"""
+
+    def makeMethod(method):
+        baseMethod = getattr(baseCls, method)
+
+        def tracedMethod(self, *args, **kwargs):
+            trace = EditorStoreTrace.current()
+            if trace is None:
+                return baseMethod(self, *args, **kwargs)
+            tStart = time.time()
+            result = baseMethod(self, *args, **kwargs)
+            trace.record(storeName, method, time.time() - tStart, list(args) + [kwargs[k] for k in sorted(kwargs)], result)
+            return result
+
+        tracedMethod.__name__ = method
+        tracedMethod.__doc__ = baseMethod.__doc__
+        return tracedMethod
+
+    clsD = {}
+    for method in EditorStoreTrace.FETCH_METHODS + EditorStoreTrace.UPDATE_METHODS:
+        if hasattr(baseCls, method):
+            clsD[method] = makeMethod(method)
+    return type("Traced" + baseCls.__name__, (baseCls,), clsD)
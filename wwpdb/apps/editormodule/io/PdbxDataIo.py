@@ -117,6 +117,37 @@
 #    2017-05-22    EP     For regular expression matching - allow per item override to allow gui to accept
 #    2017-10-26    EP     Order em_author_list properly
 #    2018-06-28    EP     Start to introduce logging.  Provide timing data. Adjust lock retry time on persist storage as was causing bottlenecks.
+#    2026-10-19    RPS    Enumerations pre-sorted when dictionary store is built and registered once per session in PdbxEnumRegistry.
+#    2026-10-19    RPS    Added iterCategoryRows()/iterCategoryRowsNdjson() for streaming export of entire categories.
+#    2026-10-19    RPS    Recording hash of set of categories in data store as session metadata, for use as navigation bar cache key.
+#    2026-10-19    RPS    Dictionary parse split out of initializeDictInfoStore() as getDictInfo() so it can run concurrently with initializeDataStore().
+#    2026-10-19    RPS    Relaunch reuses session data store and dictionary store when the source model file, dictionary and view
+#                            config are unchanged since the stores were built (fingerprints recorded in session metadata).
+#    2026-10-19    RPS    New sessions clone data store from host-level EditorStoreCache when model file content was already parsed.
+#    2026-10-19    RPS    Model file staged into session by EditorModelStaging (reflink/hardlink/stream copy/in place) with content
+#                            digest computed in the same pass, so launch reads the model bytes from the archive only once.
+#    2026-10-19    RPS    Entry header details at launch extracted from parsed container in a single pass (__extractEntryHeader())
+#                            rather than by re-fetching categories from the shelved data store.
+#    2026-10-19    RPS    Deferred imports used only at launch/export (IoAdapterCore, DBLoadUtil, DepositorSyncUtil, ...) to reduce import cost.
+#    2026-10-19    RPS    Site config, dictionary/view paths and session handle taken from process-wide EditorAppContext.
+#    2026-10-19    RPS    Per-category version numbers (EditorCategoryVersions) advanced on every category update in the data store.
+#    2026-10-19    RPS    Data store and dictionary store access recorded in the request trace (EditorStoreTrace).
+#    2026-10-19    RPS    Optional tracemalloc profiling (EditorMemoryProfile) of initializeDataStore(), initializeDictInfoStore(),
+#                            doExport() and checkForDictViolations(), requested by mem_profile=y or site setting EDITOR_MEMORY_PROFILE.
+#    2026-10-19    RPS    Timestamps in log messages formatted only when logged (EditorLogging.LOG_NOW); per-row and per-cell
+#                            events in the validation checks and __getNextOrdinalValue() logged sampled (EditorLogSampler).
+#    2026-10-19    RPS    Model file staged by stream copy unless model_staging requests linking; the digest for linked files taken
+#                            from the source fingerprint recorded in session metadata when the source is unchanged.
+#    2026-10-19    RPS    mmcif_utils.persist.PdbxDictionaryInfo (which imports IoAdapterCore) imported where the dictionary is parsed or
+#                            its store opened; traced dictionary store class built on first use (getTracedDictInfoStoreClass()).
+#    2026-10-19    RPS    Data store, dictionary store and snapshot files checked and copied through EditorFileFingerprint.getStorePath()/
+#                            getStoreFiles(), so stores written by the ndbm/dumb fallbacks of shelve are found.
+#    2026-10-19    RPS    getDictInfo() memory profiled as an operation of its own; added isMemoryProfileEnabled().
+#    2026-10-19    RPS    Data store reused on relaunch without staging the model file again when the source file has the path, size
+#                            and modification time recorded for the store and the session copy is in place.
+#    2026-10-19    RPS    Source fingerprint records the session copy as staged (EditorModelStaging.makeFingerprint()), which
+#                            must also be unchanged for the data store to be reused without staging.
+#    2026-10-19    RPS    Added getDictStoreMethods().
 ##
 """
 Encapsulates pdbx.persist.PdbxPersist functionality for parsing and manipulating Pdbx cif datafile
@@ -137,25 +168,42 @@ import os
 import os.path
 import shutil
 import re
+import json
+import hashlib
 
 from mmcif_utils.persist.PdbxPersist import PdbxPersist
-from mmcif.io.IoAdapterCore import IoAdapterCore
 
-from wwpdb.utils.config.ConfigInfo import ConfigInfo
-from mmcif_utils.persist.PdbxDictionaryInfo import PdbxDictionaryInfo, PdbxDictionaryInfoStore, PdbxDictionaryViewInfo
-from wwpdb.apps.editormodule.io.EditorDataImport import EditorDataImport
-from wwpdb.apps.editormodule.io.PdbxMasterViewDictionary import PdbxMasterViewDictionary
+from wwpdb.apps.editormodule.io.PdbxEnumRegistry import PdbxEnumRegistry
+from wwpdb.apps.editormodule.io.EditorSessionMeta import EditorSessionMeta
+from wwpdb.apps.editormodule.io.EditorCategoryVersions import EditorCategoryVersions
+from wwpdb.apps.editormodule.io.EditorFileFingerprint import EditorFileFingerprint
+from wwpdb.apps.editormodule.io.EditorStoreCache import EditorStoreCache
+from wwpdb.apps.editormodule.io.EditorModelStaging import EditorModelStaging
+from wwpdb.apps.editormodule.io.EditorStoreTrace import tracedClass
+from wwpdb.apps.editormodule.io.EditorMemoryProfile import EditorMemoryProfile
 from wwpdb.apps.editormodule.config.EditorConfig import EditorConfig
-from wwpdb.apps.editormodule.config.AccessConfigCifFiles import get_display_view_info_master_cif, get_display_view_info_cif
-from wwpdb.utils.db.DBLoadUtil import DBLoadUtil
-from wwpdb.utils.dp.DepositorSyncUtil import DepositorSyncUtil
+from wwpdb.apps.editormodule.config.EditorAppContext import EditorAppContext
+from wwpdb.apps.editormodule.config.EditorLogging import LOG_NOW, EditorLogSampler
 from mmcif.api.DataCategory import DataCategory
-from wwpdb.utils.config.ConfigInfoApp import ConfigInfoAppCommon
 
 import logging
 
 logger = logging.getLogger(__name__)
 
+# store classes recording each access in the trace of the current request
+TracedPdbxPersist = tracedClass(PdbxPersist, "data_store")
+# dictionary store class built on first use - mmcif_utils.persist.PdbxDictionaryInfo imports IoAdapterCore
+_tracedClassD = {}
+
+
+def getTracedDictInfoStoreClass():
+    """Return PdbxDictionaryInfoStore subclass recording store access in the trace of the current request"""
+    if "dict_store" not in _tracedClassD:
+        from mmcif_utils.persist.PdbxDictionaryInfo import PdbxDictionaryInfoStore  # pylint: disable=import-outside-toplevel
+
+        _tracedClassD["dict_store"] = tracedClass(PdbxDictionaryInfoStore, "dict_store")
+    return _tracedClassD["dict_store"]
+
 
 class PdbxDataIo(object):
     def __init__(self, reqObj, verbose=False, log=sys.stderr):
@@ -163,6 +211,7 @@ class PdbxDataIo(object):
         self.__lfh = log
         self.__verbose = verbose
         self.__debug = False
+        self.__cellLog = EditorLogSampler(logger)
         self.__editCifViewConfig = False
         self.__defView = None
         self.__defMethodView = None
@@ -180,14 +229,15 @@ class PdbxDataIo(object):
         self.__sObj = self.__reqObj.newSessionObj()
         self.__sessionPath = self.__sObj.getPath()
         #
-        self.__cI = ConfigInfo()
-        self.__cICommon = ConfigInfoAppCommon()
+        self.__appCtx = EditorAppContext.get(self.__reqObj.getValue("WWPDB_SITE_ID"))
+        self.__cI = self.__appCtx.getConfigInfo()
+        self.__cICommon = self.__appCtx.getConfigInfoAppCommon()
         #
-        self.__pathPdbxDictFile = self.__cICommon.get_mmcif_next_dictionary_file_path()
+        self.__pathPdbxDictFile = self.__appCtx.getPdbxDictFilePath()
         #
         logger.info("configFileProvided is: %s", configFileProvided)
 
-        self.__masterPathViewFile = get_display_view_info_master_cif()
+        self.__masterPathViewFile = self.__appCtx.getMasterViewFilePath()
 
         # Sent back to client - and returned...
         defView = self.__reqObj.getValue("defview")
@@ -210,7 +260,7 @@ class PdbxDataIo(object):
                 self.__pathViewFile = "/net/wwpdb_da/da_top/resources/pdbx_display_view_info_CIFEDITOR.cif"
                 self.__editCifViewConfig = True
             if self.__context == "entityfix":
-                self.__pathViewFile = get_display_view_info_cif()
+                self.__pathViewFile = self.__appCtx.getDisplayViewFilePath()
         #
         if self.__verbose:
             logger.info("path to view config file is: %s", self.__pathViewFile)
@@ -230,6 +280,7 @@ class PdbxDataIo(object):
         #
         self.__dbFilePath = os.path.join(self.__sessionPath, "dataFile.db")
         self.__dictDbFilePath = os.path.join(self.__sessionPath, "mmcifDict.db")
+        self.__enumRegistryFilePath = os.path.join(self.__sessionPath, "enumRegistry.json")
         self.__sessionSnapShotsPath = os.path.join(self.__sessionPath, "snapshots")
         ####################################################################
         # below attributes for accommodating "transposed tables" behavior #
@@ -262,8 +313,8 @@ class PdbxDataIo(object):
 
     def __setup(self):
         try:
-            if os.access(self.__dbFilePath, os.R_OK):
-                myPersist = PdbxPersist(self.__verbose, self.__lfh, retrySeconds=self.__retrySeconds)
+            if os.access(EditorFileFingerprint.getStorePath(self.__dbFilePath), os.R_OK):
+                myPersist = TracedPdbxPersist(self.__verbose, self.__lfh, retrySeconds=self.__retrySeconds)
                 myInd = myPersist.getIndex(dbFileName=self.__dbFilePath)
                 containerNameList = myInd["__containers__"]
                 self.__dataBlockName = containerNameList[0][0]
@@ -289,7 +340,8 @@ class PdbxDataIo(object):
                 logger.info("problem creating snapshots area at: %s", self.__sessionSnapShotsPath)
             logger.exception("In setting up snap short area")
 
-    def __setPdbxDataFilePath(self):
+    def __getPdbxDataFileSource(self):
+        """Return (source path, session-local path) of the model data file, without staging the file into the session"""
         dataFile = str(self.__reqObj.getValue("datafile"))
         fileSource = str(self.__reqObj.getValue("filesource"))
         if self.__verbose:
@@ -306,6 +358,8 @@ class PdbxDataIo(object):
                     logger.info("+++ SITE_ID is: %s.", self.__cI.get("SITE_PREFIX"))
                     logger.info("+++ deposition data set id is: %s.", depDataSetId)
             #
+            from wwpdb.apps.editormodule.io.EditorDataImport import EditorDataImport  # pylint: disable=import-outside-toplevel
+
             edtrDI = EditorDataImport(self.__reqObj, verbose=self.__verbose, log=self.__lfh)
 
             # path to file as held in WFM area
@@ -316,31 +370,49 @@ class PdbxDataIo(object):
             # Local path details - i.e. for processing within given session
             lclPdbxFileName = depDataSetId + "-model.cif"
             lclPdbxFilePath = os.path.join(self.__sessionPath, lclPdbxFileName)
-            #
-            try:
-                ############################################################################################################
-                # Make local copy of coordinate file
-                ############################################################################################################
-                if wfmPdbxFilePath is not None and os.access(wfmPdbxFilePath, os.R_OK):
-                    shutil.copyfile(wfmPdbxFilePath, lclPdbxFilePath)
-                    self.__pathPdbxDataFile = lclPdbxFilePath
-                #
-            except:  # noqa: E722 pylint: disable=bare-except
-                if self.__verbose:
-                    logger.info("+++- pre-processing of pdbx data file %s, failed for deposition id:  %s", self.__pathPdbxDataFile, depDataSetId)
-                    logger.exception("Setting pdbxModelPath")
+            return wfmPdbxFilePath, lclPdbxFilePath
         else:  # non-"workflow" processsing
             if dataFile:
                 sessionFilePath = os.path.join(self.__sessionPath, dataFile)
                 #
                 if fileSource and fileSource == "rcsb_dev":
-                    # make copy of file in sessions directory for any access/processing required by front-end
+                    # copy of file made in sessions directory for any access/processing required by front-end
                     devDataExamplesPath = os.path.join("/wwpdb/source/python/wwpdb/apps/editormodule/data/", dataFile)
-                    shutil.copyfile(devDataExamplesPath, sessionFilePath)
+                    return devDataExamplesPath, sessionFilePath
                 #
-                self.__pathPdbxDataFile = sessionFilePath
+                return sessionFilePath, sessionFilePath
+
+        return None, None
+
+    def __setPdbxDataFilePath(self, p_srcFilePath, p_lclFilePath, p_srcFingerprint=None):
+        """Stage model data file into the session directory (see EditorModelStaging).
+        p_srcFingerprint is the fingerprint recorded for the source file at an earlier launch, if any.
+
+        :Returns:
+            ``parsePath``: path from which to parse the model file (None if not available)
+            ``sha1``:      digest of the model file content, computed while staging
+        """
+        parsePath = None
+        sha1 = None
+        try:
+            ############################################################################################################
+            # Make local copy of coordinate file
+            ############################################################################################################
+            if p_srcFilePath is not None and os.access(p_srcFilePath, os.R_OK):
+                staging = EditorModelStaging(strategy=self.__reqObj.getValue("model_staging") or "stream", verbose=self.__verbose, log=self.__lfh)
+                parsePath, method, sha1 = staging.stage(p_srcFilePath, p_lclFilePath, srcFingerprint=p_srcFingerprint)
+                self.__pathPdbxDataFile = p_lclFilePath
+                logger.info("+++- staged pdbx data file %s by %s", p_srcFilePath, method)
+            elif p_srcFilePath == p_lclFilePath:
+                self.__pathPdbxDataFile = p_lclFilePath
+            #
+        except:  # noqa: E722 pylint: disable=bare-except
+            if self.__verbose:
+                logger.info("+++- pre-processing of pdbx data file %s, failed for source file:  %s", self.__pathPdbxDataFile, p_srcFilePath)
+                logger.exception("Setting pdbxModelPath")
 
         logger.info("+++- pdbx data file path is: %s", self.__pathPdbxDataFile)
+        return parsePath, sha1
 
     def getPdbxDataFilePath(self):
         if self.__pathPdbxDataFile is not None and os.access(self.__pathPdbxDataFile, os.R_OK):
@@ -377,18 +449,52 @@ class PdbxDataIo(object):
             return self.__pathPdbxDataFile
 
     def initializeDataStore(self):
+        with self.__getMemoryProfile("initializeDataStore"):
+            return self.__initializeDataStore()
+
+    def __initializeDataStore(self):
         logger.info("--------------------------------------------")
-        logger.info("Starting at %s", time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
-        #
-        self.__setPdbxDataFilePath()
-        #
+        logger.info("Starting at %s", LOG_NOW)
+        #
+        srcFilePath, lclFilePath = self.__getPdbxDataFileSource()
+        sessMeta = EditorSessionMeta(self.__sessionPath, verbose=self.__verbose, log=self.__lfh)
+        if EditorModelStaging.isStaged(srcFilePath, lclFilePath, sessMeta.get("source_fingerprint")) and self.__isDataStoreCurrent(srcFilePath, sessMeta):
+            # session copy already staged from the unchanged source file - neither copied nor read again
+            self.__pathPdbxDataFile = lclFilePath
+            self.__restoreEntryHeader(sessMeta.get("entry_header", {}))
+            logger.info("reusing data store at %s, source file and session copy unchanged: %s", self.__dbFilePath, srcFilePath)
+            return self.__dataBlockName, self.__entryTitle, self.__entryAccessionIdsLst
+        #
+        parsePath, srcSha1 = self.__setPdbxDataFilePath(srcFilePath, lclFilePath, sessMeta.get("source_fingerprint"))
+        #
+        if self.__isDataStoreCurrent(srcFilePath, sessMeta, srcSha1):
+            self.__restoreEntryHeader(sessMeta.get("entry_header", {}))
+            logger.info("reusing data store at %s, source file unchanged: %s", self.__dbFilePath, srcFilePath)
+            return self.__dataBlockName, self.__entryTitle, self.__entryAccessionIdsLst
+        #
+        srcFingerprint = EditorModelStaging.makeFingerprint(srcFilePath, lclFilePath, sha1=srcSha1) if srcSha1 is not None else None
+        storeCache = self.__getStoreCache()
+        if storeCache is not None and srcFingerprint is not None:
+            cachedD = storeCache.fetch(srcFingerprint["sha1"], self.__dbFilePath)
+            if cachedD is not None:
+                self.__restoreEntryHeader(cachedD["entry_header"])
+                sessMeta.update(cachedD)
+                self.__setDataStoreSource(srcFingerprint, sessMeta)
+                EditorCategoryVersions(sessMeta).rebase()
+                sessMeta.store()
+                logger.info("data store for %s obtained from host store cache", srcFilePath)
+                return self.__dataBlockName, self.__entryTitle, self.__entryAccessionIdsLst
+        #
+        bParsed = False
         try:
             #########################################################################################################
             # parse model cif file and determine blockname
             #########################################################################################################
-            if self.__pathPdbxDataFile is not None and os.access(self.__pathPdbxDataFile, os.R_OK):
+            if parsePath is not None and os.access(parsePath, os.R_OK):
+                from mmcif.io.IoAdapterCore import IoAdapterCore  # pylint: disable=import-outside-toplevel
+
                 pdbxReader = IoAdapterCore(verbose=self.__verbose)
-                self.__containerList = pdbxReader.readFile(inputFilePath=self.__pathPdbxDataFile, enforceAscii=True)
+                self.__containerList = pdbxReader.readFile(inputFilePath=parsePath, enforceAscii=True)
 
                 # iCountNames = len(self.__containerList)
                 # assert iCountNames == 1, "initializeDataStore -- expecting containerNameList to have single member but list had %s members" % iCountNames
@@ -399,7 +505,12 @@ class PdbxDataIo(object):
                     self.__dataBlockName = self.__containerList[0].getName()
                 logger.info("Datablock name %r", self.__dataBlockName)
                 logger.info("--------------------------------------------")
-                logger.info("identified datablock name %s in sample pdbx data file at: %s", self.__dataBlockName, self.__pathPdbxDataFile)
+                logger.info("identified datablock name %s in sample pdbx data file at: %s", self.__dataBlockName, parsePath)
+                #
+                sessMeta.set("ctgry_set_hash", self.__makeCategorySetHash(self.__containerList[0].getObjNameList()))
+                if not self.__editCifViewConfig:
+                    self.__extractEntryHeader(self.__containerList[0])
+                bParsed = True
                 #
             else:
                 if self.__verbose:
@@ -410,9 +521,12 @@ class PdbxDataIo(object):
                 logger.error("problem processing pdbx data file at: %s", self.__pathPdbxDataFile)
             logger.exception("problem processing file")
 
+        # stores from any earlier launch no longer correspond to the source file
+        sessMeta.remove("source_fingerprint")
+        EditorCategoryVersions(sessMeta).rebase()
         try:
             logger.info("About to shelve")
-            myPersist = PdbxPersist(self.__verbose, self.__lfh)
+            myPersist = TracedPdbxPersist(self.__verbose, self.__lfh)
             myPersist.setContainerList(self.__containerList)
             myPersist.store(self.__dbFilePath)
             logger.info("Done shelve")
@@ -421,21 +535,159 @@ class PdbxDataIo(object):
                 logger.info("shelved cif data to %s", self.__dbFilePath)
             if self.__editCifViewConfig:
                 self.__entryTitle = ""
-            else:
-                self.__entrydatabasedict = self.getDatabase2(myPersist)
-                self.__entryTitle = self.getEntryTitle(myPersist)
-                self.__entryAccessionIdsLst = self.getEntryAccessionIds(myPersist)
-                self.__entryExptlMethodsLst = self.__getEntryExptlList(myPersist)
+            elif not bParsed:
+                self.__entrydatabasedict = {}
+                self.__entryTitle = ""
+                self.__entryAccessionIdsLst = []
+                self.__entryExptlMethodsLst = []
+            #
+            if bParsed:
+                sessMeta.set("entry_header", self.__getEntryHeader())
+                self.__setDataStoreSource(srcFingerprint, sessMeta)
+                if storeCache is not None and srcFingerprint is not None:
+                    storeCache.store(srcFingerprint["sha1"], self.__dbFilePath, {"entry_header": sessMeta.get("entry_header"), "ctgry_set_hash": sessMeta.get("ctgry_set_hash")})
 
         except:  # noqa: E722 pylint: disable=bare-except
             logger.exception("In shelving")
 
+        sessMeta.store()
         return self.__dataBlockName, self.__entryTitle, self.__entryAccessionIdsLst
 
+    def __getStoreCache(self):
+        """Return host-level cache of data stores shared across sessions, or None if not in use for this request.
+        Not used when editing view config, for which entry header details are not gathered.
+        """
+        topSessionPath = self.__reqObj.getValue("TopSessionPath")
+        if not topSessionPath or self.__editCifViewConfig or self.__reqObj.getValue("store_cache") == "n":
+            return None
+        return EditorStoreCache(os.path.join(topSessionPath, "editor_store_cache"), verbose=self.__verbose, log=self.__lfh)
+
+    def __extractEntryHeader(self, p_container):
+        """Single pass over the parsed data container for the entry details needed at launch
+        (database_2 codes, title, requested accession types and experimental methods)
+        """
+        def getRowList(ctgryNm):
+            ctgryObj = p_container.getObj(ctgryNm)
+            return (ctgryObj, ctgryObj.getRowList()) if ctgryObj is not None else (None, [])
+
+        def getSingleValue(ctgryNm, attrNm):
+            ctgryObj, rowList = getRowList(ctgryNm)
+            if ctgryObj is None or not ctgryObj.hasAttribute(attrNm):
+                return None
+            if len(rowList) != 1:
+                logger.warning("expecting '%s' category to contain a single record but had %s records", ctgryNm, len(rowList))
+                return None
+            return rowList[0][ctgryObj.getIndex(attrNm)]
+
+        db2 = {}
+        ctgryObj, rowList = getRowList("database_2")
+        if ctgryObj is not None and ctgryObj.hasAttribute("database_id") and ctgryObj.hasAttribute("database_code"):
+            dbid = ctgryObj.getIndex("database_id")
+            dbcodeid = ctgryObj.getIndex("database_code")
+            for row in rowList:
+                db2[row[dbid]] = row[dbcodeid]
+        self.__entrydatabasedict = db2
+        #
+        if db2 and "EMDB" in db2 and "PDB" not in db2:
+            # Map only
+            entryTitle = getSingleValue("em_admin", "title")
+        else:
+            entryTitle = getSingleValue("struct", "title")
+        self.__entryTitle = entryTitle if entryTitle is not None else ""
+        #
+        accessionTypes = getSingleValue("pdbx_depui_entry_details", "requested_accession_types")
+        self.__entryAccessionIdsLst = accessionTypes.split(",") if accessionTypes is not None else []
+        #
+        ctgryObj, rowList = getRowList("exptl")
+        self.__entryExptlMethodsLst = []
+        if ctgryObj is not None and ctgryObj.hasAttribute("method"):
+            idMethod = ctgryObj.getIndex("method")
+            self.__entryExptlMethodsLst = [row[idMethod] for row in rowList]
+        #
+        logger.info("entry header obtained as: %r", self.__getEntryHeader())
+
+    def __getDataStoreStamp(self):
+        stamp = EditorFileFingerprint.stamp(EditorFileFingerprint.getStorePath(self.__dbFilePath))
+        return stamp[1:] if stamp is not None else None
+
+    def __setDataStoreSource(self, p_srcFingerprint, p_sessMeta):
+        """Record fingerprint of the file whose content the data store now holds, along with the data store's own
+        size and modification time so that any later edit to the store marks it as no longer matching the file
+        """
+        if p_srcFingerprint is None:
+            return
+        p_sessMeta.update({"source_fingerprint": p_srcFingerprint, "data_store_stamp": self.__getDataStoreStamp()})
+
+    def __isDataStoreCurrent(self, p_srcFilePath, p_sessMeta, p_srcSha1=None):
+        """Return True if the session data store was built from p_srcFilePath, neither has changed since, and the
+        entry header details were recorded, so that parsing and shelving may be skipped on relaunch
+        """
+        if self.__reqObj.getValue("resume_store") == "n":
+            return False
+        try:
+            if p_sessMeta.get("entry_header") is None or not os.access(EditorFileFingerprint.getStorePath(self.__dbFilePath), os.R_OK):
+                return False
+            if p_sessMeta.get("data_store_stamp") != self.__getDataStoreStamp():
+                return False
+            return EditorFileFingerprint.matches(p_sessMeta.get("source_fingerprint"), p_srcFilePath, sha1=p_srcSha1)
+        except:  # noqa: E722 pylint: disable=bare-except
+            logger.exception("Failed checking data store against source file %s", p_srcFilePath)
+        return False
+
+    def __getEntryHeader(self):
+        return {
+            "datablock_name": self.__dataBlockName,
+            "title": self.__entryTitle,
+            "accession_ids": self.__entryAccessionIdsLst,
+            "database_2": self.__entrydatabasedict,
+            "exptl_methods": self.__entryExptlMethodsLst,
+        }
+
+    def __restoreEntryHeader(self, p_headerD):
+        self.__dataBlockName = p_headerD.get("datablock_name")
+        if sys.version_info[0] < 3 and self.__dataBlockName is not None:
+            self.__dataBlockName = self.__dataBlockName.encode("utf-8")
+        self.__entryTitle = p_headerD.get("title")
+        self.__entryAccessionIdsLst = p_headerD.get("accession_ids")
+        self.__entrydatabasedict = p_headerD.get("database_2") or {}
+        self.__entryExptlMethodsLst = p_headerD.get("exptl_methods")
+
+    def __makeCategorySetHash(self, p_ctgryNameList):
+        return hashlib.sha1(",".join(sorted(p_ctgryNameList)).encode("utf-8")).hexdigest()
+
+    def getCategorySetHash(self):
+        """Return hash identifying the set of categories in the session data store.
+        Recorded as session metadata when the data store is initialized, otherwise derived from the data store index.
+        """
+        sessMeta = EditorSessionMeta(self.__sessionPath, verbose=self.__verbose, log=self.__lfh)
+        ctgrySetHash = sessMeta.get("ctgry_set_hash")
+        if ctgrySetHash is None:
+            try:
+                myPersist = TracedPdbxPersist(self.__verbose, self.__lfh, retrySeconds=self.__retrySeconds)
+                myInd = myPersist.getIndex(dbFileName=self.__dbFilePath)
+                dataBlockName = myInd["__containers__"][0][0]
+                ctgrySetHash = self.__makeCategorySetHash(myInd[dataBlockName])
+                sessMeta.set("ctgry_set_hash", ctgrySetHash)
+                sessMeta.store()
+            except:  # noqa: E722 pylint: disable=bare-except
+                logger.exception("Failed deriving category set hash from %s", self.__dbFilePath)
+        return ctgrySetHash
+
+    def getConfigViewId(self):
+        """Return identifier of the view configuration in effect for this request"""
+        return self.__getConfigViewId()
+
+    def getDictStoreMethods(self):
+        """Return experimental methods (or method given by context) from which the view of the session dictionary store was
+        selected, as recorded when the store was built - views of several methods share a view id (e.g. EM1)
+        """
+        sessMeta = EditorSessionMeta(self.__sessionPath, verbose=self.__verbose, log=self.__lfh)
+        return (sessMeta.get("dict_store_fingerprint") or {}).get("methods")
+
     def getEntryAccessionIds(self, p_pdbxPersist):
 
         logger.info("--------------------------------------------")
-        logger.info("Starting at %s", time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+        logger.info("Starting at %s", LOG_NOW)
         #
         accessionIdsLst = []
         try:
@@ -470,7 +722,7 @@ class PdbxDataIo(object):
 
     def getDatabase2(self, p_pdbxPersist):
         logger.info("--------------------------------------------")
-        logger.info("Starting at %s", time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+        logger.info("Starting at %s", LOG_NOW)
 
         db2 = {}
         try:
@@ -505,7 +757,7 @@ class PdbxDataIo(object):
 
     def getEntryTitlePdb(self, p_pdbxPersist):
         logger.info("--------------------------------------------")
-        logger.info("Starting at %s", time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+        logger.info("Starting at %s", LOG_NOW)
         #
         entryTitle = ""
         try:
@@ -542,7 +794,7 @@ class PdbxDataIo(object):
 
     def getEntryTitleEmdb(self, p_pdbxPersist):
         logger.info("--------------------------------------------")
-        logger.info("Starting at %s", time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+        logger.info("Starting at %s", LOG_NOW)
         #
         entryTitle = ""
         try:
@@ -577,29 +829,6 @@ class PdbxDataIo(object):
 
         return entryTitle
 
-    def __getEntryExptlList(self, p_pdbxPersist):
-
-        logger.info("--------------------------------------------")
-        logger.info("Starting at %s", time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
-        #
-        exptlLst = []
-        try:
-            ctgryObj = p_pdbxPersist.fetchOneObject(self.__dbFilePath, self.__dataBlockName, "exptl")
-            #
-            if ctgryObj:
-                if ctgryObj.hasAttribute("method"):
-                    idMethod = ctgryObj.getIndex("method")
-
-                    for row in ctgryObj.getRowList():
-                        method = row[idMethod]
-                        exptlLst.append(method)
-
-                logger.info("exptlLst obtained as: %r", exptlLst)
-        except:  # noqa: E722 pylint: disable=bare-except
-            logger.exception("Failure to get experimental methods")
-
-        return exptlLst
-
     def __setDefMethodView(self, method=None, view=None):
         """Sets the default view/method for the session"""
         if method:
@@ -613,14 +842,14 @@ class PdbxDataIo(object):
 
     def makeDataStoreSnapShot(self, p_editActnIndx):
         logger.info("--------------------------------------------")
-        logger.info("Starting at %s", time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+        logger.info("Starting at %s", LOG_NOW)
         #
         snapShotFilePath = os.path.join(self.__sessionSnapShotsPath, "dataFileSnapShot_" + str(p_editActnIndx) + ".db")
         if int(p_editActnIndx) == 0:
             if self.__verbose and self.__debug:
                 logger.info("-- p_editActnIndx is:  %s", p_editActnIndx)
 
-            if os.access(snapShotFilePath, os.R_OK):
+            if os.access(EditorFileFingerprint.getStorePath(snapShotFilePath), os.R_OK):
                 if self.__verbose:
                     logger.info("skipping over creation of zero-index dataFileSnapShot b/c already exists at:  %s", snapShotFilePath)
                 return
@@ -629,12 +858,13 @@ class PdbxDataIo(object):
                     logger.info("zero-index dataFileSnapShot does not yet exist at:  %s", snapShotFilePath)
         #
         try:
-            if self.__dbFilePath is not None and os.access(self.__dbFilePath, os.R_OK):
+            if self.__dbFilePath is not None and os.access(EditorFileFingerprint.getStorePath(self.__dbFilePath), os.R_OK):
                 if self.__sessionSnapShotsPath is not None and os.access(self.__sessionSnapShotsPath, os.R_OK):
 
-                    shutil.copyfile(self.__dbFilePath, snapShotFilePath)
+                    for suffix, storeFilePath in EditorFileFingerprint.getStoreFiles(self.__dbFilePath):
+                        shutil.copyfile(storeFilePath, snapShotFilePath + suffix)
 
-                    if os.access(snapShotFilePath, os.R_OK):
+                    if os.access(EditorFileFingerprint.getStorePath(snapShotFilePath), os.R_OK):
                         if self.__verbose:
                             logger.info("dataFileSnapShot successfully created at: %s", snapShotFilePath)
                     else:
@@ -648,14 +878,14 @@ class PdbxDataIo(object):
 
     def purgeDataStoreSnapShots(self, p_rewindIndex=None):
         logger.info("--------------------------------------------")
-        logger.info("Starting at %s", time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+        logger.info("Starting at %s", LOG_NOW)
         #
         if self.__sessionSnapShotsPath is not None and os.access(self.__sessionSnapShotsPath, os.R_OK):
             if p_rewindIndex:
                 snpShotFilePath = os.path.join(self.__sessionSnapShotsPath, "dataFileSnapShot_" + str(p_rewindIndex) + ".db")
                 try:
-                    if os.path.isfile(snpShotFilePath):
-                        os.remove(snpShotFilePath)
+                    for _suffix, storeFilePath in EditorFileFingerprint.getStoreFiles(snpShotFilePath):
+                        os.remove(storeFilePath)
                 except:  # noqa: E722 pylint: disable=bare-except
                     if self.__verbose:
                         logger.info("problem removing dataFileSnapShot: %s", snpShotFilePath)
@@ -676,10 +906,10 @@ class PdbxDataIo(object):
 
     def getDataStorePath(self):
         logger.info("--------------------------------------------")
-        logger.info("Starting at %s", time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+        logger.info("Starting at %s", LOG_NOW)
         #
         try:
-            if self.__dbFilePath is not None and os.access(self.__dbFilePath, os.R_OK):
+            if self.__dbFilePath is not None and os.access(EditorFileFingerprint.getStorePath(self.__dbFilePath), os.R_OK):
                 if self.__verbose:
                     logger.info("spersistent dataStore DB file accessible at %s", self.__dbFilePath)
                 return self.__dbFilePath
@@ -692,17 +922,62 @@ class PdbxDataIo(object):
         except:  # noqa: E722 pylint: disable=bare-except
             logger.exception("Failure in getDataStorePath")
 
-    def initializeDictInfoStore(self):
+    def getDictInfo(self):
+        """Parse PDBx dictionary and assemble per-category metadata.
+        Independent of the model data file, so may be called ahead of/concurrently with initializeDataStore().
+        """
+        with self.__getMemoryProfile("getDictInfo"):
+            return self.__getDictInfo()
+
+    def __getDictInfo(self):
         logger.info("--------------------------------------------")
-        logger.info("Starting at %s", time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+        logger.info("Starting at %s", LOG_NOW)
+        from mmcif_utils.persist.PdbxDictionaryInfo import PdbxDictionaryInfo  # pylint: disable=import-outside-toplevel
+
+        pda = PdbxDictionaryInfo(dictPath=self.__pathPdbxDictFile, verbose=self.__verbose, log=self.__lfh)
+        return pda.assembleByAttribute()
+
+    def __newDictInfoStore(self):
+        return getTracedDictInfoStoreClass()(verbose=self.__verbose, log=self.__lfh)
+
+    def __getDictViewInfo(self, p_viewObj):
+        """Return PdbxDictionaryViewInfo set from view object p_viewObj fetched from the dictionary store"""
+        from mmcif_utils.persist.PdbxDictionaryInfo import PdbxDictionaryViewInfo  # pylint: disable=import-outside-toplevel
+
+        dictViewInfo = PdbxDictionaryViewInfo(viewPath=None, verbose=self.__verbose, log=self.__lfh)
+        dictViewInfo.set(viewObj=p_viewObj)
+        return dictViewInfo
+
+    def initializeDictInfoStore(self, p_dictInfo=None):
+        with self.__getMemoryProfile("initializeDictInfoStore"):
+            return self.__initializeDictInfoStore(p_dictInfo=p_dictInfo)
+
+    def __initializeDictInfoStore(self, p_dictInfo=None):
+        """Select view for the entry's experimental methods and shelve dictionary metadata and view config for the session
+
+        :param `p_dictInfo`:  dictionary metadata as previously returned by getDictInfo(), otherwise parsed here
+
+        """
+        logger.info("--------------------------------------------")
+        logger.info("Starting at %s", LOG_NOW)
+        sessMeta = EditorSessionMeta(self.__sessionPath, verbose=self.__verbose, log=self.__lfh)
+        dictFingerprint = self.__getDictInfoStoreFingerprint()
+        if self.__isDictInfoStoreCurrent(dictFingerprint, sessMeta):
+            viewD = sessMeta.get("dict_store_view", {})
+            self.__setDefMethodView(method=viewD.get("method"), view=viewD.get("view"))
+            logger.info("reusing dictionary store at %s", self.__dictDbFilePath)
+            return
         try:
-            pda = PdbxDictionaryInfo(dictPath=self.__pathPdbxDictFile, verbose=self.__verbose, log=self.__lfh)
-            dInfo = pda.assembleByAttribute()
+            dInfo = p_dictInfo if p_dictInfo is not None else self.__getDictInfo()
             #
+            from mmcif_utils.persist.PdbxDictionaryInfo import PdbxDictionaryViewInfo  # pylint: disable=import-outside-toplevel
+
             vda = PdbxDictionaryViewInfo(viewPath=self.__pathViewFile, verbose=self.__verbose, log=self.__lfh)
 
             # Override for default cases
             if self.__pathViewFile is None:
+                from wwpdb.apps.editormodule.io.PdbxMasterViewDictionary import PdbxMasterViewDictionary  # pylint: disable=import-outside-toplevel
+
                 dV = PdbxMasterViewDictionary()
                 dV.read(self.__masterPathViewFile)
                 # Set the experimental method
@@ -727,16 +1002,87 @@ class PdbxDataIo(object):
                 #
             vInfo = vda.get()
             #
-            self.__pdbxDictStore = PdbxDictionaryInfoStore(verbose=self.__verbose, log=self.__lfh)
+            # enumerations are sorted in place here so that the dictionary store vends pre-sorted lists
+            enumRegistry = PdbxEnumRegistry(self.__enumRegistryFilePath, verbose=self.__verbose, log=self.__lfh)
+            enumRegistry.build(dInfo)
+            enumRegistry.store()
+            #
+            self.__pdbxDictStore = self.__newDictInfoStore()
             self.__pdbxDictStore.store(dbFileName=self.__dictDbFilePath, od=dInfo, ov=vInfo)
 
             if self.__verbose:
                 logger.info("shelved dictionary of cif metadata to %s", self.__dictDbFilePath)
+            #
+            sessMeta.update({"dict_store_fingerprint": dictFingerprint, "dict_store_view": {"method": self.__defMethodView, "view": self.__defView}})
+            sessMeta.store()
 
         except:  # noqa: E722 pylint: disable=bare-except
             logger.exception("in initializeDictInfoStore")
 
+    def __getDictInfoStoreFingerprint(self):
+        """Return the inputs that determine the dictionary store content: dictionary and view config files,
+        and the experimental methods (or method given by context) from which the view is selected
+        """
+        return {
+            "files": [EditorFileFingerprint.stamp(fPath) for fPath in [self.__pathPdbxDictFile, self.__pathViewFile, self.__masterPathViewFile]],
+            "methods": self.__defMethodView if self.__defMethodView else self.__entryExptlMethodsLst,
+        }
+
+    def __isDictInfoStoreCurrent(self, p_dictFingerprint, p_sessMeta):
+        if self.__reqObj.getValue("resume_store") == "n":
+            return False
+        if not (os.access(EditorFileFingerprint.getStorePath(self.__dictDbFilePath), os.R_OK) and os.access(self.__enumRegistryFilePath, os.R_OK)):
+            return False
+        return p_sessMeta.get("dict_store_fingerprint") == p_dictFingerprint
+
+    def isDictInfoStoreReusable(self):
+        """Return True if the dictionary and view config files are unchanged since the session dictionary store was built.
+        The experimental methods are compared again in initializeDictInfoStore(), once the data store is initialized.
+        """
+        sessMeta = EditorSessionMeta(self.__sessionPath, verbose=self.__verbose, log=self.__lfh)
+        dictFingerprint = self.__getDictInfoStoreFingerprint()
+        recorded = sessMeta.get("dict_store_fingerprint")
+        return recorded is not None and self.__isDictInfoStoreCurrent(dict(dictFingerprint, methods=recorded.get("methods")), sessMeta)
+
+    def isMemoryProfileEnabled(self):
+        """Return True if memory profiling is requested by mem_profile=y or site setting EDITOR_MEMORY_PROFILE"""
+        return self.__reqObj.getValue("mem_profile") == "y" or self.__appCtx.getSetting("EDITOR_MEMORY_PROFILE", "n").lower() in ["y", "yes", "true"]
+
+    def __getMemoryProfile(self, opName):
+        """Memory profile context for opName, active if memory profiling is enabled"""
+        return EditorMemoryProfile(opName, sessionPath=self.__sessionPath, enabled=self.isMemoryProfileEnabled())
+
+    def getCategoryVersion(self, p_ctgryNm):
+        """Return current version number of category p_ctgryNm in the session data store"""
+        sessMeta = EditorSessionMeta(self.__sessionPath, verbose=self.__verbose, log=self.__lfh)
+        return EditorCategoryVersions(sessMeta).get(p_ctgryNm)
+
+    def isCategoryVersionCurrent(self, p_ctgryNm, p_expectedVersion):
+        """Return True unless p_expectedVersion is given and differs from the current version of p_ctgryNm"""
+        sessMeta = EditorSessionMeta(self.__sessionPath, verbose=self.__verbose, log=self.__lfh)
+        return EditorCategoryVersions(sessMeta).isCurrent(p_ctgryNm, p_expectedVersion)
+
+    def __updateCategoryObject(self, p_myPersist, p_ctgryObj):
+        """Update category object in the data store, advancing the category version on success"""
+        bSuccess = p_myPersist.updateOneObject(p_ctgryObj, self.__dbFilePath, self.__dataBlockName)
+        if bSuccess:
+            sessMeta = EditorSessionMeta(self.__sessionPath, verbose=self.__verbose, log=self.__lfh)
+            EditorCategoryVersions(sessMeta).bump([p_ctgryObj.getName()])
+            sessMeta.store()
+        return bSuccess
+
+    def getEnumRegistry(self):
+        """Return enumeration registry built for this session's dictionary store or None if not available"""
+        enumRegistry = PdbxEnumRegistry(self.__enumRegistryFilePath, verbose=self.__verbose, log=self.__lfh)
+        if enumRegistry.load():
+            return enumRegistry
+        return None
+
     def doExport(self, exprtDirPath, exprtFilePath):
+        with self.__getMemoryProfile("doExport"):
+            return self.__doExport(exprtDirPath, exprtFilePath)
+
+    def __doExport(self, exprtDirPath, exprtFilePath):
         """Export updated cif data as file
 
         :Params:
@@ -745,11 +1091,11 @@ class PdbxDataIo(object):
             + ``exprtFilePath``: path and filename indicating target file destination
         """
         logger.info("--------------------------------------------")
-        logger.info("Starting at %s", time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+        logger.info("Starting at %s", LOG_NOW)
         #
         try:
-            if os.access(self.__dbFilePath, os.R_OK) and os.access(exprtDirPath, os.R_OK):
-                myPersist = PdbxPersist(self.__verbose, self.__lfh)
+            if os.access(EditorFileFingerprint.getStorePath(self.__dbFilePath), os.R_OK) and os.access(exprtDirPath, os.R_OK):
+                myPersist = TracedPdbxPersist(self.__verbose, self.__lfh)
 
                 self.__purgeSkeletonRows(myPersist)
                 self.__orderAuthors("audit_author", myPersist)
@@ -757,6 +1103,8 @@ class PdbxDataIo(object):
                 self.__orderAuthors("em_author_list", myPersist)
                 myPersist.recover(self.__dbFilePath)
                 #
+                from mmcif.io.IoAdapterCore import IoAdapterCore  # pylint: disable=import-outside-toplevel
+
                 myWriter = IoAdapterCore(verbose=self.__verbose)
                 cList = myPersist.getContainerList()
                 success = myWriter.writeFile(outputFilePath=exprtFilePath, containerList=cList)
@@ -767,9 +1115,16 @@ class PdbxDataIo(object):
                     return False
 
                 else:
+                    # data store content now corresponds to the exported file, which is what a relaunch will read
+                    sessMeta = EditorSessionMeta(self.__sessionPath, verbose=self.__verbose, log=self.__lfh)
+                    self.__setDataStoreSource(EditorFileFingerprint.make(exprtFilePath), sessMeta)
+                    sessMeta.store()
                     # 2015-02-06, ZF -- loading archive model cif file into da_internal database
                     fileSource = str(self.__reqObj.getValue("filesource")).strip().lower()
                     if fileSource in ["archive", "wf-archive", "wf_archive"]:
+                        from wwpdb.utils.db.DBLoadUtil import DBLoadUtil  # pylint: disable=import-outside-toplevel
+                        from wwpdb.utils.dp.DepositorSyncUtil import DepositorSyncUtil  # pylint: disable=import-outside-toplevel
+
                         dbLoader = DBLoadUtil(reqObj=self.__reqObj, verbose=self.__verbose, log=self.__lfh)
                         dbLoader.doLoading([exprtFilePath])
 
@@ -792,18 +1147,17 @@ class PdbxDataIo(object):
     def getCtgryNavConfig(self):
         """get list of navigation menu config settings"""
         logger.info("--------------------------------------------")
-        logger.info("Starting at %s", time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+        logger.info("Starting at %s", LOG_NOW)
         #
         configList = []
         #
         currViewId = self.__getConfigViewId()
 
         if not self.__pdbxDictStore:
-            self.__pdbxDictStore = PdbxDictionaryInfoStore(verbose=self.__verbose, log=self.__lfh)
+            self.__pdbxDictStore = self.__newDictInfoStore()
 
         rView = self.__pdbxDictStore.fetchViewObject(dbFileName=self.__dictDbFilePath)
-        dictViewInfo = PdbxDictionaryViewInfo(viewPath=None, verbose=self.__verbose, log=self.__lfh)
-        dictViewInfo.set(viewObj=rView)
+        dictViewInfo = self.__getDictViewInfo(rView)
         #
         topLevelMenuList = dictViewInfo.getDisplayMenuList(viewId=currViewId)
         # topLevelMenuList corresponds to values in "pdbx_display_view_category_info.category_menu_display_name" for the given view ID, serve as primary headings
@@ -952,9 +1306,9 @@ class PdbxDataIo(object):
     def checkForMandatoryItems(self):
         """get list of category.items which are mandatory but which are currently missing non-null values"""
         logger.info("--------------------------------------------")
-        logger.info("Starting at %s", time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+        logger.info("Starting at %s", LOG_NOW)
         #
-        myPersist = PdbxPersist(self.__verbose, self.__lfh)
+        myPersist = TracedPdbxPersist(self.__verbose, self.__lfh)
         #
         categoryList = []
         missingMndtryItemsDict = {"violation_map": {}}
@@ -999,8 +1353,7 @@ class PdbxDataIo(object):
                                 try:
                                     if record[colIdx] and (len(record[colIdx]) < 1 or record[colIdx] == "?"):
                                         colDisplName = catObjDict["COLUMN_DISPLAY_NAMES"].get(colIdx, ctgryColList[colIdx])
-                                        if self.__debug:
-                                            logger.debug("---- DEBUG ---- Missing non-null value for mandatory item %s in category %s", colDisplName, curCtgryNm)
+                                        self.__cellLog.debug("mandatory_missing", "Missing non-null value for mandatory item %s in category %s", colDisplName, curCtgryNm)
                                         #
                                         if len(newViolMapDict["top_menu_label"]) < 1:
                                             newViolMapDict["top_menu_label"] = topLevelMenuChoice
@@ -1012,25 +1365,17 @@ class PdbxDataIo(object):
 
                                         bFoundViolation = True
 
-                                        if self.__debug:
-                                            logger.debug(
-                                                "--- DEBUG ---- Current rowIdx is '%s', colIdx is '%s', and missingMndtryItemsDict is now '%r'",
-                                                rowIdx,
-                                                colIdx,
-                                                missingMndtryItemsDict,
-                                            )
-
                                 except:  # noqa: E722 pylint: disable=bare-except
-
-                                    logger.info(
-                                        "---- DEBUG ---- EXCEPTION: Current rowIdx is '%s', colIdx is '%s', and length of record is '%s' for category '%s'",
+                                    # logged sampled, as a malformed category may fail on every row
+                                    self.__cellLog.exception(
+                                        "mandatory_error",
+                                        "checkMandatoryItems failure at rowIdx '%s', colIdx '%s', length of record '%s' for category '%s', record is '%r'",
                                         rowIdx,
                                         colIdx,
                                         len(record),
                                         curCtgryNm,
+                                        record,
                                     )
-                                    logger.info("---- DEBUG ---- EXCEPTION: record is '%r'", record)
-                                    logger.exception("checkMandatoryItems filauire")
                         #
                         if bFoundViolation:
                             missingMndtryItemsDict["violation_map"][curCtgryNm] = newViolMapDict
@@ -1048,11 +1393,10 @@ class PdbxDataIo(object):
         categoryList = []
 
         if not self.__pdbxDictStore:
-            self.__pdbxDictStore = PdbxDictionaryInfoStore(verbose=self.__verbose, log=self.__lfh)
+            self.__pdbxDictStore = self.__newDictInfoStore()
 
         rView = self.__pdbxDictStore.fetchViewObject(dbFileName=self.__dictDbFilePath)
-        dictViewInfo = PdbxDictionaryViewInfo(viewPath=None, verbose=self.__verbose, log=self.__lfh)
-        dictViewInfo.set(viewObj=rView)
+        dictViewInfo = self.__getDictViewInfo(rView)
         #
         topLevelMenuList = dictViewInfo.getDisplayMenuList(viewId=currViewId)
         logger.info("-- topLevelMenuList obtained as %r", topLevelMenuList)
@@ -1091,7 +1435,7 @@ class PdbxDataIo(object):
         start = time.time()
 
         logger.info("---------------------------------")
-        logger.info("Starting for %s %s at %s", p_categoryNm, p_catDispLabel, time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+        logger.info("Starting for %s %s at %s", p_categoryNm, p_catDispLabel, LOG_NOW)
         #
         currViewId = self.__getConfigViewId()
         #
@@ -1105,7 +1449,7 @@ class PdbxDataIo(object):
         #
         if bOk:
             if not self.__pdbxDictStore:
-                self.__pdbxDictStore = PdbxDictionaryInfoStore(verbose=self.__verbose, log=self.__lfh)
+                self.__pdbxDictStore = self.__newDictInfoStore()
 
             ctgryMetaDict = self.__getCifCtgryMetaDict(p_categoryNm)
 
@@ -1137,8 +1481,7 @@ class PdbxDataIo(object):
 
                 # here is where we begin configuring the "view" behavior based on what is in the view config file
                 rView = self.__pdbxDictStore.fetchViewObject(dbFileName=self.__dictDbFilePath)
-                dictViewInfo = PdbxDictionaryViewInfo(viewPath=None, verbose=self.__verbose, log=self.__lfh)
-                dictViewInfo.set(viewObj=rView)
+                dictViewInfo = self.__getDictViewInfo(rView)
 
                 #
                 itemList = dictViewInfo.getItemList(viewId=currViewId, categoryDisplayName=p_catDispLabel, categoryName=p_categoryNm)
@@ -1234,11 +1577,11 @@ class PdbxDataIo(object):
         """
         start = time.time()
         logger.info("--------------------------------------------")
-        logger.info("Starting at %s", time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+        logger.info("Starting at %s", LOG_NOW)
 
         rtrnList = []
         bSuccess = False
-        myPersist = PdbxPersist(self.__verbose, self.__lfh, retrySeconds=self.__retrySeconds)
+        myPersist = TracedPdbxPersist(self.__verbose, self.__lfh, retrySeconds=self.__retrySeconds)
 
         try:
             categoryObj = myPersist.fetchOneObject(self.__dbFilePath, self.__dataBlockName, p_categoryNm)
@@ -1279,13 +1622,13 @@ class PdbxDataIo(object):
 
         """
         logger.info("--------------------------------------------")
-        logger.info("Starting at %s", time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+        logger.info("Starting at %s", LOG_NOW)
         #
         rtrnList = []
         iTotalRecords = iTotalDisplayRecords = 0
 
         try:
-            myPersist = PdbxPersist(self.__verbose, self.__lfh, retrySeconds=self.__retrySeconds)
+            myPersist = TracedPdbxPersist(self.__verbose, self.__lfh, retrySeconds=self.__retrySeconds)
             #
             if self.__verbose:
                 logger.info("Category name sought from [%s] is: '%s'", self.__dbFilePath, p_ctgryNm)
@@ -1363,12 +1706,58 @@ class PdbxDataIo(object):
 
         return (rtrnList[(p_iDisplayStart) : (p_iDisplayStart + p_iDisplayLength)], iTotalRecords, iTotalDisplayRecords)
 
+    def iterCategoryRows(self, p_ctgryNm):
+        """Iterate over all records of given category as dictionaries of attribute name -> value
+
+        The category is fetched from the data store once (eagerly, so that failures are reported to the caller),
+        after which records are produced one at a time without building filtered/sorted copies of the result set.
+
+        :param `p_ctgryNm`:    name of cif category
+
+        :Returns:
+            iterator over record dictionaries, or None if category is not present in the data store
+        """
+        try:
+            myPersist = TracedPdbxPersist(self.__verbose, self.__lfh, retrySeconds=self.__retrySeconds)
+            ctgryObj = myPersist.fetchOneObject(self.__dbFilePath, self.__dataBlockName, p_ctgryNm)
+        except:  # noqa: E722 pylint: disable=bare-except
+            logger.exception("Fetching %s for row iteration", p_ctgryNm)
+            return None
+        #
+        if ctgryObj is None:
+            if self.__verbose:
+                logger.info("-- category '%s' not found in %s", p_ctgryNm, self.__dbFilePath)
+            return None
+
+        colList = ctgryObj.getAttributeList()
+
+        def rowIter():
+            for row in ctgryObj.getRowList():
+                yield dict(zip(colList, row))
+
+        return rowIter()
+
+    def iterCategoryRowsNdjson(self, p_ctgryNm):
+        """Iterate over all records of given category as newline-delimited JSON text lines (one record per line)
+
+        :Returns:
+            iterator over text lines, or None if category is not present in the data store
+        """
+        rowIter = self.iterCategoryRows(p_ctgryNm)
+        if rowIter is None:
+            return None
+        return (json.dumps(rowD) + "\n" for rowD in rowIter)
+
     def checkForDictViolations(self):
+        with self.__getMemoryProfile("checkForDictViolations"):
+            return self.__checkForDictViolations()
+
+    def __checkForDictViolations(self):
         """get list of category.items which are currently in violation of dictionary constraints"""
         logger.info("--------------------------------------------")
-        logger.info("Starting at %s", time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+        logger.info("Starting at %s", LOG_NOW)
         #
-        myPersist = PdbxPersist(self.__verbose, self.__lfh)
+        myPersist = TracedPdbxPersist(self.__verbose, self.__lfh)
         #
         categoryList = []
         violationsDict = {"violation_map": {}}
@@ -1407,15 +1796,11 @@ class PdbxDataIo(object):
                                         colDisplName = catObjDict["COLUMN_DISPLAY_NAMES"].get(colIdx, attributeList[colIdx])
                                         #
                                         if not self.__pdbxDictStore:
-                                            self.__pdbxDictStore = PdbxDictionaryInfoStore(verbose=self.__verbose, log=self.__lfh)
+                                            self.__pdbxDictStore = self.__newDictInfoStore()
                                         #
                                         ctgryMetaDict = self.__getCifCtgryMetaDict(curCtgryNm)
                                         if ctgryMetaDict is None:
-                                            if self.__debug:
-                                                logger.debug("-- WARNING: failed to obtain ctgryMetaDict for '%s'", curCtgryNm)
-                                        else:
-                                            if self.__debug:
-                                                logger.debug(" -- ctgryMetaDict obtained as %r", list(ctgryMetaDict.items()))
+                                            self.__cellLog.debug("dict_meta_missing", "-- WARNING: failed to obtain ctgryMetaDict for '%s'", curCtgryNm)
                                         #
                                         vldtnTstRslts = self.__validateAgainstDict(ctgryMetaDict, curCtgryNm, truAttribName, itemValue)
                                         if vldtnTstRslts["pass_regex_tst"] == "false" or vldtnTstRslts["pass_bndry_tst"] == "false":
@@ -1438,21 +1823,19 @@ class PdbxDataIo(object):
 
                                             bFoundViolation = True
 
-                                            if self.__debug:
-                                                logger.debug(
-                                                    "---- DEBUG ---- Current rowIdx is '%s', colIdx is '%s', and violationsDict is now '%r'", rowIdx, colIdx, violationsDict
-                                                )
+                                            self.__cellLog.debug("dict_violation", "Violation in category '%s' at rowIdx '%s', colIdx '%s': %s", curCtgryNm, rowIdx, colIdx, msg)
                                 #
                                 except:  # noqa: E722 pylint: disable=bare-except
-                                    logger.info(
-                                        "---- DEBUG ---- EXCEPTION: Current rowIdx is '%s', colIdx is '%s', and length of record is '%s' for category '%s'",
+                                    # logged sampled, as a malformed category may fail on every cell
+                                    self.__cellLog.exception(
+                                        "dict_violation_error",
+                                        "Exception in checkForDictViolations at rowIdx '%s', colIdx '%s', length of record '%s' for category '%s', record is '%r'",
                                         rowIdx,
                                         colIdx,
                                         len(record),
                                         curCtgryNm,
+                                        record,
                                     )
-                                    logger.info("---- DEBUG ---- EXCEPTION: record is '%r'", record)
-                                    logger.exception("Excepton in checkForDictViolations")
                         #
                         if bFoundViolation:
                             violationsDict["violation_map"][curCtgryNm] = newViolMapDict
@@ -1473,19 +1856,19 @@ class PdbxDataIo(object):
 
         """
         logger.info("--------------------------------------------")
-        logger.info("Starting at %s", time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+        logger.info("Starting at %s", LOG_NOW)
         #
         rtrnDict = {}
 
         try:
-            myPersist = PdbxPersist(self.__verbose, self.__lfh)
+            myPersist = TracedPdbxPersist(self.__verbose, self.__lfh)
             if self.__debug:
-                logger.debug("++++++++++++ just before call to myPersist.fetchOneObject at %s", time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+                logger.debug("++++++++++++ just before call to myPersist.fetchOneObject at %s", LOG_NOW)
             #
             ctgryObj = myPersist.fetchOneObject(self.__dbFilePath, self.__dataBlockName, p_ctgryNm)
             #
             if self.__debug:
-                logger.debug("++++++++++++ just after call to myPersist.fetchOneObject at %s", time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+                logger.debug("++++++++++++ just after call to myPersist.fetchOneObject at %s", LOG_NOW)
             #
             if ctgryObj.getRowCount() == 1 and self.__bUseTransposedTables:
                 p_colIdx = p_rowIdx
@@ -1505,7 +1888,7 @@ class PdbxDataIo(object):
                 logger.info("User has submitted update for category.item '%s.%s' with proposed value: '%r'", p_ctgryNm, attributeNm, p_newValue)
             #
             if not self.__pdbxDictStore:
-                self.__pdbxDictStore = PdbxDictionaryInfoStore(verbose=self.__verbose, log=self.__lfh)
+                self.__pdbxDictStore = self.__newDictInfoStore()
             #
             ctgryMetaDict = self.__getCifCtgryMetaDict(p_ctgryNm)
             if ctgryMetaDict is None:
@@ -1564,19 +1947,19 @@ class PdbxDataIo(object):
 
         """
         logger.info("--------------------------------------------\n")
-        logger.info("Starting at %s", time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+        logger.info("Starting at %s", LOG_NOW)
         #
         bSuccess = False
         #
         try:
-            myPersist = PdbxPersist(self.__verbose, self.__lfh)
+            myPersist = TracedPdbxPersist(self.__verbose, self.__lfh)
             if self.__debug:
-                logger.debug("++++++++++++ just before call to myPersist.fetchOneObject at %s", time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+                logger.debug("++++++++++++ just before call to myPersist.fetchOneObject at %s", LOG_NOW)
             #
             ctgryObj = myPersist.fetchOneObject(self.__dbFilePath, self.__dataBlockName, p_ctgryNm)
             #
             if self.__debug:
-                logger.debug("++++++++++++ just after call to myPersist.fetchOneObject at %s", time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+                logger.debug("++++++++++++ just after call to myPersist.fetchOneObject at %s", LOG_NOW)
             #
             if ctgryObj.getRowCount() == 1 and self.__bUseTransposedTables:
                 p_colIdx = p_rowIdx
@@ -1612,11 +1995,11 @@ class PdbxDataIo(object):
             ctgryObj.setValue(p_newValue, attributeNm, p_rowIdx)
             #
             if self.__debug:
-                logger.debug("++++++++++++ just before call to myPersist.updateOneObject at %s", time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+                logger.debug("++++++++++++ just before call to myPersist.updateOneObject at %s", LOG_NOW)
             #
-            bSuccess = myPersist.updateOneObject(ctgryObj, self.__dbFilePath, self.__dataBlockName)
+            bSuccess = self.__updateCategoryObject(myPersist, ctgryObj)
             if self.__debug:
-                logger.debug("++++++++++++ just after call to myPersist.updateOneObject at %s", time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+                logger.debug("++++++++++++ just after call to myPersist.updateOneObject at %s", LOG_NOW)
             #
         except:  # noqa: E722 pylint: disable=bare-except
             logger.exception("In setItemValue")
@@ -1633,24 +2016,24 @@ class PdbxDataIo(object):
 
         """
         logger.info("--------------------------------------------")
-        logger.info("Starting at %s", time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+        logger.info("Starting at %s", LOG_NOW)
         #
         bSuccess = False
         cifCtgryNm = "pdbx_data_processing_status"
 
         try:
-            myPersist = PdbxPersist(self.__verbose, self.__lfh)
+            myPersist = TracedPdbxPersist(self.__verbose, self.__lfh)
             if self.__debug:
-                logger.debug("++++++++++++ just before call to myPersist.fetchOneObject at %s", time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+                logger.debug("++++++++++++ just before call to myPersist.fetchOneObject at %s", LOG_NOW)
             #
             ctgryObj = myPersist.fetchOneObject(self.__dbFilePath, self.__dataBlockName, cifCtgryNm)
             #
             if self.__debug:
-                logger.debug("++++++++++++ just after call to myPersist.fetchOneObject at %s", time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+                logger.debug("++++++++++++ just after call to myPersist.fetchOneObject at %s", LOG_NOW)
             #
             if ctgryObj is None:
                 if not self.__pdbxDictStore:
-                    self.__pdbxDictStore = PdbxDictionaryInfoStore(verbose=self.__verbose, log=self.__lfh)
+                    self.__pdbxDictStore = self.__newDictInfoStore()
                 #
                 ctgryMetaDict = self.__getCifCtgryMetaDict(cifCtgryNm)
                 #
@@ -1713,11 +2096,11 @@ class PdbxDataIo(object):
                 ctgryObj.append(rowToAdd)
             #
             if self.__debug:
-                logger.debug("++++++++++++ just before call to myPersist.updateOneObject at %s", time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+                logger.debug("++++++++++++ just before call to myPersist.updateOneObject at %s", LOG_NOW)
             #
-            bSuccess = myPersist.updateOneObject(ctgryObj, self.__dbFilePath, self.__dataBlockName)
+            bSuccess = self.__updateCategoryObject(myPersist, ctgryObj)
             if self.__debug:
-                logger.debug("++++++++++++ just after call to myPersist.updateOneObject at %s", time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+                logger.debug("++++++++++++ just after call to myPersist.updateOneObject at %s", LOG_NOW)
             #
         except:  # noqa: E722 pylint: disable=bare-except
             logger.exception("In adding skip")
@@ -1734,20 +2117,20 @@ class PdbxDataIo(object):
 
         """
         logger.info("--------------------------------------------")
-        logger.info("Starting at %s", time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+        logger.info("Starting at %s", LOG_NOW)
         #
         bSuccess = False
         cifCtgryNm = "pdbx_data_processing_status"
 
         try:
-            myPersist = PdbxPersist(self.__verbose, self.__lfh)
+            myPersist = TracedPdbxPersist(self.__verbose, self.__lfh)
             if self.__debug:
-                logger.info("++++++++++++ just before call to myPersist.fetchOneObject at %s", time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+                logger.info("++++++++++++ just before call to myPersist.fetchOneObject at %s", LOG_NOW)
             #
             ctgryObj = myPersist.fetchOneObject(self.__dbFilePath, self.__dataBlockName, cifCtgryNm)
             #
             if self.__debug:
-                logger.info("++++++++++++ just after call to myPersist.fetchOneObject at %s", time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+                logger.info("++++++++++++ just after call to myPersist.fetchOneObject at %s", LOG_NOW)
             #
             # Bypass.  Front end should not invoke unless already skipped..
             if not ctgryObj:
@@ -1799,11 +2182,11 @@ class PdbxDataIo(object):
             ctgryObj.setRowList(rowList)
 
             if self.__debug:
-                logger.info("++++++++++++just before call to myPersist.updateOneObject at %s", time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+                logger.info("++++++++++++just before call to myPersist.updateOneObject at %s", LOG_NOW)
             #
-            bSuccess = myPersist.updateOneObject(ctgryObj, self.__dbFilePath, self.__dataBlockName)
+            bSuccess = self.__updateCategoryObject(myPersist, ctgryObj)
             if self.__debug:
-                logger.info("++++++++++++ just after call to myPersist.updateOneObject at %s", time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+                logger.info("++++++++++++ just after call to myPersist.updateOneObject at %s", LOG_NOW)
             #
         except:  # noqa: E722 pylint: disable=bare-except
             logger.exception("Failure in rmSkipCalcRequest")
@@ -1820,20 +2203,20 @@ class PdbxDataIo(object):
 
         """
         logger.info("--------------------------------------------")
-        logger.info("Starting at %s", time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+        logger.info("Starting at %s", LOG_NOW)
         #
         bSkipRequested = False
         cifCtgryNm = "pdbx_data_processing_status"
 
         try:
-            myPersist = PdbxPersist(self.__verbose, self.__lfh)
+            myPersist = TracedPdbxPersist(self.__verbose, self.__lfh)
             if self.__debug:
-                logger.info("++++++++++++just before call to myPersist.fetchOneObject at %s", time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+                logger.info("++++++++++++just before call to myPersist.fetchOneObject at %s", LOG_NOW)
             #
             ctgryObj = myPersist.fetchOneObject(self.__dbFilePath, self.__dataBlockName, cifCtgryNm)
             #
             if self.__debug:
-                logger.info("+++++++++++ just after call to myPersist.fetchOneObject at %s", time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+                logger.info("+++++++++++ just after call to myPersist.fetchOneObject at %s", LOG_NOW)
             #
             if ctgryObj:
                 rowList = ctgryObj.getRowList()
@@ -1896,20 +2279,20 @@ class PdbxDataIo(object):
 
         """
         logger.info("--------------------------------------------\n")
-        logger.info("Starting at %s", time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+        logger.info("Starting at %s", LOG_NOW)
         #
         bSuccess = False
         rowToAdd = []
 
         try:
-            myPersist = PdbxPersist(self.__verbose, self.__lfh)
+            myPersist = TracedPdbxPersist(self.__verbose, self.__lfh)
             if self.__debug:
-                logger.debug("++++++++++++just before call to myPersist.fetchOneObject at %s", time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+                logger.debug("++++++++++++just before call to myPersist.fetchOneObject at %s", LOG_NOW)
             #
             ctgryObj = myPersist.fetchOneObject(self.__dbFilePath, self.__dataBlockName, p_ctgryNm)
             #
             if self.__debug:
-                logger.debug("++++++++++++ just after call to myPersist.fetchOneObject at %s", time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+                logger.debug("++++++++++++ just after call to myPersist.fetchOneObject at %s", LOG_NOW)
             #
             attributeList = ctgryObj.getAttributeList()
             #
@@ -1917,10 +2300,10 @@ class PdbxDataIo(object):
                 logger.info("+-- Attribute list retrieved is: %s", str(attributeList))
             #
             if not self.__pdbxDictStore:
-                self.__pdbxDictStore = PdbxDictionaryInfoStore(verbose=self.__verbose, log=self.__lfh)
+                self.__pdbxDictStore = self.__newDictInfoStore()
             #
             if self.__debug:
-                logger.debug("++++++++++++just after existence check/creation of PdbxDictionary at %s", time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+                logger.debug("++++++++++++just after existence check/creation of PdbxDictionary at %s", LOG_NOW)
 
             ctgryMetaDict = self.__getCifCtgryMetaDict(p_sCtgryName=p_ctgryNm, p_bCreateStub=True)
 
@@ -1937,11 +2320,11 @@ class PdbxDataIo(object):
             ctgryObj.append(rowToAdd)
             #
             if self.__debug:
-                logger.info("++++++++++++ just before call to myPersist.updateOneObject at %s", time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+                logger.info("++++++++++++ just before call to myPersist.updateOneObject at %s", LOG_NOW)
             #
-            bSuccess = myPersist.updateOneObject(ctgryObj, self.__dbFilePath, self.__dataBlockName)
+            bSuccess = self.__updateCategoryObject(myPersist, ctgryObj)
             if self.__debug:
-                logger.info("++++++++++++ just before call to myPersist.updateOneObject at %s", time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+                logger.info("++++++++++++ just before call to myPersist.updateOneObject at %s", LOG_NOW)
             #
         except:  # noqa: E722 pylint: disable=bare-except
             logger.exception("addNewRow Failure")
@@ -2037,21 +2420,21 @@ class PdbxDataIo(object):
 
         """
         logger.info("--------------------------------------------")
-        logger.info("Starting at %s", time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+        logger.info("Starting at %s", LOG_NOW)
         #
         bSuccess = False
         sErrMsg = ""
         iLastRowDeleted = None
 
         try:
-            myPersist = PdbxPersist(self.__verbose, self.__lfh)
+            myPersist = TracedPdbxPersist(self.__verbose, self.__lfh)
             if self.__debug:
-                logger.debug("++++++++++++ just before call to myPersist.fetchOneObject at %s", time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+                logger.debug("++++++++++++ just before call to myPersist.fetchOneObject at %s", LOG_NOW)
             #
             ctgryObj = myPersist.fetchOneObject(self.__dbFilePath, self.__dataBlockName, p_ctgryNm)
             #
             if self.__debug:
-                logger.debug("++++++++++++ just after call to myPersist.fetchOneObject at %s", time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+                logger.debug("++++++++++++ just after call to myPersist.fetchOneObject at %s", LOG_NOW)
             #
             rowBeingDeleted = None  # will end up being populated with last row being popped in for-loop below
             rowList = ctgryObj.getRowList()
@@ -2109,11 +2492,11 @@ class PdbxDataIo(object):
             ################################################
 
             if self.__debug:
-                logger.debug("++++++++++++ just before call to myPersist.updateOneObject at %s", time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+                logger.debug("++++++++++++ just before call to myPersist.updateOneObject at %s", LOG_NOW)
             #
-            bSuccess = myPersist.updateOneObject(ctgryObj, self.__dbFilePath, self.__dataBlockName)
+            bSuccess = self.__updateCategoryObject(myPersist, ctgryObj)
             if self.__debug:
-                logger.debug("++++++++++++ just after call to myPersist.updateOneObject at %s", time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+                logger.debug("++++++++++++ just after call to myPersist.updateOneObject at %s", LOG_NOW)
             #
         except IndexError:
             if self.__verbose:
@@ -2136,20 +2519,20 @@ class PdbxDataIo(object):
 
         """
         logger.info("--------------------------------------------")
-        logger.info("Starting at %s", time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+        logger.info("Starting at %s", LOG_NOW)
         #
         bSuccess = False
         cloneDict = None
 
         try:
-            myPersist = PdbxPersist(self.__verbose, self.__lfh)
+            myPersist = TracedPdbxPersist(self.__verbose, self.__lfh)
             if self.__debug:
-                logger.info("++++++++++++just before call to myPersist.fetchOneObject at %s", time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+                logger.info("++++++++++++just before call to myPersist.fetchOneObject at %s", LOG_NOW)
             #
             ctgryObj = myPersist.fetchOneObject(self.__dbFilePath, self.__dataBlockName, p_ctgryNm)
             #
             if self.__debug:
-                logger.info("++++++++++++just after call to myPersist.fetchOneObject at %s", time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+                logger.info("++++++++++++just after call to myPersist.fetchOneObject at %s", LOG_NOW)
             #
             attributeList = ctgryObj.getAttributeList()
             rowList = ctgryObj.getRowList()
@@ -2158,7 +2541,7 @@ class PdbxDataIo(object):
                 logger.info("+-- Current row is: %r", rowList[p_rowIdx])
 
             if not self.__pdbxDictStore:
-                self.__pdbxDictStore = PdbxDictionaryInfoStore(verbose=self.__verbose, log=self.__lfh)
+                self.__pdbxDictStore = self.__newDictInfoStore()
             #
             ctgryMetaDict = self.__getCifCtgryMetaDict(p_sCtgryName=p_ctgryNm, p_bCreateStub=True)
             #
@@ -2198,11 +2581,11 @@ class PdbxDataIo(object):
             ctgryObj.setRowList(rowList)
 
             if self.__debug:
-                logger.info("++++++++++++ just before call to myPersist.updateOneObject at %s", time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+                logger.info("++++++++++++ just before call to myPersist.updateOneObject at %s", LOG_NOW)
             #
-            bSuccess = myPersist.updateOneObject(ctgryObj, self.__dbFilePath, self.__dataBlockName)
+            bSuccess = self.__updateCategoryObject(myPersist, ctgryObj)
             if self.__debug:
-                logger.info("++++++++++++ just before call to myPersist.updateOneObject at %s", time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+                logger.info("++++++++++++ just before call to myPersist.updateOneObject at %s", LOG_NOW)
             #
         except:  # noqa: E722 pylint: disable=bare-except
             logger.exception("Failure in insertRows")
@@ -2260,7 +2643,7 @@ class PdbxDataIo(object):
 
         """
         logger.info("--------------------------------------------")
-        logger.info("Starting at %s", time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+        logger.info("Starting at %s", LOG_NOW)
         #
         bSuccess = False
         #
@@ -2270,16 +2653,16 @@ class PdbxDataIo(object):
         rewindToSnapShotFilePath = os.path.join(self.__sessionSnapShotsPath, "dataFileSnapShot_" + str(p_rewindIndex) + ".db")
 
         try:
-            if os.access(rewindToSnapShotFilePath, os.F_OK):
+            if os.access(EditorFileFingerprint.getStorePath(rewindToSnapShotFilePath), os.F_OK):
 
-                myPersist = PdbxPersist(self.__verbose, self.__lfh)
+                myPersist = TracedPdbxPersist(self.__verbose, self.__lfh)
                 #
                 if self.__verbose:
                     logger.info("-- Reverting to prior state just for category: '%s'", p_cifCtgry)
                 #
                 categoryObj = myPersist.fetchOneObject(rewindToSnapShotFilePath, self.__dataBlockName, p_cifCtgry)
                 #
-                bSuccess = myPersist.updateOneObject(categoryObj, self.__dbFilePath, self.__dataBlockName)
+                bSuccess = self.__updateCategoryObject(myPersist, categoryObj)
 
             else:
                 if self.__verbose:
@@ -2402,7 +2785,7 @@ class PdbxDataIo(object):
     def __getNextOrdinalValue(self, p_ctgryObj, p_attributeNm):
 
         logger.info("--------------------------------------------\n")
-        logger.info("Starting at %s", time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+        logger.info("Starting at %s", LOG_NOW)
         #
         try:
             fullRsltSet = p_ctgryObj.getRowList()
@@ -2429,14 +2812,12 @@ class PdbxDataIo(object):
             #
             currentMax = 0
             for i, record in enumerate(fullRsltSet):
-                if self.__verbose and self.__debug:
-                    logger.debug("-- for row #%s, record[%s] is '%s'", i, desiredIdx, record[desiredIdx])
+                self.__cellLog.debug("ordinal_row", "-- for row #%s, record[%s] is '%s'", i, desiredIdx, record[desiredIdx])
                 try:
                     if int(record[desiredIdx]) > int(currentMax):
                         currentMax = int(record[desiredIdx])
                 except ValueError:
-                    if self.__verbose and self.__debug:
-                        logger.debug("-- therefore '%s' is not used to determine current max value of ordinal id field.", record[desiredIdx])
+                    self.__cellLog.debug("ordinal_not_int", "-- '%s' is not used to determine current max value of ordinal id field.", record[desiredIdx])
 
             logger.info("currentMax obtained as: '%s'", currentMax)
 
@@ -2573,7 +2954,7 @@ class PdbxDataIo(object):
         bSuccess = True
 
         if not self.__pdbxDictStore:
-            self.__pdbxDictStore = PdbxDictionaryInfoStore(verbose=self.__verbose, log=self.__lfh)
+            self.__pdbxDictStore = self.__newDictInfoStore()
         #
         #  the purgeSkeletonRowList is a list of categories for which "junk" rows are to be deleted,
         #  regardless of whether or not the CIF editor created the row as a dummy placeholder
@@ -2685,9 +3066,9 @@ class PdbxDataIo(object):
                     #
                     ctgryObj.setRowList(rowList)
 
-                    bSuccess = p_myPersist.updateOneObject(ctgryObj, self.__dbFilePath, self.__dataBlockName)
+                    bSuccess = self.__updateCategoryObject(p_myPersist, ctgryObj)
                     if self.__debug:
-                        logger.debug("++++++++++++ just after call to myPersist.updateOneObject at %s", time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+                        logger.debug("++++++++++++ just after call to myPersist.updateOneObject at %s", LOG_NOW)
                     #
                 else:
                     if self.__verbose:
@@ -2700,7 +3081,7 @@ class PdbxDataIo(object):
         bSuccess = True
 
         if not self.__pdbxDictStore:
-            self.__pdbxDictStore = PdbxDictionaryInfoStore(verbose=self.__verbose, log=self.__lfh)
+            self.__pdbxDictStore = self.__newDictInfoStore()
         #
         if p_ctgryName == "audit_author":
             targetAttributeNm = "pdbx_ordinal"
@@ -2727,9 +3108,9 @@ class PdbxDataIo(object):
             if indxOrdinal >= 0:
                 rowList.sort(key=lambda authorRecord: int(authorRecord[indxOrdinal]))
                 ctgryObj.setRowList(rowList)
-                bSuccess = p_myPersist.updateOneObject(ctgryObj, self.__dbFilePath, self.__dataBlockName)
+                bSuccess = self.__updateCategoryObject(p_myPersist, ctgryObj)
                 if self.__debug:
-                    logger.debug("++++++++++++ just after call to myPersist.updateOneObject at %s", time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+                    logger.debug("++++++++++++ just after call to myPersist.updateOneObject at %s", LOG_NOW)
                     logger.debug("++++++++++++ just after call to myPersist.updateOneObject and bSuccess is %s", bSuccess)
                 #
             else:
@@ -2747,12 +3128,12 @@ class PdbxDataIo(object):
         origTitleValue = None
         bSuccess = False
 
-        if os.access(self.__dbFilePath, os.R_OK):
+        if os.access(EditorFileFingerprint.getStorePath(self.__dbFilePath), os.R_OK):
             bSuccess = True
-            myPersist = PdbxPersist(self.__verbose, self.__lfh)
+            myPersist = TracedPdbxPersist(self.__verbose, self.__lfh)
 
             if not self.__pdbxDictStore:
-                self.__pdbxDictStore = PdbxDictionaryInfoStore(verbose=self.__verbose, log=self.__lfh)
+                self.__pdbxDictStore = self.__newDictInfoStore()
             #
             targetAttributeNm = "title"
             if p_targetCtgry == "struct":
@@ -2822,7 +3203,7 @@ class PdbxDataIo(object):
                         origTitleValue = targetTitleValue
                         targetCtgryObj.setValue(srcTitleValue, targetAttributeNm, targetRowNmbr)
 
-                        bSuccess = myPersist.updateOneObject(targetCtgryObj, self.__dbFilePath, self.__dataBlockName)
+                        bSuccess = self.__updateCategoryObject(myPersist, targetCtgryObj)
                         #
                 else:
                     if self.__verbose:
@@ -2842,7 +3223,7 @@ class PdbxDataIo(object):
         localExclList = ["TESTING"]
 
         if not self.__pdbxDictStore:
-            self.__pdbxDictStore = PdbxDictionaryInfoStore(verbose=self.__verbose, log=self.__lfh)
+            self.__pdbxDictStore = self.__newDictInfoStore()
         #
         # ctgryMetaDict = self.__pdbxDictStore.fetchOneObject(dbFileName=self.__dictDbFilePath,objectName=p_ctgryNm)
         ctgryMetaDict = self.__getCifCtgryMetaDict(p_sCtgryName=p_ctgryNm, p_bCreateStub=True)
@@ -2860,9 +3241,9 @@ class PdbxDataIo(object):
 
         if p_ctgryNm not in localExclList:
             aCatObj.append(rowToAdd)
-        bSuccess = p_myPersist.updateOneObject(aCatObj, self.__dbFilePath, self.__dataBlockName)
+        bSuccess = self.__updateCategoryObject(p_myPersist, aCatObj)
         if self.__debug:
-            logger.debug("just after call to myPersist.updateOneObject at %s", time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+            logger.debug("just after call to myPersist.updateOneObject at %s", LOG_NOW)
         #
         if bSuccess:
             ofh = open(self.__skltnLstFlPath, "a")
@@ -2890,7 +3271,7 @@ class PdbxDataIo(object):
                 attribsToAdd.append(attribName)
         #
         if bUpdateRequired:
-            myPersist = PdbxPersist(self.__verbose, self.__lfh)
+            myPersist = TracedPdbxPersist(self.__verbose, self.__lfh)
             #
             if self.__verbose:
                 logger.info("Need to supply placeholder(s) for missing cif items for category: '%s'", p_categoryNm)
@@ -2904,9 +3285,9 @@ class PdbxDataIo(object):
             if self.__debug:
                 logger.debug("fullRsltSet is now %r", fullRsltSet)
             #
-            bSuccess = myPersist.updateOneObject(categoryObj, self.__dbFilePath, self.__dataBlockName)
+            bSuccess = self.__updateCategoryObject(myPersist, categoryObj)
             if self.__debug:
-                logger.debug("++++++++++++ just after call to myPersist.updateOneObject at %s", time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+                logger.debug("++++++++++++ just after call to myPersist.updateOneObject at %s", LOG_NOW)
         else:
             bSuccess = True
         #
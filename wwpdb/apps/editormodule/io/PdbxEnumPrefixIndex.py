@@ -0,0 +1,77 @@
+##
+# File:    PdbxEnumPrefixIndex.py
+# Date:    19-Oct-2026
+#
+# Updates:
+#    2026-10-19    RPS    Added getStats() (process-wide cache entries and hit/miss counts).
+##
+"""
+Sorted prefix index over a dictionary enumeration for server-side autocomplete.
+
+Indexes are built from the session enum registry and kept process-wide per enum id,
+so large enumerations (e.g. taxonomy scientific names) are indexed once per worker.
+
+"""
+__docformat__ = "restructuredtext en"
+__author__ = "Raul Sala"
+__email__ = "rsala@rcsb.rutgers.edu"
+__license__ = "Creative Commons Attribution 3.0 Unported"
+__version__ = "V0.01"
+
+import bisect
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class PdbxEnumPrefixIndex(object):
+    """Case-insensitive prefix search over a list of enumeration values"""
+
+    # process-wide cache of built indexes keyed by enum id (content hash, so never stale)
+    __cache = {}
+    __maxCacheEntries = 256
+    __hits = 0
+    __misses = 0
+
+    def __init__(self, enumList):
+        pairs = sorted((val.lower(), val) for val in enumList)
+        self.__keys = [k for k, _v in pairs]
+        self.__values = [v for _k, v in pairs]
+
+    @classmethod
+    def get(cls, enumId, enumRegistry):
+        """Return index for given enum id, building it from enumRegistry on first use"""
+        idx = cls.__cache.get(enumId)
+        if idx is not None:
+            cls.__hits += 1
+        else:
+            cls.__misses += 1
+            enumList = enumRegistry.getEnum(enumId)
+            if enumList is None:
+                return None
+            idx = cls(enumList)
+            if len(cls.__cache) >= cls.__maxCacheEntries:
+                cls.__cache.clear()
+            cls.__cache[enumId] = idx
+        return idx
+
+    @classmethod
+    def getStats(cls):
+        """Return dictionary of cache entry count and hit/miss counts"""
+        return {"entries": len(cls.__cache), "max_entries": cls.__maxCacheEntries, "hits": cls.__hits, "misses": cls.__misses}
+
+    def __len__(self):
+        return len(self.__keys)
+
+    def search(self, prefix, limit=20):
+        """Return up to limit values starting with prefix (case-insensitive), in sorted order
+
+        :Returns:
+            ``matches``: list of matching enumeration values
+            ``total``:   total number of values matching the prefix
+        """
+        key = prefix.lower()
+        lo = bisect.bisect_left(self.__keys, key)
+        # all keys sharing the prefix sort before key + highest code point
+        hi = bisect.bisect_left(self.__keys, key + u"\uffff", lo)
+        return self.__values[lo : min(hi, lo + limit)], hi - lo
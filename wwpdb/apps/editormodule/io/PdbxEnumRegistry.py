@@ -0,0 +1,175 @@
+##
+# File:    PdbxEnumRegistry.py
+# Date:    19-Oct-2026
+#
+# Updates:
+#    2026-10-19    RPS    Added getStats() (process-wide cache entries, hit/miss counts and registry versions).
+##
+"""
+Session level registry of dictionary enumerations.
+
+Each distinct enumeration list is stored once under an id derived from a hash of its
+content.  Table config dictionaries can then refer to an enumeration by id, and the
+front end fetches the list once per registry (i.e. dictionary) version.
+
+"""
+__docformat__ = "restructuredtext en"
+__author__ = "Raul Sala"
+__email__ = "rsala@rcsb.rutgers.edu"
+__license__ = "Creative Commons Attribution 3.0 Unported"
+__version__ = "V0.01"
+
+import sys
+import os
+import hashlib
+import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class PdbxEnumRegistry(object):
+    """Registry of sorted enumeration lists keyed by content hash
+
+    Registry file layout (JSON):
+
+        {"version": <hash over all enum ids>,
+         "enums": {<enumId>: [sorted values]},
+         "refs": {<category>: {"COLUMN_ENUMS": {<attribute>: <enumId>}, "COLUMN_ENUMS_ALT": {...}}}}
+
+    """
+
+    # process-wide cache of loaded registries keyed by file path -> (mtime, registry content)
+    __cache = {}
+    __hits = 0
+    __misses = 0
+
+    def __init__(self, registryFilePath=None, verbose=False, log=sys.stderr):
+        self.__verbose = verbose
+        self.__lfh = log
+        self.__registryFilePath = registryFilePath
+        #
+        self.__version = None
+        self.__enumD = {}
+        self.__refD = {}
+
+    @staticmethod
+    def sortEnum(enumList):
+        """Sort enumeration values in place in the case-insensitive order presented to the user"""
+        enumList.sort(key=str.lower)
+        return enumList
+
+    @staticmethod
+    def makeEnumId(enumList):
+        """Content hash id for the given (already sorted) enumeration list"""
+        hsh = hashlib.sha1()
+        for val in enumList:
+            hsh.update(val.encode("utf-8"))
+            hsh.update(b"\n")
+        return hsh.hexdigest()[:16]
+
+    def build(self, dInfo):
+        """Pre-sort all enumerations in the dictionary metadata and register each distinct list once
+
+        :param `dInfo`:  dictionary of per-category metadata as assembled by PdbxDictionaryInfo.  Enumeration
+                         lists in the COLUMN_ENUMS/COLUMN_ENUMS_ALT settings are sorted in place, so that
+                         a dictionary store built from dInfo vends pre-sorted lists.
+
+        """
+        self.__enumD = {}
+        self.__refD = {}
+        for ctgryNm, ctgryMetaDict in dInfo.items():
+            if not isinstance(ctgryMetaDict, dict):
+                continue
+            for key in ["COLUMN_ENUMS", "COLUMN_ENUMS_ALT"]:
+                enumDict = ctgryMetaDict.get(key)
+                if not enumDict or not isinstance(enumDict, dict):
+                    continue
+                for attribNm, enumList in enumDict.items():
+                    if not enumList:
+                        continue
+                    self.sortEnum(enumList)
+                    enumId = self.makeEnumId(enumList)
+                    if enumId not in self.__enumD:
+                        self.__enumD[enumId] = list(enumList)
+                    self.__refD.setdefault(ctgryNm, {}).setdefault(key, {})[attribNm] = enumId
+        #
+        hsh = hashlib.sha1()
+        for enumId in sorted(self.__enumD):
+            hsh.update(enumId.encode("utf-8"))
+        self.__version = hsh.hexdigest()[:16]
+        #
+        if self.__verbose:
+            logger.info("registered %s distinct enumerations, version %s", len(self.__enumD), self.__version)
+        return self.__version
+
+    def store(self):
+        """Write registry to its session file"""
+        try:
+            rD = {"version": self.__version, "enums": self.__enumD, "refs": self.__refD}
+            tmpPath = self.__registryFilePath + ".tmp"
+            with open(tmpPath, "w") as ofh:
+                json.dump(rD, ofh)
+            os.rename(tmpPath, self.__registryFilePath)
+            return True
+        except:  # noqa: E722 pylint: disable=bare-except
+            logger.exception("Failed storing enum registry to %s", self.__registryFilePath)
+            return False
+
+    def load(self):
+        """Read registry from its session file, reusing the process-wide copy when the file is unchanged"""
+        try:
+            mtime = os.stat(self.__registryFilePath).st_mtime
+        except OSError:
+            if self.__verbose:
+                logger.info("no enum registry available at %s", self.__registryFilePath)
+            return False
+        #
+        cached = PdbxEnumRegistry.__cache.get(self.__registryFilePath)
+        if cached is not None and cached[0] == mtime:
+            PdbxEnumRegistry.__hits += 1
+            rD = cached[1]
+        else:
+            PdbxEnumRegistry.__misses += 1
+            try:
+                with open(self.__registryFilePath, "r") as ifh:
+                    rD = json.load(ifh)
+            except:  # noqa: E722 pylint: disable=bare-except
+                logger.exception("Failed reading enum registry from %s", self.__registryFilePath)
+                return False
+            PdbxEnumRegistry.__cache[self.__registryFilePath] = (mtime, rD)
+        #
+        self.__version = rD.get("version")
+        self.__enumD = rD.get("enums", {})
+        self.__refD = rD.get("refs", {})
+        return True
+
+    def getVersion(self):
+        return self.__version
+
+    @classmethod
+    def getStats(cls):
+        """Return dictionary of process-wide cache entry count, hit/miss counts and number of cached registries per version"""
+        versionD = {}
+        for _mtime, rD in list(cls.__cache.values()):
+            version = rD.get("version")
+            versionD[version] = versionD.get(version, 0) + 1
+        return {"entries": len(cls.__cache), "hits": cls.__hits, "misses": cls.__misses, "versions": versionD}
+
+    def getEnumId(self, ctgryNm, attribNm, alt=False):
+        """Enum id registered for the given category attribute or None"""
+        key = "COLUMN_ENUMS_ALT" if alt else "COLUMN_ENUMS"
+        return self.__refD.get(ctgryNm, {}).get(key, {}).get(attribNm)
+
+    def hasAltEnums(self, ctgryNm):
+        """True if "_ALT" enumerations, which take precedence for the UI, are registered for the category"""
+        return len(self.__refD.get(ctgryNm, {}).get("COLUMN_ENUMS_ALT", {})) > 0
+
+    def getEnum(self, enumId):
+        return self.__enumD.get(enumId)
+
+    def getEnumDict(self, enumIdList=None):
+        """Dictionary of enumId -> sorted values, restricted to enumIdList when provided"""
+        if enumIdList is None:
+            return dict(self.__enumD)
+        return dict((enumId, self.__enumD[enumId]) for enumId in enumIdList if enumId in self.__enumD)
@@ -0,0 +1,262 @@
+##
+# File:    EditorAsgiApp.py
+# Date:    19-Oct-2026
+#
+# Updates:
+#    2026-10-19    RPS    Requests waiting for a worker tracked for getStats() (pending count, oldest pending request);
+#                         /service/editor/status answered outside the request pool.
+#    2026-10-19    RPS    Requests counted in flight before the request body is read, so that the pending limit holds for requests
+#                         arriving together.
+##
+"""
+ASGI front end for the general annotation editor.
+
+Requests to the same /service/editor/* paths handled by the WSGI/FCGI responders are
+parsed on the event loop and the blocking EditorWebApp dispatch (data store access,
+parsing, export) is run in a bounded thread or process pool, so that one host process can
+serve many concurrent annotator sessions while long operations are in progress.  Requests
+beyond the pool size wait in a bounded queue; beyond that a 503 response is returned.
+
+Streamed (ndjson) responses are iterated in the pool and sent chunk by chunk.  Status requests
+(/service/editor/status) are run in a separate single thread, so that they are answered while the
+pool is busy and report on the requests waiting for it (getInstanceStats()).  Multipart
+(file upload) requests are not handled here and should be routed to the WSGI responder.
+
+Usage (e.g. with uvicorn):
+    uvicorn wwpdb.apps.editormodule.webapp.doServiceRequestAsgi:application
+
+"""
+__docformat__ = "restructuredtext en"
+__author__ = "Raul Sala"
+__email__ = "rsala@rcsb.rutgers.edu"
+__license__ = "Creative Commons Attribution 3.0 Unported"
+__version__ = "V0.01"
+
+import asyncio
+import os
+import sys
+import time
+import weakref
+import logging
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from urllib.parse import parse_qs
+
+logger = logging.getLogger(__name__)
+
+
+def runEditorRequest(parameterDict, siteId=None, verbose=False, materialize=False):
+    """Dispatch one request through EditorWebApp and return its response dictionary.
+    With materialize=True any streamed content is collected, as needed when returning from a worker process.
+    """
+    from wwpdb.apps.editormodule.webapp.EditorWebApp import EditorWebApp  # pylint: disable=import-outside-toplevel
+
+    rspD = EditorWebApp(parameterDict=parameterDict, verbose=verbose, log=sys.stderr, siteId=siteId).doOp()
+    if materialize and rspD.get("RETURN_ITERABLE") is not None:
+        rspD["RETURN_ITERABLE"] = list(rspD["RETURN_ITERABLE"])
+    return rspD
+
+
+class EditorAsgiApp(object):
+    """ASGI application callable dispatching to EditorWebApp in a bounded worker pool"""
+
+    STATUS_PATH = "/service/editor/status"
+    # application instances of this process, for status requests
+    __instances = weakref.WeakSet()
+
+    def __init__(self, maxWorkers=8, maxPending=64, useProcesses=False, siteId=None, requestFunc=None, verbose=False, log=sys.stderr):
+        """
+        :param `maxWorkers`:    size of the thread/process pool running blocking request handling
+        :param `maxPending`:    requests allowed to wait for a worker before 503 responses are returned
+        :param `useProcesses`:  use a process pool rather than a thread pool
+        :param `siteId`:        site id passed to EditorWebApp (default from WWPDB_SITE_ID)
+        :param `requestFunc`:   callable(parameterDict, siteId, verbose, materialize) returning the response dictionary
+                                (default runEditorRequest(); must be picklable when useProcesses is set)
+
+        """
+        self.__verbose = verbose
+        self.__lfh = log
+        self.__maxWorkers = maxWorkers
+        self.__maxPending = maxPending
+        self.__useProcesses = useProcesses
+        self.__siteId = siteId if siteId else os.environ.get("WWPDB_SITE_ID")
+        self.__requestFunc = requestFunc if requestFunc is not None else runEditorRequest
+        self.__executor = None
+        self.__statusExecutor = None
+        self.__inFlight = 0
+        self.__rejected = 0
+        # requests submitted to the pool: sequence number -> (path, time submitted, future)
+        self.__jobD = {}
+        self.__jobSeq = 0
+        EditorAsgiApp.__instances.add(self)
+
+    def __getExecutor(self):
+        if self.__executor is None:
+            if self.__useProcesses:
+                self.__executor = ProcessPoolExecutor(max_workers=self.__maxWorkers)
+            else:
+                self.__executor = ThreadPoolExecutor(max_workers=self.__maxWorkers, thread_name_prefix="editor-asgi")
+        return self.__executor
+
+    def __getStatusExecutor(self):
+        if self.__statusExecutor is None:
+            self.__statusExecutor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="editor-asgi-status")
+        return self.__statusExecutor
+
+    def shutdown(self):
+        if self.__executor is not None:
+            self.__executor.shutdown(wait=True)
+            self.__executor = None
+        if self.__statusExecutor is not None:
+            self.__statusExecutor.shutdown(wait=True)
+            self.__statusExecutor = None
+
+    def getStats(self):
+        """Return pool size, requests in flight, running in the pool and waiting for a worker (with the oldest of these), and rejected requests"""
+        now = time.time()
+        running = 0
+        pendingL = []
+        for path, tSubmit, future in list(self.__jobD.values()):
+            if future.running():
+                running += 1
+            elif not future.done():
+                pendingL.append((tSubmit, path))
+        oldest = min(pendingL) if pendingL else None
+        return {
+            "max_workers": self.__maxWorkers,
+            "max_pending": self.__maxPending,
+            "in_flight": self.__inFlight,
+            "running": running,
+            "pending": len(pendingL),
+            "oldest_pending_secs": round(now - oldest[0], 3) if oldest else None,
+            "oldest_pending_path": oldest[1] if oldest else None,
+            "rejected": self.__rejected,
+            "processes": self.__useProcesses,
+        }
+
+    @classmethod
+    def getInstanceStats(cls):
+        """Return getStats() of each application instance of this process"""
+        return [app.getStats() for app in list(cls.__instances)]
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "lifespan":
+            await self.__lifespan(receive, send)
+            return
+        if scope["type"] != "http":
+            return
+        #
+        bStatus = scope.get("path", "").lower() == self.STATUS_PATH
+        if not bStatus:
+            if self.__inFlight >= self.__maxWorkers + self.__maxPending:
+                self.__rejected += 1
+                await self.__sendSimple(send, 503, b"Server busy")
+                return
+            # counted before any await, so that requests arriving together cannot all pass the check above
+            self.__inFlight += 1
+        try:
+            await self.__handleHttp(scope, receive, send, bStatus)
+        finally:
+            if not bStatus:
+                self.__inFlight -= 1
+
+    async def __handleHttp(self, scope, receive, send, bStatus):
+        executor = self.__getStatusExecutor() if bStatus else self.__getExecutor()
+        body = await self.__readBody(receive)
+        contentType = self.__getHeader(scope, b"content-type")
+        if contentType.startswith("multipart/"):
+            await self.__sendSimple(send, 415, b"Multipart requests are not supported by this front end")
+            return
+        parameterDict = self.__getParameterDict(scope, body, contentType)
+        #
+        loop = asyncio.get_event_loop()
+        if bStatus:
+            # run in this process, where the pool state is held, whatever the pool type
+            rspD = await self.__runRequest(send, executor.submit(self.__requestFunc, parameterDict, self.__siteId, self.__verbose, False), scope)
+            if rspD is not None:
+                await self.__sendResponse(send, rspD, loop, executor)
+            return
+        self.__jobSeq += 1
+        jobId = self.__jobSeq
+        try:
+            # requests beyond the pool size queue in the executor, bounded by the in-flight check in __call__()
+            future = executor.submit(self.__requestFunc, parameterDict, self.__siteId, self.__verbose, self.__useProcesses)
+            self.__jobD[jobId] = (scope.get("path"), time.time(), future)
+            rspD = await self.__runRequest(send, future, scope)
+            self.__jobD.pop(jobId, None)
+            if rspD is not None:
+                await self.__sendResponse(send, rspD, loop, executor)
+        finally:
+            self.__jobD.pop(jobId, None)
+
+    async def __runRequest(self, send, future, scope):
+        """Wait for request handling submitted to a pool, returning the response dictionary (None after sending an error response)"""
+        try:
+            return await asyncio.wrap_future(future)
+        except Exception:  # pylint: disable=broad-except
+            logger.exception("Failed handling %s", scope.get("path"))
+            await self.__sendSimple(send, 500, b"Operation failure")
+        return None
+
+    async def __lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                self.shutdown()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    async def __readBody(self, receive):
+        chunks = []
+        while True:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                break
+            chunks.append(message.get("body", b""))
+            if not message.get("more_body", False):
+                break
+        return b"".join(chunks)
+
+    def __getHeader(self, scope, name):
+        for key, value in scope.get("headers", []):
+            if key.lower() == name:
+                return value.decode("latin-1").lower()
+        return ""
+
+    def __getParameterDict(self, scope, body, contentType):
+        """Parameter dictionary of lists, as built by the WSGI responder"""
+        parameterDict = parse_qs(scope.get("query_string", b"").decode("utf-8"), keep_blank_values=True)
+        if body and contentType.startswith("application/x-www-form-urlencoded"):
+            for name, valueL in parse_qs(body.decode("utf-8"), keep_blank_values=True).items():
+                parameterDict.setdefault(name, []).extend(valueL)
+        parameterDict["request_path"] = [scope.get("path", "").lower()]
+        return parameterDict
+
+    async def __sendSimple(self, send, status, body):
+        await send({"type": "http.response.start", "status": status, "headers": [(b"content-type", b"text/plain")]})
+        await send({"type": "http.response.body", "body": body})
+
+    async def __sendResponse(self, send, rspD, loop, executor):
+        contentType = rspD.get("CONTENT_TYPE", "text/html")
+        await send({"type": "http.response.start", "status": 200, "headers": [(b"content-type", contentType.encode("latin-1"))]})
+        lineIter = rspD.get("RETURN_ITERABLE")
+        if lineIter is None:
+            body = rspD.get("RETURN_STRING", "")
+            await send({"type": "http.response.body", "body": body.encode("utf-8") if not isinstance(body, bytes) else body})
+            return
+        #
+        if isinstance(lineIter, list):
+            # already collected in a worker process
+            for chunk in lineIter:
+                await send({"type": "http.response.body", "body": chunk, "more_body": True})
+            await send({"type": "http.response.body", "body": b""})
+            return
+        lineIter = iter(lineIter)
+        while True:
+            # each step may touch the data store, so is run in the pool too
+            chunk = await loop.run_in_executor(executor, next, lineIter, None)
+            if chunk is None:
+                break
+            await send({"type": "http.response.body", "body": chunk, "more_body": True})
+        await send({"type": "http.response.body", "body": b""})
@@ -0,0 +1,118 @@
+##
+# File:    EditorLaunchPipeline.py
+# Date:    19-Oct-2026
+#
+# Updates:
+#    2026-10-19    RPS    Dictionary parse skipped when the session dictionary store can be reused.
+#    2026-10-19    RPS    Run serially when memory profiling is enabled.
+##
+"""
+Launch pipeline for the general annotation editor.
+
+The PDBx dictionary parse does not depend on the model data file, so it is run in a
+worker thread while the model file is staged, parsed and shelved.  Only the view
+selection, which needs the entry's experimental methods, waits for both.  Time spent
+in each stage is recorded so that launch time can be attributed.
+
+On relaunch, if the dictionary and view config files are unchanged since the session
+dictionary store was built, the dictionary is not parsed ahead of time at all.
+
+With memory profiling enabled the stages are run one after the other, since the process-wide
+tracemalloc figures of the model data store would otherwise include the concurrent dictionary parse.
+
+"""
+__docformat__ = "restructuredtext en"
+__author__ = "Raul Sala"
+__email__ = "rsala@rcsb.rutgers.edu"
+__license__ = "Creative Commons Attribution 3.0 Unported"
+__version__ = "V0.01"
+
+import sys
+import time
+import threading
+import logging
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+
+class EditorLaunchPipeline(object):
+    """Run data store and dictionary store initialization for a launch, recording per-stage timings"""
+
+    def __init__(self, pdbxDataIo, parallel=True, verbose=False, log=sys.stderr):
+        """
+        :param `pdbxDataIo`:  PdbxDataIo instance for the session being launched
+        :param `parallel`:    if True, overlap dictionary parse with model data store initialization (unless memory profiling is enabled)
+
+        """
+        self.__verbose = verbose
+        self.__lfh = log
+        self.__pdbxDataIo = pdbxDataIo
+        self.__parallel = parallel and not pdbxDataIo.isMemoryProfileEnabled()
+        self.__timings = []
+        self.__reusedDictStore = False
+        self.__tStart = time.time()
+
+    @contextmanager
+    def stage(self, name):
+        """Context manager recording elapsed wall time for the named stage"""
+        t0 = time.time()
+        try:
+            yield
+        finally:
+            self.__timings.append((name, (time.time() - t0) * 1000.0))
+
+    def run(self):
+        """Initialize model data store and dictionary info store
+
+        :Returns:
+            ``dataBlockName``, ``entryTitle``, ``entryAccessionIdsLst`` as returned by PdbxDataIo.initializeDataStore()
+        """
+        dictResult = {}
+
+        def parseDictionary():
+            t0 = time.time()
+            try:
+                dictResult["dInfo"] = self.__pdbxDataIo.getDictInfo()
+            except:  # noqa: E722 pylint: disable=bare-except
+                logger.exception("Failed parsing dictionary in launch pipeline")
+            dictResult["ms"] = (time.time() - t0) * 1000.0
+
+        if self.__pdbxDataIo.isDictInfoStoreReusable():
+            # initializeDictInfoStore() parses in place should the view selection turn out to differ
+            dictThread = None
+            self.__reusedDictStore = True
+        elif self.__parallel:
+            dictThread = threading.Thread(target=parseDictionary, name="editor-dict-parse")
+            dictThread.daemon = True
+            dictThread.start()
+        else:
+            dictThread = None
+            parseDictionary()
+
+        with self.stage("model_store"):
+            dataBlockName, entryTitle, entryAccessionIdsLst = self.__pdbxDataIo.initializeDataStore()
+
+        if dictThread is not None:
+            with self.stage("dictionary_parse_wait"):
+                dictThread.join()
+        if not self.__reusedDictStore:
+            self.__timings.append(("dictionary_parse", dictResult.get("ms", 0.0)))
+
+        with self.stage("dictionary_store"):
+            # falls back to parsing in place if the concurrent parse failed
+            self.__pdbxDataIo.initializeDictInfoStore(p_dictInfo=dictResult.get("dInfo"))
+
+        return dataBlockName, entryTitle, entryAccessionIdsLst
+
+    def getTimings(self):
+        """Return dictionary of stage name -> elapsed milliseconds, plus 'total' since pipeline creation"""
+        tD = dict((name, round(ms, 1)) for name, ms in self.__timings)
+        tD["total"] = round((time.time() - self.__tStart) * 1000.0, 1)
+        return tD
+
+    def isParallel(self):
+        return self.__parallel
+
+    def isDictStoreReused(self):
+        return self.__reusedDictStore
@@ -0,0 +1,283 @@
+##
+# File:    EditorRequestMetrics.py
+# Date:    19-Oct-2026
+#
+# Updates:
+#    2026-10-19    RPS    Per-route totals of store access recorded by EditorStoreTrace.
+#    2026-10-19    RPS    Snapshots of exited processes (and those not renewed within STALE_SNAPSHOT_SECS) removed on loading.
+##
+"""
+Per-route request metrics for the general annotation editor: latency histogram, error count
+and response payload size for every service path.
+
+Metrics are accumulated per process.  Each process periodically writes a snapshot as JSON
+to a shared directory, so that the /service/editor/metrics endpoint can report on all worker
+processes of a host (scope=host) and snapshots can be collected for offline analysis.
+Snapshots of processes that have exited, or that have not been renewed for STALE_SNAPSHOT_SECS
+(taken as left by a process whose id has since been reused), are removed when loaded, so that
+host figures do not keep the counts of replaced worker processes.
+Output is in Prometheus text exposition format, or JSON.
+
+"""
+__docformat__ = "restructuredtext en"
+__author__ = "Raul Sala"
+__email__ = "rsala@rcsb.rutgers.edu"
+__license__ = "Creative Commons Attribution 3.0 Unported"
+__version__ = "V0.01"
+
+import os
+import errno
+import json
+import time
+import socket
+import threading
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class EditorRequestMetrics(object):
+    """Process-wide per-route request metrics"""
+
+    # latency histogram bucket upper bounds (seconds)
+    BUCKETS = [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0]
+    # minimum interval between snapshots written by maybeDump()
+    DUMP_INTERVAL_SECS = 10.0
+    # snapshots older than this are discarded by loadSnapshots(), whether or not a process with their pid is running
+    STALE_SNAPSHOT_SECS = 360 * DUMP_INTERVAL_SECS
+
+    __lock = threading.Lock()
+    __routeD = {}
+    __lastDump = 0.0
+    __startTime = time.time()
+
+    @classmethod
+    def __getRoute(cls, route):
+        rD = cls.__routeD.get(route)
+        if rD is None:
+            rD = {
+                "count": 0,
+                "errors": 0,
+                "latency_secs_sum": 0.0,
+                "buckets": [0] * len(cls.BUCKETS),
+                "payload_bytes_sum": 0,
+                "payload_bytes_max": 0,
+                "payload_count": 0,
+                "stores": {},
+            }
+            cls.__routeD[route] = rD
+        return rD
+
+    @classmethod
+    def record(cls, route, latencySecs, isError=False, payloadBytes=None):
+        """Record one request on route"""
+        with cls.__lock:
+            rD = cls.__getRoute(route)
+            rD["count"] += 1
+            if isError:
+                rD["errors"] += 1
+            rD["latency_secs_sum"] += latencySecs
+            for ii, upperBound in enumerate(cls.BUCKETS):
+                if latencySecs <= upperBound:
+                    rD["buckets"][ii] += 1
+                    break
+            if payloadBytes is not None:
+                cls.__recordPayload(rD, payloadBytes)
+
+    @classmethod
+    def recordPayload(cls, route, payloadBytes):
+        """Record payload size of a response on route delivered after the request was recorded (streamed responses)"""
+        with cls.__lock:
+            cls.__recordPayload(cls.__getRoute(route), payloadBytes)
+
+    @classmethod
+    def __recordPayload(cls, rD, payloadBytes):
+        rD["payload_count"] += 1
+        rD["payload_bytes_sum"] += payloadBytes
+        rD["payload_bytes_max"] = max(rD["payload_bytes_max"], payloadBytes)
+
+    @classmethod
+    def recordStoreTrace(cls, route, traceD):
+        """Add store access totals of one request on route (as returned by EditorStoreTrace.end())"""
+        if not traceD:
+            return
+        with cls.__lock:
+            storeD = cls.__getRoute(route)["stores"]
+            for storeName, sD in traceD["stores"].items():
+                tD = storeD.setdefault(storeName, {"opens": 0, "fetches": 0, "updates": 0, "bytes": 0, "secs": 0.0, "opens_max": 0})
+                for key in ["opens", "fetches", "updates", "bytes", "secs"]:
+                    tD[key] += sD[key]
+                tD["opens_max"] = max(tD["opens_max"], sD["opens"])
+
+    @classmethod
+    def countingIterator(cls, route, chunkIter):
+        """Wrap iterable of response chunks, recording the total size once it is exhausted"""
+        nBytes = 0
+        for chunk in chunkIter:
+            nBytes += len(chunk)
+            yield chunk
+        cls.recordPayload(route, nBytes)
+
+    @classmethod
+    def reset(cls):
+        with cls.__lock:
+            cls.__routeD.clear()
+
+    @classmethod
+    def getSnapshot(cls):
+        """Return JSON serializable snapshot of the metrics of this process"""
+        with cls.__lock:
+            routeD = json.loads(json.dumps(cls.__routeD))
+        return {"host": socket.gethostname(), "pid": os.getpid(), "time": time.time(), "start_time": cls.__startTime, "buckets": cls.BUCKETS, "routes": routeD}
+
+    @classmethod
+    def dump(cls, filePath):
+        """Write snapshot of the metrics of this process to filePath (atomically replacing any prior version)"""
+        try:
+            tmpPath = "%s.%d.tmp" % (filePath, os.getpid())
+            with open(tmpPath, "w") as ofh:
+                json.dump(cls.getSnapshot(), ofh, indent=1)
+            os.rename(tmpPath, filePath)
+            return True
+        except:  # noqa: E722 pylint: disable=bare-except
+            logger.exception("Failed writing metrics to %s", filePath)
+            return False
+
+    @classmethod
+    def getDumpFilePath(cls, dirPath):
+        return os.path.join(dirPath, "metrics_%s_%d.json" % (socket.gethostname(), os.getpid()))
+
+    @classmethod
+    def maybeDump(cls, dirPath):
+        """Write snapshot into dirPath if none has been written by this process within DUMP_INTERVAL_SECS"""
+        now = time.time()
+        with cls.__lock:
+            if now - cls.__lastDump < cls.DUMP_INTERVAL_SECS:
+                return False
+            cls.__lastDump = now
+        try:
+            if not os.path.isdir(dirPath):
+                os.makedirs(dirPath)
+        except OSError:
+            logger.exception("Failed creating metrics directory %s", dirPath)
+            return False
+        return cls.dump(cls.getDumpFilePath(dirPath))
+
+    @staticmethod
+    def isProcessAlive(pid):
+        """Return True if a process with id pid is running on this host (always True where this cannot be checked)"""
+        if os.name != "posix" or not isinstance(pid, int) or pid <= 0:
+            return True
+        try:
+            os.kill(pid, 0)
+        except OSError as e:
+            # EPERM - running under another user
+            return e.errno == errno.EPERM
+        return True
+
+    @classmethod
+    def loadSnapshots(cls, dirPath):
+        """Return list of current snapshots written into dirPath by processes of this host, removing those of
+        processes that have exited or that are older than STALE_SNAPSHOT_SECS
+        """
+        snapshotL = []
+        prefix = "metrics_%s_" % socket.gethostname()
+        if not os.path.isdir(dirPath):
+            return snapshotL
+        now = time.time()
+        for fn in sorted(os.listdir(dirPath)):
+            if fn.startswith(prefix) and fn.endswith(".json"):
+                filePath = os.path.join(dirPath, fn)
+                try:
+                    with open(filePath, "r") as ifh:
+                        snapshot = json.load(ifh)
+                except (IOError, OSError, ValueError):
+                    logger.warning("skipping unreadable metrics snapshot %s", fn)
+                    continue
+                if now - snapshot.get("time", 0.0) > cls.STALE_SNAPSHOT_SECS or not cls.isProcessAlive(snapshot.get("pid")):
+                    try:
+                        os.remove(filePath)
+                        logger.info("removed metrics snapshot %s of process %s", fn, snapshot.get("pid"))
+                    except OSError:
+                        # removed concurrently by another process
+                        pass
+                    continue
+                snapshotL.append(snapshot)
+        return snapshotL
+
+    @staticmethod
+    def mergeSnapshots(snapshotList):
+        """Return single snapshot combining the route metrics of snapshotList"""
+        mergedD = {"host": socket.gethostname(), "pid": None, "time": time.time(), "buckets": EditorRequestMetrics.BUCKETS, "routes": {}, "processes": len(snapshotList)}
+        for snapshot in snapshotList:
+            for route, rD in snapshot.get("routes", {}).items():
+                mD = mergedD["routes"].get(route)
+                if mD is None:
+                    mergedD["routes"][route] = json.loads(json.dumps(rD))
+                    continue
+                for key in ["count", "errors", "latency_secs_sum", "payload_bytes_sum", "payload_count"]:
+                    mD[key] += rD[key]
+                mD["payload_bytes_max"] = max(mD["payload_bytes_max"], rD["payload_bytes_max"])
+                mD["buckets"] = [a + b for a, b in zip(mD["buckets"], rD["buckets"])]
+                for storeName, sD in rD.get("stores", {}).items():
+                    tD = mD.setdefault("stores", {}).get(storeName)
+                    if tD is None:
+                        mD["stores"][storeName] = dict(sD)
+                        continue
+                    for key in ["opens", "fetches", "updates", "bytes", "secs"]:
+                        tD[key] += sD[key]
+                    tD["opens_max"] = max(tD["opens_max"], sD["opens_max"])
+        return mergedD
+
+    @staticmethod
+    def toPrometheus(snapshot, extraLines=None):
+        """Render snapshot in Prometheus text exposition format"""
+        lineL = []
+        routeItems = sorted(snapshot.get("routes", {}).items())
+        lineL.append("# HELP editor_request_latency_seconds Request handling latency by service path.")
+        lineL.append("# TYPE editor_request_latency_seconds histogram")
+        for route, rD in routeItems:
+            cumulative = 0
+            for upperBound, count in zip(snapshot["buckets"], rD["buckets"]):
+                cumulative += count
+                lineL.append('editor_request_latency_seconds_bucket{route="%s",le="%s"} %d' % (route, upperBound, cumulative))
+            lineL.append('editor_request_latency_seconds_bucket{route="%s",le="+Inf"} %d' % (route, rD["count"]))
+            lineL.append('editor_request_latency_seconds_sum{route="%s"} %.6f' % (route, rD["latency_secs_sum"]))
+            lineL.append('editor_request_latency_seconds_count{route="%s"} %d' % (route, rD["count"]))
+        lineL.append("# HELP editor_request_errors_total Requests returning an error response by service path.")
+        lineL.append("# TYPE editor_request_errors_total counter")
+        for route, rD in routeItems:
+            lineL.append('editor_request_errors_total{route="%s"} %d' % (route, rD["errors"]))
+        lineL.append("# HELP editor_response_payload_bytes Response payload size by service path.")
+        lineL.append("# TYPE editor_response_payload_bytes summary")
+        for route, rD in routeItems:
+            lineL.append('editor_response_payload_bytes_sum{route="%s"} %d' % (route, rD["payload_bytes_sum"]))
+            lineL.append('editor_response_payload_bytes_count{route="%s"} %d' % (route, rD["payload_count"]))
+        lineL.append("# HELP editor_response_payload_bytes_max Largest response payload by service path.")
+        lineL.append("# TYPE editor_response_payload_bytes_max gauge")
+        for route, rD in routeItems:
+            lineL.append('editor_response_payload_bytes_max{route="%s"} %d' % (route, rD["payload_bytes_max"]))
+        lineL.append("# HELP editor_store_ops_total Persisted store accesses by service path, store and kind (opens, fetches, updates).")
+        lineL.append("# TYPE editor_store_ops_total counter")
+        for route, rD in routeItems:
+            for storeName, sD in sorted(rD.get("stores", {}).items()):
+                for kind in ["opens", "fetches", "updates"]:
+                    lineL.append('editor_store_ops_total{route="%s",store="%s",kind="%s"} %d' % (route, storeName, kind, sD[kind]))
+        lineL.append("# HELP editor_store_seconds_total Time spent in persisted store access by service path and store.")
+        lineL.append("# TYPE editor_store_seconds_total counter")
+        for route, rD in routeItems:
+            for storeName, sD in sorted(rD.get("stores", {}).items()):
+                lineL.append('editor_store_seconds_total{route="%s",store="%s"} %.6f' % (route, storeName, sD["secs"]))
+        lineL.append("# HELP editor_store_bytes_total Estimated bytes unpickled from persisted stores (traced requests only).")
+        lineL.append("# TYPE editor_store_bytes_total counter")
+        for route, rD in routeItems:
+            for storeName, sD in sorted(rD.get("stores", {}).items()):
+                lineL.append('editor_store_bytes_total{route="%s",store="%s"} %d' % (route, storeName, sD["bytes"]))
+        lineL.append("# HELP editor_store_opens_max Most store opens by a single request, by service path and store.")
+        lineL.append("# TYPE editor_store_opens_max gauge")
+        for route, rD in routeItems:
+            for storeName, sD in sorted(rD.get("stores", {}).items()):
+                lineL.append('editor_store_opens_max{route="%s",store="%s"} %d' % (route, storeName, sD["opens_max"]))
+        if extraLines:
+            lineL.extend(extraLines)
+        return "\n".join(lineL) + "\n"
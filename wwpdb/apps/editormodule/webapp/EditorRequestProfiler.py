@@ -0,0 +1,114 @@
+##
+# File:    EditorRequestProfiler.py
+# Date:    19-Oct-2026
+#
+# Updates:
+#    2026-10-19    RPS    Slow-request threshold parsed once per setting value (malformed values disable slow mode);
+#                         profile file names carry a per-process sequence number.
+##
+"""
+On-demand cProfile capture of editor request handling.
+
+A request is profiled when asked for (request parameter profile=y, or site setting
+EDITOR_PROFILE_REQUESTS), and the statistics are written into the session directory as
+profile_<op>_<timestamp>_<pid>_<seq>.prof for inspection with pstats/snakeviz.
+
+In slow-request mode (site setting EDITOR_PROFILE_SLOW_SECONDS) every request is profiled but
+the statistics are only kept for requests taking longer than the threshold.  This adds the
+cProfile overhead to all requests, so is intended for diagnosing reported slowness rather than
+for permanent use.
+
+"""
+__docformat__ = "restructuredtext en"
+__author__ = "Raul Sala"
+__email__ = "rsala@rcsb.rutgers.edu"
+__license__ = "Creative Commons Attribution 3.0 Unported"
+__version__ = "V0.01"
+
+import os
+import re
+import time
+import cProfile
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+class EditorRequestProfiler(object):
+    """Run a callable under cProfile and save the statistics when required"""
+
+    __lock = threading.Lock()
+    __seq = 0
+    __slowSecsD = {}
+
+    def __init__(self, slowSecs=None):
+        """
+        :param `slowSecs`:  if given, statistics are only kept when the call takes longer than slowSecs
+
+        """
+        self.__slowSecs = slowSecs
+        self.__profile = None
+        self.__elapsedSecs = None
+
+    @classmethod
+    def parseSlowSecs(cls, value):
+        """Return the slow-request threshold in seconds for setting value, or None if not set or malformed.
+        Each distinct value is parsed (and a malformed one reported) once per process.
+        """
+        if not value:
+            return None
+        with cls.__lock:
+            if value not in cls.__slowSecsD:
+                try:
+                    cls.__slowSecsD[value] = float(value)
+                except (TypeError, ValueError):
+                    logger.warning("Invalid EDITOR_PROFILE_SLOW_SECONDS %r, slow-request profiling disabled", value)
+                    cls.__slowSecsD[value] = None
+            return cls.__slowSecsD[value]
+
+    @classmethod
+    def __nextSeq(cls):
+        with cls.__lock:
+            cls.__seq += 1
+            return cls.__seq
+
+    def run(self, func, *args, **kwargs):
+        """Call func(*args, **kwargs) under the profiler and return its result"""
+        self.__profile = cProfile.Profile()
+        tStart = time.time()
+        try:
+            self.__profile.enable()
+        except ValueError:
+            # another profiler is already active in this thread
+            logger.warning("profiler not available, request not profiled")
+            self.__profile = None
+            return func(*args, **kwargs)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            self.__profile.disable()
+            self.__elapsedSecs = time.time() - tStart
+
+    def getElapsedSecs(self):
+        return self.__elapsedSecs
+
+    def isKept(self):
+        """Return True if statistics of the last run are to be saved"""
+        if self.__profile is None or self.__elapsedSecs is None:
+            return False
+        return self.__slowSecs is None or self.__elapsedSecs > self.__slowSecs
+
+    def save(self, dirPath, opName):
+        """Write statistics into dirPath as profile_<opName>_<timestamp>_<pid>_<seq>.prof.  Returns the file path or None."""
+        if not self.isKept():
+            return None
+        opName = re.sub(r"[^A-Za-z0-9]+", "_", opName).strip("_")
+        filePath = os.path.join(dirPath, "profile_%s_%s_%d_%d.prof" % (opName, time.strftime("%Y%m%d%H%M%S", time.localtime()), os.getpid(), self.__nextSeq()))
+        try:
+            self.__profile.dump_stats(filePath)
+            logger.info("request %s took %.3f s, profile written to %s", opName, self.__elapsedSecs, filePath)
+            return filePath
+        except:  # noqa: E722 pylint: disable=bare-except
+            logger.exception("Failed writing profile to %s", filePath)
+        return None
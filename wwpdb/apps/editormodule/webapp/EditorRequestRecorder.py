@@ -0,0 +1,96 @@
+##
+# File:    EditorRequestRecorder.py
+# Date:    19-Oct-2026
+#
+# Updates:
+##
+"""
+Recording of editor requests to a per-session request log, for offline replay (see bench.EditorRequestReplay).
+
+When enabled (request parameter record_requests=y, or site setting EDITOR_RECORD_REQUESTS) each
+request on a session is appended to <session>/editor_request_log.jsonl as one JSON object:
+
+    {"t": <request start, epoch secs>, "route": <service path>, "ms": <handling time>,
+     "error": <error flag>, "sessionid": <session id>, "params": <request parameters>}
+
+Parameters are recorded as received from the web framework (dictionary of lists), before the
+server-side values (TopSessionPath, TemplatePath, WWPDB_SITE_ID) are added.  File uploads are not
+recorded - an uploaded file is replaced by {"__upload__": <file name>}, so that the file can be
+supplied again on replay.
+
+"""
+__docformat__ = "restructuredtext en"
+__author__ = "Raul Sala"
+__email__ = "rsala@rcsb.rutgers.edu"
+__license__ = "Creative Commons Attribution 3.0 Unported"
+__version__ = "V0.01"
+
+import os
+import sys
+import json
+import ntpath
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class EditorRequestRecorder(object):
+    """Snapshot of the parameters of one request, appended to the session request log when handled"""
+
+    LOG_FILE_NAME = "editor_request_log.jsonl"
+    UPLOAD_KEY = "__upload__"
+
+    def __init__(self, parameterDict):
+        """
+        :param `parameterDict`: request parameters as a dictionary of lists - copied here, as
+                                the request object adds to and modifies the same dictionary
+
+        """
+        self.__paramD = {}
+        for name, vL in parameterDict.items():
+            self.__paramD[name] = [self.__getRecordValue(v) for v in (vL if isinstance(vL, list) else [vL])]
+
+    def __getRecordValue(self, value):
+        if hasattr(value, "filename") and hasattr(value, "file"):
+            # file upload (cgi.FieldStorage or equivalent)
+            return {self.UPLOAD_KEY: ntpath.basename(str(value.filename))}
+        if isinstance(value, bytes) and sys.version_info[0] >= 3:
+            return value.decode("utf-8", "replace")
+        return value
+
+    def getParameters(self):
+        return self.__paramD
+
+    def record(self, sessionPath, route, tStart, latencySecs, isError=False, sessionId=None):
+        """Append request to the log in directory sessionPath.  Returns True on success."""
+        if sessionPath is None or not os.path.isdir(sessionPath):
+            return False
+        recD = {"t": round(tStart, 6), "route": route, "ms": round(latencySecs * 1000.0, 3), "error": bool(isError), "sessionid": sessionId, "params": self.__paramD}
+        try:
+            line = json.dumps(recD, sort_keys=True, default=str) + "\n"
+            # single write of a complete line, so lines of concurrent requests on a session are not interleaved
+            with open(os.path.join(sessionPath, self.LOG_FILE_NAME), "a") as ofh:
+                ofh.write(line)
+            return True
+        except:  # noqa: E722 pylint: disable=bare-except
+            logger.exception("Failed recording request %s in %s", route, sessionPath)
+        return False
+
+    @classmethod
+    def isUpload(cls, value):
+        """Return True if value is the placeholder recorded for a file upload"""
+        return isinstance(value, dict) and cls.UPLOAD_KEY in value
+
+    @classmethod
+    def readLog(cls, filePath):
+        """Return list of records in request log filePath (a session directory or log file), skipping incomplete lines"""
+        if os.path.isdir(filePath):
+            filePath = os.path.join(filePath, cls.LOG_FILE_NAME)
+        recL = []
+        with open(filePath, "r") as ifh:
+            for line in ifh:
+                try:
+                    recL.append(json.loads(line))
+                except ValueError:
+                    logger.warning("skipping incomplete request log line in %s", filePath)
+        return recL
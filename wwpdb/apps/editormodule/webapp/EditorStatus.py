@@ -0,0 +1,194 @@
+##
+# File:    EditorStatus.py
+# Date:    19-Oct-2026
+#
+# Updates:
+##
+"""
+Health and cache status of an editor worker process, for /service/editor/status.
+
+Reported sections:
+
+    dictionary   PDBx dictionary and view config files (size, mtime) and the versions of the session
+                 enum registries cached in this process
+    caches       entries and hit rates of the template, data store, enum registry and enum prefix
+                 index caches, and the number of session handles held
+    sessions     per-session data store, dictionary store and rollback snapshot disk usage, with totals
+    jobs         request pool of the ASGI front end (requests running and waiting for a worker, age of
+                 the oldest waiting request) and session lock contention
+
+Figures other than disk usage are process counters, read without scanning the file system.  Disk usage is collected
+at most once per EDITOR_STATUS_TTL_SECONDS (site setting, default 10) per site and scope, so that
+the status can be polled frequently.  By default the sessions served by this process are
+reported; with scope=host all sessions of the session area, most recently updated first and up
+to EDITOR_STATUS_MAX_SESSIONS (default 100) listed individually.
+
+"""
+__docformat__ = "restructuredtext en"
+__author__ = "Raul Sala"
+__email__ = "rsala@rcsb.rutgers.edu"
+__license__ = "Creative Commons Attribution 3.0 Unported"
+__version__ = "V0.01"
+
+import os
+import sys
+import time
+import platform
+import threading
+import logging
+
+from wwpdb.apps.editormodule.depict.EditorTemplateCache import EditorTemplateCache
+from wwpdb.apps.editormodule.io.EditorFileFingerprint import EditorFileFingerprint
+from wwpdb.apps.editormodule.io.EditorSessionLock import EditorSessionLock
+from wwpdb.apps.editormodule.io.EditorStoreCache import EditorStoreCache
+from wwpdb.apps.editormodule.io.PdbxEnumPrefixIndex import PdbxEnumPrefixIndex
+from wwpdb.apps.editormodule.io.PdbxEnumRegistry import PdbxEnumRegistry
+
+logger = logging.getLogger(__name__)
+
+
+def getHitRate(statsD):
+    """Return statsD with the fraction of hits among hits and misses added as 'hit_rate' (None before any lookup)"""
+    lookups = statsD.get("hits", 0) + statsD.get("misses", 0)
+    rD = dict(statsD)
+    rD["hit_rate"] = round(float(statsD.get("hits", 0)) / lookups, 4) if lookups else None
+    return rD
+
+
+class EditorStatus(object):
+    """Collect status of dictionary caches, session stores, cache hit rates and background jobs"""
+
+    SCOPES = ["process", "host"]
+    # file name prefixes of the stores in a session directory (single file or .dat/.dir/.bak per dbm implementation)
+    DATA_STORE_PREFIX = "dataFile.db"
+    DICT_STORE_PREFIXES = ("mmcifDict.db", "enumRegistry.json")
+    SNAPSHOT_PREFIX = "dataFileSnapShot_"
+
+    # disk usage figures per (site, scope), with the time they were collected
+    __diskD = {}
+    __diskLock = threading.Lock()
+
+    def __init__(self, appCtx, verbose=False, log=sys.stderr):
+        self.__verbose = verbose
+        self.__lfh = log
+        self.__appCtx = appCtx
+        self.__ttlSecs = float(appCtx.getSetting("EDITOR_STATUS_TTL_SECONDS", 10))
+        self.__maxSessions = int(appCtx.getSetting("EDITOR_STATUS_MAX_SESSIONS", 100))
+
+    def get(self, scope="process"):
+        """Return dictionary of status sections for scope 'process' (sessions served by this process) or 'host'"""
+        scope = scope if scope in self.SCOPES else "process"
+        diskD = self.__getDiskUsage(scope)
+        storeCacheD = getHitRate(EditorStoreCache.getStats())
+        storeCacheD.update(diskD["store_cache"])
+        enumRegistryD = PdbxEnumRegistry.getStats()
+        return {
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime()),
+            "site_id": self.__appCtx.getSiteId(),
+            "pid": os.getpid(),
+            "python": platform.python_version(),
+            "dictionary": {
+                "files": dict((name, self.__getFileStatus(fPath)) for name, fPath in self.__getDictionaryFiles()),
+                "enum_registry_versions": enumRegistryD.pop("versions"),
+            },
+            "caches": {
+                "templates": getHitRate(EditorTemplateCache.getStats()),
+                "data_stores": storeCacheD,
+                "enum_registries": getHitRate(enumRegistryD),
+                "enum_prefix_indexes": getHitRate(PdbxEnumPrefixIndex.getStats()),
+                "session_handles": self.__appCtx.getStats()["session_handles"],
+            },
+            "sessions": diskD["sessions"],
+            "jobs": {"asgi": self.__getAsgiStats(), "session_locks": EditorSessionLock.getStats()},
+            "disk_usage_age_secs": round(time.time() - diskD["time"], 3),
+        }
+
+    def __getDictionaryFiles(self):
+        return [
+            ("pdbx_dict", self.__appCtx.getPdbxDictFilePath()),
+            ("display_view", self.__appCtx.getDisplayViewFilePath()),
+            ("master_view", self.__appCtx.getMasterViewFilePath()),
+        ]
+
+    def __getFileStatus(self, filePath):
+        stamp = EditorFileFingerprint.stamp(filePath)
+        if stamp is None:
+            return {"path": filePath, "available": False}
+        return {"path": stamp[0], "available": True, "size": stamp[1], "mtime": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(stamp[2]))}
+
+    def __getAsgiStats(self):
+        """Pool status of the ASGI front end, if serving from this process (the module is not imported otherwise)"""
+        asgiModule = sys.modules.get("wwpdb.apps.editormodule.webapp.EditorAsgiApp")
+        return asgiModule.EditorAsgiApp.getInstanceStats() if asgiModule is not None else []
+
+    def __getDiskUsage(self, scope):
+        key = (self.__appCtx.getSiteId(), scope)
+        with EditorStatus.__diskLock:
+            cached = EditorStatus.__diskD.get(key)
+            if cached is not None and time.time() - cached["time"] < self.__ttlSecs:
+                return cached
+            topSessionPath = self.__appCtx.getTopSessionPath()
+            diskD = {
+                "time": time.time(),
+                "sessions": self.__getSessionsUsage(topSessionPath, scope),
+                "store_cache": EditorStoreCache(os.path.join(topSessionPath, "editor_store_cache")).getUsage(),
+            }
+            EditorStatus.__diskD[key] = diskD
+            return diskD
+
+    def __getSessionsUsage(self, topSessionPath, scope):
+        if scope == "host":
+            sessionsPath = os.path.join(topSessionPath, "sessions")
+            sessionL = [(sessionId, os.path.join(sessionsPath, sessionId)) for sessionId in (os.listdir(sessionsPath) if os.path.isdir(sessionsPath) else [])]
+        else:
+            sessionL = self.__appCtx.getSessionPaths()
+        #
+        usageL = []
+        for sessionId, sessionPath in sessionL:
+            usageD = self.getSessionUsage(sessionPath)
+            if usageD is not None:
+                usageD["session_id"] = sessionId
+                usageL.append(usageD)
+        # most recently updated first
+        usageL.sort(key=lambda uD: uD["updated_secs_ago"] if uD["updated_secs_ago"] is not None else float("inf"))
+        totalD = {"scope": scope, "count": len(usageL)}
+        for name in ["data_store_bytes", "dict_store_bytes", "snapshots", "snapshot_bytes"]:
+            totalD[name] = sum(uD[name] for uD in usageL)
+        totalD["listed"] = usageL[: self.__maxSessions]
+        return totalD
+
+    @classmethod
+    def getSessionUsage(cls, sessionPath):
+        """Return dictionary of store and snapshot disk usage of the session at sessionPath, or None if it is not a session directory"""
+        try:
+            fileL = os.listdir(sessionPath)
+        except OSError:
+            return None
+        now = time.time()
+        usageD = {"data_store_bytes": 0, "dict_store_bytes": 0, "snapshots": 0, "snapshot_bytes": 0, "updated_secs_ago": None}
+        lastUpdate = None
+        for fn in fileL:
+            try:
+                if fn.startswith(cls.DATA_STORE_PREFIX):
+                    st = os.stat(os.path.join(sessionPath, fn))
+                    usageD["data_store_bytes"] += st.st_size
+                    lastUpdate = max(lastUpdate, st.st_mtime) if lastUpdate is not None else st.st_mtime
+                elif fn.startswith(cls.DICT_STORE_PREFIXES):
+                    usageD["dict_store_bytes"] += os.stat(os.path.join(sessionPath, fn)).st_size
+            except OSError:
+                # removed meanwhile
+                pass
+        if lastUpdate is not None:
+            usageD["updated_secs_ago"] = round(now - lastUpdate, 1)
+        #
+        snapShotsPath = os.path.join(sessionPath, "snapshots")
+        snapShotIdxS = set()
+        for fn in os.listdir(snapShotsPath) if os.path.isdir(snapShotsPath) else []:
+            if fn.startswith(cls.SNAPSHOT_PREFIX):
+                try:
+                    usageD["snapshot_bytes"] += os.stat(os.path.join(snapShotsPath, fn)).st_size
+                    snapShotIdxS.add(fn.split(".")[0])
+                except OSError:
+                    pass
+        usageD["snapshots"] = len(snapShotIdxS)
+        return usageD
@@ -51,6 +51,31 @@
 # 2017-02-19    EP     _launchOp() store the default view - so can do without a recalc or guess.
 # 2018-06-28    Ep     Add _getDataMultiTblConfigDtls() to provide configs on the whole page at once. Reduces contention from web server and retry of
 #                        locks on persistant storage.
+# 2026-10-19    RPS    Added _getEnumRegistryOp() for vending session enum registry (enumerations referenced by id from DataTable configs).
+# 2026-10-19    RPS    Added _getEnumMatchesOp() providing server-side prefix search for autocomplete enumerations.
+# 2026-10-19    RPS    Added _exportCategoryNdjsonOp() for streaming entire cif category as newline-delimited JSON.
+# 2026-10-19    RPS    _launchOp() now runs EditorLaunchPipeline (dictionary parse overlapped with model parse) and records per-stage timings.
+# 2026-10-19    RPS    Deferred imports needed only by particular operations, to reduce import cost of this entry point.
+# 2026-10-19    RPS    Site config and resolved paths taken from process-wide EditorAppContext.
+# 2026-10-19    RPS    Operations on an existing session run under EditorSessionLock (concurrent reads, serialized writes).
+# 2026-10-19    RPS    submit_edit, act_on_row and propagate_title reject requests carrying a stale 'ctgry_version';
+#                        current category version returned with mutation and get_dtbl_data responses.
+# 2026-10-19    RPS    Per-route latency/error/payload metrics recorded in EditorRequestMetrics; added /service/editor/metrics.
+# 2026-10-19    RPS    Store access traced per request (EditorStoreTrace), aggregated in metrics and returned as 'store_trace'
+#                        in JSON responses when requested with store_trace=y (or detail, to include bytes unpickled).
+# 2026-10-19    RPS    Request handling profiled on demand (profile=y, or site settings EDITOR_PROFILE_REQUESTS /
+#                        EDITOR_PROFILE_SLOW_SECONDS), with statistics written to the session directory.
+# 2026-10-19    RPS    Memory profile figures (EditorMemoryProfile) and process peak RSS included in /service/editor/metrics.
+# 2026-10-19    RPS    Requests optionally recorded to a per-session request log for offline replay (record_requests=y, or
+#                        site setting EDITOR_RECORD_REQUESTS).
+# 2026-10-19    RPS    Logging settings of the site (per-subsystem levels, queued handlers) applied on first request via EditorLogging;
+#                        timestamps in log messages formatted only when logged.
+# 2026-10-19    RPS    Added /service/editor/status (dictionary and cache status, session store and snapshot disk usage, background jobs).
+# 2026-10-19    RPS    Session lock of streamed (ndjson) responses held until the stream has been consumed or closed.
+# 2026-10-19    RPS    submit_edit with 'ctgry_version' answers in JSON with the value and the new category version.
+# 2026-10-19    RPS    Malformed EDITOR_PROFILE_SLOW_SECONDS setting disables slow-request profiling rather than failing requests.
+# 2026-10-19    RPS    get_enum_matches 'limit' bounded to 1..ENUM_MATCH_LIMIT_MAX.
+# 2026-10-19    RPS    Metrics snapshots not written when the site has no top session path.
 ##
 """
 General annotation editor tool web request and response processing modules.
@@ -70,30 +95,34 @@ __email__ = "jwest@rcsb.rutgers.edu"
 __license__ = "Creative Commons Attribution 3.0 Unported"
 __version__ = "V0.07"
 
-import base64
 import logging
-import mimetypes
 import ntpath
 import os
-import smtplib
 import sys
 import time
 import types
 
 #
-from wwpdb.io.graphics.GraphicsContext3D import GraphicsContext3D
-
-#
-from wwpdb.io.locator.DataReference import DataFileReference
-from wwpdb.utils.config.ConfigInfoApp import ConfigInfoAppCommon
-
 #
 # from wwpdb.utils.wf.dbapi.WfTracking import WfTracking
 
-from wwpdb.apps.editormodule.depict.EditorDepict import EditorDepict
+#
+# Imports needed only by particular operations (EditorDepict, GraphicsContext3D, DataFileReference, smtplib,
+# base64, mimetypes) are made within those operations to keep start-up cost low for short-lived workers.
 from wwpdb.apps.editormodule.io.PdbxDataIo import PdbxDataIo
+from wwpdb.apps.editormodule.io.PdbxEnumPrefixIndex import PdbxEnumPrefixIndex
+from wwpdb.apps.editormodule.io.EditorSessionMeta import EditorSessionMeta
+from wwpdb.apps.editormodule.io.EditorSessionLock import EditorSessionLock
+from wwpdb.apps.editormodule.io.EditorStoreTrace import EditorStoreTrace
+from wwpdb.apps.editormodule.io.EditorMemoryProfile import EditorMemoryProfile
+from wwpdb.apps.editormodule.webapp.EditorLaunchPipeline import EditorLaunchPipeline
+from wwpdb.apps.editormodule.webapp.EditorRequestMetrics import EditorRequestMetrics
+from wwpdb.apps.editormodule.webapp.EditorRequestProfiler import EditorRequestProfiler
+from wwpdb.apps.editormodule.webapp.EditorRequestRecorder import EditorRequestRecorder
 from wwpdb.apps.editormodule.webapp.WebRequest import EditorInputRequest, ResponseContent
-from wwpdb.apps.editormodule.config.AccessTemplateFiles import get_template_file_path
+from wwpdb.apps.editormodule.config.EditorAppContext import EditorAppContext
+from wwpdb.apps.editormodule.config import EditorLogging
+from wwpdb.apps.editormodule.config.EditorLogging import LOG_NOW
 
 # from json import loads, dumps
 # from time import localtime, strftime
@@ -120,9 +149,11 @@ class EditorWebApp(object):
         self.__lfh = log
         self.__debug = False
         self.__siteId = siteId
-        self.__cICommon = ConfigInfoAppCommon(self.__siteId)
-        self.__topSessionPath = self.__cICommon.get_site_web_apps_top_sessions_path()
-        self.__templatePath = get_template_file_path()
+        self.__appCtx = EditorAppContext.get(self.__siteId)
+        EditorLogging.configure(self.__appCtx)
+        self.__cICommon = self.__appCtx.getConfigInfoAppCommon()
+        self.__topSessionPath = self.__appCtx.getTopSessionPath()
+        self.__templatePath = self.__appCtx.getTemplatePath()
         #
 
         if isinstance(parameterDict, dict):
@@ -135,6 +166,11 @@ class EditorWebApp(object):
             logger.info("dumping input parameter dictionary")
             logger.info("%s", "".join(self.__dumpRequest()))
 
+        # parameters are copied for the request log before the request object adds server-side values
+        self.__recorder = None
+        if self.__myParameterDict.get("record_requests", [""])[0] == "y" or self.__appCtx.getSetting("EDITOR_RECORD_REQUESTS", "n").lower() in ["y", "yes", "true"]:
+            self.__recorder = EditorRequestRecorder(self.__myParameterDict)
+
         self.__reqObj = EditorInputRequest(self.__myParameterDict, verbose=self.__verbose, log=self.__lfh)
         #
         self.__reqObj.setValue("TopSessionPath", self.__topSessionPath)
@@ -159,8 +195,16 @@ class EditorWebApp(object):
              Minimally, the content of this dictionary will include the
              keys: CONTENT_TYPE and REQUEST_STRING.
         """
+        tStart = time.time()
+        storeTraceOpt = self.__reqObj.getValue("store_trace")
+        EditorStoreTrace.begin(detail=(storeTraceOpt == "detail"))
         stw = EditorWebAppWorker(reqObj=self.__reqObj, verbose=self.__verbose, log=self.__lfh)
-        rC = stw.doOp()
+        try:
+            rC = stw.doOp()
+        finally:
+            storeTraceD = EditorStoreTrace.end()
+        if storeTraceOpt in ["y", "detail"]:
+            rC.addDictionaryItems({"store_trace": storeTraceD})
         if self.__debug:
             rqp = self.__reqObj.getRequestPath()
             logger.debug("+EditorWebApp.doOp() operation %s", rqp)
@@ -173,7 +217,30 @@ class EditorWebApp(object):
         #
         # Package return according to the request return_format -
         #
-        return rC.get()
+        rD = rC.get()
+        latencySecs = time.time() - tStart
+        self.__recordMetrics(stw.getOpRoute(), latencySecs, rC, rD, storeTraceD)
+        if self.__recorder is not None and len(self.__reqObj.getSessionId()) > 0:
+            # session handle not taken from the application context, so as not to recreate a removed session directory
+            self.__recorder.record(self.__reqObj.getSessionObj().getPath(), stw.getOpRoute(), tStart, latencySecs, isError=rC.isError(), sessionId=self.__reqObj.getSessionId())
+        return rD
+
+    def __recordMetrics(self, route, latencySecs, rC, rD, storeTraceD):
+        """Record request in per-route metrics - streamed content is measured as it is delivered"""
+        try:
+            EditorRequestMetrics.recordStoreTrace(route, storeTraceD)
+            if rD.get("RETURN_ITERABLE") is not None:
+                rD["RETURN_ITERABLE"] = EditorRequestMetrics.countingIterator(route, rD["RETURN_ITERABLE"])
+                EditorRequestMetrics.record(route, latencySecs, isError=rC.isError())
+            else:
+                rtrnString = rD.get("RETURN_STRING", "")
+                payloadBytes = len(rtrnString.encode("utf-8")) if not isinstance(rtrnString, bytes) else len(rtrnString)
+                EditorRequestMetrics.record(route, latencySecs, isError=rC.isError(), payloadBytes=payloadBytes)
+            if self.__topSessionPath:
+                # no snapshots where the site has no sessions directory
+                EditorRequestMetrics.maybeDump(os.path.join(self.__topSessionPath, "editor_metrics"))
+        except:  # noqa: E722 pylint: disable=bare-except
+            logger.exception("Failed recording request metrics")
 
     def __dumpRequest(self):
         """Utility method to format the contents of the internal parameter dictionary
@@ -194,6 +261,27 @@ class EditorWebApp(object):
 
 
 class EditorWebAppWorker(object):
+    # largest number of values returned by one enumeration prefix search (get_enum_matches)
+    ENUM_MATCH_LIMIT_MAX = 100
+    # operations that only read the session stores and so may run concurrently within a session -
+    # all other operations on an existing session are serialized.  Note that category table configuration,
+    # row fetches and the mandatory item/dictionary checks may add skeleton categories or missing items
+    # to the data store on first access, so are not included here.
+    READ_ONLY_OPS = frozenset(
+        [
+            "_dumpOp",
+            "_validateEditOp",
+            "_exportCategoryNdjsonOp",
+            "_getJmolSetup",
+            "_getCategories3Dcontext",
+            "_checkSkipCalc",
+            "_getEnumRegistryOp",
+            "_getEnumMatchesOp",
+            "_getMetricsOp",
+            "_getStatusOp",
+        ]
+    )
+
     def __init__(self, reqObj=None, verbose=False, log=sys.stderr):
         """
         Worker methods for the general annotation editor application
@@ -227,6 +315,7 @@ class EditorWebAppWorker(object):
             "/service/editor/act_on_row": "_rowActionOp",
             "/service/editor/devproto": "_devproto",
             "/service/editor/test_see_json": "_getCifCategoryJsonOp",
+            "/service/editor/export_ctgry_ndjson": "_exportCategoryNdjsonOp",
             "/service/editor/exit_not_finished": "_exit_notFinished",
             "/service/editor/exit_finished": "_exit_finished",
             "/service/editor/exit_abort": "_exit_abort",
@@ -239,6 +328,10 @@ class EditorWebAppWorker(object):
             "/service/editor/skip_calc_undo": "_undoSkipCalcOp",
             "/service/editor/check_skip_calc": "_checkSkipCalc",
             "/service/editor/init_rollback_point": "_createInitRollbackPoint",
+            "/service/editor/get_enum_registry": "_getEnumRegistryOp",
+            "/service/editor/get_enum_matches": "_getEnumMatchesOp",
+            "/service/editor/metrics": "_getMetricsOp",
+            "/service/editor/status": "_getStatusOp",
             # ##############  below are URLs to be used for WFM environ######################
             "/service/editor/new_session/wf": "_launchOp",
             "/service/editor/wf/new_session": "_launchOp",
@@ -258,7 +351,24 @@ class EditorWebAppWorker(object):
 
         Operation output is packaged in a ResponseContent() object.
         """
-        return self.__doOpException()
+        appCtx = EditorAppContext.get(self.__reqObj.getValue("WWPDB_SITE_ID"))
+        bProfile = self.__reqObj.getValue("profile") == "y" or appCtx.getSetting("EDITOR_PROFILE_REQUESTS", "n").lower() in ["y", "yes", "true"]
+        slowSecs = EditorRequestProfiler.parseSlowSecs(appCtx.getSetting("EDITOR_PROFILE_SLOW_SECONDS"))
+        if not bProfile and slowSecs is None:
+            return self.__doOpException()
+        #
+        profiler = EditorRequestProfiler(slowSecs=None if bProfile else slowSecs)
+        rC = profiler.run(self.__doOpException)
+        if profiler.isKept() and len(self.__reqObj.getSessionId()) > 0:
+            profilePath = profiler.save(self.__reqObj.newSessionObj().getPath(), self.__appPathD.get(self.__reqObj.getRequestPath(), "unknown"))
+            if profilePath is not None and bProfile:
+                rC.addDictionaryItems({"profile_file": os.path.basename(profilePath)})
+        return rC
+
+    def getOpRoute(self):
+        """Return request path if it maps to an operation, otherwise 'unknown' (bounds the routes recorded in metrics)"""
+        reqPath = self.__reqObj.getRequestPath()
+        return reqPath if reqPath in self.__appPathD else "unknown"
 
     def __doOpNoException(self):  # pylint: disable=unused-private-member
         """Map operation to path and invoke operation.  No exception handling is performed.
@@ -275,8 +385,7 @@ class EditorWebAppWorker(object):
             rC.setError(errMsg="Unknown operation")
             return rC
         else:
-            mth = getattr(self, self.__appPathD[reqPath], None)
-            rC = mth()
+            rC = self.__invokeOp(self.__appPathD[reqPath])
         return rC
 
     def __doOpException(self):
@@ -294,8 +403,7 @@ class EditorWebAppWorker(object):
                 rC = ResponseContent(reqObj=self.__reqObj, verbose=self.__verbose, log=self.__lfh)
                 rC.setError(errMsg="Unknown operation")
             else:
-                mth = getattr(self, self.__appPathD[reqPath], None)
-                rC = mth()
+                rC = self.__invokeOp(self.__appPathD[reqPath])
             return rC
         except:  # noqa: E722 pylint: disable=bare-except
             logger.exception("__doOpException failure")
@@ -303,6 +411,30 @@ class EditorWebAppWorker(object):
             rC.setError(errMsg="Operation failure")
             return rC
 
+    def __invokeOp(self, opName):
+        """Invoke operation method opName holding the session lock for an existing session -
+        shared for read-only operations and exclusive otherwise.  For streamed content the lock
+        is held until the stream has been consumed or closed.
+        """
+        mth = getattr(self, opName, None)
+        sessionPath = None
+        if len(self.__reqObj.getSessionId()) > 0:
+            sessionPath = self.__reqObj.newSessionObj().getPath()
+        sLock = EditorSessionLock(sessionPath, verbose=self.__verbose, log=self.__lfh)
+        sLock.acquire(write=opName not in self.READ_ONLY_OPS, opName=opName)
+        bStreamed = False
+        try:
+            rC = mth()
+            lineIter = rC.getStreamContent() if rC is not None else None
+            if lineIter is not None:
+                # records are read from the session stores as the stream is consumed, after this returns
+                rC.setStreamContent(sLock.iterHolding(lineIter), contentType=rC.getStreamContentType())
+                bStreamed = True
+            return rC
+        finally:
+            if not bStreamed:
+                sLock.release()
+
     ################################################################################################################
     # ------------------------------------------------------------------------------------------------------------
     #      Top-level REST methods
@@ -313,7 +445,59 @@ class EditorWebAppWorker(object):
         rC.setHtmlList(self.__reqObj.dump(format="html"))
         return rC
 
+    def _getMetricsOp(self):
+        """Per-route request metrics in Prometheus text format (format=json for JSON).
+        scope=host reports on all worker processes of this host, from their most recent snapshots.
+        """
+        metricsPath = os.path.join(self.__reqObj.getValue("TopSessionPath"), "editor_metrics")
+        if self.__reqObj.getValue("scope") == "host":
+            if os.path.isdir(metricsPath):
+                # current figures for this process rather than its last periodic snapshot
+                EditorRequestMetrics.dump(EditorRequestMetrics.getDumpFilePath(metricsPath))
+            snapshot = EditorRequestMetrics.mergeSnapshots(EditorRequestMetrics.loadSnapshots(metricsPath))
+        else:
+            snapshot = EditorRequestMetrics.getSnapshot()
+        #
+        if self.__reqObj.getValue("format") == "json":
+            self.__reqObj.setReturnFormat("json")
+            rC = ResponseContent(reqObj=self.__reqObj, verbose=self.__verbose, log=self.__lfh)
+            rC.addDictionaryItems({"metrics": snapshot})
+            return rC
+        #
+        extraLines = []
+        lockStatsD = EditorSessionLock.getStats()
+        if lockStatsD:
+            extraLines.append("# HELP editor_session_lock_wait_seconds_total Time spent waiting for session locks by this process.")
+            extraLines.append("# TYPE editor_session_lock_wait_seconds_total counter")
+            for mode, sD in sorted(lockStatsD.items()):
+                extraLines.append('editor_session_lock_wait_seconds_total{mode="%s"} %.6f' % (mode, sD["wait_secs_total"]))
+            extraLines.append("# HELP editor_session_lock_contended_total Session lock acquisitions that had to wait, by this process.")
+            extraLines.append("# TYPE editor_session_lock_contended_total counter")
+            for mode, sD in sorted(lockStatsD.items()):
+                extraLines.append('editor_session_lock_contended_total{mode="%s"} %d' % (mode, sD["contended"]))
+        extraLines.extend(EditorMemoryProfile.toPrometheus())
+        self.__reqObj.setReturnFormat("text")
+        rC = ResponseContent(reqObj=self.__reqObj, verbose=self.__verbose, log=self.__lfh)
+        rC.setTextContent(EditorRequestMetrics.toPrometheus(snapshot, extraLines))
+        return rC
+
+    def _getStatusOp(self):
+        """Status of dictionary caches, cache hit rates, session store and snapshot disk usage and background jobs, as JSON.
+        scope=host reports on all sessions of the session area rather than those served by this process.
+        """
+        from wwpdb.apps.editormodule.webapp.EditorStatus import EditorStatus  # pylint: disable=import-outside-toplevel
+
+        appCtx = EditorAppContext.get(self.__reqObj.getValue("WWPDB_SITE_ID"))
+        statusD = EditorStatus(appCtx, verbose=self.__verbose, log=self.__lfh).get(scope=self.__reqObj.getValue("scope") or "process")
+        self.__reqObj.setReturnFormat("json")
+        rC = ResponseContent(reqObj=self.__reqObj, verbose=self.__verbose, log=self.__lfh)
+        rC.addDictionaryItems({"status": statusD})
+        return rC
+
     def _captureFeedback(self):
+        import base64  # pylint: disable=import-outside-toplevel
+        import smtplib  # pylint: disable=import-outside-toplevel
+
         self.__getSession()
         #
         senderEmail = str(self.__reqObj.getValue("sender"))
@@ -500,7 +684,7 @@ Content-Disposition: attachment; filename=\"%s\"
             This container page is then populated with content via AJAX calls.
         """
         if self.__debug:
-            logger.debug("+++++++++++++++++++++ Starting at %s", time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+            logger.debug("+++++++++++++++++++++ Starting at %s", LOG_NOW)
         # determine if currently operating in Workflow Managed environment
         bIsWorkflow = self.__isWorkflow()
         #
@@ -565,20 +749,12 @@ Content-Disposition: attachment; filename=\"%s\"
                             self.__reqObj.setValue("configFilePath", sFileAbsPathCnfg)
 
         #
-        # instantiate datastore to be used for capturing/persisting edits
+        # instantiate datastore to be used for capturing/persisting edits, and dictionary info store to be used for retrieving
+        # cif category meta data -- the dictionary parse is overlapped with parsing of the model file unless "launch_pipeline=serial"
         pdbxDataIo = PdbxDataIo(self.__reqObj, self.__verbose, self.__lfh)
-        if self.__debug:
-            logger.debug("+++++++++++++++++++++ before call to pdbxDataIo.initializeDataStore at %s", time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
-        dataBlockName, entryTitle, entryAccessionIdsLst = pdbxDataIo.initializeDataStore()
-        if self.__debug:
-            logger.debug("+++++++++++++++++++++ after call to pdbxDataIo.initializeDataStore at %s", time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
-
-        # instantiate dictionary info store to be used for retrieving cif category meta data
-        if self.__debug:
-            logger.debug("+++++++++++++++++++++ before call to pdbxDataIo.initializeDictInfoStore at %s", time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
-        pdbxDataIo.initializeDictInfoStore()
-        if self.__debug:
-            logger.debug("+++++++++++++++++++++ after call to pdbxDataIo.initializeDictInfoStore at %s", time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+        bParallel = str(self.__reqObj.getValue("launch_pipeline")).lower() != "serial"
+        launchPipeline = EditorLaunchPipeline(pdbxDataIo, parallel=bParallel, verbose=self.__verbose, log=self.__lfh)
+        dataBlockName, entryTitle, entryAccessionIdsLst = launchPipeline.run()
 
         defView = pdbxDataIo.getDefView()
         if self.__debug:
@@ -602,11 +778,19 @@ Content-Disposition: attachment; filename=\"%s\"
         if (len(entryAccessionIdsLst) == 0) or (entryAccessionIdsLst and "PDB" in entryAccessionIdsLst):
             self.__reqObj.setValue("emmodelview", "y")
         #
-        edtrDpct = EditorDepict(self.__verbose, self.__lfh)
-        edtrDpct.setSessionPaths(self.__reqObj)
-        oL = edtrDpct.doRender(self.__reqObj, bIsWorkflow)
+        with launchPipeline.stage("render"):
+            from wwpdb.apps.editormodule.depict.EditorDepict import EditorDepict  # pylint: disable=import-outside-toplevel
+            edtrDpct = EditorDepict(self.__verbose, self.__lfh)
+            edtrDpct.setSessionPaths(self.__reqObj)
+            oL = edtrDpct.doRender(self.__reqObj, bIsWorkflow)
         rC.setHtmlText("\n".join(oL))
         #
+        launchTimings = launchPipeline.getTimings()
+        logger.info("launch stage timings (ms, parallel=%s): %r", bParallel, launchTimings)
+        sessMeta = EditorSessionMeta(self.__sessionPath, verbose=self.__verbose, log=self.__lfh)
+        sessMeta.set("launch_timings", launchTimings)
+        sessMeta.store()
+        #
         return rC
 
     def _reloadOp(self):
@@ -621,7 +805,7 @@ Content-Disposition: attachment; filename=\"%s\"
             This container page is then populated with content via AJAX calls.
         """
         if self.__debug:
-            logger.debug("+++++++++++++++++++++ Starting at %s", time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+            logger.debug("+++++++++++++++++++++ Starting at %s", LOG_NOW)
         # determine if currently operating in Workflow Managed environment
         bIsWorkflow = self.__isWorkflow()
         #
@@ -642,6 +826,7 @@ Content-Disposition: attachment; filename=\"%s\"
         if self.__verbose:
             logger.info("+EditorWebAppWorker._reloadOp() Call EditorDepict with workflow %r", bIsWorkflow)
         #
+        from wwpdb.apps.editormodule.depict.EditorDepict import EditorDepict  # pylint: disable=import-outside-toplevel
         edtrDpct = EditorDepict(self.__verbose, self.__lfh)
         edtrDpct.setSessionPaths(self.__reqObj)
         oL = edtrDpct.doRender(self.__reqObj, bIsWorkflow)
@@ -695,6 +880,7 @@ Content-Disposition: attachment; filename=\"%s\"
         dataBlockName, _entryTitle, _entryAccessionIdsLst = pdbxDataIo.initializeDataStore()
         pdbxDataIo.initializeDictInfoStore()
         #
+        from wwpdb.apps.editormodule.depict.EditorDepict import EditorDepict  # pylint: disable=import-outside-toplevel
         edtrDpct = EditorDepict(self.__verbose, self.__lfh)
         edtrDpct.setSessionPaths(self.__reqObj)
         oL = edtrDpct.doRenderDevProto(self.__reqObj, bIsWorkflow, dataBlockName)
@@ -779,6 +965,7 @@ Content-Disposition: attachment; filename=\"%s\"
         self.__reqObj.setReturnFormat(return_format="json")
         rC = ResponseContent(reqObj=self.__reqObj, verbose=self.__verbose, log=self.__lfh)
         #
+        from wwpdb.io.graphics.GraphicsContext3D import GraphicsContext3D  # pylint: disable=import-outside-toplevel
         gC = GraphicsContext3D(app3D="JMol", verbose=self.__verbose, log=self.__lfh)
         ctgryLst = gC.getCategoriesWithContext()
         #
@@ -816,6 +1003,7 @@ Content-Disposition: attachment; filename=\"%s\"
         self.__reqObj.setReturnFormat(return_format="json")
         rC = ResponseContent(reqObj=self.__reqObj, verbose=self.__verbose, log=self.__lfh)
         #
+        from wwpdb.apps.editormodule.depict.EditorDepict import EditorDepict  # pylint: disable=import-outside-toplevel
         edtrDpct = EditorDepict(verbose=self.__verbose, log=self.__lfh)
         jmolMrkp = edtrDpct.getJmolMarkup(self.__reqObj, bIsWorkflow)
 
@@ -862,6 +1050,7 @@ Content-Disposition: attachment; filename=\"%s\"
         self.__reqObj.setReturnFormat(return_format="json")
         rC = ResponseContent(reqObj=self.__reqObj, verbose=self.__verbose, log=self.__lfh)
 
+        from wwpdb.apps.editormodule.depict.EditorDepict import EditorDepict  # pylint: disable=import-outside-toplevel
         edtrDpct = EditorDepict(verbose=self.__verbose, log=self.__lfh)
         dataTblTmplt, catObjDict = edtrDpct.getDataTableTemplate(self.__reqObj, cifCtgry)
         # dataTblTmplt = edtrDpct.getDataTableTemplate( cifCtgry, ctgryColList, bTrnspsdTbl, catObjDict['col_displ_name'] )  # example of supporting user friendly column display names
@@ -923,6 +1112,7 @@ Content-Disposition: attachment; filename=\"%s\"
             if self.__verbose:
                 logger.debug("  cifctgry is:%s", cifCtgry)
 
+            from wwpdb.apps.editormodule.depict.EditorDepict import EditorDepict  # pylint: disable=import-outside-toplevel
             edtrDpct = EditorDepict(verbose=self.__verbose, log=self.__lfh)
             dataTblTmplt, catObjDict = edtrDpct.getDataTableTemplate(self.__reqObj, cifCtgry, dispLabels[i])
 
@@ -940,6 +1130,103 @@ Content-Disposition: attachment; filename=\"%s\"
 
         return rC
 
+    def _getEnumRegistryOp(self):
+        """Get enumeration lists referenced by enum id from DataTable config details (see "enum_refs" request parameter).
+
+        Client supplies the registry version it has cached as "enum_registry_version", and optionally a comma separated
+        list of "enum_ids" of interest. If the cached version is current and no ids are requested, no enumerations are returned.
+
+        :Returns:
+            Operation output is packaged in a ResponseContent() object.
+            The output consists of JSON object with properties:
+                'enum_registry_version' --> current registry version for the session
+                'up_to_date' --> boolean indicating whether client's cached version is current
+                'enums' --> dictionary of enum id -> sorted list of enumeration values
+        """
+        if self.__verbose:
+            logger.info("Starting")
+        #
+        self.__getSession()
+        #
+        self.__reqObj.setReturnFormat(return_format="json")
+        rC = ResponseContent(reqObj=self.__reqObj, verbose=self.__verbose, log=self.__lfh)
+        #
+        clientVersion = self.__reqObj.getValue("enum_registry_version")
+        enumIds = [enumId.strip() for enumId in self.__reqObj.getValue("enum_ids").split(",") if len(enumId.strip()) > 0]
+        #
+        pdbxDataIo = PdbxDataIo(self.__reqObj, self.__verbose, self.__lfh)
+        enumRegistry = pdbxDataIo.getEnumRegistry()
+        #
+        rtrnDict = {}
+        if enumRegistry is None:
+            rC.setError(errMsg="Enumeration registry not available for this session")
+            return rC
+        #
+        rtrnDict["enum_registry_version"] = enumRegistry.getVersion()
+        rtrnDict["up_to_date"] = clientVersion == enumRegistry.getVersion()
+        if enumIds:
+            rtrnDict["enums"] = enumRegistry.getEnumDict(enumIds)
+        elif rtrnDict["up_to_date"]:
+            rtrnDict["enums"] = {}
+        else:
+            rtrnDict["enums"] = enumRegistry.getEnumDict()
+        #
+        rC.addDictionaryItems(rtrnDict)
+
+        return rC
+
+    def _getEnumMatchesOp(self):
+        """Get enumeration values for given cif category.attribute starting with the term typed so far (case-insensitive).
+        Serves autocomplete UI controls so that large enumerations need not be shipped to the browser.
+
+        Request parameters: "cifctgry", "cifitem" (attribute name), "term", and optional "limit" (default 20,
+        at most ENUM_MATCH_LIMIT_MAX).
+
+        :Returns:
+            Operation output is packaged in a ResponseContent() object.
+            The output consists of JSON object with properties:
+                'matches' --> list of up to "limit" matching values, in sorted order
+                'total' --> total number of values matching the term
+        """
+        if self.__verbose:
+            logger.info("Starting")
+        #
+        self.__getSession()
+        #
+        self.__reqObj.setReturnFormat(return_format="json")
+        rC = ResponseContent(reqObj=self.__reqObj, verbose=self.__verbose, log=self.__lfh)
+        #
+        cifCtgry = self.__reqObj.getValue("cifctgry")
+        cifItem = self.__reqObj.getValue("cifitem")
+        term = self.__reqObj.getRawValue("term") or ""
+        try:
+            limit = min(max(int(self.__reqObj.getValue("limit")), 1), self.ENUM_MATCH_LIMIT_MAX)
+        except ValueError:
+            limit = 20
+        #
+        pdbxDataIo = PdbxDataIo(self.__reqObj, self.__verbose, self.__lfh)
+        enumRegistry = pdbxDataIo.getEnumRegistry()
+        if enumRegistry is None:
+            rC.setError(errMsg="Enumeration registry not available for this session")
+            return rC
+        #
+        enumId = enumRegistry.getEnumId(cifCtgry, cifItem, alt=enumRegistry.hasAltEnums(cifCtgry))
+        prefixIndex = PdbxEnumPrefixIndex.get(enumId, enumRegistry) if enumId else None
+        #
+        rtrnDict = {}
+        if prefixIndex is None:
+            rtrnDict["matches"] = []
+            rtrnDict["total"] = 0
+        else:
+            rtrnDict["matches"], rtrnDict["total"] = prefixIndex.search(term.strip(), limit)
+        #
+        if self.__verbose:
+            logger.info("%s.%s term %r -- %s matches", cifCtgry, cifItem, term, rtrnDict["total"])
+        #
+        rC.addDictionaryItems(rtrnDict)
+
+        return rC
+
     def _createInitRollbackPoint(self):
         """ """
         #
@@ -1008,11 +1295,14 @@ Content-Disposition: attachment; filename=\"%s\"
         #
         # if (self.__verbose and self.__debug ):
         #    logger.debug("-- ctgryRecordList returned from PdbxDataIo is: %r\n" % ctgryRecordList)
+        from wwpdb.apps.editormodule.depict.EditorDepict import EditorDepict  # pylint: disable=import-outside-toplevel
         edtrDpct = EditorDepict(verbose=self.__verbose, log=self.__lfh)
         dataTblDict = edtrDpct.getJsonDataTable(self.__reqObj, ctgryRecordList, iDisplayStart, ctgryColList)
         dataTblDict["sEcho"] = sEcho
         dataTblDict["iTotalRecords"] = iTotalRecords
         dataTblDict["iTotalDisplayRecords"] = iTotalDisplayRecords
+        # client may cache category pages against the version
+        dataTblDict["ctgry_version"] = pdbxDataIo.getCategoryVersion(cifCtgry)
         #
         rC.addDictionaryItems(dataTblDict)
 
@@ -1041,6 +1331,7 @@ Content-Disposition: attachment; filename=\"%s\"
         _bOk, ctgryColList = pdbxDataIo.getCategoryColList(cifCtgry)
         ctgryRecordList, iTotalRecords, iTotalDisplayRecords = pdbxDataIo.getCategoryRowList(cifCtgry, 0, 20, "", {})
 
+        from wwpdb.apps.editormodule.depict.EditorDepict import EditorDepict  # pylint: disable=import-outside-toplevel
         edtrDpct = EditorDepict(verbose=self.__verbose, log=self.__lfh)
         dataTblDict = edtrDpct.getJsonDataTable(self.__reqObj, ctgryRecordList, 0, ctgryColList)
         dataTblDict["sEcho"] = sEcho
@@ -1051,10 +1342,35 @@ Content-Disposition: attachment; filename=\"%s\"
 
         return rC
 
+    def _exportCategoryNdjsonOp(self):
+        """Stream all records of given cif category ("cifctgry") as newline-delimited JSON, one record object per line.
+        Unlike the DataTables paths, no page of records is assembled in memory.
+
+        :Returns:
+            Operation output is packaged in a ResponseContent() object with streamed content.
+        """
+        if self.__verbose:
+            logger.info("Starting")
+        #
+        self.__getSession()
+        cifCtgry = self.__reqObj.getValue("cifctgry")
+        #
+        self.__reqObj.setReturnFormat(return_format="ndjson")
+        rC = ResponseContent(reqObj=self.__reqObj, verbose=self.__verbose, log=self.__lfh)
+        #
+        pdbxDataIo = PdbxDataIo(self.__reqObj, self.__verbose, self.__lfh)
+        lineIter = pdbxDataIo.iterCategoryRowsNdjson(cifCtgry)
+        if lineIter is None:
+            rC.setError(errMsg="The datafile being processed did not contain any data corresponding to cif category, '%s'." % cifCtgry)
+        else:
+            rC.setStreamContent(lineIter)
+
+        return rC
+
     def _validateEditOp(self):
         #
         if self.__debug:
-            logger.debug("++++++++++++STARTING at %s", time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+            logger.debug("++++++++++++STARTING at %s", LOG_NOW)
         #
         rtrnDict = {}
         #
@@ -1072,12 +1388,12 @@ Content-Disposition: attachment; filename=\"%s\"
         # INVOKE VALIDATION METHOD
         pdbxDataIo = PdbxDataIo(self.__reqObj, self.__verbose, self.__lfh)
         if self.__debug:
-            logger.debug("++++++++++++ just before call to pdbxDataIo.validateItemValue at %s", time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+            logger.debug("++++++++++++ just before call to pdbxDataIo.validateItemValue at %s", LOG_NOW)
             #
         rtrnDict = pdbxDataIo.validateItemValue(cifCtgry, newValue, rowIdx, colIdx)
         #
         if self.__debug:
-            logger.debug("++++++++++++ just after call to pdbxDataIo.validateItemValue at %s", time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+            logger.debug("++++++++++++ just after call to pdbxDataIo.validateItemValue at %s", LOG_NOW)
             #
         rC.addDictionaryItems(rtrnDict)
 
@@ -1086,7 +1402,7 @@ Content-Disposition: attachment; filename=\"%s\"
     def _submitEditOp(self):
         #
         if self.__debug:
-            logger.debug("++++++++++++STARTING at %s", time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+            logger.debug("++++++++++++STARTING at %s", LOG_NOW)
         #
         self.__getSession()
         newValue = self.__reqObj.getRawValue("new_value")
@@ -1101,7 +1417,12 @@ Content-Disposition: attachment; filename=\"%s\"
             logger.info("cifctgry is:%s", cifCtgry)
             logger.info("editActnIndx is:%s", editActnIndx)
         #
-        self.__reqObj.setDefaultReturnFormat(return_format="html")
+        # clients tracking the category version get the new version back with the value, as from act_on_row and propagate_title
+        bVersioned = len(self.__reqObj.getValue("ctgry_version")) > 0
+        if bVersioned:
+            self.__reqObj.setReturnFormat("json")
+        else:
+            self.__reqObj.setDefaultReturnFormat(return_format="html")
         rC = ResponseContent(reqObj=self.__reqObj, verbose=self.__verbose, log=self.__lfh)
         #
         rowIdx = int(rowIdx.replace("row_", ""))
@@ -1121,15 +1442,23 @@ Content-Disposition: attachment; filename=\"%s\"
         rtrnValue = None
         #
         pdbxDataIo = PdbxDataIo(self.__reqObj, self.__verbose, self.__lfh)
+        if not pdbxDataIo.isCategoryVersionCurrent(cifCtgry, self.__reqObj.getValue("ctgry_version")):
+            if bVersioned:
+                rC.addDictionaryItems(
+                    {"status": "CONFLICT", "err_msg": self.__getVersionConflictMsg(pdbxDataIo, cifCtgry), "ctgry_version": pdbxDataIo.getCategoryVersion(cifCtgry)}
+                )
+            else:
+                rC.setError(errMsg=self.__getVersionConflictMsg(pdbxDataIo, cifCtgry))
+            return rC
 
         if self.__debug:
-            logger.debug("++++++++++++ just before call to pdbxDataIo.setItemValue at %s", time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+            logger.debug("++++++++++++ just before call to pdbxDataIo.setItemValue at %s", LOG_NOW)
             self.__lfh.flush()
             #
         bOk = pdbxDataIo.setItemValue(cifCtgry, newValue, rowIdx, colIdx)
         #
         if self.__debug:
-            logger.debug("++++++++++++just after call to pdbxDataIo.setItemValue at %s", time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+            logger.debug("++++++++++++just after call to pdbxDataIo.setItemValue at %s", LOG_NOW)
             self.__lfh.flush()
 
         if bOk:
@@ -1155,17 +1484,20 @@ Content-Disposition: attachment; filename=\"%s\"
 
         rtrnValue = newValue
 
-        rC.setHtmlText(rtrnValue)
+        if bVersioned:
+            rC.addDictionaryItems({"status": "OK" if bOk else "ERROR", "value": rtrnValue, "ctgry_version": pdbxDataIo.getCategoryVersion(cifCtgry)})
+        else:
+            rC.setHtmlText(rtrnValue)
         #
         if self.__debug:
-            logger.debug("++++++++++++COMPLETING at %s", time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+            logger.debug("++++++++++++COMPLETING at %s", LOG_NOW)
             #
         return rC
 
     def _propagateTitleOp(self):
         #
         if self.__debug:
-            logger.debug("++++++++++++STARTING at %s", time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+            logger.debug("++++++++++++STARTING at %s", LOG_NOW)
             #
         #
         rtrnDict = {}
@@ -1183,16 +1515,23 @@ Content-Disposition: attachment; filename=\"%s\"
         rC = ResponseContent(reqObj=self.__reqObj, verbose=self.__verbose, log=self.__lfh)
         #
         pdbxDataIo = PdbxDataIo(self.__reqObj, self.__verbose, self.__lfh)
+        if not pdbxDataIo.isCategoryVersionCurrent(targetCifCtgry, self.__reqObj.getValue("ctgry_version")):
+            rtrnDict["status"] = "CONFLICT"
+            rtrnDict["err_msg"] = self.__getVersionConflictMsg(pdbxDataIo, targetCifCtgry)
+            rtrnDict["ctgry_version"] = pdbxDataIo.getCategoryVersion(targetCifCtgry)
+            rC.addDictionaryItems(rtrnDict)
+            return rC
         #
         bOk, origValue = pdbxDataIo.propagateTitle(targetCifCtgry)
         #
         if self.__debug:
-            logger.debug("++++++++++++ just after call to pdbxDataIo.setItemValue at %s", time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+            logger.debug("++++++++++++ just after call to pdbxDataIo.setItemValue at %s", LOG_NOW)
             self.__lfh.flush()
 
         if bOk:
             rtrnDict["status"] = "OK"
             rtrnDict["orig_value"] = origValue
+            rtrnDict["ctgry_version"] = pdbxDataIo.getCategoryVersion(targetCifCtgry)
             # 2014-09-22 decided to change strategy for making snapshots to support rollbacks.
             # at point in time of this method, an initial zero-index snapshot had already been made when user action invokes first call to
             # have datatables populated in the browser. So we now make snapshots after the edit action so user does not have to wait for
@@ -1205,7 +1544,7 @@ Content-Disposition: attachment; filename=\"%s\"
         rC.addDictionaryItems(rtrnDict)
         #
         if self.__debug:
-            logger.debug("++++++++++++COMPLETING at %s", time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+            logger.debug("++++++++++++COMPLETING at %s", LOG_NOW)
             #
         return rC
 
@@ -1214,7 +1553,7 @@ Content-Disposition: attachment; filename=\"%s\"
         rtrnDict = {}
         #
         if self.__debug:
-            logger.debug("++++++++++++STARTING at %s", time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+            logger.debug("++++++++++++STARTING at %s", LOG_NOW)
             #
         #
         cloneList = None
@@ -1246,6 +1585,12 @@ Content-Disposition: attachment; filename=\"%s\"
         rC = ResponseContent(reqObj=self.__reqObj, verbose=self.__verbose, log=self.__lfh)
         #
         pdbxDataIo = PdbxDataIo(self.__reqObj, self.__verbose, self.__lfh)
+        if not pdbxDataIo.isCategoryVersionCurrent(cifCtgry, self.__reqObj.getValue("ctgry_version")):
+            rtrnDict["status"] = "CONFLICT"
+            rtrnDict["err_msg"] = self.__getVersionConflictMsg(pdbxDataIo, cifCtgry)
+            rtrnDict["ctgry_version"] = pdbxDataIo.getCategoryVersion(cifCtgry)
+            rC.addDictionaryItems(rtrnDict)
+            return rC
 
         #
         sErrMsg = "Problem when submitting request."
@@ -1258,6 +1603,7 @@ Content-Disposition: attachment; filename=\"%s\"
         #
         if ok:
             rtrnDict["status"] = "OK"
+            rtrnDict["ctgry_version"] = pdbxDataIo.getCategoryVersion(cifCtgry)
             # 2014-09-22 decided to change strategy for making snapshots to support rollbacks.
             # at point in time of this method, an initial zero-index snapshot had already been made when user action invokes first call to
             # have datatables populated in the browser. So we now make snapshots after the edit action so user does not have to wait for
@@ -1270,7 +1616,7 @@ Content-Disposition: attachment; filename=\"%s\"
         rC.addDictionaryItems(rtrnDict)
         #
         if self.__debug:
-            logger.debug("++++++++++++COMPLETING at %s", time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+            logger.debug("++++++++++++COMPLETING at %s", LOG_NOW)
             #
         return rC
 
@@ -1285,7 +1631,7 @@ Content-Disposition: attachment; filename=\"%s\"
         rtrnDict = {}
         #
         if self.__debug:
-            logger.debug("++++++++++++STARTING at %s", time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+            logger.debug("++++++++++++STARTING at %s", LOG_NOW)
             #
         #
         self.__getSession()
@@ -1310,7 +1656,7 @@ Content-Disposition: attachment; filename=\"%s\"
         rC.addDictionaryItems(rtrnDict)
         #
         if self.__debug:
-            logger.debug("++++++++++++COMPLETING at %s", time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+            logger.debug("++++++++++++COMPLETING at %s", LOG_NOW)
             #
         return rC
 
@@ -1319,7 +1665,7 @@ Content-Disposition: attachment; filename=\"%s\"
         rtrnDict = {}
         #
         if self.__debug:
-            logger.debug("++++++++++++STARTING at %s", time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+            logger.debug("++++++++++++STARTING at %s", LOG_NOW)
             #
         #
         self.__getSession()
@@ -1343,7 +1689,7 @@ Content-Disposition: attachment; filename=\"%s\"
         rC.addDictionaryItems(rtrnDict)
         #
         if self.__debug:
-            logger.debug("++++++++++++COMPLETING at %s", time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+            logger.debug("++++++++++++COMPLETING at %s", LOG_NOW)
             #
         return rC
 
@@ -1352,7 +1698,7 @@ Content-Disposition: attachment; filename=\"%s\"
         rtrnDict = {}
         #
         if self.__debug:
-            logger.debug("++++++++++++STARTING at %s", time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+            logger.debug("++++++++++++STARTING at %s", LOG_NOW)
             #
         #
         self.__getSession()
@@ -1370,12 +1716,12 @@ Content-Disposition: attachment; filename=\"%s\"
         #
         pdbxDataIo = PdbxDataIo(self.__reqObj, self.__verbose, self.__lfh)
         if self.__debug:
-            logger.debug("++++++++++++ just before call to pdbxDataIo._undoEdits at %s", time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+            logger.debug("++++++++++++ just before call to pdbxDataIo._undoEdits at %s", LOG_NOW)
             #
         ok = pdbxDataIo.undoEdits(cifCtgry, rewindIndex)
         #
         if self.__debug:
-            logger.debug("++++++++++++ just after call to pdbxDataIo._undoEdits at %s", time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+            logger.debug("++++++++++++ just after call to pdbxDataIo._undoEdits at %s", LOG_NOW)
             #
         if ok:
             rtrnDict["status"] = "OK"
@@ -1385,7 +1731,7 @@ Content-Disposition: attachment; filename=\"%s\"
         rC.addDictionaryItems(rtrnDict)
         #
         if self.__debug:
-            logger.debug("++++++++++++COMPLETING at %s", time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+            logger.debug("++++++++++++COMPLETING at %s", LOG_NOW)
             #
         return rC
 
@@ -1407,6 +1753,11 @@ Content-Disposition: attachment; filename=\"%s\"
     #      Private helper methods
     # ------------------------------------------------------------------------------------------------------------
     #
+    def __getVersionConflictMsg(self, pdbxDataIo, cifCtgry):
+        currentVersion = pdbxDataIo.getCategoryVersion(cifCtgry)
+        logger.info("rejecting edit of %s at version %s, current version is %s", cifCtgry, self.__reqObj.getValue("ctgry_version"), currentVersion)
+        return "CONFLICT: category %s has been changed by another request (version %s), please reload." % (cifCtgry, currentVersion)
+
     def __encodeUtf8ToCif(self, p_content):
         """Encoding unicode/utf-8 content into cif friendly ascii"""
         text = p_content.encode("ascii", "xmlcharrefreplace")
@@ -1538,10 +1889,10 @@ Content-Disposition: attachment; filename=\"%s\"
                     bOkay = self.__saveEditorModState()
                     if bOkay:
                         if self.__verbose:
-                            logger.info("successfully saved cif file to session directory %s at %s", self.__sessionPath, time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+                            logger.info("successfully saved cif file to session directory %s at %s", self.__sessionPath, LOG_NOW)
                     else:
                         if self.__verbose:
-                            logger.info("failed to save cif file to session directory %s at %s", self.__sessionPath, time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+                            logger.info("failed to save cif file to session directory %s at %s", self.__sessionPath, LOG_NOW)
                         rC.setError(errMsg="+EditorWebAppWorker.__exitEditorMod() - problem saving cif file")
 
                 else:
@@ -1550,7 +1901,7 @@ Content-Disposition: attachment; filename=\"%s\"
 
             except:  # noqa: E722 pylint: disable=bare-except
                 if self.__verbose:
-                    logger.info("failed to save cif file to session directory %s at %s", self.__sessionPath, time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+                    logger.info("failed to save cif file to session directory %s at %s", self.__sessionPath, LOG_NOW)
                 logger.exception("In save cif")
                 rC.setError(errMsg="+%s.%s() -- exception thrown on saving cif file" % ("EditorWebAppWorker", "__exitEditorMod"))
             # """
@@ -1597,6 +1948,8 @@ Content-Disposition: attachment; filename=\"%s\"
 
     def __saveEditorModState(self):
         """PLACEHOLDER"""
+        from wwpdb.io.locator.DataReference import DataFileReference  # pylint: disable=import-outside-toplevel
+
         exprtDirPath = None
         exprtFilePath = None
         fileSource = str(self.__reqObj.getValue("filesource")).strip().lower()
@@ -1755,6 +2108,7 @@ Content-Disposition: attachment; filename=\"%s\"
                 fName = os.path.basename(fNameInput)
 
             #
+            import mimetypes  # pylint: disable=import-outside-toplevel
             mimeType = mimetypes.guess_type(fNameInput)[0]
             #
             if self.__verbose:
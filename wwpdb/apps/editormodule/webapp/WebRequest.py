@@ -7,6 +7,10 @@
 # 25-Jul-2010 Ported to ccmodule package
 # 24-Aug-2010 Add dictionary update for content request object.
 # 02-Feb-2012 Ported here to editormodule package
+# 19-Oct-2026 Add streamed (ndjson) response content delivered as an iterable.
+# 19-Oct-2026 newSessionObj() reuses process-wide session handles from EditorAppContext for existing sessions.
+# 19-Oct-2026 Add ResponseContent.setTextContent() and isError().
+# 19-Oct-2026 Add ResponseContent.getStreamContent()/getStreamContentType().
 ##
 """
 WebRequest provides containers and accessors for managing request parameter information.
@@ -24,6 +28,7 @@ from json import loads, dumps
 import os
 
 from wwpdb.utils.session.SessionManager import SessionManager
+from wwpdb.apps.editormodule.config.EditorAppContext import EditorAppContext
 
 
 class WebRequest(object):
@@ -184,20 +189,20 @@ class EditorInputRequest(WebRequest):
         return sObj
 
     def newSessionObj(self):
-        if self.exists("TopSessionPath"):
-            sObj = SessionManager(topPath=self._getStringValue("TopSessionPath"))
-        else:
-            sObj = SessionManager()
-
         sessionId = self._getStringValue("sessionid")
+        topPath = self._getStringValue("TopSessionPath") if self.exists("TopSessionPath") else None
 
         if len(sessionId) > 0:
-            sObj.setId(sessionId)
-            sObj.makeSessionPath()
+            # existing session - handle held by the process-wide application context
+            return EditorAppContext.get(self._getStringValue("WWPDB_SITE_ID")).getSessionObj(topPath, sessionId)
+
+        if topPath is not None:
+            sObj = SessionManager(topPath=topPath)
         else:
-            sObj.assignId()
-            sObj.makeSessionPath()
-            self.setValue("sessionid", sObj.getId())
+            sObj = SessionManager()
+        sObj.assignId()
+        sObj.makeSessionPath()
+        self.setValue("sessionid", sObj.getId())
 
         return sObj
 
@@ -257,11 +262,28 @@ class ResponseContent(object):
         with open(filePath, "r") as fin:
             self.__cD["textcontent"] = fin.read()
 
+    def setTextContent(self, text=""):
+        self.__cD["textcontent"] = text
+
+    def setStreamContent(self, lineIter, contentType="application/x-ndjson"):
+        """Content delivered incrementally as an iterable of text lines (return_format='ndjson')"""
+        self.__cD["streamcontent"] = lineIter
+        self.__cD["streamcontenttype"] = contentType
+
+    def getStreamContent(self):
+        return self.__cD.get("streamcontent")
+
+    def getStreamContentType(self):
+        return self.__cD.get("streamcontenttype")
+
     def setError(self, errMsg="", semaphore=""):
         self.__cD["errorflag"] = True
         self.__cD["errortext"] = errMsg
         self.__cD["semaphore"] = semaphore
 
+    def isError(self):
+        return self.__cD["errorflag"]
+
     def setStatusCode(self, aCode):
         self.__cD["statuscode"] = aCode
 
@@ -293,6 +315,11 @@ class ResponseContent(object):
             rD = self.__initJsonResponse(self.__cD)
         elif self.__reqObj.getReturnFormat() == "jsonText":
             rD = self.__initJsonResponseInTextArea(self.__cD)
+        elif self.__reqObj.getReturnFormat() == "ndjson":
+            if self.__cD["errorflag"] is False and "streamcontent" in self.__cD:
+                rD = self.__initStreamResponse(self.__cD["streamcontent"], self.__cD["streamcontenttype"])
+            else:
+                rD = self.__initHtmlResponse(self.__cD["errortext"])
         else:
             pass
         #
@@ -314,6 +341,14 @@ class ResponseContent(object):
         rspDict["RETURN_STRING"] = "<textarea>" + dumps(myD) + "</textarea>"
         return rspDict
 
+    def __initStreamResponse(self, lineIter, contentType):
+        """Response body is supplied by iterating RETURN_ITERABLE (utf-8 encoded chunks) rather than RETURN_STRING"""
+        rspDict = {}
+        rspDict["CONTENT_TYPE"] = contentType
+        rspDict["RETURN_STRING"] = ""
+        rspDict["RETURN_ITERABLE"] = (line.encode("utf-8") for line in lineIter)
+        return rspDict
+
     def __initHtmlResponse(self, myHtml=""):
         rspDict = {}
         rspDict["CONTENT_TYPE"] = "text/html"
@@ -0,0 +1,43 @@
+##
+# File:     doServiceRequestAsgi.py
+# Created:  19-Oct-2026
+#
+# Updated:
+##
+"""
+This top-level responder for requests to /service/editor/... url for the
+wwPDB General Annotation editor application framework.
+
+This version depends on an ASGI server (e.g. uvicorn, hypercorn):
+
+    uvicorn wwpdb.apps.editormodule.webapp.doServiceRequestAsgi:application --workers 2
+
+Pool size and queue depth are taken from EDITOR_ASGI_MAX_WORKERS / EDITOR_ASGI_MAX_PENDING,
+and EDITOR_ASGI_PROCESSES=1 selects a process pool.
+
+"""
+__docformat__ = "restructuredtext en"
+__author__ = "Raul Sala"
+__email__ = "rsala@rcsb.rutgers.edu"
+__license__ = "Creative Commons Attribution 3.0 Unported"
+__version__ = "V0.01"
+
+import os
+import sys
+import logging
+
+from wwpdb.apps.editormodule.webapp.EditorAsgiApp import EditorAsgiApp
+
+# Create logger
+FORMAT = "[%(levelname)s]-%(module)s.%(funcName)s: %(message)s"
+logging.basicConfig(format=FORMAT)
+logger = logging.getLogger()
+logger.setLevel(logging.INFO)
+
+application = EditorAsgiApp(
+    maxWorkers=int(os.environ.get("EDITOR_ASGI_MAX_WORKERS", "8")),
+    maxPending=int(os.environ.get("EDITOR_ASGI_MAX_PENDING", "64")),
+    useProcesses=os.environ.get("EDITOR_ASGI_PROCESSES", "0") == "1",
+    verbose=False,
+    log=sys.stderr,
+)
@@ -0,0 +1,66 @@
+##
+# File: EditorAppContextTests.py
+# Date:  19-Oct-2026
+#
+# Updates:
+##
+"""Test cases for process-wide application context
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "Raul Sala"
+__email__ = "rsala@rcsb.rutgers.edu"
+__license__ = "Creative Commons Attribution 3.0 Unported"
+__version__ = "V0.01"
+
+import os
+import platform
+import shutil
+import unittest
+
+from wwpdb.apps.editormodule.config.EditorAppContext import EditorAppContext
+from wwpdb.apps.editormodule.webapp.WebRequest import EditorInputRequest
+
+
+class EditorAppContextTests(unittest.TestCase):
+    def setUp(self):
+        HERE = os.path.abspath(os.path.dirname(__file__))
+        self.__sessiontop = os.path.join(HERE, "test-output", platform.python_version())
+        sdir = os.path.join(self.__sessiontop, "sessions")
+        if not os.path.exists(sdir):  # pragma: no cover
+            os.makedirs(sdir)
+        EditorAppContext.reset()
+
+    def testContextReuse(self):
+        """Tests one context per site and cached resource paths"""
+        ctx = EditorAppContext.get("WWPDB_DEV_TEST")
+        self.assertIs(ctx, EditorAppContext.get("WWPDB_DEV_TEST"))
+        self.assertIsNot(ctx, EditorAppContext.get("WWPDB_OTHER_TEST"))
+        self.assertTrue(os.path.isdir(ctx.getTemplatePath()))
+        self.assertTrue(os.path.exists(ctx.getMasterViewFilePath()))
+        self.assertEqual(["master_view", "templates"], ctx.getStats()["resolved_paths"])
+
+    def testSessionHandles(self):
+        """Tests session handles reused across requests and session path recreated if removed"""
+        paramDict = {"TopSessionPath": [self.__sessiontop], "WWPDB_SITE_ID": ["WWPDB_DEV_TEST"], "sessionid": ["appctxtest"]}
+        sObj = EditorInputRequest(paramDict).newSessionObj()
+        self.assertTrue(os.path.isdir(sObj.getPath()))
+        self.assertIs(sObj, EditorInputRequest(paramDict).newSessionObj())
+        #
+        shutil.rmtree(sObj.getPath())
+        sObj2 = EditorInputRequest(paramDict).newSessionObj()
+        self.assertTrue(os.path.isdir(sObj2.getPath()))
+        self.assertEqual(1, EditorAppContext.get("WWPDB_DEV_TEST").getStats()["session_handles"])
+
+    def testInstallLocal(self):
+        """Tests locally given paths and settings take the place of site configuration"""
+        ctx = EditorAppContext.installLocal("LOCAL_TEST", self.__sessiontop, "/tmp/local.dic", settingD={"EDITOR_MEMORY_PROFILE": "y"})
+        self.assertIs(ctx, EditorAppContext.get("LOCAL_TEST"))
+        self.assertEqual(self.__sessiontop, ctx.getTopSessionPath())
+        self.assertEqual("/tmp/local.dic", ctx.getPdbxDictFilePath())
+        self.assertEqual("y", ctx.getSetting("EDITOR_MEMORY_PROFILE", "n"))
+        self.assertTrue(os.path.exists(ctx.getMasterViewFilePath()))
+
+
+if __name__ == "__main__":
+    unittest.main()
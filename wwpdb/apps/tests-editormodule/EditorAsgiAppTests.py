@@ -0,0 +1,154 @@
+##
+# File: EditorAsgiAppTests.py
+# Date:  19-Oct-2026
+#
+# Updates:
+##
+"""Test cases for ASGI front end and local load test
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "Raul Sala"
+__email__ = "rsala@rcsb.rutgers.edu"
+__license__ = "Creative Commons Attribution 3.0 Unported"
+__version__ = "V0.01"
+
+import json
+import sys
+import threading
+import time
+import unittest
+
+if sys.version_info[0] >= 3:
+    import asyncio
+    from wwpdb.apps.editormodule.webapp.EditorAsgiApp import EditorAsgiApp
+    from wwpdb.apps.editormodule.bench.AsgiLoadTest import AsgiLoadTest, syntheticRequest
+
+
+def echoRequest(parameterDict, siteId=None, verbose=False, materialize=False):  # pylint: disable=unused-argument
+    if parameterDict["request_path"][0] == "/service/editor/export_ctgry_ndjson":
+        return {"CONTENT_TYPE": "application/x-ndjson", "RETURN_STRING": "", "RETURN_ITERABLE": iter([b'{"a": 1}\n', b'{"a": 2}\n'])}
+    return {"CONTENT_TYPE": "application/json", "RETURN_STRING": json.dumps(parameterDict)}
+
+
+@unittest.skipIf(sys.version_info[0] < 3, "asyncio front end requires Python 3")
+class EditorAsgiAppTests(unittest.TestCase):
+    def __call(self, app, path, queryString=b"", body=b"", contentType=b"application/x-www-form-urlencoded"):
+        loop = asyncio.new_event_loop()
+        try:
+            return loop.run_until_complete(self.__request(app, path, queryString, body, contentType))
+        finally:
+            loop.close()
+
+    async def __request(self, app, path, queryString=b"", body=b"", contentType=b"application/x-www-form-urlencoded"):
+        scope = {"type": "http", "method": "POST", "path": path, "query_string": queryString, "headers": [(b"content-type", contentType)]}
+        messageL = []
+
+        async def receive():
+            # the body arrives after other requests have been accepted, as from a network connection
+            await asyncio.sleep(0)
+            return {"type": "http.request", "body": body, "more_body": False}
+
+        async def send(message):
+            messageL.append(message)
+
+        await app(scope, receive, send)
+        return messageL[0]["status"], b"".join([m.get("body", b"") for m in messageL[1:]])
+
+    def testParameters(self):
+        """Tests request parameters taken from query string and form body"""
+        app = EditorAsgiApp(maxWorkers=2, requestFunc=echoRequest)
+        status, body = self.__call(app, "/service/editor/Validate_Edit", queryString=b"sessionid=abc", body=b"cifctgry=struct&value=")
+        self.assertEqual(200, status)
+        pD = json.loads(body.decode("utf-8"))
+        self.assertEqual(["/service/editor/validate_edit"], pD["request_path"])
+        self.assertEqual(["abc"], pD["sessionid"])
+        self.assertEqual([""], pD["value"])
+        #
+        status, body = self.__call(app, "/service/editor/export_ctgry_ndjson")
+        self.assertEqual(b'{"a": 1}\n{"a": 2}\n', body)
+        status, body = self.__call(app, "/service/editor/upload", contentType=b"multipart/form-data; boundary=x")
+        self.assertEqual(415, status)
+        app.shutdown()
+
+    def testLoad(self):
+        """Tests blocking operations overlap in the pool and overload is rejected"""
+        app = EditorAsgiApp(maxWorkers=10, maxPending=20, requestFunc=syntheticRequest)
+        t0 = time.time()
+        rD = AsgiLoadTest(app, queryString="delay_ms=50", requests=30, concurrency=30).run()
+        # a single synchronous worker would need 1.5s
+        self.assertLess(time.time() - t0, 0.6)
+        self.assertEqual({"200": 30}, rD["status"])
+        self.assertEqual(0, app.getStats()["in_flight"])
+        #
+        rD = AsgiLoadTest(app, queryString="delay_ms=50", requests=40, concurrency=40).run()
+        self.assertEqual(40, sum(rD["status"].values()))
+        self.assertEqual(10, rD["status"].get("503"))
+        app.shutdown()
+
+    def testConcurrentLimit(self):
+        """Tests requests arriving together beyond the pool size and pending limit are rejected"""
+
+        def slowRequest(parameterDict, siteId=None, verbose=False, materialize=False):  # pylint: disable=unused-argument
+            time.sleep(0.05)
+            return {"CONTENT_TYPE": "text/plain", "RETURN_STRING": "done"}
+
+        app = EditorAsgiApp(maxWorkers=1, maxPending=1, requestFunc=slowRequest)
+
+        async def run():
+            return await asyncio.gather(*[self.__request(app, "/service/editor/get_dtbl_data") for _ in range(10)])
+
+        loop = asyncio.new_event_loop()
+        try:
+            resultL = loop.run_until_complete(run())
+        finally:
+            loop.close()
+        self.assertEqual([200, 200] + [503] * 8, sorted(rsp[0] for rsp in resultL))
+        sD = app.getStats()
+        self.assertEqual(8, sD["rejected"])
+        self.assertEqual(0, sD["in_flight"])
+        app.shutdown()
+
+    def testStatus(self):
+        """Tests status requests answered while the pool is busy, with the requests waiting for a worker reported"""
+        release = threading.Event()
+
+        def blockingRequest(parameterDict, siteId=None, verbose=False, materialize=False):  # pylint: disable=unused-argument
+            if parameterDict["request_path"][0] == EditorAsgiApp.STATUS_PATH:
+                return {"CONTENT_TYPE": "application/json", "RETURN_STRING": json.dumps(EditorAsgiApp.getInstanceStats())}
+            release.wait(5)
+            return {"CONTENT_TYPE": "text/plain", "RETURN_STRING": "done"}
+
+        app = EditorAsgiApp(maxWorkers=1, maxPending=2, requestFunc=blockingRequest)
+
+        async def run():
+            taskL = [asyncio.ensure_future(self.__request(app, "/service/editor/get_dtbl_data")) for _ in range(3)]
+            await asyncio.sleep(0.2)
+            try:
+                # the pool and its queue are full
+                rejected = await self.__request(app, "/service/editor/get_dtbl_data")
+                status = await self.__request(app, "/service/editor/status")
+            finally:
+                release.set()
+            return rejected, status, await asyncio.gather(*taskL)
+
+        loop = asyncio.new_event_loop()
+        try:
+            rejected, status, resultL = loop.run_until_complete(run())
+        finally:
+            loop.close()
+        self.assertEqual(503, rejected[0])
+        self.assertEqual(200, status[0])
+        sD = [sD for sD in json.loads(status[1].decode("utf-8")) if sD["max_pending"] == 2][0]
+        self.assertEqual(3, sD["in_flight"])
+        self.assertEqual(1, sD["running"])
+        self.assertEqual(2, sD["pending"])
+        self.assertGreater(sD["oldest_pending_secs"], 0.1)
+        self.assertEqual("/service/editor/get_dtbl_data", sD["oldest_pending_path"])
+        self.assertEqual([200, 200, 200], [rsp[0] for rsp in resultL])
+        self.assertEqual(0, app.getStats()["pending"])
+        app.shutdown()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,158 @@
+##
+# File: EditorBenchmarkTests.py
+# Date:  19-Oct-2026
+#
+# Updates:
+#    2026-10-19    RPS    Added test of multi-session load test.
+#    2026-10-19    RPS    Added test of comparison with benchmark baselines.
+##
+"""Test cases for the synthetic entry generator and editor operations benchmark
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "Raul Sala"
+__email__ = "rsala@rcsb.rutgers.edu"
+__license__ = "Creative Commons Attribution 3.0 Unported"
+__version__ = "V0.01"
+
+import os
+import platform
+import shutil
+import unittest
+
+from mmcif.io.IoAdapterCore import IoAdapterCore
+from mmcif_utils.persist.PdbxDictionaryInfo import PdbxDictionaryInfo
+from wwpdb.apps.editormodule.bench.SyntheticEntry import SyntheticEntryGenerator
+from wwpdb.apps.editormodule.bench.EditorBenchmark import EditorBenchmark
+from wwpdb.apps.editormodule.bench.EditorBenchmarkBaseline import EditorBenchmarkBaseline, isScenarioFailed
+from wwpdb.apps.editormodule.bench.EditorSessionLoadTest import EditorSessionLoadTest
+
+
+def _hasGdbm():
+    # data stores are expected as single files, as written by the gdbm backend of shelve
+    try:
+        import dbm.gnu  # noqa: F401 pylint: disable=import-outside-toplevel,unused-import
+
+        return True
+    except ImportError:
+        return False
+
+
+class EditorBenchmarkTests(unittest.TestCase):
+    def setUp(self):
+        HERE = os.path.abspath(os.path.dirname(__file__))
+        self.__workPath = os.path.join(HERE, "test-output", platform.python_version(), "editorbench")
+        if os.path.exists(self.__workPath):
+            shutil.rmtree(self.__workPath)
+        os.makedirs(self.__workPath)
+
+    def testSyntheticEntry(self):
+        """Tests size of generated entry and dictionary coverage of its categories"""
+        generator = SyntheticEntryGenerator(entities=3, authors=7, structConnRows=11, categories=4, atoms=250)
+        entryPath = generator.writeEntry(os.path.join(self.__workPath, "entry.cif"))
+        dictPath = generator.writeDictionary(os.path.join(self.__workPath, "entry.dic"))
+        #
+        container = IoAdapterCore().readFile(inputFilePath=entryPath)[0]
+        self.assertEqual(3, container.getObj("entity").getRowCount())
+        self.assertEqual(7, container.getObj("audit_author").getRowCount())
+        self.assertEqual(11, container.getObj("struct_conn").getRowCount())
+        self.assertEqual(250, container.getObj("atom_site").getRowCount())
+        self.assertEqual(13 + 4, len(container.getObjNameList()))
+        #
+        dInfo = PdbxDictionaryInfo(dictPath=dictPath, verbose=False).assembleByAttribute()
+        self.assertEqual(sorted(container.getObjNameList()), sorted(dInfo))
+        self.assertEqual(["pdbx_ordinal"], dInfo["audit_author"]["PRIMARY_KEYS"])
+        self.assertIn("X-RAY DIFFRACTION", dInfo["exptl"]["COLUMN_ENUMS"]["method"])
+        #
+        # same size and seed give the same entry
+        with open(entryPath, "r") as ifh:
+            entryText = ifh.read()
+        with open(generator.writeEntry(os.path.join(self.__workPath, "entry2.cif")), "r") as ifh:
+            self.assertEqual(entryText, ifh.read())
+
+    def testBaselineCompare(self):
+        """Tests regressions in host-relative scenario time and in store access are detected"""
+
+        def result(launchMs, editMs, editFetches):
+            return {
+                "benchmark": "editor_ops",
+                "time": "2026-10-19T12:00:00",
+                "entry": {"atoms": 100},
+                "repeat": 3,
+                "scenarios": {
+                    "launch": {"ms_min": launchMs, "stores": {"data_store": {"opens": 1, "fetches": 0, "updates": 1}}},
+                    "edit": {"ms_min": editMs, "stores": {"data_store": {"opens": 4, "fetches": editFetches, "updates": 1}}},
+                    "export": {"failed": True},
+                },
+            }
+
+        baselinePath = os.path.join(self.__workPath, "baseline.json")
+        EditorBenchmarkBaseline.fromResult(result(100.0, 10.0, 3), 50.0, tolerance=0.25).write(baselinePath)
+        baseline = EditorBenchmarkBaseline.fromFile(baselinePath)
+        self.assertEqual(["edit", "launch"], baseline.getScenarios())
+        self.assertEqual({"atoms": 100}, baseline.getEntrySize())
+        self.assertEqual(3, baseline.getRepeat())
+        # twice the time on a host half the speed
+        self.assertTrue(baseline.compare(result(200.0, 20.0, 3), 100.0)["ok"])
+        cD = baseline.compare(result(130.0, 10.0, 3), 50.0)
+        self.assertFalse(cD["ok"])
+        self.assertTrue(cD["scenarios"]["launch"]["time_regressed"])
+        self.assertFalse(cD["scenarios"]["edit"]["time_regressed"])
+        self.assertTrue(baseline.compare(result(130.0, 10.0, 3), 50.0, tolerance=0.5)["ok"])
+        # fewer store fetches are an improvement, more are a regression whatever the time
+        self.assertTrue(baseline.compare(result(100.0, 10.0, 2), 50.0)["ok"])
+        cD = baseline.compare(result(100.0, 5.0, 4), 50.0)
+        self.assertFalse(cD["ok"])
+        self.assertEqual(["data_store fetches 4 > 3"], cD["scenarios"]["edit"]["store_regressions"])
+        # scenario failing on comparison
+        resultD = result(100.0, 10.0, 3)
+        resultD["scenarios"]["edit"] = {"failed": True}
+        self.assertFalse(baseline.compare(resultD, 50.0)["ok"])
+        # scenarios that ran but did not do their work
+        for extraD in [{"ok": False}, {"rows": 0}, {"ok": True, "bytes": 0}]:
+            resultD = result(100.0, 10.0, 3)
+            resultD["scenarios"]["edit"].update(extraD)
+            cD = baseline.compare(resultD, 50.0)
+            self.assertFalse(cD["ok"], extraD)
+            self.assertEqual({"failed": True}, cD["scenarios"]["edit"])
+        resultD = result(100.0, 10.0, 3)
+        resultD["scenarios"]["edit"].update({"ok": True, "rows": 25, "bytes": 100})
+        self.assertTrue(baseline.compare(resultD, 50.0)["ok"])
+        self.assertTrue(isScenarioFailed({"ms_min": 1.0, "ok": False}))
+        self.assertFalse(isScenarioFailed({"ms_min": 1.0, "skipped": True}))
+
+    @unittest.skipUnless(_hasGdbm(), "data store requires gdbm")
+    def testBenchmark(self):
+        """Tests benchmark scenarios run against a small synthetic entry"""
+        generator = SyntheticEntryGenerator(entities=2, authors=5, structConnRows=10, categories=2, atoms=400)
+        rD = EditorBenchmark(self.__workPath, generator=generator, repeat=2).run()
+        self.assertEqual(sorted(EditorBenchmark.SCENARIOS), sorted(rD["scenarios"]))
+        for name, sD in rD["scenarios"].items():
+            self.assertFalse(sD.get("failed"), name)
+            self.assertEqual(2, sD["runs"])
+        self.assertEqual(400, rD["scenarios"]["page_fetch"]["total_rows"])
+        self.assertEqual(25, rD["scenarios"]["page_fetch_last"]["rows"])
+        self.assertTrue(rD["scenarios"]["edit"]["ok"])
+        self.assertTrue(rD["scenarios"]["row_insert"]["ok"])
+        self.assertTrue(rD["scenarios"]["row_delete"]["ok"])
+        self.assertTrue(rD["scenarios"]["export"]["ok"])
+        self.assertGreater(rD["scenarios"]["launch_template"]["bytes"], 0)
+        self.assertGreater(rD["scenarios"]["jmol_template"]["bytes"], 0)
+
+    @unittest.skipUnless(_hasGdbm(), "data store requires gdbm")
+    def testSessionLoad(self):
+        """Tests simulated sessions run concurrently without errors, with per-route and per-session figures"""
+        generator = SyntheticEntryGenerator(entities=2, authors=5, structConnRows=10, categories=2, atoms=400)
+        rD = EditorSessionLoadTest(self.__workPath, generator=generator, sessions=3, processes=2, navigations=2, edits=1).run()
+        # launch, 2 x (config, rollback point, first pages, edit, reload, undo), exit
+        self.assertEqual(3 * (1 + 2 * (1 + 1 + 3 + 2 + 1) + 1), rD["requests"])
+        self.assertEqual(0, rD["errors"])
+        self.assertEqual(3, rD["routes"]["/service/editor/launch"]["count"])
+        self.assertEqual(6, rD["routes"]["/service/editor/submit_edit"]["count"])
+        self.assertEqual(3, len(rD["per_session"]))
+        for sD in rD["per_session"]:
+            self.assertGreater(sD["disk_bytes"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
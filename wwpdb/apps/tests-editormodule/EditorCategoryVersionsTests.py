@@ -0,0 +1,72 @@
+##
+# File: EditorCategoryVersionsTests.py
+# Date:  19-Oct-2026
+#
+# Updates:
+##
+"""Test cases for per-category version numbers
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "Raul Sala"
+__email__ = "rsala@rcsb.rutgers.edu"
+__license__ = "Creative Commons Attribution 3.0 Unported"
+__version__ = "V0.01"
+
+import os
+import platform
+import shutil
+import unittest
+
+from wwpdb.apps.editormodule.io.EditorSessionMeta import EditorSessionMeta
+from wwpdb.apps.editormodule.io.EditorCategoryVersions import EditorCategoryVersions
+
+
+class EditorCategoryVersionsTests(unittest.TestCase):
+    def setUp(self):
+        HERE = os.path.abspath(os.path.dirname(__file__))
+        self.__sessionPath = os.path.join(HERE, "test-output", platform.python_version(), "ctgryversions")
+        if os.path.exists(self.__sessionPath):
+            shutil.rmtree(self.__sessionPath)
+        os.makedirs(self.__sessionPath)
+
+    def testBump(self):
+        """Tests versions advance per category and persist with session metadata"""
+        sM = EditorSessionMeta(self.__sessionPath)
+        cV = EditorCategoryVersions(sM)
+        self.assertEqual(0, cV.get("struct"))
+        self.assertEqual({"struct": 1, "citation": 1}, cV.bump(["struct", "citation"]))
+        cV.bump(["struct"])
+        sM.store()
+
+        cV2 = EditorCategoryVersions(EditorSessionMeta(self.__sessionPath))
+        self.assertEqual(2, cV2.get("struct"))
+        self.assertEqual(1, cV2.get("citation"))
+        self.assertEqual(0, cV2.get("audit_author"))
+        self.assertEqual({"struct": 2, "citation": 1}, cV2.getAll())
+
+    def testIsCurrent(self):
+        """Tests stale and missing expected versions"""
+        cV = EditorCategoryVersions(EditorSessionMeta(self.__sessionPath))
+        cV.bump(["struct"])
+        self.assertTrue(cV.isCurrent("struct", "1"))
+        self.assertTrue(cV.isCurrent("struct", None))
+        self.assertTrue(cV.isCurrent("struct", ""))
+        self.assertFalse(cV.isCurrent("struct", "0"))
+        self.assertFalse(cV.isCurrent("struct", "abc"))
+
+    def testRebase(self):
+        """Tests versions after a store rebuild never repeat an earlier version"""
+        cV = EditorCategoryVersions(EditorSessionMeta(self.__sessionPath))
+        cV.bump(["struct", "struct", "struct"])
+        cV.bump(["citation"])
+        cV.rebase()
+        self.assertEqual(4, cV.get("struct"))
+        self.assertEqual(4, cV.get("citation"))
+        self.assertEqual(4, cV.get("audit_author"))
+        self.assertEqual({"citation": 5}, cV.bump(["citation"]))
+        self.assertFalse(cV.isCurrent("struct", "3"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+##
+# File: EditorDepictTests.py
+# Date:  19-Oct-2026
+#
+# Updates:
+##
+"""Test cases for reuse of rendered navigation bar markup across sessions
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "Raul Sala"
+__email__ = "rsala@rcsb.rutgers.edu"
+__license__ = "Creative Commons Attribution 3.0 Unported"
+__version__ = "V0.01"
+
+import os
+import platform
+import shutil
+import unittest
+
+from wwpdb.apps.editormodule.bench.SyntheticEntry import SyntheticEntryGenerator
+from wwpdb.apps.editormodule.depict.EditorDepict import EditorDepict
+from wwpdb.apps.editormodule.io.EditorSessionMeta import EditorSessionMeta
+from wwpdb.apps.editormodule.io.PdbxDataIo import PdbxDataIo
+
+
+class EditorDepictTests(unittest.TestCase):
+    SITE_ID = "EDITOR_DEPICT_TEST"
+
+    def setUp(self):
+        HERE = os.path.abspath(os.path.dirname(__file__))
+        self.__topPath = os.path.join(HERE, "test-output", platform.python_version(), "depict")
+        if os.path.exists(self.__topPath):
+            shutil.rmtree(self.__topPath)
+        os.makedirs(os.path.join(self.__topPath, "sessions"))
+
+    def __render(self, sessionId, methods):
+        """Launch a session on an entry of the given experimental methods and render its launch page.
+        Returns the navigation bar recorded in the session metadata (only when rendered rather than reused) and the page.
+        """
+        generator = SyntheticEntryGenerator(entities=1, authors=3, structConnRows=2, atoms=20, methods=methods)
+        reqObj = generator.launchSession(self.__topPath, self.SITE_ID, sessionId, "depict-model.cif")
+        edtrDpct = EditorDepict()
+        edtrDpct.setSessionPaths(reqObj)
+        pageText = "\n".join(edtrDpct.doRender(reqObj, False))
+        return PdbxDataIo(reqObj), EditorSessionMeta(reqObj.newSessionObj().getPath()).get("nav_bar"), pageText
+
+    def testNavBarMethods(self):
+        """Tests navigation bar is reused only for sessions with the same view methods and category set"""
+        emDataIo, emNavBar, emText = self.__render("depict_em", ["ELECTRON MICROSCOPY"])
+        ecDataIo, ecNavBar, ecText = self.__render("depict_ec", ["ELECTRON CRYSTALLOGRAPHY"])
+        # same view id and set of categories, but views generated for different methods
+        self.assertEqual(emDataIo.getConfigViewId(), ecDataIo.getConfigViewId())
+        self.assertEqual(emDataIo.getCategorySetHash(), ecDataIo.getCategorySetHash())
+        self.assertIsNotNone(emNavBar)
+        self.assertIsNotNone(ecNavBar)
+        self.assertNotEqual(emNavBar["key"], ecNavBar["key"])
+        self.assertIn(emNavBar["markup"], emText)
+        self.assertIn(ecNavBar["markup"], ecText)
+        # a further session of the first method reuses the markup rendered for it
+        _dataIo, navBar, text = self.__render("depict_em_2", ["ELECTRON MICROSCOPY"])
+        self.assertIsNone(navBar)
+        self.assertIn(emNavBar["markup"], text)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+##
+# File: EditorFileFingerprintTests.py
+# Date:  19-Oct-2026
+#
+# Updates:
+##
+"""Test cases for file fingerprints used to decide reuse of session stores
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "Raul Sala"
+__email__ = "rsala@rcsb.rutgers.edu"
+__license__ = "Creative Commons Attribution 3.0 Unported"
+__version__ = "V0.01"
+
+import os
+import platform
+import unittest
+
+from wwpdb.apps.editormodule.io.EditorFileFingerprint import EditorFileFingerprint
+
+
+class EditorFileFingerprintTests(unittest.TestCase):
+    def setUp(self):
+        HERE = os.path.abspath(os.path.dirname(__file__))
+        self.__testOutput = os.path.join(HERE, "test-output", platform.python_version())
+        if not os.path.exists(self.__testOutput):  # pragma: no cover
+            os.makedirs(self.__testOutput)
+        self.__filePath = os.path.join(self.__testOutput, "fingerprint_test.cif")
+        with open(self.__filePath, "w") as ofh:
+            ofh.write("data_D_000000\n_struct.title 'A title'\n")
+
+    def testMatches(self):
+        """Tests fingerprint matching on unchanged, touched and modified files"""
+        fpD = EditorFileFingerprint.make(self.__filePath)
+        self.assertTrue(EditorFileFingerprint.matches(fpD, self.__filePath))
+        self.assertFalse(EditorFileFingerprint.matches(fpD, self.__filePath + ".other"))
+        self.assertFalse(EditorFileFingerprint.matches(None, self.__filePath))
+
+        # same content, new modification time
+        st = os.stat(self.__filePath)
+        os.utime(self.__filePath, (st.st_atime, st.st_mtime + 10))
+        self.assertTrue(EditorFileFingerprint.matches(fpD, self.__filePath))
+        self.assertFalse(EditorFileFingerprint.matches(EditorFileFingerprint.make(self.__filePath, withHash=False), self.__filePath + "x"))
+
+        # same size, different content
+        with open(self.__filePath, "w") as ofh:
+            ofh.write("data_D_000001\n_struct.title 'A title'\n")
+        os.utime(self.__filePath, (st.st_atime, st.st_mtime + 20))
+        self.assertFalse(EditorFileFingerprint.matches(fpD, self.__filePath))
+
+    def testStamp(self):
+        """Tests stamp of missing file"""
+        self.assertIsNone(EditorFileFingerprint.stamp(None))
+        self.assertIsNone(EditorFileFingerprint.make(self.__filePath + ".missing"))
+        self.assertEqual(self.__filePath, EditorFileFingerprint.stamp(self.__filePath)[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+##
+# File: EditorLaunchPipelineTests.py
+# Date:  19-Oct-2026
+#
+# Updates:
+#    2026-10-19    RPS    Added test for reused dictionary store.
+#    2026-10-19    RPS    Added test for serial run when memory profiling.
+#    2026-10-19    RPS    Overlap of the launch steps checked from their recorded times rather than total elapsed time.
+##
+"""Test cases for launch pipeline ordering and timings
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "Raul Sala"
+__email__ = "rsala@rcsb.rutgers.edu"
+__license__ = "Creative Commons Attribution 3.0 Unported"
+__version__ = "V0.01"
+
+import threading
+import time
+import unittest
+
+from wwpdb.apps.editormodule.webapp.EditorLaunchPipeline import EditorLaunchPipeline
+
+
+class SlowDataIo(object):
+    """Stand-in for PdbxDataIo with fixed delays per launch step"""
+
+    def __init__(self, delay=0.05, failDict=False, dictStoreReusable=False, memProfile=False):
+        self.delay = delay
+        self.failDict = failDict
+        self.dictStoreReusable = dictStoreReusable
+        self.memProfile = memProfile
+        self.dictInfoReceived = "unset"
+        self.dictParsed = False
+        # step name -> (start, end) times
+        self.spanD = {}
+        # each step waits (up to a timeout) for the other to have started, so that steps run concurrently overlap whatever the scheduling
+        self.dictStarted = threading.Event()
+        self.dataStarted = threading.Event()
+
+    def isMemoryProfileEnabled(self):
+        return self.memProfile
+
+    def isDictInfoStoreReusable(self):
+        return self.dictStoreReusable
+
+    def getDictInfo(self):
+        self.dictParsed = True
+        t0 = time.time()
+        self.dictStarted.set()
+        self.dataStarted.wait(self.delay * 10)
+        time.sleep(self.delay)
+        self.spanD["dict"] = (t0, time.time())
+        if self.failDict:
+            raise ValueError("bad dictionary")
+        return {"struct": {}}
+
+    def initializeDataStore(self):
+        t0 = time.time()
+        self.dataStarted.set()
+        self.dictStarted.wait(self.delay * 10)
+        time.sleep(self.delay)
+        self.spanD["data"] = (t0, time.time())
+        return "D_000000", "A title", ["PDB"]
+
+    def isOverlapped(self):
+        return self.spanD["dict"][0] < self.spanD["data"][1] and self.spanD["data"][0] < self.spanD["dict"][1]
+
+    def initializeDictInfoStore(self, p_dictInfo=None):
+        self.dictInfoReceived = p_dictInfo
+
+
+class EditorLaunchPipelineTests(unittest.TestCase):
+    def testParallel(self):
+        """Tests dictionary parse overlaps model store and result is passed on"""
+        dataIo = SlowDataIo()
+        lP = EditorLaunchPipeline(dataIo, parallel=True)
+        self.assertEqual(("D_000000", "A title", ["PDB"]), lP.run())
+        self.assertTrue(dataIo.isOverlapped())
+        self.assertEqual({"struct": {}}, dataIo.dictInfoReceived)
+        with lP.stage("render"):
+            pass
+        tD = lP.getTimings()
+        for stage in ["model_store", "dictionary_parse", "dictionary_parse_wait", "dictionary_store", "render", "total"]:
+            self.assertIn(stage, tD)
+        self.assertTrue(lP.isParallel())
+
+    def testSerialAndFailure(self):
+        """Tests serial mode and fallback when dictionary parse fails"""
+        dataIo = SlowDataIo(delay=0.0, failDict=True)
+        lP = EditorLaunchPipeline(dataIo, parallel=False)
+        lP.run()
+        self.assertIsNone(dataIo.dictInfoReceived)
+        self.assertNotIn("dictionary_parse_wait", lP.getTimings())
+
+    def testSerialWhenProfiling(self):
+        """Tests dictionary parse is not overlapped with model store while memory profiling"""
+        dataIo = SlowDataIo(memProfile=True)
+        lP = EditorLaunchPipeline(dataIo, parallel=True)
+        lP.run()
+        self.assertFalse(dataIo.isOverlapped())
+        self.assertFalse(lP.isParallel())
+        self.assertEqual({"struct": {}}, dataIo.dictInfoReceived)
+        self.assertNotIn("dictionary_parse_wait", lP.getTimings())
+
+    def testDictStoreReused(self):
+        """Tests dictionary parse skipped when dictionary store is reusable"""
+        dataIo = SlowDataIo(delay=0.0, dictStoreReusable=True)
+        lP = EditorLaunchPipeline(dataIo, parallel=True)
+        lP.run()
+        self.assertFalse(dataIo.dictParsed)
+        self.assertIsNone(dataIo.dictInfoReceived)
+        self.assertTrue(lP.isDictStoreReused())
+        self.assertNotIn("dictionary_parse", lP.getTimings())
+
+
+if __name__ == "__main__":
+    unittest.main()
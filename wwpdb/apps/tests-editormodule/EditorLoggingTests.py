@@ -0,0 +1,127 @@
+##
+# File: EditorLoggingTests.py
+# Date:  19-Oct-2026
+#
+# Updates:
+##
+"""Test cases for lazy, sampled, per-subsystem and queued logging
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "Raul Sala"
+__email__ = "rsala@rcsb.rutgers.edu"
+__license__ = "Creative Commons Attribution 3.0 Unported"
+__version__ = "V0.01"
+
+import logging
+import sys
+import unittest
+
+from wwpdb.apps.editormodule.config import EditorLogging
+from wwpdb.apps.editormodule.config.EditorAppContext import EditorAppContext
+from wwpdb.apps.editormodule.config.EditorLogging import LOG_NOW, EditorLogSampler, LazyLogArg
+
+
+class _ListHandler(logging.Handler):
+    def __init__(self):
+        logging.Handler.__init__(self)
+        self.recordL = []
+
+    def emit(self, record):
+        self.recordL.append(record)
+
+
+class EditorLoggingTests(unittest.TestCase):
+    def setUp(self):
+        self.__logger = logging.getLogger("wwpdb.apps.editormodule.io.EditorLoggingTest")
+        self.__handler = _ListHandler()
+        self.__logger.addHandler(self.__handler)
+        self.__logger.propagate = False
+        self.__logger.setLevel(logging.DEBUG)
+
+    def tearDown(self):
+        self.__logger.removeHandler(self.__handler)
+        self.__logger.propagate = True
+        self.__logger.setLevel(logging.NOTSET)
+        logging.getLogger("wwpdb.apps.editormodule.io").setLevel(logging.NOTSET)
+        logging.getLogger("mmcif_utils").setLevel(logging.NOTSET)
+
+    def testLazyArg(self):
+        """Tests log arguments are evaluated only when a record is formatted"""
+        callL = []
+        lazyArg = LazyLogArg(lambda: callL.append(1) or "value")
+        self.__logger.setLevel(logging.WARNING)
+        self.__logger.info("not logged %s", lazyArg)
+        self.assertEqual([], callL)
+        self.__logger.warning("logged %s", lazyArg)
+        self.assertEqual("logged value", self.__handler.recordL[0].getMessage())
+        self.assertEqual(1, len(callL))
+        self.assertEqual(19, len(str(LOG_NOW)))
+
+    def testSampler(self):
+        """Tests first and every Nth event per key logged, and nothing counted while the level is disabled"""
+        sampler = EditorLogSampler(self.__logger, every=10)
+        loggedL = [sampler.debug("cell", "row %d", ii) for ii in range(25)]
+        self.assertEqual([0, 9, 19], [ii for ii, bLogged in enumerate(loggedL) if bLogged])
+        self.assertTrue(sampler.debug("other", "row %d", 0))
+        self.assertEqual({"cell": 25, "other": 1}, sampler.getCounts())
+        self.assertEqual("[cell #10, 1 in 10 logged] row 9", self.__handler.recordL[1].getMessage())
+        if sys.version_info >= (3, 8):
+            self.assertEqual("testSampler", self.__handler.recordL[3].funcName)
+        #
+        self.__logger.setLevel(logging.INFO)
+        self.assertFalse(sampler.debug("cell", "row %d", 25))
+        self.assertEqual(25, sampler.getCounts()["cell"])
+        try:
+            raise ValueError("bad cell")
+        except ValueError:
+            self.assertTrue(sampler.exception("error", "failed at %d", 3))
+        self.assertIsNotNone(self.__handler.recordL[-1].exc_info)
+
+    def testSetLevels(self):
+        """Tests per-subsystem levels, logger names taken as given and invalid entries skipped"""
+        levelD = EditorLogging.setLevels("io=WARNING, mmcif_utils=error,depict=LOUD,bad")
+        self.assertEqual({"wwpdb.apps.editormodule.io": logging.WARNING, "mmcif_utils": logging.ERROR}, levelD)
+        self.assertFalse(logging.getLogger("wwpdb.apps.editormodule.io.PdbxDataIo").isEnabledFor(logging.INFO))
+        self.assertEqual({}, EditorLogging.setLevels(None))
+
+    @unittest.skipIf(sys.version_info[0] < 3, "QueueHandler requires Python 3")
+    def testQueue(self):
+        """Tests records passed through the queue to the original root handlers, restored on stop"""
+        rootLogger = logging.getLogger()
+        rootHandler = _ListHandler()
+        savedL = list(rootLogger.handlers)
+        for hndlr in savedL:
+            rootLogger.removeHandler(hndlr)
+        rootLogger.addHandler(rootHandler)
+        self.__logger.propagate = True
+        self.__logger.removeHandler(self.__handler)
+        try:
+            self.assertTrue(EditorLogging.installQueue())
+            self.assertFalse(EditorLogging.installQueue())
+            self.assertTrue(EditorLogging.isQueueInstalled())
+            self.assertNotIn(rootHandler, rootLogger.handlers)
+            self.__logger.info("queued %s", LOG_NOW)
+            self.assertTrue(EditorLogging.stopQueue())
+            self.assertFalse(EditorLogging.isQueueInstalled())
+            self.assertEqual([rootHandler], rootLogger.handlers)
+            self.assertEqual(1, len(rootHandler.recordL))
+            self.assertTrue(rootHandler.recordL[0].getMessage().startswith("queued "))
+        finally:
+            EditorLogging.stopQueue()
+            rootLogger.removeHandler(rootHandler)
+            for hndlr in savedL:
+                rootLogger.addHandler(hndlr)
+
+    def testConfigure(self):
+        """Tests site settings applied once per site"""
+        ctx = EditorAppContext.installLocal("LOGGING_TEST", "/tmp", "/tmp/local.dic", settingD={"EDITOR_LOG_LEVELS": "io=ERROR"})
+        self.assertTrue(EditorLogging.configure(ctx))
+        self.assertEqual(logging.ERROR, logging.getLogger("wwpdb.apps.editormodule.io").level)
+        logging.getLogger("wwpdb.apps.editormodule.io").setLevel(logging.NOTSET)
+        self.assertFalse(EditorLogging.configure(ctx))
+        self.assertEqual(logging.NOTSET, logging.getLogger("wwpdb.apps.editormodule.io").level)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,155 @@
+##
+# File: EditorMemoryProfileTests.py
+# Date:  19-Oct-2026
+#
+# Updates:
+#    2026-10-19    RPS    Added test of profiled launch of a synthetic entry.
+#    2026-10-19    RPS    Added tests of concurrent and nested profiled operations.
+##
+"""Test cases for memory profiling of editor operations
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "Raul Sala"
+__email__ = "rsala@rcsb.rutgers.edu"
+__license__ = "Creative Commons Attribution 3.0 Unported"
+__version__ = "V0.01"
+
+import os
+import json
+import platform
+import shutil
+import sys
+import threading
+import time
+import unittest
+
+from wwpdb.apps.editormodule.bench.SyntheticEntry import SyntheticEntryGenerator
+from wwpdb.apps.editormodule.config.EditorAppContext import EditorAppContext
+from wwpdb.apps.editormodule.io.EditorMemoryProfile import EditorMemoryProfile
+from wwpdb.apps.editormodule.io.PdbxDataIo import PdbxDataIo
+from wwpdb.apps.editormodule.webapp.EditorLaunchPipeline import EditorLaunchPipeline
+from wwpdb.apps.editormodule.webapp.WebRequest import EditorInputRequest
+
+
+@unittest.skipIf(sys.version_info[0] < 3, "tracemalloc requires Python 3")
+class EditorMemoryProfileTests(unittest.TestCase):
+    def setUp(self):
+        HERE = os.path.abspath(os.path.dirname(__file__))
+        self.__sessionPath = os.path.join(HERE, "test-output", platform.python_version(), "memprofile")
+        if os.path.exists(self.__sessionPath):
+            shutil.rmtree(self.__sessionPath)
+        os.makedirs(self.__sessionPath)
+
+    def testProfile(self):
+        """Tests traced peak, allocation sites and report file of a profiled operation"""
+        import tracemalloc  # pylint: disable=import-outside-toplevel
+
+        with EditorMemoryProfile("initializeDataStore", sessionPath=self.__sessionPath) as mP:
+            transientL = [bytearray(10000) for _ in range(200)]
+            del transientL
+            keptL = [bytearray(1024) for _ in range(100)]
+        self.assertFalse(tracemalloc.is_tracing())
+        reportD = mP.getReport()
+        self.assertGreater(reportD["traced_peak_bytes"], 2000000)
+        self.assertGreater(reportD["traced_growth_bytes"], 100 * 1024)
+        self.assertLess(reportD["traced_growth_bytes"], reportD["traced_peak_bytes"])
+        self.assertTrue([siteD for siteD in reportD["top_sites"] if "EditorMemoryProfileTests.py" in siteD["site"]])
+        fileL = [fn for fn in os.listdir(self.__sessionPath) if fn.startswith("memprofile_initializeDataStore_")]
+        self.assertEqual(1, len(fileL))
+        self.assertTrue(fileL[0].endswith("_%d.json" % os.getpid()))
+        with open(os.path.join(self.__sessionPath, fileL[0]), "r") as ifh:
+            self.assertEqual("initializeDataStore", json.load(ifh)["op"])
+        self.assertEqual(100, len(keptL))
+        #
+        self.assertGreaterEqual(EditorMemoryProfile.getStats()["initializeDataStore"]["count"], 1)
+        textL = EditorMemoryProfile.toPrometheus()
+        self.assertTrue([line for line in textL if line.startswith('editor_memory_traced_peak_bytes{op="initializeDataStore"}')])
+        self.assertTrue([line for line in textL if line.startswith("editor_process_peak_rss_bytes ")])
+
+    def testLaunch(self):
+        """Tests launch with profiling reports the dictionary parse and the model data store separately"""
+        topPath = os.path.join(self.__sessionPath, "site")
+        generator = SyntheticEntryGenerator(entities=1, authors=3, structConnRows=2, atoms=20)
+        dictPath = generator.writeDictionary(os.path.join(self.__sessionPath, "profile.dic"))
+        EditorAppContext.installLocal("EDITOR_MEMORY_PROFILE_TEST", topPath, dictPath)
+        reqObj = EditorInputRequest(
+            {
+                "TopSessionPath": [topPath],
+                "WWPDB_SITE_ID": ["EDITOR_MEMORY_PROFILE_TEST"],
+                "sessionid": ["profile_session"],
+                "datafile": ["profile-model.cif"],
+                "filesource": ["upload"],
+                "identifier": ["D_800001"],
+                "mem_profile": ["y"],
+            }
+        )
+        sessionPath = reqObj.newSessionObj().getPath()
+        generator.writeEntry(os.path.join(sessionPath, "profile-model.cif"))
+        lP = EditorLaunchPipeline(PdbxDataIo(reqObj), parallel=True)
+        lP.run()
+        self.assertFalse(lP.isParallel())
+        opL = sorted(fn.split("_")[1] for fn in os.listdir(sessionPath) if fn.startswith("memprofile_"))
+        self.assertEqual(["getDictInfo", "initializeDataStore", "initializeDictInfoStore"], opL)
+
+    def testDisabled(self):
+        """Tests nothing is traced or written when not enabled"""
+        with EditorMemoryProfile("doExport", sessionPath=self.__sessionPath, enabled=False) as mP:
+            pass
+        self.assertIsNone(mP.getReport())
+        self.assertEqual([], os.listdir(self.__sessionPath))
+
+    def testException(self):
+        """Tests tracing is stopped and failure recorded when the operation raises"""
+        import tracemalloc  # pylint: disable=import-outside-toplevel
+
+        mP = EditorMemoryProfile("doExport", sessionPath=self.__sessionPath)
+        try:
+            with mP:
+                raise ValueError("export failure")
+        except ValueError:
+            pass
+        self.assertFalse(tracemalloc.is_tracing())
+        self.assertTrue(mP.getReport()["failed"])
+
+    def testConcurrent(self):
+        """Tests operations profiled in concurrent threads each get a complete report of their own allocations"""
+        import tracemalloc  # pylint: disable=import-outside-toplevel
+
+        reportD = {}
+
+        def operation(opName, nBlocks):
+            with EditorMemoryProfile(opName) as mP:
+                transientL = [bytearray(10000) for _ in range(nBlocks)]
+                # give the other thread the chance to start (or stop) tracing meanwhile
+                time.sleep(0.05)
+                del transientL
+            reportD[opName] = mP.getReport()
+
+        threadL = [threading.Thread(target=operation, args=("doExport", 100)), threading.Thread(target=operation, args=("checkForDictViolations", 400))]
+        for th in threadL:
+            th.start()
+        for th in threadL:
+            th.join()
+        self.assertFalse(tracemalloc.is_tracing())
+        self.assertGreater(reportD["doExport"]["traced_peak_bytes"], 1000000)
+        self.assertLess(reportD["doExport"]["traced_peak_bytes"], 3000000)
+        self.assertGreater(reportD["checkForDictViolations"]["traced_peak_bytes"], 4000000)
+
+    def testNested(self):
+        """Tests an operation profiled within another is accounted to the enclosing one"""
+        import tracemalloc  # pylint: disable=import-outside-toplevel
+
+        with EditorMemoryProfile("initializeDictInfoStore") as outerP:
+            transientL = [bytearray(10000) for _ in range(200)]
+            del transientL
+            with EditorMemoryProfile("getDictInfo") as innerP:
+                pass
+            self.assertTrue(tracemalloc.is_tracing())
+        self.assertFalse(tracemalloc.is_tracing())
+        self.assertIsNone(innerP.getReport())
+        self.assertGreater(outerP.getReport()["traced_peak_bytes"], 2000000)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+##
+# File: EditorModelStagingTests.py
+# Date:  19-Oct-2026
+#
+# Updates:
+#    2026-10-19    RPS    Added tests of staging skipped for an unchanged source file and session copy.
+##
+"""Test cases for staging of model data file into session directory
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "Raul Sala"
+__email__ = "rsala@rcsb.rutgers.edu"
+__license__ = "Creative Commons Attribution 3.0 Unported"
+__version__ = "V0.01"
+
+import hashlib
+import os
+import platform
+import shutil
+import unittest
+
+from wwpdb.apps.editormodule.io.EditorFileFingerprint import EditorFileFingerprint
+from wwpdb.apps.editormodule.io.EditorModelStaging import EditorModelStaging
+
+
+class EditorModelStagingTests(unittest.TestCase):
+    def setUp(self):
+        HERE = os.path.abspath(os.path.dirname(__file__))
+        self.__testOutput = os.path.join(HERE, "test-output", platform.python_version(), "staging")
+        if os.path.exists(self.__testOutput):
+            shutil.rmtree(self.__testOutput)
+        os.makedirs(self.__testOutput)
+        self.__content = b"data_D_000000\n" + b"_struct.title 'A title'\n" * 50000
+        self.__sha1 = hashlib.sha1(self.__content).hexdigest()
+        self.__srcPath = os.path.join(self.__testOutput, "archive.cif")
+        with open(self.__srcPath, "wb") as ofh:
+            ofh.write(self.__content)
+        self.__lclPath = os.path.join(self.__testOutput, "D_000000-model.cif")
+
+    def __checkLocal(self):
+        with open(self.__lclPath, "rb") as ifh:
+            self.assertEqual(self.__content, ifh.read())
+        self.assertEqual([], [fn for fn in os.listdir(self.__testOutput) if fn.endswith(".tmp")])
+
+    def testStrategies(self):
+        """Tests each staging strategy yields session copy and content digest"""
+        for strategy in ["auto", "reflink", "hardlink", "stream", "inplace", "bogus"]:
+            # stale session file from an earlier launch is replaced, never written through
+            if os.path.lexists(self.__lclPath):
+                os.remove(self.__lclPath)
+            with open(self.__lclPath, "wb") as ofh:
+                ofh.write(b"stale")
+            parsePath, method, sha1 = EditorModelStaging(strategy=strategy).stage(self.__srcPath, self.__lclPath)
+            self.assertEqual(self.__sha1, sha1, strategy)
+            self.__checkLocal()
+            if strategy == "stream":
+                self.assertEqual("stream", method)
+            if method == "inplace":
+                self.assertEqual(self.__srcPath, parsePath)
+                self.assertTrue(os.path.islink(self.__lclPath))
+            else:
+                self.assertEqual(self.__lclPath, parsePath)
+            with open(self.__srcPath, "rb") as ifh:
+                self.assertEqual(self.__content, ifh.read())
+
+    def testDefaultCopy(self):
+        """Tests the session file is a copy of its own by default, so writes to it leave the source unchanged"""
+        parsePath, method, sha1 = EditorModelStaging().stage(self.__srcPath, self.__lclPath)
+        self.assertEqual((self.__lclPath, "stream", self.__sha1), (parsePath, method, sha1))
+        self.assertNotEqual(os.stat(self.__srcPath).st_ino, os.stat(self.__lclPath).st_ino)
+        self.assertEqual("stream", EditorModelStaging(strategy="bogus").stage(self.__srcPath, self.__lclPath)[1])
+
+    def testRecordedDigest(self):
+        """Tests linking strategies take the digest of the recorded fingerprint only while the source is unchanged"""
+        fpD = EditorFileFingerprint.make(self.__srcPath, sha1="recorded")
+        parsePath, method, sha1 = EditorModelStaging(strategy="hardlink").stage(self.__srcPath, self.__lclPath, srcFingerprint=fpD)
+        if method != "hardlink":  # pragma: no cover
+            self.skipTest("hard links not supported")
+        self.assertEqual("recorded", sha1)
+        os.utime(self.__srcPath, (fpD["mtime"] + 10, fpD["mtime"] + 10))
+        self.assertEqual(self.__sha1, EditorModelStaging(strategy="hardlink").stage(self.__srcPath, self.__lclPath, srcFingerprint=fpD)[2])
+
+    def testSamePath(self):
+        """Tests file already in session is only hashed, or not read at all while unchanged since fingerprinted"""
+        self.assertEqual((self.__srcPath, "none", self.__sha1), EditorModelStaging().stage(self.__srcPath, self.__srcPath))
+        fpD = EditorFileFingerprint.make(self.__srcPath, sha1="recorded")
+        self.assertEqual((self.__srcPath, "none", "recorded"), EditorModelStaging().stage(self.__srcPath, self.__srcPath, srcFingerprint=fpD))
+
+    def testUnchanged(self):
+        """Tests nothing is copied or read while the source file and its session copy are unchanged since staged"""
+        EditorModelStaging().stage(self.__srcPath, self.__lclPath)
+        fpD = EditorModelStaging.makeFingerprint(self.__srcPath, self.__lclPath, sha1="recorded")
+        inode = os.stat(self.__lclPath).st_ino
+        self.assertEqual((self.__lclPath, "none", "recorded"), EditorModelStaging().stage(self.__srcPath, self.__lclPath, srcFingerprint=fpD))
+        self.assertEqual(inode, os.stat(self.__lclPath).st_ino)
+        # a session copy rewritten since (or a fingerprint without it, e.g. of an exported file) is staged again
+        os.utime(self.__lclPath, (fpD["mtime"] + 10, fpD["mtime"] + 10))
+        self.assertEqual((self.__lclPath, "stream", self.__sha1), EditorModelStaging().stage(self.__srcPath, self.__lclPath, srcFingerprint=fpD))
+        fpD = EditorFileFingerprint.make(self.__srcPath, sha1="recorded")
+        self.assertEqual("stream", EditorModelStaging().stage(self.__srcPath, self.__lclPath, srcFingerprint=fpD)[1])
+        # as is a changed source file
+        fpD = EditorModelStaging.makeFingerprint(self.__srcPath, self.__lclPath, sha1="recorded")
+        os.utime(self.__srcPath, (fpD["mtime"] + 10, fpD["mtime"] + 10))
+        self.assertEqual((self.__lclPath, "stream", self.__sha1), EditorModelStaging().stage(self.__srcPath, self.__lclPath, srcFingerprint=fpD))
+        self.__checkLocal()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,151 @@
+##
+# File: EditorRequestMetricsTests.py
+# Date:  19-Oct-2026
+#
+# Updates:
+#    2026-10-19    RPS    Added test of requests on a site without top session path.
+#    2026-10-19    RPS    Added test of removal of snapshots of exited processes.
+##
+"""Test cases for per-route request metrics
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "Raul Sala"
+__email__ = "rsala@rcsb.rutgers.edu"
+__license__ = "Creative Commons Attribution 3.0 Unported"
+__version__ = "V0.01"
+
+import json
+import logging
+import os
+import platform
+import shutil
+import socket
+import subprocess
+import sys
+import time
+import unittest
+
+from wwpdb.apps.editormodule.config.EditorAppContext import EditorAppContext
+from wwpdb.apps.editormodule.webapp.EditorRequestMetrics import EditorRequestMetrics
+from wwpdb.apps.editormodule.webapp.EditorWebApp import EditorWebApp
+
+
+class _ListHandler(logging.Handler):
+    def __init__(self):
+        logging.Handler.__init__(self)
+        self.recordL = []
+
+    def emit(self, record):
+        self.recordL.append(record)
+
+
+class EditorRequestMetricsTests(unittest.TestCase):
+    def setUp(self):
+        HERE = os.path.abspath(os.path.dirname(__file__))
+        self.__metricsPath = os.path.join(HERE, "test-output", platform.python_version(), "metrics")
+        if os.path.exists(self.__metricsPath):
+            shutil.rmtree(self.__metricsPath)
+        EditorRequestMetrics.reset()
+
+    def testRecord(self):
+        """Tests latency histogram, error count and payload size per route"""
+        EditorRequestMetrics.record("/service/editor/get_dtbl_data", 0.02, payloadBytes=1000)
+        EditorRequestMetrics.record("/service/editor/get_dtbl_data", 0.3, payloadBytes=3000)
+        EditorRequestMetrics.record("/service/editor/submit_edit", 100.0, isError=True, payloadBytes=10)
+        rD = EditorRequestMetrics.getSnapshot()["routes"]["/service/editor/get_dtbl_data"]
+        self.assertEqual(2, rD["count"])
+        self.assertEqual(0, rD["errors"])
+        self.assertEqual(4000, rD["payload_bytes_sum"])
+        self.assertEqual(3000, rD["payload_bytes_max"])
+        self.assertEqual(1, rD["buckets"][EditorRequestMetrics.BUCKETS.index(0.025)])
+        self.assertEqual(1, rD["buckets"][EditorRequestMetrics.BUCKETS.index(0.5)])
+        rD = EditorRequestMetrics.getSnapshot()["routes"]["/service/editor/submit_edit"]
+        # beyond the largest bucket only counted in +Inf
+        self.assertEqual(0, sum(rD["buckets"]))
+        self.assertEqual(1, rD["errors"])
+
+    def testStreamedPayload(self):
+        """Tests streamed payload is recorded once the response has been delivered"""
+        route = "/service/editor/export_ctgry_ndjson"
+        EditorRequestMetrics.record(route, 0.01)
+        chunkL = list(EditorRequestMetrics.countingIterator(route, iter([b"abc\n", b"de\n"])))
+        self.assertEqual([b"abc\n", b"de\n"], chunkL)
+        rD = EditorRequestMetrics.getSnapshot()["routes"][route]
+        self.assertEqual(1, rD["payload_count"])
+        self.assertEqual(7, rD["payload_bytes_sum"])
+
+    def testPrometheus(self):
+        """Tests Prometheus text exposition of a snapshot"""
+        EditorRequestMetrics.record("/service/editor/undo", 0.2, payloadBytes=50)
+        text = EditorRequestMetrics.toPrometheus(EditorRequestMetrics.getSnapshot(), ["extra_metric 1"])
+        self.assertIn("# TYPE editor_request_latency_seconds histogram", text)
+        self.assertIn('editor_request_latency_seconds_bucket{route="/service/editor/undo",le="0.1"} 0', text)
+        self.assertIn('editor_request_latency_seconds_bucket{route="/service/editor/undo",le="0.25"} 1', text)
+        self.assertIn('editor_request_latency_seconds_bucket{route="/service/editor/undo",le="+Inf"} 1', text)
+        self.assertIn('editor_request_errors_total{route="/service/editor/undo"} 0', text)
+        self.assertIn('editor_response_payload_bytes_sum{route="/service/editor/undo"} 50', text)
+        self.assertTrue(text.endswith("extra_metric 1\n"))
+
+    def testStoreTrace(self):
+        """Tests store access totals per route"""
+        route = "/service/editor/submit_edit"
+        traceD = {"stores": {"data_store": {"opens": 3, "fetches": 2, "updates": 1, "bytes": 0, "secs": 0.01}}}
+        EditorRequestMetrics.recordStoreTrace(route, traceD)
+        EditorRequestMetrics.recordStoreTrace(route, {"stores": {"data_store": {"opens": 5, "fetches": 4, "updates": 1, "bytes": 0, "secs": 0.02}}})
+        EditorRequestMetrics.recordStoreTrace(route, None)
+        sD = EditorRequestMetrics.getSnapshot()["routes"][route]["stores"]["data_store"]
+        self.assertEqual(8, sD["opens"])
+        self.assertEqual(5, sD["opens_max"])
+        text = EditorRequestMetrics.toPrometheus(EditorRequestMetrics.getSnapshot())
+        self.assertIn('editor_store_ops_total{route="%s",store="data_store",kind="updates"} 2' % route, text)
+
+    def testDumpMerge(self):
+        """Tests snapshots dumped by processes are merged for host scope"""
+        EditorRequestMetrics.record("/service/editor/launch", 2.0, payloadBytes=100)
+        os.makedirs(self.__metricsPath)
+        self.assertTrue(EditorRequestMetrics.dump(EditorRequestMetrics.getDumpFilePath(self.__metricsPath)))
+        snapshot = EditorRequestMetrics.getSnapshot()
+        snapshot["pid"] = -1
+        merged = EditorRequestMetrics.mergeSnapshots(EditorRequestMetrics.loadSnapshots(self.__metricsPath) + [snapshot])
+        self.assertEqual(2, merged["processes"])
+        rD = merged["routes"]["/service/editor/launch"]
+        self.assertEqual(2, rD["count"])
+        self.assertEqual(200, rD["payload_bytes_sum"])
+        self.assertEqual(2, rD["buckets"][EditorRequestMetrics.BUCKETS.index(2.5)])
+
+    def testStaleSnapshots(self):
+        """Tests snapshots of exited processes and snapshots not renewed for long are removed on loading"""
+        EditorRequestMetrics.record("/service/editor/launch", 2.0)
+        os.makedirs(self.__metricsPath)
+        self.assertTrue(EditorRequestMetrics.dump(EditorRequestMetrics.getDumpFilePath(self.__metricsPath)))
+        proc = subprocess.Popen([sys.executable, "-c", "pass"])
+        proc.wait()
+        for pid, age in [(proc.pid, 0.0), (os.getppid(), EditorRequestMetrics.STALE_SNAPSHOT_SECS + 60.0)]:
+            snapshot = EditorRequestMetrics.getSnapshot()
+            snapshot["pid"] = pid
+            snapshot["time"] = time.time() - age
+            with open(os.path.join(self.__metricsPath, "metrics_%s_%d.json" % (socket.gethostname(), pid)), "w") as ofh:
+                json.dump(snapshot, ofh)
+        #
+        snapshotL = EditorRequestMetrics.loadSnapshots(self.__metricsPath)
+        self.assertEqual([os.getpid()], [snapshot["pid"] for snapshot in snapshotL])
+        self.assertEqual([os.path.basename(EditorRequestMetrics.getDumpFilePath(self.__metricsPath))], os.listdir(self.__metricsPath))
+        self.assertEqual(1, EditorRequestMetrics.mergeSnapshots(snapshotL)["routes"]["/service/editor/launch"]["count"])
+
+    def testNoTopSessionPath(self):
+        """Tests requests are recorded without error on a site without top session path (no snapshots written)"""
+        EditorAppContext.installLocal("EDITOR_METRICS_NO_SESSIONS", None, os.path.join(self.__metricsPath, "none.dic"))
+        handler = _ListHandler()
+        webAppLogger = logging.getLogger("wwpdb.apps.editormodule.webapp.EditorWebApp")
+        webAppLogger.addHandler(handler)
+        try:
+            EditorWebApp(parameterDict={"request_path": ["/service/editor/environment/dump"]}, siteId="EDITOR_METRICS_NO_SESSIONS").doOp()
+        finally:
+            webAppLogger.removeHandler(handler)
+        self.assertEqual([], [record.getMessage() for record in handler.recordL if record.levelno >= logging.ERROR])
+        self.assertEqual(1, EditorRequestMetrics.getSnapshot()["routes"]["/service/editor/environment/dump"]["count"])
+
+
+if __name__ == "__main__":
+    unittest.main()
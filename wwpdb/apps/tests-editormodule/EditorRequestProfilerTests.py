@@ -0,0 +1,94 @@
+##
+# File: EditorRequestProfilerTests.py
+# Date:  19-Oct-2026
+#
+# Updates:
+#    2026-10-19    RPS    Added tests of slow-request threshold setting and of profiles saved in the same second.
+##
+"""Test cases for on-demand request profiling
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "Raul Sala"
+__email__ = "rsala@rcsb.rutgers.edu"
+__license__ = "Creative Commons Attribution 3.0 Unported"
+__version__ = "V0.01"
+
+import os
+import platform
+import pstats
+import shutil
+import time
+import unittest
+
+from wwpdb.apps.editormodule.config.EditorAppContext import EditorAppContext
+from wwpdb.apps.editormodule.webapp.EditorRequestProfiler import EditorRequestProfiler
+from wwpdb.apps.editormodule.webapp.EditorWebApp import EditorWebApp
+
+
+def _slowOp(delaySecs):
+    time.sleep(delaySecs)
+    return "done"
+
+
+class EditorRequestProfilerTests(unittest.TestCase):
+    def setUp(self):
+        HERE = os.path.abspath(os.path.dirname(__file__))
+        self.__sessionPath = os.path.join(HERE, "test-output", platform.python_version(), "profiler")
+        if os.path.exists(self.__sessionPath):
+            shutil.rmtree(self.__sessionPath)
+        os.makedirs(self.__sessionPath)
+
+    def testProfile(self):
+        """Tests profile statistics are written for a requested profile"""
+        profiler = EditorRequestProfiler()
+        self.assertEqual("done", profiler.run(_slowOp, 0.01))
+        self.assertTrue(profiler.isKept())
+        filePath = profiler.save(self.__sessionPath, "_getDataTblData")
+        self.assertTrue(os.path.basename(filePath).startswith("profile_getDataTblData_"))
+        stats = pstats.Stats(filePath)
+        self.assertTrue([key for key in stats.stats if key[2] == "_slowOp"])
+
+    def testSlowThreshold(self):
+        """Tests statistics are only kept for requests over the slow-request threshold"""
+        profiler = EditorRequestProfiler(slowSecs=0.5)
+        profiler.run(_slowOp, 0.0)
+        self.assertFalse(profiler.isKept())
+        self.assertIsNone(profiler.save(self.__sessionPath, "_submitEditOp"))
+        profiler = EditorRequestProfiler(slowSecs=0.01)
+        profiler.run(_slowOp, 0.05)
+        self.assertTrue(profiler.isKept())
+        self.assertIsNotNone(profiler.save(self.__sessionPath, "_submitEditOp"))
+        self.assertEqual(1, len([fn for fn in os.listdir(self.__sessionPath) if fn.endswith(".prof")]))
+
+    def testException(self):
+        """Tests profiler is stopped when the request raises"""
+        profiler = EditorRequestProfiler()
+        self.assertRaises(ZeroDivisionError, profiler.run, lambda: 1 / 0)
+        self.assertIsNotNone(profiler.getElapsedSecs())
+        # a new profile can be started in this thread
+        self.assertEqual("done", EditorRequestProfiler().run(_slowOp, 0.0))
+
+    def testSameSecond(self):
+        """Tests profiles of the same operation saved within one second are all kept"""
+        pathL = []
+        for _ in range(3):
+            profiler = EditorRequestProfiler()
+            profiler.run(_slowOp, 0.0)
+            pathL.append(profiler.save(self.__sessionPath, "_submitEditOp"))
+        self.assertEqual(3, len(set(pathL)))
+        self.assertEqual(3, len([fn for fn in os.listdir(self.__sessionPath) if fn.endswith(".prof")]))
+
+    def testSlowSecsSetting(self):
+        """Tests a malformed slow-request threshold setting disables slow mode without failing requests"""
+        self.assertEqual(2.5, EditorRequestProfiler.parseSlowSecs("2.5"))
+        self.assertIsNone(EditorRequestProfiler.parseSlowSecs(None))
+        self.assertIsNone(EditorRequestProfiler.parseSlowSecs("2.5s"))
+        EditorAppContext.installLocal("EDITOR_PROFILE_BAD_SLOW", self.__sessionPath, os.path.join(self.__sessionPath, "none.dic"), settingD={"EDITOR_PROFILE_SLOW_SECONDS": "2.5s"})
+        for _ in range(2):
+            rD = EditorWebApp(parameterDict={"request_path": ["/service/editor/environment/dump"]}, siteId="EDITOR_PROFILE_BAD_SLOW").doOp()
+            self.assertIn("WebRequest.dump()", rD["RETURN_STRING"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,124 @@
+##
+# File: EditorRequestReplayTests.py
+# Date:  19-Oct-2026
+#
+# Updates:
+#    2026-10-19    RPS    Added test of replay with a request missing from the replay log.
+##
+"""Test cases for request recording and offline replay of editor sessions
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "Raul Sala"
+__email__ = "rsala@rcsb.rutgers.edu"
+__license__ = "Creative Commons Attribution 3.0 Unported"
+__version__ = "V0.01"
+
+import io
+import os
+import platform
+import shutil
+import unittest
+
+from wwpdb.apps.editormodule.config.EditorAppContext import EditorAppContext
+from wwpdb.apps.editormodule.webapp.EditorWebApp import EditorWebApp
+from wwpdb.apps.editormodule.webapp.EditorRequestRecorder import EditorRequestRecorder
+from wwpdb.apps.editormodule.bench.EditorRequestReplay import EditorRequestReplay
+
+
+class _Upload(object):
+    def __init__(self, filename, content):
+        self.filename = filename
+        self.file = io.BytesIO(content)
+
+
+class _LossyReplay(EditorRequestReplay):
+    """Replay whose first request is lost before it is handled (and so logged)"""
+
+    def __init__(self, *args, **kwargs):
+        super(_LossyReplay, self).__init__(*args, **kwargs)
+        self.__count = 0
+
+    def _EditorRequestReplay__doRequest(self, parameterDict):
+        self.__count += 1
+        if self.__count > 1:
+            super(_LossyReplay, self)._EditorRequestReplay__doRequest(parameterDict)
+
+
+class EditorRequestReplayTests(unittest.TestCase):
+    def setUp(self):
+        HERE = os.path.abspath(os.path.dirname(__file__))
+        self.__topPath = os.path.join(HERE, "test-output", platform.python_version(), "requestreplay")
+        if os.path.exists(self.__topPath):
+            shutil.rmtree(self.__topPath)
+        os.makedirs(os.path.join(self.__topPath, "sessions"))
+        self.__siteId = "EDITOR_REPLAY_TEST"
+        EditorAppContext.installLocal(self.__siteId, self.__topPath, os.path.join(self.__topPath, "none.dic"))
+
+    def __doOp(self, requestPath, sessionId, **paramD):
+        parameterDict = {"request_path": [requestPath], "sessionid": [sessionId], "record_requests": ["y"]}
+        for name, value in paramD.items():
+            parameterDict[name] = [value]
+        return EditorWebApp(parameterDict=parameterDict, siteId=self.__siteId).doOp()
+
+    def testRecord(self):
+        """Tests requests are logged with their parameters, uploads being replaced by their file name"""
+        self.__doOp("/service/editor/environment/dump", "rec_1", cifinput=_Upload("C:\\data\\D_800001_model.cif", b"data_x\n"))
+        self.__doOp("/service/editor/no_such_op", "rec_1")
+        EditorWebApp(parameterDict={"request_path": ["/service/editor/environment/dump"], "sessionid": ["rec_1"]}, siteId=self.__siteId).doOp()
+        #
+        recL = EditorRequestRecorder.readLog(os.path.join(self.__topPath, "sessions", "rec_1"))
+        self.assertEqual(2, len(recL))
+        self.assertEqual("/service/editor/environment/dump", recL[0]["route"])
+        self.assertFalse(recL[0]["error"])
+        self.assertEqual("rec_1", recL[0]["sessionid"])
+        self.assertEqual([{"__upload__": "D_800001_model.cif"}], recL[0]["params"]["cifinput"])
+        self.assertNotIn("TopSessionPath", recL[0]["params"])
+        self.assertEqual("unknown", recL[1]["route"])
+        self.assertTrue(recL[1]["error"])
+
+    def testReplay(self):
+        """Tests recorded sessions are replayed in order on new sessions, with uploads supplied again"""
+        uploadPath = os.path.join(self.__topPath, "uploads")
+        os.makedirs(uploadPath)
+        with open(os.path.join(uploadPath, "model.cif"), "w") as ofh:
+            ofh.write("data_x\n")
+        self.__doOp("/service/editor/environment/dump", "rec_1", cifinput=_Upload("model.cif", b"data_x\n"))
+        self.__doOp("/service/editor/environment/dump", "rec_2")
+        self.__doOp("/service/editor/metrics", "rec_1", format="json")
+        self.__doOp("/service/editor/no_such_op", "rec_2")
+        #
+        sessionsPath = os.path.join(self.__topPath, "sessions")
+        logPathL = [os.path.join(sessionsPath, "rec_1"), os.path.join(sessionsPath, "rec_2", EditorRequestRecorder.LOG_FILE_NAME)]
+        replay = EditorRequestReplay(logPathL, self.__siteId, uploadPath=uploadPath)
+        self.assertEqual(4, replay.getRequestCount())
+        rD = replay.run()
+        self.assertEqual(2, rD["sessions"])
+        self.assertEqual(4, rD["requests"])
+        self.assertEqual(1, rD["errors"])
+        self.assertEqual([], rD["mismatches"])
+        self.assertEqual(2, rD["routes"]["/service/editor/environment/dump"]["replay"]["runs"])
+        self.assertEqual(1, rD["routes"]["unknown"]["recorded"]["runs"])
+        #
+        replayL = [sessionId for sessionId in os.listdir(sessionsPath) if sessionId.startswith("rec_1_replay_")]
+        self.assertEqual(1, len(replayL))
+        recL = EditorRequestRecorder.readLog(os.path.join(sessionsPath, replayL[0]))
+        self.assertEqual(["/service/editor/environment/dump", "/service/editor/metrics"], [recD["route"] for recD in recL])
+        self.assertEqual([{"__upload__": "model.cif"}], recL[0]["params"]["cifinput"])
+
+    def testReplayUnlogged(self):
+        """Tests a request missing from the replay log does not shift the records of later requests"""
+        self.__doOp("/service/editor/environment/dump", "rec_1")
+        self.__doOp("/service/editor/no_such_op", "rec_1")
+        self.__doOp("/service/editor/environment/dump", "rec_1")
+        #
+        rD = _LossyReplay([os.path.join(self.__topPath, "sessions", "rec_1")], self.__siteId).run()
+        self.assertEqual(3, rD["requests"])
+        self.assertEqual(1, rD["unlogged"])
+        self.assertEqual(1, rD["errors"])
+        self.assertEqual([], rD["mismatches"])
+        self.assertEqual(1, rD["routes"]["/service/editor/environment/dump"]["replay"]["runs"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,155 @@
+##
+# File: EditorSessionLockTests.py
+# Date:  19-Oct-2026
+#
+# Updates:
+##
+"""Test cases for per-session reader-writer lock, including concurrent edits on one session
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "Raul Sala"
+__email__ = "rsala@rcsb.rutgers.edu"
+__license__ = "Creative Commons Attribution 3.0 Unported"
+__version__ = "V0.01"
+
+import os
+import json
+import platform
+import shutil
+import threading
+import time
+import multiprocessing
+import unittest
+
+from wwpdb.apps.editormodule.io.EditorSessionLock import EditorSessionLock
+
+
+def _editCounter(sessionPath, nEdits):
+    """Read-modify-write of a counter in the session directory, as done for a category by an edit request"""
+    fPath = os.path.join(sessionPath, "counter.json")
+    for _ in range(nEdits):
+        with EditorSessionLock(sessionPath).write("_submitEditOp"):
+            with open(fPath, "r") as ifh:
+                value = json.load(ifh)["value"]
+            # widen the window in which an unserialized edit would be lost
+            time.sleep(0.001)
+            with open(fPath, "w") as ofh:
+                json.dump({"value": value + 1}, ofh)
+
+
+@unittest.skipIf(not hasattr(os, "fork"), "flock based locking requires a POSIX platform")
+class EditorSessionLockTests(unittest.TestCase):
+    def setUp(self):
+        HERE = os.path.abspath(os.path.dirname(__file__))
+        self.__sessionPath = os.path.join(HERE, "test-output", platform.python_version(), "sessionlock")
+        if os.path.exists(self.__sessionPath):
+            shutil.rmtree(self.__sessionPath)
+        os.makedirs(self.__sessionPath)
+        with open(os.path.join(self.__sessionPath, "counter.json"), "w") as ofh:
+            json.dump({"value": 0}, ofh)
+        EditorSessionLock.resetStats()
+
+    def __getCounter(self):
+        with open(os.path.join(self.__sessionPath, "counter.json"), "r") as ifh:
+            return json.load(ifh)["value"]
+
+    def testConcurrentEditsThreads(self):
+        """Tests concurrent edits from many threads on one session are all applied"""
+        threadL = [threading.Thread(target=_editCounter, args=(self.__sessionPath, 20)) for _ in range(8)]
+        for th in threadL:
+            th.start()
+        for th in threadL:
+            th.join()
+        self.assertEqual(160, self.__getCounter())
+        sD = EditorSessionLock.getStats()["write"]
+        self.assertEqual(160, sD["acquired"])
+        self.assertGreater(sD["contended"], 0)
+        self.assertGreater(sD["queued_max"], 0)
+
+    def testConcurrentEditsProcesses(self):
+        """Tests concurrent edits from several worker processes on one session are all applied"""
+        procL = [multiprocessing.Process(target=_editCounter, args=(self.__sessionPath, 20)) for _ in range(4)]
+        for proc in procL:
+            proc.start()
+        _editCounter(self.__sessionPath, 20)
+        for proc in procL:
+            proc.join()
+        self.assertEqual(100, self.__getCounter())
+
+    def testReadersConcurrent(self):
+        """Tests readers hold the lock together and exclude a writer"""
+        barrier = threading.Barrier(3) if hasattr(threading, "Barrier") else None
+        if barrier is None:
+            self.skipTest("threading.Barrier not available")
+        writerDone = []
+
+        def reader():
+            with EditorSessionLock(self.__sessionPath).read("_getJmolSetup"):
+                # all readers must be inside the lock together to pass the barrier
+                barrier.wait(timeout=5)
+                time.sleep(0.05)
+                self.assertEqual([], writerDone)
+
+        def writer():
+            with EditorSessionLock(self.__sessionPath).write("_submitEditOp"):
+                writerDone.append(True)
+
+        threadL = [threading.Thread(target=reader) for _ in range(3)]
+        for th in threadL:
+            th.start()
+        time.sleep(0.01)
+        wTh = threading.Thread(target=writer)
+        wTh.start()
+        for th in threadL + [wTh]:
+            th.join()
+        self.assertEqual([True], writerDone)
+
+    def testFairOrdering(self):
+        """Tests waiters are admitted in arrival order - a writer is not overtaken by later readers"""
+        orderL = []
+        holder = EditorSessionLock(self.__sessionPath)
+        holder.acquire(write=True, opName="_launchOp")
+
+        def waiter(name, write):
+            sLock = EditorSessionLock(self.__sessionPath)
+            sLock.acquire(write=write, opName=name)
+            orderL.append(name)
+            time.sleep(0.02)
+            sLock.release()
+
+        threadL = []
+        for name, write in [("w1", True), ("r1", False), ("w2", True), ("r2", False)]:
+            th = threading.Thread(target=waiter, args=(name, write))
+            th.start()
+            threadL.append(th)
+            time.sleep(0.02)
+        holder.release()
+        for th in threadL:
+            th.join()
+        self.assertEqual(["w1", "r1", "w2", "r2"], orderL)
+
+    def testIterHolding(self):
+        """Tests lock handed to an iterator is held until the iterator is exhausted or closed"""
+        for consume in [list, lambda it: it.close()]:
+            sLock = EditorSessionLock(self.__sessionPath)
+            sLock.acquire(write=False, opName="_exportCategoryNdjsonOp")
+            lineIter = sLock.iterHolding(iter(["a\n", "b\n"]))
+            wTh = threading.Thread(target=_editCounter, args=(self.__sessionPath, 1))
+            wTh.start()
+            wTh.join(0.2)
+            self.assertTrue(wTh.is_alive())
+            consume(lineIter)
+            wTh.join(5)
+            self.assertFalse(wTh.is_alive())
+        self.assertEqual(2, self.__getCounter())
+
+    def testNoSession(self):
+        """Tests lock is a no-op for requests without a session"""
+        with EditorSessionLock(None).write("_launchOp"):
+            pass
+        self.assertEqual({}, EditorSessionLock.getStats())
+
+
+if __name__ == "__main__":
+    unittest.main()
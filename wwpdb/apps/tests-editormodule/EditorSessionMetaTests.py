@@ -0,0 +1,51 @@
+##
+# File: EditorSessionMetaTests.py
+# Date:  19-Oct-2026
+#
+# Updates:
+##
+"""Test cases for session metadata file
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "Raul Sala"
+__email__ = "rsala@rcsb.rutgers.edu"
+__license__ = "Creative Commons Attribution 3.0 Unported"
+__version__ = "V0.01"
+
+import os
+import platform
+import shutil
+import unittest
+
+from wwpdb.apps.editormodule.io.EditorSessionMeta import EditorSessionMeta
+
+
+class EditorSessionMetaTests(unittest.TestCase):
+    def setUp(self):
+        HERE = os.path.abspath(os.path.dirname(__file__))
+        self.__sessionPath = os.path.join(HERE, "test-output", platform.python_version(), "sessionmeta")
+        if os.path.exists(self.__sessionPath):
+            shutil.rmtree(self.__sessionPath)
+        os.makedirs(self.__sessionPath)
+
+    def testRoundTrip(self):
+        """Tests metadata set/store/load"""
+        sM = EditorSessionMeta(self.__sessionPath)
+        self.assertFalse(sM.load())
+        self.assertIsNone(sM.get("ctgry_set_hash"))
+        sM.set("ctgry_set_hash", "abc")
+        sM.update({"nav_bar": {"key": "AV1", "markup": "<li/>"}})
+        self.assertTrue(sM.store())
+
+        sM2 = EditorSessionMeta(self.__sessionPath)
+        self.assertEqual("abc", sM2.get("ctgry_set_hash"))
+        self.assertEqual("<li/>", sM2.get("nav_bar")["markup"])
+        sM2.remove("nav_bar")
+        sM2.store()
+        self.assertIsNone(EditorSessionMeta(self.__sessionPath).get("nav_bar", None))
+        self.assertEqual(os.path.join(self.__sessionPath, "sessionMeta.json"), sM2.getFilePath())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+##
+# File: EditorStatusTests.py
+# Date:  19-Oct-2026
+#
+# Updates:
+##
+"""Test cases for the health and cache status endpoint
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "Raul Sala"
+__email__ = "rsala@rcsb.rutgers.edu"
+__license__ = "Creative Commons Attribution 3.0 Unported"
+__version__ = "V0.01"
+
+import json
+import os
+import platform
+import shutil
+import unittest
+
+from wwpdb.apps.editormodule.config.EditorAppContext import EditorAppContext
+from wwpdb.apps.editormodule.webapp.EditorWebApp import EditorWebApp
+from wwpdb.apps.editormodule.webapp.EditorStatus import EditorStatus, getHitRate
+
+
+class EditorStatusTests(unittest.TestCase):
+    def setUp(self):
+        HERE = os.path.abspath(os.path.dirname(__file__))
+        self.__topPath = os.path.join(HERE, "test-output", platform.python_version(), "status")
+        if os.path.exists(self.__topPath):
+            shutil.rmtree(self.__topPath)
+        self.__siteId = "EDITOR_STATUS_TEST"
+        EditorAppContext.installLocal(self.__siteId, self.__topPath, os.path.join(self.__topPath, "none.dic"), settingD={"EDITOR_STATUS_TTL_SECONDS": "60"})
+        self.__makeSession("sess_1", dataBytes=1000, snapShots=2)
+        self.__makeSession("sess_2", dataBytes=300, snapShots=0)
+
+    def __makeSession(self, sessionId, dataBytes, snapShots):
+        sessionPath = os.path.join(self.__topPath, "sessions", sessionId)
+        os.makedirs(os.path.join(sessionPath, "snapshots"))
+        for fn, size in [("dataFile.db.dat", dataBytes), ("dataFile.db.dir", 10), ("mmcifDict.db", 200), ("enumRegistry.json", 20), ("other.log", 5000)]:
+            with open(os.path.join(sessionPath, fn), "wb") as ofh:
+                ofh.write(b"x" * size)
+        for ii in range(snapShots):
+            for ext in [".db.dat", ".db.dir"]:
+                with open(os.path.join(sessionPath, "snapshots", "dataFileSnapShot_%d%s" % (ii, ext)), "wb") as ofh:
+                    ofh.write(b"x" * 50)
+
+    def __getStatus(self, scope):
+        parameterDict = {"request_path": ["/service/editor/status"], "scope": [scope]}
+        rD = EditorWebApp(parameterDict=parameterDict, siteId=self.__siteId).doOp()
+        self.assertEqual("application/json", rD["CONTENT_TYPE"])
+        return json.loads(rD["RETURN_STRING"])["status"]
+
+    def testSessionUsage(self):
+        """Tests store and snapshot disk usage of a session directory"""
+        uD = EditorStatus.getSessionUsage(os.path.join(self.__topPath, "sessions", "sess_1"))
+        self.assertEqual(1010, uD["data_store_bytes"])
+        self.assertEqual(220, uD["dict_store_bytes"])
+        self.assertEqual(2, uD["snapshots"])
+        self.assertEqual(200, uD["snapshot_bytes"])
+        self.assertIsNotNone(uD["updated_secs_ago"])
+        self.assertIsNone(EditorStatus.getSessionUsage(os.path.join(self.__topPath, "sessions", "none")))
+
+    def testStatus(self):
+        """Tests status sections and session totals, with disk usage reused within the TTL"""
+        sD = self.__getStatus("host")
+        self.assertEqual(self.__siteId, sD["site_id"])
+        self.assertFalse(sD["dictionary"]["files"]["pdbx_dict"]["available"])
+        for name in ["templates", "data_stores", "enum_registries", "enum_prefix_indexes"]:
+            self.assertIn("hit_rate", sD["caches"][name])
+        tD = sD["sessions"]
+        self.assertEqual("host", tD["scope"])
+        self.assertEqual(2, tD["count"])
+        self.assertEqual(1320, tD["data_store_bytes"])
+        self.assertEqual(440, tD["dict_store_bytes"])
+        self.assertEqual(2, tD["snapshots"])
+        self.assertEqual(["sess_1", "sess_2"], sorted(uD["session_id"] for uD in tD["listed"]))
+        self.assertIsInstance(sD["jobs"]["session_locks"], dict)
+        #
+        self.__makeSession("sess_3", dataBytes=10, snapShots=1)
+        sD = self.__getStatus("host")
+        self.assertEqual(2, sD["sessions"]["count"])
+        self.assertGreater(sD["disk_usage_age_secs"], 0.0)
+        # process scope covers only the sessions served by this process
+        self.assertEqual("process", self.__getStatus("bad")["sessions"]["scope"])
+
+    def testHitRate(self):
+        """Tests hit rate of cache counters"""
+        self.assertEqual(0.75, getHitRate({"hits": 3, "misses": 1})["hit_rate"])
+        self.assertIsNone(getHitRate({"hits": 0, "misses": 0})["hit_rate"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+##
+# File: EditorStoreCacheTests.py
+# Date:  19-Oct-2026
+#
+# Updates:
+##
+"""Test cases for host-level data store cache
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "Raul Sala"
+__email__ = "rsala@rcsb.rutgers.edu"
+__license__ = "Creative Commons Attribution 3.0 Unported"
+__version__ = "V0.01"
+
+import os
+import platform
+import shutil
+import time
+import unittest
+
+from wwpdb.apps.editormodule.io.EditorStoreCache import EditorStoreCache
+
+
+class EditorStoreCacheTests(unittest.TestCase):
+    def setUp(self):
+        HERE = os.path.abspath(os.path.dirname(__file__))
+        self.__testOutput = os.path.join(HERE, "test-output", platform.python_version(), "storecache")
+        if os.path.exists(self.__testOutput):
+            shutil.rmtree(self.__testOutput)
+        os.makedirs(self.__testOutput)
+        self.__cachePath = os.path.join(self.__testOutput, "cache")
+
+    def __makeStore(self, name, content):
+        fPath = os.path.join(self.__testOutput, name)
+        with open(fPath, "wb") as ofh:
+            ofh.write(content)
+        return fPath
+
+    def testStoreFetch(self):
+        """Tests entries are cloned in and out, and clones are independent of the cache"""
+        sC = EditorStoreCache(self.__cachePath)
+        dbFilePath = self.__makeStore("dataFile.db", b"persisted store")
+        self.assertIsNone(sC.fetch("abc", dbFilePath))
+        self.assertTrue(sC.store("abc", dbFilePath, {"ctgry_set_hash": "h1"}))
+
+        # session edits its own store after it was cached
+        with open(dbFilePath, "ab") as ofh:
+            ofh.write(b" edited")
+        otherDbFilePath = os.path.join(self.__testOutput, "other.db")
+        self.assertEqual({"ctgry_set_hash": "h1"}, sC.fetch("abc", otherDbFilePath))
+        with open(otherDbFilePath, "rb") as ifh:
+            self.assertEqual(b"persisted store", ifh.read())
+        self.assertEqual([], [fn for fn in os.listdir(self.__cachePath) if fn.endswith(".tmp")])
+
+    def testPrune(self):
+        """Tests least recently used entries are pruned"""
+        sC = EditorStoreCache(self.__cachePath, maxEntries=2)
+        dbFilePath = self.__makeStore("dataFile.db", b"persisted store")
+        for key in ["k1", "k2"]:
+            sC.store(key, dbFilePath, {})
+            time.sleep(0.02)
+        # k1 becomes most recently used
+        sC.fetch("k1", os.path.join(self.__testOutput, "clone.db"))
+        time.sleep(0.02)
+        sC.store("k3", dbFilePath, {})
+        self.assertIsNotNone(sC.fetch("k1", os.path.join(self.__testOutput, "clone.db")))
+        self.assertIsNone(sC.fetch("k2", os.path.join(self.__testOutput, "clone.db")))
+        self.assertEqual(4, len(os.listdir(self.__cachePath)))
+
+    def testCloneFile(self):
+        """Tests clone falls back to copy"""
+        srcPath = self.__makeStore("src.db", b"x" * 10000)
+        dstPath = os.path.join(self.__testOutput, "dst.db")
+        self.assertIn(EditorStoreCache.cloneFile(srcPath, dstPath), ["reflink", "copy"])
+        self.assertEqual(10000, os.path.getsize(dstPath))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+##
+# File: EditorStoreTraceTests.py
+# Date:  19-Oct-2026
+#
+# Updates:
+##
+"""Test cases for per-request store access tracing
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "Raul Sala"
+__email__ = "rsala@rcsb.rutgers.edu"
+__license__ = "Creative Commons Attribution 3.0 Unported"
+__version__ = "V0.01"
+
+import threading
+import unittest
+
+from wwpdb.apps.editormodule.io.EditorStoreTrace import EditorStoreTrace, tracedClass
+
+
+class _Store(object):
+    """Minimal store with the access methods of PdbxPersist"""
+
+    def __init__(self):
+        self.objD = {}
+
+    def fetchOneObject(self, dbFileName, containerName, objectName):  # pylint: disable=unused-argument
+        return self.objD.get(objectName)
+
+    def updateOneObject(self, obj, dbFileName, containerName):  # pylint: disable=unused-argument
+        self.objD[obj[0]] = obj
+        return True
+
+    def getIndex(self, dbFileName):  # pylint: disable=unused-argument
+        return {"__containers__": [["D_1", "data"]]}
+
+    def getContainerList(self):
+        return []
+
+
+TracedStore = tracedClass(_Store, "data_store")
+
+
+class EditorStoreTraceTests(unittest.TestCase):
+    def tearDown(self):
+        EditorStoreTrace.end()
+
+    def testTrace(self):
+        """Tests opens, fetches and updates are counted and repeated fetches reported"""
+        EditorStoreTrace.begin()
+        store = TracedStore()
+        store.getIndex(dbFileName="dataFile.db")
+        store.updateOneObject(("struct", "title"), "dataFile.db", "D_1")
+        self.assertEqual(("struct", "title"), store.fetchOneObject("dataFile.db", "D_1", "struct"))
+        store.fetchOneObject("dataFile.db", "D_1", "struct")
+        store.fetchOneObject("dataFile.db", "D_1", "citation")
+        store.getContainerList()
+        traceD = EditorStoreTrace.end()
+        sD = traceD["stores"]["data_store"]
+        self.assertEqual(5, traceD["opens"])
+        self.assertEqual(4, sD["fetches"])
+        self.assertEqual(1, sD["updates"])
+        self.assertEqual(0, sD["bytes"])
+        self.assertEqual({"getIndex": 1, "updateOneObject": 1, "fetchOneObject": 3}, sD["calls"])
+        self.assertEqual({"data_store:fetchOneObject:dataFile.db:D_1:struct": 2}, traceD["repeated_fetches"])
+        self.assertEqual("Traced_Store", TracedStore.__name__)
+
+    def testDetail(self):
+        """Tests estimate of bytes unpickled when detail is requested"""
+        EditorStoreTrace.begin(detail=True)
+        store = TracedStore()
+        store.updateOneObject(("struct", "x" * 1000), "dataFile.db", "D_1")
+        store.fetchOneObject("dataFile.db", "D_1", "struct")
+        self.assertGreater(EditorStoreTrace.end()["stores"]["data_store"]["bytes"], 1000)
+
+    def testNoTrace(self):
+        """Tests store access outside a trace and in other threads is not recorded"""
+        store = TracedStore()
+        self.assertIsNone(store.fetchOneObject("dataFile.db", "D_1", "struct"))
+        self.assertIsNone(EditorStoreTrace.end())
+        #
+        EditorStoreTrace.begin()
+        thread = threading.Thread(target=store.getIndex, args=("dataFile.db",))
+        thread.start()
+        thread.join()
+        self.assertEqual(0, EditorStoreTrace.end()["opens"])
+        # unless the thread adopts the trace
+        EditorStoreTrace.begin()
+        trace = EditorStoreTrace.current()
+
+        def adopt():
+            EditorStoreTrace.attach(trace)
+            store.getIndex("dataFile.db")
+
+        thread = threading.Thread(target=adopt)
+        thread.start()
+        thread.join()
+        self.assertEqual(1, EditorStoreTrace.end()["opens"])
+
+
+if __name__ == "__main__":
+    unittest.main()
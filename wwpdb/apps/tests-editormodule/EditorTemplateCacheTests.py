@@ -0,0 +1,61 @@
+##
+# File: EditorTemplateCacheTests.py
+# Date:  19-Oct-2026
+#
+# Updates:
+##
+"""Test cases for template cache
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "Raul Sala"
+__email__ = "rsala@rcsb.rutgers.edu"
+__license__ = "Creative Commons Attribution 3.0 Unported"
+__version__ = "V0.01"
+
+import os
+import platform
+import re
+import time
+import unittest
+
+from wwpdb.apps.editormodule.depict.EditorTemplateCache import EditorTemplateCache
+
+
+class EditorTemplateCacheTests(unittest.TestCase):
+    def setUp(self):
+        HERE = os.path.abspath(os.path.dirname(__file__))
+        self.__tmpltPath = os.path.join(HERE, "..", "editormodule", "templates")
+        self.__testOutput = os.path.join(HERE, "test-output", platform.python_version())
+        if not os.path.exists(self.__testOutput):  # pragma: no cover
+            os.makedirs(self.__testOutput)
+
+    def testTemplatesMatchPercentSubstitution(self):
+        """Tests compiled rendering gives same result as "%" substitution for packaged templates"""
+        for fn in ["editor_launch_tmplt.html", "editor_jmol_tmplt.html", "editor_launch_tmplt_config.html"]:
+            fPath = os.path.join(self.__tmpltPath, fn)
+            with open(fPath, "r") as ifh:
+                text = ifh.read()
+            myD = dict((key, "<%s>" % key) for key in re.findall(r"%\((\w+)\)s", text))
+            self.assertEqual(text % myD, EditorTemplateCache.render(fPath, myD), fn)
+            self.assertEqual(text % myD, EditorTemplateCache.render(fPath, myD, compiled=False), fn)
+
+    def testReloadOnChange(self):
+        """Tests template re-read when modified and fallback for other conversions"""
+        fPath = os.path.join(self.__testOutput, "tmplt_cache_test.html")
+        with open(fPath, "w") as ofh:
+            ofh.write("<p>%(a)s 100%%</p>")
+        self.assertEqual("<p>1 100%</p>", EditorTemplateCache.render(fPath, {"a": 1}))
+        hits = EditorTemplateCache.getStats()["hits"]
+        self.assertEqual("<p>2 100%</p>", EditorTemplateCache.render(fPath, {"a": 2}))
+        self.assertEqual(hits + 1, EditorTemplateCache.getStats()["hits"])
+
+        time.sleep(0.01)
+        with open(fPath, "w") as ofh:
+            ofh.write("<p>%(a)d of %(b)s</p>")
+        self.assertEqual("<p>3 of x</p>", EditorTemplateCache.render(fPath, {"a": 3, "b": "x"}))
+        self.assertRaises(KeyError, EditorTemplateCache.render, fPath, {"a": 3})
+
+
+if __name__ == "__main__":
+    unittest.main()
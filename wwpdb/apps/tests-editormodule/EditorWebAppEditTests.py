@@ -0,0 +1,130 @@
+##
+# File: EditorWebAppEditTests.py
+# Date:  19-Oct-2026
+#
+# Updates:
+#    2026-10-19    RPS    Test session launched with SyntheticEntryGenerator.launchSession().
+##
+"""Test cases for edit requests through EditorWebApp on a launched session of a small synthetic entry
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "Raul Sala"
+__email__ = "rsala@rcsb.rutgers.edu"
+__license__ = "Creative Commons Attribution 3.0 Unported"
+__version__ = "V0.01"
+
+import json
+import os
+import platform
+import shutil
+import threading
+import unittest
+
+from wwpdb.apps.editormodule.bench.SyntheticEntry import SyntheticEntryGenerator
+from wwpdb.apps.editormodule.io.PdbxDataIo import PdbxDataIo
+from wwpdb.apps.editormodule.webapp.EditorWebApp import EditorWebApp
+
+
+@unittest.skipIf(not hasattr(os, "fork"), "flock based locking requires a POSIX platform")
+class EditorWebAppEditTests(unittest.TestCase):
+    SITE_ID = "EDITOR_WEBAPP_EDIT_TEST"
+    SESSION_ID = "edit_session"
+    AUTHORS = 12
+
+    def setUp(self):
+        HERE = os.path.abspath(os.path.dirname(__file__))
+        self.__topPath = os.path.join(HERE, "test-output", platform.python_version(), "webappedit")
+        if os.path.exists(self.__topPath):
+            shutil.rmtree(self.__topPath)
+        os.makedirs(os.path.join(self.__topPath, "sessions"))
+        generator = SyntheticEntryGenerator(entities=1, authors=self.AUTHORS, structConnRows=2, atoms=20)
+        self.__reqObj = generator.launchSession(self.__topPath, self.SITE_ID, self.SESSION_ID, "edit-model.cif")
+        _bOk, self.__colList = PdbxDataIo(self.__reqObj).getCategoryColList("audit_author")
+
+    def __doRequest(self, requestPath, **kw):
+        parameterDict = {"request_path": [requestPath], "sessionid": [self.SESSION_ID]}
+        for ky, val in kw.items():
+            parameterDict[ky] = [str(val)]
+        return EditorWebApp(parameterDict=parameterDict, siteId=self.SITE_ID).doOp()
+
+    def __submitEdit(self, rowIdx, newValue, editActnIndx=0, **kw):
+        return self.__doRequest(
+            "/service/editor/submit_edit",
+            cifctgry="audit_author",
+            row_idx="row_%d" % rowIdx,
+            col_idx=self.__colList.index("name"),
+            new_value=newValue,
+            edit_actn_indx=editActnIndx,
+            **kw
+        )
+
+    def __getNames(self):
+        rowList, _iTotal, _iDisplay = PdbxDataIo(self.__reqObj).getCategoryRowList("audit_author", 0, self.AUTHORS, "", {})
+        # each row is {row index in the store: record}
+        return [rcrd[self.__colList.index("name")] for rowD in rowList for rcrd in rowD.values()]
+
+    def testConcurrentEdits(self):
+        """Tests concurrent edits of one category from many threads are all applied"""
+        errorL = []
+
+        def editor(rowL):
+            for rowIdx in rowL:
+                rD = self.__submitEdit(rowIdx, "Edited, A.%d" % rowIdx)
+                if "Edited, A.%d" % rowIdx not in rD["RETURN_STRING"]:
+                    errorL.append(rD)
+
+        threadL = [threading.Thread(target=editor, args=(range(ii, self.AUTHORS, 4),)) for ii in range(4)]
+        for th in threadL:
+            th.start()
+        for th in threadL:
+            th.join()
+        self.assertEqual([], errorL)
+        self.assertEqual(["Edited, A.%d" % ii for ii in range(self.AUTHORS)], self.__getNames())
+
+    def testVersionedEdits(self):
+        """Tests consecutive edits each carrying the category version returned by the previous one"""
+        version = PdbxDataIo(self.__reqObj).getCategoryVersion("audit_author")
+        for ii in range(2):
+            rD = self.__submitEdit(ii, "Versioned, A.%d" % ii, editActnIndx=ii, ctgry_version=version)
+            self.assertEqual("application/json", rD["CONTENT_TYPE"])
+            rtrnD = json.loads(rD["RETURN_STRING"])
+            self.assertEqual(("OK", "Versioned, A.%d" % ii), (rtrnD["status"], rtrnD["value"]))
+            self.assertGreater(rtrnD["ctgry_version"], version)
+            version = rtrnD["ctgry_version"]
+        # an edit at a superseded version is rejected, reporting the current one
+        rtrnD = json.loads(self.__submitEdit(2, "Stale, A.", editActnIndx=2, ctgry_version=version - 1)["RETURN_STRING"])
+        self.assertEqual(("CONFLICT", version), (rtrnD["status"], rtrnD["ctgry_version"]))
+        self.assertEqual(["Versioned, A.0", "Versioned, A.1"], self.__getNames()[:2])
+        self.assertNotIn("Stale, A.", self.__getNames())
+        # unversioned edits are answered with the value alone
+        self.assertEqual("Unversioned, A.", self.__submitEdit(2, "Unversioned, A.", editActnIndx=2)["RETURN_STRING"])
+
+    def testEnumMatchLimit(self):
+        """Tests the number of enumeration prefix matches returned is bounded by the limit, which is kept within range"""
+        for limit, nExpected in [("2", 2), ("-1", 1), ("0", 1), ("1000000", 4), ("bogus", 4)]:
+            rD = self.__doRequest("/service/editor/get_enum_matches", cifctgry="database_2", cifitem="database_id", term="", limit=limit)
+            rtrnD = json.loads(rD["RETURN_STRING"])
+            self.assertEqual(4, rtrnD["total"], limit)
+            self.assertEqual(nExpected, len(rtrnD["matches"]), limit)
+
+    def testStreamHoldsLock(self):
+        """Tests an edit waits for a streamed export of the session to be consumed"""
+        rD = self.__doRequest("/service/editor/export_ctgry_ndjson", cifctgry="audit_author")
+        chunkIter = iter(rD["RETURN_ITERABLE"])
+        firstChunk = next(chunkIter)
+        editTh = threading.Thread(target=self.__submitEdit, args=(self.AUTHORS - 1, "Edited, A."))
+        editTh.start()
+        editTh.join(0.5)
+        self.assertTrue(editTh.is_alive())
+        chunkL = [firstChunk] + list(chunkIter)
+        editTh.join(10)
+        self.assertFalse(editTh.is_alive())
+        # the export is of the records before the edit
+        self.assertEqual(self.AUTHORS, len(chunkL))
+        self.assertNotIn(b"Edited, A.", b"".join(chunkL))
+        self.assertEqual("Edited, A.", self.__getNames()[-1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,44 @@
+##
+# File: ImportTimeBenchmarkTests.py
+# Date:  19-Oct-2026
+#
+# Updates:
+##
+"""Test cases for import-time benchmark
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "Raul Sala"
+__email__ = "rsala@rcsb.rutgers.edu"
+__license__ = "Creative Commons Attribution 3.0 Unported"
+__version__ = "V0.01"
+
+import sys
+import unittest
+
+from wwpdb.apps.editormodule.bench.ImportTimeBenchmark import ImportTimeBenchmark
+
+
+class ImportTimeBenchmarkTests(unittest.TestCase):
+    def testParse(self):
+        """Tests parsing of -X importtime output"""
+        text = """import time: self [us] | cumulative | imported package
+import time:       150 |        150 |   _io
+import time:       812 |       2100 | wwpdb.apps.editormodule.io.EditorSessionMeta
+"""
+        rD = ImportTimeBenchmark.parseImportTime(text)
+        self.assertEqual((150, 150), rD["_io"])
+        self.assertEqual((812, 2100), rD["wwpdb.apps.editormodule.io.EditorSessionMeta"])
+        self.assertEqual(2, len(rD))
+
+    @unittest.skipIf(sys.version_info < (3, 7), "-X importtime requires Python 3.7")
+    def testRun(self):
+        """Tests the editor web entry point loads none of the modules deferred to the operations needing them"""
+        rD = ImportTimeBenchmark(module="wwpdb.apps.editormodule.webapp.EditorWebApp", repeat=1).run()
+        self.assertGreater(rD["cumulative_ms"], 0)
+        self.assertEqual([], rD["deferred_loaded"])
+        self.assertTrue(rD["top_imports"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+##
+# File: PdbxDataIoTests.py
+# Date:  19-Oct-2026
+#
+# Updates:
+##
+"""Test cases for reuse of the session data store on relaunch of a session
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "Raul Sala"
+__email__ = "rsala@rcsb.rutgers.edu"
+__license__ = "Creative Commons Attribution 3.0 Unported"
+__version__ = "V0.01"
+
+import logging
+import os
+import platform
+import shutil
+import unittest
+
+from wwpdb.apps.editormodule.bench.SyntheticEntry import SyntheticEntryGenerator
+from wwpdb.apps.editormodule.io.PdbxDataIo import PdbxDataIo
+
+
+class _ListHandler(logging.Handler):
+    def __init__(self):
+        logging.Handler.__init__(self)
+        self.recordL = []
+
+    def emit(self, record):
+        self.recordL.append(record)
+
+
+class PdbxDataIoTests(unittest.TestCase):
+    SITE_ID = "EDITOR_PDBX_DATA_IO_TEST"
+
+    def setUp(self):
+        HERE = os.path.abspath(os.path.dirname(__file__))
+        self.__topPath = os.path.join(HERE, "test-output", platform.python_version(), "pdbxdataio")
+        if os.path.exists(self.__topPath):
+            shutil.rmtree(self.__topPath)
+        os.makedirs(os.path.join(self.__topPath, "sessions"))
+        generator = SyntheticEntryGenerator(entities=1, authors=3, structConnRows=2, atoms=20)
+        self.__reqObj = generator.launchSession(self.__topPath, self.SITE_ID, "relaunch_session", "relaunch-model.cif")
+        self.__modelPath = os.path.join(self.__reqObj.newSessionObj().getPath(), "relaunch-model.cif")
+
+    def __relaunch(self):
+        """Initialize the data store of the session again, returning the entry header and the messages logged"""
+        handler = _ListHandler()
+        dataIoLogger = logging.getLogger("wwpdb.apps.editormodule.io.PdbxDataIo")
+        level = dataIoLogger.level
+        dataIoLogger.setLevel(logging.INFO)
+        dataIoLogger.addHandler(handler)
+        try:
+            headerT = PdbxDataIo(self.__reqObj).initializeDataStore()
+        finally:
+            dataIoLogger.removeHandler(handler)
+            dataIoLogger.setLevel(level)
+        return headerT, [record.getMessage() for record in handler.recordL]
+
+    def testRelaunchUnchanged(self):
+        """Tests data store of an unchanged model file is reused without staging the file again"""
+        headerT, msgL = self.__relaunch()
+        self.assertEqual("D_800001", headerT[0])
+        self.assertEqual([], [msg for msg in msgL if msg.startswith("+++- staged pdbx data file")])
+        self.assertTrue([msg for msg in msgL if msg.startswith("reusing data store")])
+
+    def testRelaunchTouched(self):
+        """Tests data store is reused after the model file is staged and found to have unchanged content"""
+        st = os.stat(self.__modelPath)
+        os.utime(self.__modelPath, (st.st_atime, st.st_mtime + 10))
+        headerT, msgL = self.__relaunch()
+        self.assertEqual("D_800001", headerT[0])
+        self.assertTrue([msg for msg in msgL if msg.startswith("+++- staged pdbx data file")])
+        self.assertTrue([msg for msg in msgL if msg.startswith("reusing data store")])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+##
+# File: PdbxEnumPrefixIndexTests.py
+# Date:  19-Oct-2026
+#
+# Updates:
+##
+"""Test cases for enumeration prefix search
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "Raul Sala"
+__email__ = "rsala@rcsb.rutgers.edu"
+__license__ = "Creative Commons Attribution 3.0 Unported"
+__version__ = "V0.01"
+
+import unittest
+
+from wwpdb.apps.editormodule.io.PdbxEnumPrefixIndex import PdbxEnumPrefixIndex
+from wwpdb.apps.editormodule.io.PdbxEnumRegistry import PdbxEnumRegistry
+
+
+class PdbxEnumPrefixIndexTests(unittest.TestCase):
+    def setUp(self):
+        self.__names = ["Homo sapiens", "Mus musculus", "Escherichia coli", "Escherichia coli K-12", "homo erectus", "Saccharomyces cerevisiae"]
+
+    def testSearch(self):
+        """Tests case-insensitive prefix matches and limits"""
+        pI = PdbxEnumPrefixIndex(self.__names)
+        self.assertEqual(len(self.__names), len(pI))
+
+        matches, total = pI.search("esch")
+        self.assertEqual(["Escherichia coli", "Escherichia coli K-12"], matches)
+        self.assertEqual(2, total)
+
+        matches, total = pI.search("HOMO", limit=1)
+        self.assertEqual(["homo erectus"], matches)
+        self.assertEqual(2, total)
+
+        matches, total = pI.search("xyz")
+        self.assertEqual([], matches)
+        self.assertEqual(0, total)
+
+        matches, total = pI.search("", limit=3)
+        self.assertEqual(3, len(matches))
+        self.assertEqual(len(self.__names), total)
+
+    def testGetFromRegistry(self):
+        """Tests index lookup via registry enum id"""
+        reg = PdbxEnumRegistry()
+        reg.build({"entity_src_nat": {"COLUMN_ENUMS": {"pdbx_organism_scientific": list(self.__names)}}})
+        enumId = reg.getEnumId("entity_src_nat", "pdbx_organism_scientific")
+        pI = PdbxEnumPrefixIndex.get(enumId, reg)
+        self.assertIs(pI, PdbxEnumPrefixIndex.get(enumId, reg))
+        self.assertEqual(["Mus musculus"], pI.search("mus")[0])
+        self.assertIsNone(PdbxEnumPrefixIndex.get("unknown", reg))
+
+
+if __name__ == "__main__":
+    unittest.main()
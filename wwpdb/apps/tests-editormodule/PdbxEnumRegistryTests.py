@@ -0,0 +1,112 @@
+##
+# File: PdbxEnumRegistryTests.py
+# Date:  19-Oct-2026
+#
+# Updates:
+##
+"""Test cases for session enumeration registry
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "Raul Sala"
+__email__ = "rsala@rcsb.rutgers.edu"
+__license__ = "Creative Commons Attribution 3.0 Unported"
+__version__ = "V0.01"
+
+import os
+import platform
+import unittest
+
+from wwpdb.apps.editormodule.depict.EditorDepict import EditorDepict
+from wwpdb.apps.editormodule.io.PdbxEnumRegistry import PdbxEnumRegistry
+
+
+class _DataIo(object):
+    def __init__(self, enumRegistry):
+        self.__enumRegistry = enumRegistry
+
+    def getEnumRegistry(self):
+        return self.__enumRegistry
+
+
+class PdbxEnumRegistryTests(unittest.TestCase):
+    def setUp(self):
+        HERE = os.path.abspath(os.path.dirname(__file__))
+        TESTOUTPUT = os.path.join(HERE, "test-output", platform.python_version())
+        if not os.path.exists(TESTOUTPUT):  # pragma: no cover
+            os.makedirs(TESTOUTPUT)
+        self.__registryPath = os.path.join(TESTOUTPUT, "enumRegistry.json")
+        self.__dInfo = {
+            "entity_src_gen": {
+                "COLUMN_ENUMS": {"pdbx_gene_src_scientific_name": ["Mus musculus", "homo sapiens", "Escherichia coli"]},
+                "COLUMN_ENUMS_ALT": {},
+            },
+            "entity_src_nat": {
+                "COLUMN_ENUMS": {"pdbx_organism_scientific": ["Escherichia coli", "Mus musculus", "homo sapiens"]},
+                "COLUMN_ENUMS_ALT": {"pdbx_organism_scientific": ["b", "A"]},
+            },
+            "struct": {"COLUMN_ENUMS": {}, "COLUMN_ENUMS_ALT": {}},
+        }
+
+    def testBuildSortsAndDeduplicates(self):
+        """Tests enumerations are pre-sorted in place and identical lists share one id"""
+        reg = PdbxEnumRegistry(self.__registryPath)
+        version = reg.build(self.__dInfo)
+        self.assertIsNotNone(version)
+
+        self.assertEqual(["Escherichia coli", "homo sapiens", "Mus musculus"], self.__dInfo["entity_src_gen"]["COLUMN_ENUMS"]["pdbx_gene_src_scientific_name"])
+        self.assertEqual(["A", "b"], self.__dInfo["entity_src_nat"]["COLUMN_ENUMS_ALT"]["pdbx_organism_scientific"])
+
+        genId = reg.getEnumId("entity_src_gen", "pdbx_gene_src_scientific_name")
+        natId = reg.getEnumId("entity_src_nat", "pdbx_organism_scientific")
+        altId = reg.getEnumId("entity_src_nat", "pdbx_organism_scientific", alt=True)
+        self.assertEqual(genId, natId)
+        self.assertNotEqual(genId, altId)
+        self.assertEqual(2, len(reg.getEnumDict()))
+        self.assertIsNone(reg.getEnumId("struct", "title"))
+
+    def testStoreLoad(self):
+        """Tests registry round trip through session file"""
+        reg = PdbxEnumRegistry(self.__registryPath)
+        version = reg.build(self.__dInfo)
+        self.assertTrue(reg.store())
+
+        reg2 = PdbxEnumRegistry(self.__registryPath)
+        self.assertTrue(reg2.load())
+        self.assertEqual(version, reg2.getVersion())
+        altId = reg2.getEnumId("entity_src_nat", "pdbx_organism_scientific", alt=True)
+        self.assertEqual(["A", "b"], reg2.getEnum(altId))
+        self.assertEqual({altId: ["A", "b"]}, reg2.getEnumDict([altId, "unknown"]))
+
+        self.assertFalse(PdbxEnumRegistry(self.__registryPath + ".missing").load())
+
+    def testVersionStable(self):
+        """Tests version depends only on enumeration content"""
+        v1 = PdbxEnumRegistry().build(self.__dInfo)
+        v2 = PdbxEnumRegistry().build(self.__dInfo)
+        self.assertEqual(v1, v2)
+        self.__dInfo["struct"]["COLUMN_ENUMS"]["pdbx_type"] = ["x"]
+        self.assertNotEqual(v1, PdbxEnumRegistry().build(self.__dInfo))
+
+    def testApplyEnumRefs(self):
+        """Tests only lists identical to the registered list are replaced by references"""
+        reg = PdbxEnumRegistry()
+        reg.build(self.__dInfo)
+        colList = ["pdbx_gene_src_scientific_name", "pdbx_gene_src_gene", "pdbx_description"]
+        catObjDict = {
+            "COLUMN_ENUMS": {0: ["Escherichia coli", "homo sapiens", "Mus musculus"], 1: ["?", "x"]},
+            "COLUMN_ENUMS_ALT": {},
+        }
+        EditorDepict()._EditorDepict__applyEnumRefs(_DataIo(reg), "entity_src_gen", catObjDict, colList)  # pylint: disable=protected-access
+        self.assertEqual({0: reg.getEnumId("entity_src_gen", "pdbx_gene_src_scientific_name")}, catObjDict["COLUMN_ENUM_REFS"])
+        self.assertEqual({1: ["?", "x"]}, catObjDict["COLUMN_ENUMS"])
+        self.assertEqual(reg.getVersion(), catObjDict["ENUM_REGISTRY_VERSION"])
+        # same length, different content - served inline
+        catObjDict = {"COLUMN_ENUMS": {0: ["Escherichia coli", "Homo sapiens", "Rattus"]}, "COLUMN_ENUMS_ALT": {}}
+        EditorDepict()._EditorDepict__applyEnumRefs(_DataIo(reg), "entity_src_gen", catObjDict, colList)  # pylint: disable=protected-access
+        self.assertEqual({}, catObjDict["COLUMN_ENUM_REFS"])
+        self.assertEqual(3, len(catObjDict["COLUMN_ENUMS"][0]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+##
+# File: StoreOpBudgetTests.py
+# Date:  19-Oct-2026
+#
+# Updates:
+#    2026-10-19    RPS    Test session launched with SyntheticEntryGenerator.launchSession().
+#    2026-10-19    RPS    Budgets checked on store access reported by requests made through EditorWebApp.
+##
+"""Upper bounds on persisted store access by editor endpoints.
+
+Requests are made through EditorWebApp with store_trace=y on a test session launched on a small
+synthetic entry and dictionary, and the store access reported in the response is checked against
+the budget of the endpoint.  A change that reopens the data store for the same category, or adds
+store access per row or column, fails here.
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "Raul Sala"
+__email__ = "rsala@rcsb.rutgers.edu"
+__license__ = "Creative Commons Attribution 3.0 Unported"
+__version__ = "V0.01"
+
+import json
+import os
+import platform
+import shutil
+import unittest
+
+from wwpdb.apps.editormodule.bench.SyntheticEntry import SyntheticEntryGenerator
+from wwpdb.apps.editormodule.io.EditorStoreTrace import EditorStoreTrace
+from wwpdb.apps.editormodule.io.PdbxDataIo import PdbxDataIo
+from wwpdb.apps.editormodule.webapp.EditorWebApp import EditorWebApp
+
+# endpoint -> store -> (maximum opens, maximum fetches, maximum updates)
+STORE_OP_BUDGETS = {
+    "get_dtbl_config_dtls": {"data_store": (3, 3, 0), "dict_store": (2, 2, 0)},
+    "get_dtbl_data": {"data_store": (3, 3, 0), "dict_store": (0, 0, 0)},
+    "init_rollback_point": {"data_store": (1, 1, 0), "dict_store": (0, 0, 0)},
+    "submit_edit": {"data_store": (4, 3, 1), "dict_store": (0, 0, 0)},
+    "act_on_row": {"data_store": (5, 4, 1), "dict_store": (1, 1, 0)},
+    "undo": {"data_store": (3, 2, 1), "dict_store": (0, 0, 0)},
+}
+
+
+@unittest.skipIf(not hasattr(os, "fork"), "flock based locking requires a POSIX platform")
+class StoreOpBudgetTests(unittest.TestCase):
+    SITE_ID = "EDITOR_STORE_BUDGET_TEST"
+    SESSION_ID = "budget_session"
+
+    def setUp(self):
+        HERE = os.path.abspath(os.path.dirname(__file__))
+        self.__topPath = os.path.join(HERE, "test-output", platform.python_version(), "storebudget")
+        if os.path.exists(self.__topPath):
+            shutil.rmtree(self.__topPath)
+        os.makedirs(os.path.join(self.__topPath, "sessions"))
+        # data store and dictionary store of the session, as written at launch
+        generator = SyntheticEntryGenerator(entities=1, authors=3, structConnRows=2, atoms=20)
+        self.__reqObj = generator.launchSession(self.__topPath, self.SITE_ID, self.SESSION_ID, "budget-model.cif")
+        _bOk, self.__colList = PdbxDataIo(self.__reqObj).getCategoryColList("audit_author")
+
+    def tearDown(self):
+        EditorStoreTrace.end()
+
+    def __doRequest(self, endpoint, **kw):
+        """Make request to endpoint, check its store access against the budget and return the JSON response"""
+        parameterDict = {"request_path": ["/service/editor/" + endpoint], "sessionid": [self.SESSION_ID], "store_trace": ["y"]}
+        for ky, val in kw.items():
+            parameterDict[ky] = [str(val)]
+        rD = EditorWebApp(parameterDict=parameterDict, siteId=self.SITE_ID).doOp()
+        rtrnD = json.loads(rD["RETURN_STRING"])
+        self.assertFalse(rtrnD["errorflag"], rtrnD)
+        traceD = rtrnD["store_trace"]
+        for storeName, (maxOpens, maxFetches, maxUpdates) in STORE_OP_BUDGETS[endpoint].items():
+            sD = traceD["stores"].get(storeName, {"opens": 0, "fetches": 0, "updates": 0})
+            self.assertLessEqual(sD["opens"], maxOpens, "%s opened %s %d times: %r" % (endpoint, storeName, sD["opens"], traceD))
+            self.assertLessEqual(sD["fetches"], maxFetches, "%s fetched from %s %d times: %r" % (endpoint, storeName, sD["fetches"], traceD))
+            self.assertLessEqual(sD["updates"], maxUpdates, "%s updated %s %d times: %r" % (endpoint, storeName, sD["updates"], traceD))
+        return rtrnD
+
+    def testTableDisplay(self):
+        """Tests store access for the set up and a page of rows of a category table (get_dtbl_config_dtls, get_dtbl_data)"""
+        rtrnD = self.__doRequest("get_dtbl_config_dtls", cifctgry="audit_author")
+        self.assertIn("audit_author", rtrnD["html"])
+        for _ in range(2):
+            rtrnD = self.__doRequest("get_dtbl_data", cifctgry="audit_author", iDisplayStart=0, iDisplayLength=10, sEcho=1, sSearch="")
+            self.assertEqual(3, rtrnD["iTotalRecords"])
+            self.assertEqual(3, len(rtrnD["aaData"]))
+
+    def testEdits(self):
+        """Tests store access for an edit of one value, row insertion and deletion and undo (submit_edit, act_on_row, undo)"""
+        version = PdbxDataIo(self.__reqObj).getCategoryVersion("audit_author")
+        self.__doRequest("init_rollback_point")
+        rtrnD = self.__doRequest(
+            "submit_edit", cifctgry="audit_author", row_idx="row_0", col_idx=self.__colList.index("name"), new_value="Edited, A.", edit_actn_indx=0, ctgry_version=version
+        )
+        self.assertEqual(("OK", "Edited, A."), (rtrnD["status"], rtrnD["value"]))
+        rtrnD = self.__doRequest("act_on_row", cifctgry="audit_author", action="addrow", edit_actn_indx=1, ctgry_version=rtrnD["ctgry_version"])
+        self.assertEqual("OK", rtrnD["status"])
+        rtrnD = self.__doRequest("act_on_row", cifctgry="audit_author", action="delrow", row_idx="row_3", num_rows=1, edit_actn_indx=2, ctgry_version=rtrnD["ctgry_version"])
+        self.assertEqual("OK", rtrnD["status"])
+        rtrnD = self.__doRequest("undo", cifctgry="audit_author", mode="single", rewind_idx=0)
+        self.assertEqual("OK", rtrnD["status"])
+        rowList, _iTotal, _iDisplay = PdbxDataIo(self.__reqObj).getCategoryRowList("audit_author", 0, 10, "", {})
+        self.assertNotIn("Edited, A.", [rcrd[self.__colList.index("name")] for rowD in rowList for rcrd in rowD.values()])
+
+    def testCategoryVersion(self):
+        """Tests category version check needs no store access beyond PdbxDataIo set up"""
+        pdbxDataIo = PdbxDataIo(self.__reqObj)
+        version = pdbxDataIo.getCategoryVersion("struct")
+        EditorStoreTrace.begin()
+        self.assertTrue(pdbxDataIo.isCategoryVersionCurrent("struct", str(version)))
+        self.assertEqual({}, EditorStoreTrace.end()["stores"])
+
+
+if __name__ == "__main__":
+    unittest.main()
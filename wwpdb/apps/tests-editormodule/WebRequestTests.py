@@ -150,6 +150,22 @@ class ResponseTests(unittest.TestCase):
 
         self.assertIn("dump", rc.dump()[0])
 
+    def testStreamResponse(self):
+        """Tests streamed ndjson response content"""
+        reqObj = EditorInputRequest(self.__paramDict)
+        reqObj.setReturnFormat("ndjson")
+        rc = ResponseContent(reqObj)
+        rc.setStreamContent(iter(['{"id": "1"}\n', '{"id": "2"}\n']))
+        rD = rc.get()
+        self.assertEqual(rD["CONTENT_TYPE"], "application/x-ndjson")
+        self.assertEqual(b"".join(rD["RETURN_ITERABLE"]), b'{"id": "1"}\n{"id": "2"}\n')
+
+        rc = ResponseContent(reqObj)
+        rc.setError(errMsg="No such category")
+        rD = rc.get()
+        self.assertNotIn("RETURN_ITERABLE", rD)
+        self.assertEqual(rD["RETURN_STRING"], "No such category")
+
 
 if __name__ == "__main__":  # pragma: no cover
     unittest.main()